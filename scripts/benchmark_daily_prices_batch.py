@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+scripts/benchmark_daily_prices_batch.py
+
+get_daily_prices_batch 벤치마크: 기존 방식(전체 행 조회 → 행별 dict → 종목별 DataFrame)과
+윈도우 쿼리 + 컬럼 적재 방식의 전송 행 수와 소요 시간을 비교합니다.
+
+사용법:
+    # 합성 데이터 (SQLite in-memory, 기본 2500종목 × 750일)
+    python scripts/benchmark_daily_prices_batch.py --codes 2500 --days 750 --limit 120
+
+    # 실제 MariaDB (watchlist 크기만큼 상위 종목 사용)
+    python scripts/benchmark_daily_prices_batch.py --use-db --codes 200 --limit 120
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+# 프로젝트 루트 경로 설정
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+import pandas as pd
+from sqlalchemy import text
+
+from shared.database.market import get_daily_prices_batch
+
+
+def legacy_get_daily_prices_batch(session, stock_codes, limit=120, table_name="STOCK_DAILY_PRICES_3Y"):
+    """변경 전 구현 (limit 미적용, 행별 dict 생성) - 비교 기준"""
+    result = {code: [] for code in stock_codes}
+    placeholder = ','.join([f':code{i}' for i in range(len(stock_codes))])
+    params = {f'code{i}': code for i, code in enumerate(stock_codes)}
+    rows = session.execute(text(f"""
+        SELECT STOCK_CODE, PRICE_DATE, OPEN_PRICE, HIGH_PRICE, LOW_PRICE, CLOSE_PRICE, VOLUME
+        FROM {table_name}
+        WHERE STOCK_CODE IN ({placeholder})
+        ORDER BY STOCK_CODE, PRICE_DATE DESC
+    """), params).fetchall()
+    for row in rows:
+        result[row[0]].append({
+            "STOCK_CODE": row[0], "PRICE_DATE": row[1], "OPEN_PRICE": row[2], "HIGH_PRICE": row[3],
+            "LOW_PRICE": row[4], "CLOSE_PRICE": row[5], "VOLUME": row[6],
+        })
+    for code, items in result.items():
+        if items:
+            result[code] = pd.DataFrame(items).iloc[::-1]
+    return result, len(rows)
+
+
+def build_synthetic_session(num_codes, num_days):
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from shared.db.models import Base
+
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    base = datetime(2023, 1, 1)
+    codes = [f"{i:06d}" for i in range(num_codes)]
+    rows = []
+    for code_idx, code in enumerate(codes):
+        for d in range(num_days):
+            price = 10000 + (code_idx % 50) * 100 + d
+            rows.append({
+                "code": code, "date": base + timedelta(days=d),
+                "o": price, "h": price * 1.01, "l": price * 0.99, "c": price, "v": 1000 + d,
+            })
+    session.execute(text("""
+        INSERT INTO STOCK_DAILY_PRICES_3Y
+            (STOCK_CODE, PRICE_DATE, OPEN_PRICE, HIGH_PRICE, LOW_PRICE, CLOSE_PRICE, VOLUME)
+        VALUES (:code, :date, :o, :h, :l, :c, :v)
+    """), rows)
+    session.commit()
+    return session, codes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="get_daily_prices_batch 벤치마크")
+    parser.add_argument("--codes", type=int, default=2500)
+    parser.add_argument("--days", type=int, default=750)
+    parser.add_argument("--limit", type=int, default=120)
+    parser.add_argument("--use-db", action="store_true", help="실제 MariaDB 사용")
+    args = parser.parse_args()
+
+    if args.use_db:
+        from shared.db.connection import init_engine, session_scope
+        from shared.database.market import get_all_stock_codes
+        init_engine(None, None, None, None)
+        with session_scope(readonly=True) as session:
+            codes = get_all_stock_codes(session)[:args.codes]
+            run(session, codes, args.limit)
+    else:
+        print(f"합성 데이터 생성 중: {args.codes}종목 × {args.days}일 ...")
+        session, codes = build_synthetic_session(args.codes, args.days)
+        run(session, codes, args.limit)
+
+
+def run(session, codes, limit):
+    t0 = time.perf_counter()
+    legacy, legacy_rows = legacy_get_daily_prices_batch(session, codes, limit=limit)
+    legacy_sec = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    current = get_daily_prices_batch(session, codes, limit=limit)
+    current_sec = time.perf_counter() - t0
+    current_rows = sum(len(df) for df in current.values() if isinstance(df, pd.DataFrame))
+
+    print(f"종목 수: {len(codes)}, limit: {limit}")
+    print(f"  기존 : rows={legacy_rows:>10,}  time={legacy_sec:8.3f}s")
+    print(f"  신규 : rows={current_rows:>10,}  time={current_sec:8.3f}s")
+    if current_sec > 0:
+        print(f"  속도 향상: x{legacy_sec / current_sec:.1f}, 전송 행 감소: {legacy_rows - current_rows:,}")
+
+
+if __name__ == "__main__":
+    main()
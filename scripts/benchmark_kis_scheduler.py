@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+scripts/benchmark_kis_scheduler.py
+
+KIS 호출 처리량/지연 벤치마크: 기존 방식(호출마다 새 연결 + 호출 후 API_CALL_DELAY 고정 sleep)과
+KIS 호출 스케줄러(keep-alive 세션 + 토큰 버킷 + 우선순위 대기열, shared/kis/request.safe_request)를 비교합니다.
+
+docker/kis-mock/mock_server.py를 프로세스 안에서 띄워 (--latency-ms만큼 응답 지연) 대량 시세 조회(스레드 N개)와
+그 사이에 섞인 매도 주문을 보내고, 계열별 p50/p99 지연과 초당 처리량을 출력합니다.
+
+사용법:
+    python scripts/benchmark_kis_scheduler.py --quotes 200 --sells 10 --threads 8 --rate 20 --latency-ms 30
+
+    # 이미 떠 있는 mock 서버 사용
+    python scripts/benchmark_kis_scheduler.py --base-url http://localhost:9443
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# 프로젝트 루트 경로 설정
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+sys.path.append(os.path.join(PROJECT_ROOT, "docker", "kis-mock"))
+
+import requests
+
+from shared.kis import scheduler as kis_scheduler
+from shared.kis.request import safe_request
+
+QUOTE_PATH = "/uapi/domestic-stock/v1/quotations/inquire-price"
+ORDER_PATH = "/uapi/domestic-stock/v1/trading/order-cash"
+QUOTE_TR_ID = "FHKST01010100"
+SELL_TR_ID = "VTTC0011U"
+CODES = ["005930", "000660", "035420", "035720"]
+
+
+class _BenchClient:
+    """safe_request가 사용하는 속성만 가진 최소 클라이언트"""
+
+    TIMEOUT = 5
+
+    def __init__(self, name, delay):
+        self.APP_KEY = name
+        self.TRADING_MODE = "MOCK"
+        self.API_CALL_DELAY = delay
+        self.headers = {"Content-Type": "application/json", "Authorization": "Bearer bench"}
+
+
+def _legacy_request(client, method, url, params=None, data=None, tr_id="", priority=None):
+    """v3.5 이전 safe_request의 전송 방식 (새 연결 + 호출 후 고정 sleep)"""
+    try:
+        headers = dict(client.headers, tr_id=tr_id, custtype="P")
+        res = requests.request(method, url, headers=headers, params=params,
+                               data=json.dumps(data) if data else None, timeout=client.TIMEOUT)
+        return res.json()
+    finally:
+        time.sleep(client.API_CALL_DELAY)
+
+
+def _scheduled_request(client, method, url, params=None, data=None, tr_id="", priority=None):
+    return safe_request(client, method, url, params=params, data=data, tr_id=tr_id, priority=priority)
+
+
+def _start_mock_server(latency_ms):
+    from werkzeug.serving import make_server
+    import mock_server
+
+    def _app(environ, start_response):
+        # 실제 KIS까지의 네트워크 왕복 지연 흉내
+        time.sleep(latency_ms / 1000.0)
+        return mock_server.app(environ, start_response)
+
+    server = make_server("127.0.0.1", 0, _app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def _percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def _run(label, request_fn, client, base_url, quotes, sells, threads):
+    latencies = {"quote": [], "sell": []}
+    lock = threading.Lock()
+
+    def _quote(i):
+        started = time.perf_counter()
+        request_fn(client, "GET", base_url + QUOTE_PATH,
+                   params={"FID_COND_MRKT_DIV_CODE": "J", "FID_INPUT_ISCD": CODES[i % len(CODES)]},
+                   tr_id=QUOTE_TR_ID)
+        with lock:
+            latencies["quote"].append(time.perf_counter() - started)
+
+    def _sell(i):
+        started = time.perf_counter()
+        request_fn(client, "POST", base_url + ORDER_PATH,
+                   data={"PDNO": CODES[i % len(CODES)], "ORD_QTY": "1", "ORD_DVSN": "01"},
+                   tr_id=SELL_TR_ID)
+        with lock:
+            latencies["sell"].append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as quote_pool, ThreadPoolExecutor(max_workers=1) as sell_pool:
+        futures = [quote_pool.submit(_quote, i) for i in range(quotes)]
+        # 대량 시세 조회가 도는 동안 매도 주문을 별도 스레드에서 일정 간격으로 투입
+        for i in range(sells):
+            time.sleep(0.1)
+            futures.append(sell_pool.submit(_sell, i))
+        for future in futures:
+            future.result()
+    elapsed = time.perf_counter() - started
+
+    print(f"\n[{label}] 총 {quotes + sells}건, {elapsed:.2f}s → {(quotes + sells) / elapsed:.1f} req/s")
+    for kind, values in latencies.items():
+        if values:
+            print(f"  {kind:5s} n={len(values):4d}  p50={statistics.median(values) * 1000:8.1f}ms"
+                  f"  p99={_percentile(values, 99) * 1000:8.1f}ms  max={max(values) * 1000:8.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KIS 호출 스케줄러 벤치마크")
+    parser.add_argument("--base-url", default=None, help="기존 mock 서버 주소 (미지정 시 프로세스 내 기동)")
+    parser.add_argument("--quotes", type=int, default=200)
+    parser.add_argument("--sells", type=int, default=10)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=30.0, help="프로세스 내 mock 서버 응답 지연")
+    parser.add_argument("--rate", type=float, default=20.0, help="초당 호출 한도 (기존 방식 delay = 1/rate)")
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        server, base_url = _start_mock_server(args.latency_ms)
+
+    delay = 1.0 / args.rate
+    try:
+        # 기존 방식은 스레드별로 sleep하므로 스레드가 늘면 한도를 넘고, 1개면 (지연 + delay)로 묶임
+        _run("legacy: 새 연결 + 고정 sleep, 1 thread", _legacy_request, _BenchClient("legacy", delay),
+             base_url, args.quotes, args.sells, 1)
+        _run(f"legacy: 새 연결 + 고정 sleep, {args.threads} threads", _legacy_request, _BenchClient("legacy", delay),
+             base_url, args.quotes, args.sells, args.threads)
+        os.environ["KIS_RATE_LIMIT_PER_SEC"] = str(args.rate)
+        client = _BenchClient("scheduled", delay)
+        _run(f"scheduler: keep-alive + 토큰 버킷, {args.threads} threads", _scheduled_request, client,
+             base_url, args.quotes, args.sells, args.threads)
+        print(f"\n스케줄러 통계: {json.dumps(kis_scheduler.get_scheduler(client).get_stats(), ensure_ascii=False)}")
+    finally:
+        if server is not None:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
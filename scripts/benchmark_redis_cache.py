@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+scripts/benchmark_redis_cache.py
+
+감성 점수 전체 조회 벤치마크: 기존 방식(KEYS sentiment:* + 키별 GET)과
+해시 저장소(shared/redis_cache, HGETALL/ZREVRANGE + HMGET 파이프라인)를 비교합니다.
+
+기본은 fakeredis로 실행하며, 네트워크 왕복 비용은 --rtt-ms로 왕복 1회마다 더합니다.
+(실제 Redis로 재려면 --redis-url 지정, 이 경우 --rtt-ms는 0으로 두세요.)
+
+사용법:
+    python scripts/benchmark_redis_cache.py --entries 2500 --top 20 --rtt-ms 0.5
+    python scripts/benchmark_redis_cache.py --redis-url redis://localhost:6379/15
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+# 프로젝트 루트 경로 설정
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from shared import redis_cache
+
+
+class RoundTripCounter:
+    """클라이언트 명령/파이프라인 실행을 왕복 1회로 세고, 왕복마다 rtt를 더합니다."""
+
+    def __init__(self, client, rtt_seconds):
+        self.round_trips = 0
+        self._rtt = rtt_seconds
+        execute_command = client.execute_command
+        make_pipeline = client.pipeline
+
+        def counted_execute_command(*args, **kwargs):
+            self._tick()
+            return execute_command(*args, **kwargs)
+
+        def counted_pipeline(*args, **kwargs):
+            pipe = make_pipeline(*args, **kwargs)
+            execute = pipe.execute
+
+            def counted_execute(*e_args, **e_kwargs):
+                self._tick()
+                return execute(*e_args, **e_kwargs)
+
+            pipe.execute = counted_execute
+            return pipe
+
+        client.execute_command = counted_execute_command
+        client.pipeline = counted_pipeline
+
+    def _tick(self):
+        self.round_trips += 1
+        if self._rtt:
+            time.sleep(self._rtt)
+
+
+def legacy_top(r, limit):
+    """기존 대시보드 방식: KEYS + 키별 GET 후 정렬"""
+    items = []
+    for key in r.keys("sentiment:*"):
+        data = r.get(key)
+        if data:
+            parsed = json.loads(data)
+            items.append((key.split(":")[-1], parsed))
+    items.sort(key=lambda x: x[1].get("score") or 0, reverse=True)
+    return items[:limit]
+
+
+def seed(r, entries):
+    now = time.time()
+    legacy = r.pipeline(transaction=False)
+    for i in range(entries):
+        code = f"{i:06d}"
+        data = {"score": (i * 37) % 100, "reason": "벤치마크", "source_url": None,
+                "stock_name": f"종목{i}", "updated_at": "2025-01-01T09:00:00"}
+        legacy.setex(f"sentiment:{code}", 604800, json.dumps(data))
+        # 해시 저장소는 별도 키에 미리 채움 (레거시 키 이전이 측정에 섞이지 않도록)
+        redis_cache._hash_put(r, "bench_sentiment", code, data, 604800,
+                              "bench_sentiment_rank", data["score"], pipe=legacy)
+    legacy.execute()
+    return now
+
+
+def measure(label, fn, counter, repeat):
+    counter.round_trips = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    elapsed = (time.perf_counter() - started) / repeat
+    print(f"  {label:<32} {elapsed * 1000:9.1f} ms/회   왕복 {counter.round_trips // repeat:6d}회   결과 {len(result)}건")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Redis 감성 점수 조회 벤치마크")
+    parser.add_argument("--entries", type=int, default=2500, help="저장할 종목 수")
+    parser.add_argument("--top", type=int, default=20, help="상위 N개 조회")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="왕복 1회당 추가 지연 (ms)")
+    parser.add_argument("--redis-url", default=None, help="실제 Redis URL (미지정 시 fakeredis)")
+    args = parser.parse_args()
+
+    if args.redis_url:
+        import redis
+        r = redis.from_url(args.redis_url, decode_responses=True)
+    else:
+        import fakeredis
+        r = fakeredis.FakeStrictRedis(decode_responses=True)
+    r.flushdb()
+    seed(r, args.entries)
+
+    counter = RoundTripCounter(r, args.rtt_ms / 1000.0)
+    print(f"종목 {args.entries}개, 상위 {args.top}개, 왕복 지연 {args.rtt_ms}ms")
+
+    legacy = measure("KEYS + GET (기존)", lambda: legacy_top(r, args.top), counter, args.repeat)
+
+    def hash_top():
+        codes = r.zrevrange("bench_sentiment_rank", 0, args.top - 1)
+        entries = redis_cache._hash_get_many(r, "bench_sentiment", codes)
+        return [(code, entries[code]) for code in codes if code in entries]
+
+    top = measure("ZREVRANGE + HMGET (상위 N)", hash_top, counter, args.repeat)
+    full = measure("HGETALL 파이프라인 (전체)",
+                   lambda: redis_cache._hash_get_all(r, "bench_sentiment", "bench_sentiment_rank"),
+                   counter, args.repeat)
+
+    print(f"\n상위 N 조회: {legacy / top:.1f}배, 전체 조회: {legacy / full:.1f}배 빠름")
+    r.flushdb()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+scripts/benchmark_ws_ticks.py
+
+KIS 실시간 체결(H0STCNT0) 프레임 처리량 벤치마크.
+
+1) 해석: 기존 방식(프레임마다 '|'·'^' split 후 첫 레코드만 사용)과
+   shared/kis/tick_decoder.decode_frame(다건 레코드 전체 해석)의 프레임/틱 처리량 비교
+2) 디스패치: 보유 종목 조회를 portfolio_cache 전체 순회 vs 종목코드 인덱스로 비교
+3) 합치기: 느린 처리 함수(--handler-ms)로 버스트를 보낼 때 TickCoalescer가 처리한 건수
+
+녹화한 프레임 파일(--frames, 한 줄에 원본 프레임 1개)이 없으면 다건 프레임을 섞어 생성합니다.
+
+사용법:
+    python scripts/benchmark_ws_ticks.py --frames 200000 --codes 30
+    python scripts/benchmark_ws_ticks.py --frames-file recorded_frames.txt
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# 프로젝트 루트 경로 설정
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from shared.kis.tick_decoder import H0STCNT0_FIELD_COUNT, TickCoalescer, decode_frame
+
+SAMPLE_RECORD = (
+    "{code}^093354^{price}^5^-100^-0.14^72023.83^72100^72400^71700^71900^71800^1^3052507^219853241700^"
+    "5105^6221^1116^84.90^1381954^1291279^1^0.39^20.28^090020^5^-200^090820^5^-500^092619^2^200^"
+    "20230612^20^N^65105^79622^1059221^2060871^0.05^2542196^120.07^0^^72100"
+)
+
+
+def generate_frames(n_frames, codes, seed=42):
+    """1건 프레임 위주에 2~5건 프레임을 섞은 녹화 프레임 대용"""
+    rng = random.Random(seed)
+    frames = []
+    for _ in range(n_frames):
+        count = rng.choice((1, 1, 1, 1, 2, 3, 5))
+        records = [SAMPLE_RECORD.format(code=rng.choice(codes), price=70000 + rng.randint(-500, 500))
+                   for _ in range(count)]
+        frames.append(f"0|H0STCNT0|{count:03d}|" + "^".join(records))
+    return frames
+
+
+def legacy_decode(message):
+    """기존 WebsocketManager.on_message 해석 (첫 레코드만)"""
+    if message[0] in ['0', '1']:
+        parts = message.split('|')
+        if len(parts) >= 4:
+            fields = parts[3].split('^')
+            if len(fields) >= 6:
+                return [(fields[0], float(fields[2]), float(fields[5]))]
+    return []
+
+
+def bench_decode(label, fn, frames):
+    started = time.perf_counter()
+    ticks = 0
+    for frame in frames:
+        ticks += len(fn(frame))
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<30} {len(frames) / elapsed:>12,.0f} 프레임/s {ticks / elapsed:>12,.0f} 틱/s   틱 {ticks:,}건")
+    return ticks
+
+
+def bench_lookup(frames, codes, holdings_per_code):
+    portfolio = [{"id": i, "code": code} for i, code in enumerate(c for c in codes for _ in range(holdings_per_code))]
+    portfolio_cache = {h["id"]: h for h in portfolio}
+    holdings_by_code = {}
+    for h in portfolio:
+        holdings_by_code.setdefault(h["code"], []).append(h)
+    ticks = [tick for frame in frames for tick in decode_frame(frame)]
+
+    started = time.perf_counter()
+    for tick in ticks:
+        [h for h in portfolio_cache.values() if h["code"] == tick.code]
+    scan = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for tick in ticks:
+        holdings_by_code.get(tick.code)
+    index = time.perf_counter() - started
+    print(f"  {'portfolio_cache 전체 순회':<30} {len(ticks) / scan:>12,.0f} 틱/s")
+    print(f"  {'종목코드 인덱스':<30} {len(ticks) / index:>12,.0f} 틱/s   ({scan / index:.0f}배)")
+
+
+def bench_coalesce(frames, handler_ms):
+    handled = []
+
+    def handler(tick):
+        time.sleep(handler_ms / 1000)
+        handled.append(tick)
+
+    coalescer = TickCoalescer(handler).start()
+    started = time.perf_counter()
+    for frame in frames:
+        coalescer.push(decode_frame(frame))
+    push_elapsed = time.perf_counter() - started
+    while coalescer.get_stats()["pending"]:
+        time.sleep(0.01)
+    coalescer.stop()
+    stats = coalescer.get_stats()
+    print(f"  수신 {stats['received']:,}틱을 {push_elapsed:.2f}초에 전달 (수신 스레드 블로킹 없음)")
+    print(f"  처리 {stats['dispatched']:,}틱, 합쳐짐 {stats['coalesced']:,}틱 (처리 함수 {handler_ms}ms/틱)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KIS 실시간 체결 프레임 처리량 벤치마크")
+    parser.add_argument("--frames", type=int, default=200000, help="생성할 프레임 수")
+    parser.add_argument("--frames-file", default=None, help="녹화한 프레임 파일 (한 줄에 1개)")
+    parser.add_argument("--codes", type=int, default=30, help="종목 수 (생성 시)")
+    parser.add_argument("--holdings-per-code", type=int, default=2, help="종목당 보유 건수")
+    parser.add_argument("--handler-ms", type=float, default=0.5, help="합치기 측정용 틱당 처리 시간")
+    args = parser.parse_args()
+
+    codes = [f"{i:06d}" for i in range(args.codes)]
+    if args.frames_file:
+        with open(args.frames_file, encoding="utf-8") as f:
+            frames = [line.rstrip("\n") for line in f if line.strip()]
+        codes = sorted({tick.code for frame in frames for tick in decode_frame(frame)}) or codes
+    else:
+        frames = generate_frames(args.frames, codes)
+    print(f"프레임 {len(frames):,}개, 종목 {len(codes)}개, 레코드당 필드 {H0STCNT0_FIELD_COUNT}개\n")
+
+    print("[해석]")
+    legacy = bench_decode("기존 (첫 레코드만)", legacy_decode, frames)
+    decoded = bench_decode("decode_frame (다건)", decode_frame, frames)
+    print(f"  기존 방식에서 누락된 틱: {decoded - legacy:,}건\n")
+
+    print("[보유 종목 조회]")
+    bench_lookup(frames, codes, args.holdings_per_code)
+
+    print("\n[합치기]")
+    bench_coalesce(frames[:20000], args.handler_ms)
+
+
+if __name__ == "__main__":
+    main()
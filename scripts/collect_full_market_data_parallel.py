@@ -1,15 +1,18 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-# Version: v3.8
+# Version: v3.9
 # 작업 LLM: Claude Opus 4.5
 """
 [v3.8] scripts/collect_full_market_data_parallel.py
 KOSPI 전 종목의 700일치 데이터를 병렬로 수집합니다.
-- MariaDB/Oracle 하이브리드 지원 (Claude Opus 4.5)
+- MariaDB 전용 (공유 SQLAlchemy 엔진 사용, Oracle MERGE 분기 제거)
+- [v3.9] 스레드는 조회만, 저장은 메인 스레드에서 chunk 단위 Bulk UPSERT (--chunk-size, --infile)
+  --infile도 INFILE_FLUSH_ROWS 행마다 나눠 LOAD DATA (전 종목을 메모리에 모아 두지 않음)
 """
 
 import os
 import sys
+import argparse
 import logging
 import time
 from datetime import datetime, timedelta
@@ -25,6 +28,8 @@ import shared.auth as auth
 import shared.database as database
 from shared.kis.client import KISClient
 from shared.kis.market_data import MarketData
+from shared.database.price_store import append_ohlcv_rows, get_price_store
+from shared.db.connection import ensure_engine_initialized, session_scope
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -33,110 +38,99 @@ logger = logging.getLogger(__name__)
 # 전역 설정
 MAX_WORKERS = 5  # 동시 실행 스레드 수 (API 제한 고려)
 DAYS_TO_COLLECT = 711
+# --infile: LOAD DATA 파일 하나당 행 수 (executemany chunk보다 크게 묶되, 전 종목을 한 번에 들고 있지 않도록)
+INFILE_FLUSH_ROWS = 100_000
 
-def _is_mariadb() -> bool:
-    """현재 DB 타입이 MariaDB인지 확인"""
-    return os.getenv("DB_TYPE", "ORACLE").upper() == "MARIADB"
-
-def collect_stock_data(code, kis_client, db_config):
-    """단일 종목 데이터 수집 및 저장 (스레드에서 실행)"""
-    conn = None
+def fetch_stock_rows(code, kis_client, start_date=None):
+    """
+    [v3.9] 단일 종목 일봉 조회 (스레드에서 실행, DB 저장은 메인 스레드에서 묶어서 수행)
+    
+    Returns:
+        KIS 일봉 행 리스트 (code 키 추가), 실패/데이터 없음이면 None
+    """
     try:
-        # DB 연결 (스레드별 독립 연결)
-        conn = database.get_db_connection(**db_config)
-        if not conn:
-            logger.error(f"❌ [{code}] DB 연결 실패")
-            return False
-            
-        cur = conn.cursor()
-        
-        # Oracle 전용: 병렬 DML 비활성화 (ORA-12838 방지)
-        if not _is_mariadb():
-            try:
-                cur.execute("ALTER SESSION DISABLE PARALLEL DML")
-            except:
-                pass
-            
         market_data = MarketData(kis_client)
         
         end_date = datetime.now().strftime("%Y%m%d")
-        start_date = (datetime.now() - timedelta(days=DAYS_TO_COLLECT)).strftime("%Y%m%d")
+        if start_date is None:
+            start_date = (datetime.now() - timedelta(days=DAYS_TO_COLLECT)).strftime("%Y%m%d")
         
         # 데이터 조회 (페이지네이션 적용됨)
         rows = market_data.get_stock_history_by_chart(code, start_date=start_date, end_date=end_date)
         
         if not rows:
             logger.warning(f"⚠️ [{code}] 데이터 없음")
-            return False
-            
-        # DB 저장
-        if _is_mariadb():
-            # MariaDB: INSERT ... ON DUPLICATE KEY UPDATE
-            sql = """
-            INSERT INTO STOCK_DAILY_PRICES_3Y 
-                (STOCK_CODE, PRICE_DATE, OPEN_PRICE, HIGH_PRICE, LOW_PRICE, CLOSE_PRICE, VOLUME)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            ON DUPLICATE KEY UPDATE
-                OPEN_PRICE = VALUES(OPEN_PRICE),
-                HIGH_PRICE = VALUES(HIGH_PRICE),
-                LOW_PRICE = VALUES(LOW_PRICE),
-                CLOSE_PRICE = VALUES(CLOSE_PRICE),
-                VOLUME = VALUES(VOLUME)
-            """
-            for row in rows:
-                cur.execute(sql, (
-                    code, row['date'], row['open'], row['high'], 
-                    row['low'], row['close'], row['volume']
-                ))
-        else:
-            # Oracle: MERGE INTO
-            for row in rows:
-                params = {
-                    'code': code,
-                    'pdate': row['date'],
-                    'open': row['open'],
-                    'high': row['high'],
-                    'low': row['low'],
-                    'close': row['close'],
-                    'vol': row['volume']
-                }
-                
-                merge_sql = """
-                MERGE INTO STOCK_DAILY_PRICES_3Y target
-                USING (SELECT :code AS STOCK_CODE, TO_DATE(:pdate, 'YYYY-MM-DD') AS PRICE_DATE FROM DUAL) source
-                ON (target.STOCK_CODE = source.STOCK_CODE AND target.PRICE_DATE = source.PRICE_DATE)
-                WHEN MATCHED THEN
-                    UPDATE SET 
-                        OPEN_PRICE = :open,
-                        HIGH_PRICE = :high,
-                        LOW_PRICE = :low,
-                        CLOSE_PRICE = :close,
-                        VOLUME = :vol
-                WHEN NOT MATCHED THEN
-                    INSERT (STOCK_CODE, PRICE_DATE, OPEN_PRICE, HIGH_PRICE, LOW_PRICE, CLOSE_PRICE, VOLUME)
-                    VALUES (:code, TO_DATE(:pdate, 'YYYY-MM-DD'), :open, :high, :low, :close, :vol)
-                """
-                cur.execute(merge_sql, params)
-        
-        conn.commit()
-        cur.close()
-        return True
+            return None
+        for row in rows:
+            row['code'] = code
+        return rows
         
     except Exception as e:
-        logger.error(f"❌ [{code}] 처리 실패: {e}")
-        if conn:
-            conn.rollback()
-        return False
-    finally:
-        if conn:
-            conn.close()
+        logger.error(f"❌ [{code}] 조회 실패: {e}")
+        return None
+
+
+class DailyPriceWriter:
+    """
+    [v3.9] 수집한 일봉을 모아 chunk_size 단위로 Bulk UPSERT (database.save_daily_ohlcv)
+    종목마다 연결을 열고 행마다 INSERT하던 것을 묶음당 executemany 1회로 줄입니다.
+    """
+    
+    def __init__(self, chunk_size, use_infile=False, store_buffer=None):
+        self.chunk_size = chunk_size
+        self.use_infile = use_infile
+        self.flush_rows = max(chunk_size, INFILE_FLUSH_ROWS) if use_infile else chunk_size
+        self.store_buffer = store_buffer
+        self.pending = []      # (code, rows)
+        self.pending_rows = 0
+        self.written = 0
+        self.failed_codes = []
+        self.elapsed = 0.0
+    
+    def add(self, code, rows):
+        self.pending.append((code, rows))
+        self.pending_rows += len(rows)
+        # LOAD DATA는 큰 파일로 묶을수록 빠르므로 INFILE_FLUSH_ROWS 단위로 저장
+        if self.pending_rows >= self.flush_rows:
+            self.flush()
+    
+    def flush(self):
+        if not self.pending:
+            return
+        batch, self.pending, self.pending_rows = self.pending, [], 0
+        started = time.perf_counter()
+        try:
+            with session_scope() as session:
+                written = database.save_daily_ohlcv(
+                    session, (row for _, rows in batch for row in rows),
+                    chunk_size=self.chunk_size, use_infile=self.use_infile, sync_store=False,
+                )
+        except Exception as e:
+            logger.error(f"❌ 일봉 Bulk 저장 실패 ({len(batch)}종목): {e}")
+            self.failed_codes.extend(code for code, _ in batch)
+            return
+        finally:
+            self.elapsed += time.perf_counter() - started
+        self.written += written
+        if self.store_buffer is not None:
+            self.store_buffer.extend(row for _, rows in batch for row in rows)
+    
+    @property
+    def rows_per_sec(self):
+        return self.written / self.elapsed if self.elapsed else 0.0
+
 
 def main():
-    load_dotenv()
+    parser = argparse.ArgumentParser(description="KOSPI 전 종목 일봉 병렬 수집")
+    parser.add_argument("--incremental", action="store_true",
+                        help="로컬 가격 스토어(PRICE_STORE_DIR)의 종목별 마지막 일자부터만 수집")
+    parser.add_argument("--chunk-size", type=int, default=database.bulk.DEFAULT_CHUNK_SIZE,
+                        help="Bulk UPSERT 한 번에 보낼 행 수 (기본: BULK_UPSERT_CHUNK_SIZE 또는 1000)")
+    parser.add_argument("--infile", action="store_true",
+                        help="LOAD DATA LOCAL INFILE로 저장 (백필용, MARIADB_LOCAL_INFILE=true 필요)")
+    args = parser.parse_args()
     
-    # DB 타입 확인
-    db_type = os.getenv("DB_TYPE", "ORACLE").upper()
-    logger.info(f"DB 타입: {db_type}")
+    load_dotenv()
     
     # KIS Client 초기화 (공유)
     project_id = os.getenv("GCP_PROJECT_ID")
@@ -168,26 +162,9 @@ def main():
         logger.error("KIS API 인증 실패")
         return
 
-    # DB 설정 (스레드에 전달용)
-    # MariaDB는 환경변수에서 직접 읽으므로 Oracle 형식의 더미 값 전달
-    if _is_mariadb():
-        db_config = {
-            "db_user": "dummy",  # MariaDB는 환경변수에서 읽음
-            "db_password": "dummy",
-            "db_service_name": "dummy",
-            "wallet_path": "dummy"
-        }
-    else:
-        db_user = auth.get_secret(os.getenv("SECRET_ID_ORACLE_DB_USER"), project_id)
-        db_password = auth.get_secret(os.getenv("SECRET_ID_ORACLE_DB_PASSWORD"), project_id)
-        wallet_path = os.path.join(PROJECT_ROOT, os.getenv("OCI_WALLET_DIR_NAME", "wallet"))
-        
-        db_config = {
-            "db_user": db_user,
-            "db_password": db_password,
-            "db_service_name": os.getenv("OCI_DB_SERVICE_NAME"),
-            "wallet_path": wallet_path
-        }
+    if ensure_engine_initialized() is None:
+        logger.error("DB 연결 실패")
+        return
 
     # KOSPI 종목 리스트 가져오기
     logger.info("FinanceDataReader를 사용하여 KOSPI 종목 리스트를 가져옵니다...")
@@ -195,20 +172,40 @@ def main():
     codes = df_krx['Code'].tolist()
     logger.info(f"✅ KOSPI 종목 {len(codes)}개 확보 완료.")
     
+    # 로컬 가격 스토어 (PRICE_STORE_DIR 설정 시에만)
+    store = get_price_store()
+    store_buffer = [] if store is not None else None
+    start_dates = {}
+    if args.incremental:
+        if store is not None and store.last_date is not None:
+            # 종목별 마지막 일자부터 (마지막 일자도 다시 받아 장중 수집분을 종가로 덮어씀, 스토어에 없는 종목은 전체 기간)
+            for code in codes:
+                last_date = store.last_date_of(code)
+                if last_date is not None:
+                    start_dates[code] = last_date.strftime("%Y%m%d")
+            logger.info(f"증분 수집: {len(start_dates)}개 종목은 종목별 마지막 일자부터, 나머지는 전체 기간")
+        else:
+            logger.warning("⚠️ 가격 스토어가 없거나 비어 있어 전체 기간을 수집합니다.")
+    
     logger.info(f"=== KOSPI 전 종목({len(codes)}개) 병렬 수집 시작 (Workers: {MAX_WORKERS}) ===")
     
+    writer = DailyPriceWriter(args.chunk_size, use_infile=args.infile, store_buffer=store_buffer)
     success_count = 0
     fail_count = 0
     
     with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        future_to_code = {executor.submit(collect_stock_data, code, kis_client, db_config): code for code in codes}
+        future_to_code = {
+            executor.submit(fetch_stock_rows, code, kis_client, start_dates.get(code)): code
+            for code in codes
+        }
         
         for i, future in enumerate(as_completed(future_to_code)):
             code = future_to_code[future]
             try:
-                result = future.result()
-                if result:
+                rows = future.result()
+                if rows:
                     success_count += 1
+                    writer.add(code, rows)
                     if success_count % 10 == 0:
                         logger.info(f"[{i+1}/{len(codes)}] 진행 중... 성공: {success_count}, 실패: {fail_count}")
                 else:
@@ -216,8 +213,15 @@ def main():
             except Exception as e:
                 logger.error(f"❌ [{code}] 예외 발생: {e}")
                 fail_count += 1
+    writer.flush()
+    success_count -= len(writer.failed_codes)
+    fail_count += len(writer.failed_codes)
                 
     logger.info(f"=== 수집 완료: 성공 {success_count}, 실패 {fail_count} ===")
+    logger.info(f"=== DB 저장: {writer.written:,}행, {writer.elapsed:.1f}초 ({writer.rows_per_sec:,.0f}행/초) ===")
+    
+    # DB에 저장된 행을 한 번에 스토어에 병합 (flush마다 병합하면 파일을 매번 다시 씀)
+    append_ohlcv_rows(store_buffer)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+scripts/loadtest_dashboard.py
+
+Dashboard V2 백엔드 동시 접속 부하 테스트.
+여러 클라이언트가 대시보드 API를 동시에 폴링할 때 엔드포인트별 처리량과 지연(p50/p95/p99)을 측정합니다.
+
+/health는 DB/Redis를 쓰지 않으므로, 느린 조회가 이벤트 루프를 막으면 /health 지연이 함께 늘어납니다.
+(이벤트 루프 응답성 지표로 사용)
+
+사용법:
+    python scripts/loadtest_dashboard.py --base-url http://localhost:8090 --clients 50 --duration 20
+    python scripts/loadtest_dashboard.py --token <JWT> --endpoints /api/portfolio/summary /health
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from collections import defaultdict
+
+import httpx
+
+DEFAULT_ENDPOINTS = [
+    "/api/portfolio/summary",
+    "/api/portfolio/positions",
+    "/api/watchlist",
+    "/api/trades",
+    "/api/scout/status",
+    "/health",
+]
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+async def login(client, username, password):
+    response = await client.post("/api/auth/login", json={"username": username, "password": password})
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def run_client(client, endpoints, headers, deadline, offset, latencies, errors):
+    """한 클라이언트: 엔드포인트를 차례로 계속 호출 (클라이언트마다 시작 위치를 달리함)"""
+    i = offset
+    while time.perf_counter() < deadline:
+        endpoint = endpoints[i % len(endpoints)]
+        i += 1
+        started = time.perf_counter()
+        try:
+            response = await client.get(endpoint, headers=headers)
+            if response.status_code >= 400:
+                errors[endpoint] += 1
+        except httpx.HTTPError:
+            errors[endpoint] += 1
+        latencies[endpoint].append(time.perf_counter() - started)
+
+
+async def main_async(args):
+    limits = httpx.Limits(max_connections=args.clients, max_keepalive_connections=args.clients)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        token = args.token or await login(client, args.username, args.password)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        latencies = defaultdict(list)
+        errors = defaultdict(int)
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(
+            run_client(client, args.endpoints, headers, deadline, n, latencies, errors)
+            for n in range(args.clients)
+        ))
+        elapsed = time.perf_counter() - started
+
+    print(f"클라이언트 {args.clients}개, {elapsed:.1f}초, 대상 {args.base_url}")
+    print(f"  {'엔드포인트':<28} {'요청':>7} {'req/s':>8} {'p50(ms)':>9} {'p95(ms)':>9} "
+          f"{'p99(ms)':>9} {'max(ms)':>9} {'오류':>6}")
+    total = 0
+    for endpoint in args.endpoints:
+        values = latencies.get(endpoint, [])
+        total += len(values)
+        print(f"  {endpoint:<28} {len(values):>7} {len(values) / elapsed:>8.1f} "
+              f"{percentile(values, 50) * 1000:>9.1f} {percentile(values, 95) * 1000:>9.1f} "
+              f"{percentile(values, 99) * 1000:>9.1f} {max(values, default=0) * 1000:>9.1f} "
+              f"{errors.get(endpoint, 0):>6}")
+    all_values = [v for values in latencies.values() for v in values]
+    mean_ms = statistics.mean(all_values) * 1000 if all_values else 0.0
+    print(f"\n전체 {total}건, {total / elapsed:.1f} req/s, 평균 {mean_ms:.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dashboard V2 백엔드 부하 테스트")
+    parser.add_argument("--base-url", default=os.getenv("DASHBOARD_URL", "http://localhost:8090"))
+    parser.add_argument("--clients", type=int, default=50, help="동시 클라이언트 수")
+    parser.add_argument("--duration", type=float, default=20, help="측정 시간 (초)")
+    parser.add_argument("--timeout", type=float, default=30, help="요청 타임아웃 (초)")
+    parser.add_argument("--endpoints", nargs="+", default=DEFAULT_ENDPOINTS)
+    parser.add_argument("--token", default=None, help="JWT (없으면 로그인)")
+    parser.add_argument("--username", default=os.getenv("DASHBOARD_USERNAME", "admin"))
+    parser.add_argument("--password", default=os.getenv("DASHBOARD_PASSWORD", ""))
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
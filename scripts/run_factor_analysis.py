@@ -18,6 +18,7 @@ FactorAnalyzer 배치 작업 실행 스크립트
 Usage:
     DB_TYPE=MARIADB python3 scripts/run_factor_analysis.py
     DB_TYPE=MARIADB python3 scripts/run_factor_analysis.py --codes 100 --regime BULL
+    DB_TYPE=MARIADB python3 scripts/run_factor_analysis.py --codes 2000 --workers 0   # CPU 코어 수만큼 병렬
 """
 
 import argparse
@@ -95,6 +96,8 @@ def parse_args():
                         help="뉴스 카테고리 분석 건너뛰기")
     parser.add_argument("--skip-compound", action="store_true",
                         help="복합 조건 분석 건너뛰기")
+    parser.add_argument("--workers", type=int, default=int(os.getenv("FACTOR_ANALYSIS_WORKERS", "1")),
+                        help="(팩터, 섹터, 보유기간) 병렬 작업 프로세스 수 (기본: 1=순차, 0=CPU 코어 수)")
     parser.add_argument("--backtest", action="store_true",
                         help="[v1.0] 팩터 가중치 검증용 백테스트 실행")
     parser.add_argument("--backtest-days", type=int, default=180,
@@ -112,6 +115,7 @@ def main():
     logger.info(f"   - 분석 기간: {args.days}일")
     logger.info(f"   - 시장 국면: {args.regime}")
     logger.info(f"   - 전체 재분석: {'예' if args.full else '아니오'}")
+    logger.info(f"   - 병렬 워커: {args.workers}")
     logger.info("=" * 60)
     
     start_time = datetime.now()
@@ -147,7 +151,8 @@ def main():
             stock_codes=stock_codes,
             market_regime=args.regime,
             lookback_days=args.days,
-            force_refresh=args.full
+            force_refresh=args.full,
+            workers=args.workers,
         )
         
         # 결과 요약
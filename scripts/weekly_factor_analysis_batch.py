@@ -70,9 +70,10 @@ logger = logging.getLogger(__name__)
 class WeeklyFactorAnalysisBatch:
     """주간 팩터 분석 배치 잡"""
     
-    def __init__(self, full_refresh: bool = False, analysis_only: bool = False):
+    def __init__(self, full_refresh: bool = False, analysis_only: bool = False, workers: int = None):
         self.full_refresh = full_refresh
         self.analysis_only = analysis_only
+        self.workers = workers  # 팩터 분석 병렬 프로세스 수 (None이면 run_factor_analysis 기본값)
         self.scripts_dir = PROJECT_ROOT / 'scripts'
         self.results = {}
         
@@ -212,6 +213,8 @@ class WeeklyFactorAnalysisBatch:
         
         if self.full_refresh:
             args.append('--full')
+        if self.workers is not None:
+            args.extend(['--workers', str(self.workers)])
         
         return self.run_script('run_factor_analysis.py', args)
     
@@ -307,6 +310,9 @@ def main():
     # 특정 단계만 실행
     python scripts/weekly_factor_analysis_batch.py --step news
     python scripts/weekly_factor_analysis_batch.py --step analysis
+    
+    # 팩터 분석을 CPU 코어 수만큼 병렬 실행
+    python scripts/weekly_factor_analysis_batch.py --analysis-only --workers 0
         """
     )
     
@@ -329,11 +335,19 @@ def main():
         help='특정 단계만 실행'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='팩터 분석 병렬 프로세스 수 (0: CPU 코어 수, 기본: 순차 실행)'
+    )
+    
     args = parser.parse_args()
     
     batch = WeeklyFactorAnalysisBatch(
         full_refresh=args.full_refresh,
-        analysis_only=args.analysis_only
+        analysis_only=args.analysis_only,
+        workers=args.workers,
     )
     
     if args.step:
@@ -1,10 +1,13 @@
 # services/buy-executor/executor.py
-# Version: v3.5
+# Version: v3.6
 # Buy Executor - 매수 결재 및 주문 실행 로직
+# [v3.6] 매수 전 상태(포트폴리오/오늘 매수/최근 거래/현금)를 한 번에 동시 조회하고
+#        신호 사이에 재사용 (shared/pretrade_state.py). 단계별 소요 시간 기록
 
 import logging
 import sys
 import os
+import time
 from datetime import datetime, timezone
 
 # shared 패키지 임포트
@@ -12,12 +15,12 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 import shared.database as database
 from shared.db.connection import session_scope
-from shared.db import repository as repo
 import shared.auth as auth
 from shared.position_sizing import PositionSizer
 from shared.portfolio_diversification import DiversificationChecker
 from shared.sector_classifier import SectorClassifier
 from shared.market_regime import MarketRegimeDetector
+from shared.pretrade_state import PreTradeStateProvider, StageTimer
 from shared.strategy_presets import (
     apply_preset_to_config,
     resolve_preset_for_regime,
@@ -46,6 +49,10 @@ class BuyExecutor:
         self.sector_classifier = SectorClassifier(kis, db_pool_initialized=True)
         self.diversification_checker = DiversificationChecker(config, self.sector_classifier)
         self.market_regime_detector = MarketRegimeDetector()
+        
+        # [v3.6] 매수 전 상태 캐시 (체결 이벤트로 무효화)
+        self.pretrade = PreTradeStateProvider(kis.get_cash_balance)
+        self.pretrade.subscribe_trade_events()
 
     def process_buy_signal(self, scan_result: dict, dry_run: bool = True) -> dict:
         """
@@ -65,9 +72,17 @@ class BuyExecutor:
                 "order_no": "12345",
                 "quantity": 10,
                 "price": 72000,
-                "reason": "..."
+                "reason": "...",
+                "timings_ms": {"pretrade": 12.3, "order": 85.0, ..., "total": 110.2}
             }
         """
+        timer = StageTimer()
+        result = self._process_buy_signal(scan_result, dry_run, timer)
+        result['timings_ms'] = timer.as_ms()
+        logger.info(f"⏱️ 매수 처리 단계별 소요: {timer.summary()}")
+        return result
+
+    def _process_buy_signal(self, scan_result: dict, dry_run: bool, timer: StageTimer) -> dict:
         logger.info("=== 매수 신호 처리 시작 ===")
         
         with session_scope() as session:
@@ -82,7 +97,8 @@ class BuyExecutor:
             if (market_regime in (None, 'UNKNOWN') or
                     not scan_result.get('strategy_preset') or
                     not scan_result.get('risk_setting')): # [v3.7] database -> repo
-                shared_regime_cache = database.get_market_regime_cache()
+                with timer.stage('regime'):
+                    shared_regime_cache = database.get_market_regime_cache()
                 if shared_regime_cache:
                     market_regime = shared_regime_cache.get('regime', market_regime)
 
@@ -102,16 +118,29 @@ class BuyExecutor:
             self.position_sizer.refresh_from_config()
             logger.info("전략 프리셋 적용: %s", preset_name)
             
-            # 2. 안전장치 체크
-            safety_check = self._check_safety_constraints(session)
+            # 2. 매수 전 상태 (포트폴리오 / 오늘 매수 건수 / 최근 거래 / 현금) - 동시 조회, 신호 사이 재사용
+            candidate_codes = [c.get('stock_code', c.get('code')) for c in candidates]
+            with timer.stage('pretrade'):
+                try:
+                    state = self.pretrade.get(candidate_codes)
+                except Exception as e:
+                    logger.error(f"매수 전 상태 조회 오류: {e}", exc_info=True)
+                    return {"status": "skipped", "reason": f"Safety check error: {e}"}
+            logger.info(
+                f"매수 전 상태 {'재사용' if state.warm else '조회'}: 보유 {len(state.portfolio)}종목, "
+                f"오늘 매수 {state.today_buy_count}건/{state.today_buy_amount:,.0f}원, 현금 {state.cash:,.0f}원"
+            )
+            
+            # 2.1 안전장치 체크
+            safety_check = self._check_safety_constraints(state)
             if not safety_check['allowed']:
                 logger.warning(f"⚠️ 안전장치 발동: {safety_check['reason']}")
                 return {"status": "skipped", "reason": safety_check['reason']}
             
             # 2.5 중복 주문 및 보유 여부 체크 (Idempotency)
             # 이미 보유 중인지 확인
-            current_portfolio = repo.get_active_portfolio(session)
-            holding_codes = [p['code'] for p in current_portfolio]
+            current_portfolio = state.portfolio
+            holding_codes = state.holding_codes
             
             # LLM 랭킹 전, 후보 중 이미 보유한 종목 제외
             # 키 호환성 처리 (code 또는 stock_code)
@@ -121,11 +150,11 @@ class BuyExecutor:
                 return {"status": "skipped", "reason": "All candidates already held"}
                 
             # 최근 매수 주문 확인 (중복 실행 방지)
-            # 후보 중 하나라도 최근에 매수 시도했으면 건너뛰기 (보수적 접근)
+            # 후보 중 하나라도 최근 10분 내 거래 이력이 있으면 건너뛰기 (보수적 접근)
             for candidate in candidates:
                 c_code = candidate.get('stock_code', candidate.get('code'))
                 c_name = candidate.get('stock_name', candidate.get('name'))
-                if repo.was_traded_recently(session, c_code, hours=0.17): # 10분 = 0.17시간
+                if c_code in state.recently_traded:
                     logger.warning(f"⚠️ 최근 매수 주문 이력 존재: {c_name}({c_code}) - 중복 실행 방지")
                     return {"status": "skipped", "reason": f"Duplicate order detected for {c_code}"}
             
@@ -149,9 +178,8 @@ class BuyExecutor:
             logger.info(f"✅ [Fast Hands] 최고점 후보 선정: {stock_name}({stock_code}) - {current_score}점")
             logger.info(f"   이유: {selected_candidate.get('llm_reason', '')[:100]}...")
             
-            # 4. 계좌 잔고 조회 (순서 변경: 분산 검증에 필요)
-            # KIS Gateway의 get_cash_balance 사용
-            available_cash = self.kis.get_cash_balance()
+            # 4. 계좌 잔고 (매수 전 상태에서 함께 조회됨)
+            available_cash = state.cash
             logger.info(f"가용 현금: {available_cash:,}원")
 
             # 리스크 설정 기본값
@@ -167,7 +195,8 @@ class BuyExecutor:
             current_price = selected_candidate.get('current_price', 0)
             if not current_price:
                 # 실시간 가격 조회
-                snapshot = self.kis.get_stock_snapshot(stock_code)
+                with timer.stage('price'):
+                    snapshot = self.kis.get_stock_snapshot(stock_code)
                 if not snapshot:
                     logger.error("실시간 가격 조회 실패")
                     return {"status": "error", "reason": "Failed to get current price"}
@@ -197,13 +226,14 @@ class BuyExecutor:
                         return {"status": "error", "reason": "Insufficient cash for manual order"}
                 logger.info(f"📏 수동 수량 사용: {position_size}주 (사용자 지정)")
             else:
-                sizing_result = self.position_sizer.calculate_quantity(
-                    stock_code=stock_code,
-                    stock_price=current_price,
-                    atr=atr,
-                    account_balance=available_cash,
-                    portfolio_value=portfolio_value
-                )
+                with timer.stage('sizing'):
+                    sizing_result = self.position_sizer.calculate_quantity(
+                        stock_code=stock_code,
+                        stock_price=current_price,
+                        atr=atr,
+                        account_balance=available_cash,
+                        portfolio_value=portfolio_value
+                    )
                 
                 base_quantity = sizing_result.get('quantity', 0)
                 
@@ -234,10 +264,11 @@ class BuyExecutor:
                 max_stock_pct = 20.0
                 logger.info(f"🚀 [Dynamic Limits] Strong Bull Market: Sector Limit -> 50%, Stock Limit -> 20%")
 
-            is_approved, div_result = self._check_diversification(session,
-                selected_candidate, current_portfolio, available_cash, position_size, current_price, db_conn,
-                override_max_sector_pct=max_sector_pct, override_max_stock_pct=max_stock_pct
-            )
+            with timer.stage('diversification'):
+                is_approved, div_result = self._check_diversification(session,
+                    selected_candidate, current_portfolio, available_cash, position_size, current_price,
+                    override_max_sector_pct=max_sector_pct, override_max_stock_pct=max_stock_pct
+                )
             
             original_qty = position_size
 
@@ -267,7 +298,7 @@ class BuyExecutor:
                             
                             # 재검증 (혹시 모를 다른 규칙 위반 확인)
                             is_approved_retry, _ = self._check_diversification(session,
-                                selected_candidate, current_portfolio, available_cash, position_size, current_price, db_conn,
+                                selected_candidate, current_portfolio, available_cash, position_size, current_price,
                                 override_max_sector_pct=max_sector_pct, override_max_stock_pct=max_stock_pct
                             )
                             if not is_approved_retry:
@@ -298,7 +329,7 @@ class BuyExecutor:
                         
                         # 재검증
                         is_approved_retry, _ = self._check_diversification(session,
-                            selected_candidate, current_portfolio, available_cash, position_size, current_price, db_conn,
+                            selected_candidate, current_portfolio, available_cash, position_size, current_price,
                             override_max_sector_pct=max_sector_pct, override_max_stock_pct=max_stock_pct
                         )
                         if not is_approved_retry:
@@ -314,11 +345,12 @@ class BuyExecutor:
                 logger.info(f"🔧 [DRY_RUN] 매수 주문: {stock_name}({stock_code}) {position_size}주 @ {current_price:,}원")
                 order_no = f"DRY_RUN_{datetime.now().strftime('%Y%m%d%H%M%S')}"
             else:
-                order_no = self.kis.place_buy_order(
-                    stock_code=stock_code,
-                    quantity=position_size,
-                    price=0  # 시장가
-                )
+                with timer.stage('order'):
+                    order_no = self.kis.place_buy_order(
+                        stock_code=stock_code,
+                        quantity=position_size,
+                        price=0  # 시장가
+                    )
                 
                 if not order_no:
                     logger.error("매수 주문 실패")
@@ -326,24 +358,29 @@ class BuyExecutor:
                 
                 logger.info(f"✅ 매수 주문 체결: 주문번호 {order_no}")
             
-            # 8. DB 기록
-            self._record_trade(
-                session=session,
-                stock_code=stock_code,
-                stock_name=stock_name,
-                order_no=order_no,
-                quantity=position_size,
-                price=current_price,
-                buy_signal_type=selected_candidate.get('buy_signal_type', 'UNKNOWN'),
-                factor_score=selected_candidate.get('factor_score', 0),
-                llm_reason=selected_candidate.get('llm_reason', ''),
-                dry_run=dry_run,
-                risk_setting=risk_setting
-            )
+            # 8. DB 기록 (이후 매수 전 상태는 다시 읽도록 무효화)
+            with timer.stage('record'):
+                try:
+                    self._record_trade(
+                        session=session,
+                        stock_code=stock_code,
+                        stock_name=stock_name,
+                        order_no=order_no,
+                        quantity=position_size,
+                        price=current_price,
+                        buy_signal_type=selected_candidate.get('buy_signal_type', 'UNKNOWN'),
+                        factor_score=selected_candidate.get('factor_score', 0),
+                        llm_reason=selected_candidate.get('llm_reason', ''),
+                        dry_run=dry_run,
+                        risk_setting=risk_setting
+                    )
+                finally:
+                    self.pretrade.invalidate(f"BUY {stock_code}")
             
             # 9. 텔레그램 알림 발송
             if self.telegram_bot:
                 try:
+                    notify_started = time.perf_counter()
                     total_amount = position_size * current_price
                     
                     # Mock/Real 모드 및 DRY_RUN 표시
@@ -366,6 +403,7 @@ class BuyExecutor:
 {selected_candidate.get('llm_reason', '')[:200]}"""
                     
                     self.telegram_bot.send_message(message)
+                    timer.timings['notify'] = time.perf_counter() - notify_started
                     logger.info("✅ 텔레그램 알림 발송 완료")
                 except Exception as e:
                     logger.warning(f"⚠️ 텔레그램 알림 발송 실패: {e}")
@@ -382,12 +420,12 @@ class BuyExecutor:
                 "dry_run": dry_run
             }
             
-    def _check_safety_constraints(self, session) -> dict:
-        """안전장치 체크"""
+    def _check_safety_constraints(self, state) -> dict:
+        """안전장치 체크 (state: PreTradeState)"""
         try:
             # 1. 오늘 매수 횟수 확인
             max_buy_count = self.config.get_int('MAX_BUY_COUNT_PER_DAY', default=5)
-            today_buy_count = repo.get_today_buy_count(session)
+            today_buy_count = state.today_buy_count
             
             if today_buy_count >= max_buy_count:
                 return {
@@ -397,7 +435,7 @@ class BuyExecutor:
             
             # 2. 최대 보유 종목 수 확인
             max_portfolio_size = self.config.get_int('MAX_PORTFOLIO_SIZE', default=10)
-            current_portfolio = repo.get_active_portfolio(session)
+            current_portfolio = state.portfolio
             
             if len(current_portfolio) >= max_portfolio_size:
                 return {
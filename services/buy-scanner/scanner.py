@@ -10,12 +10,15 @@ from datetime import datetime, timezone
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from threading import Lock
 
+import numpy as np
+
 # shared 패키지 임포트
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 import shared.database as database
 import shared.auth as auth
 import shared.strategy as strategy
+from shared.strategy_panel import bollinger_panel, cross_panel, momentum_panel, right_aligned_panel
 from shared.market_regime import MarketRegimeDetector, StrategySelector
 
 # [v3.7] SQLAlchemy ORM 기반으로 리팩토링
@@ -354,24 +357,47 @@ class BuyScanner:
             daily_prices_dict = database.get_daily_prices_batch(db_session, stock_codes_to_scan, limit=120, table_name="STOCK_DAILY_PRICES_3Y")
             kospi_prices_df = database.get_daily_prices(db_session, "0001", limit=120, table_name="STOCK_DAILY_PRICES_3Y")
         
-        # 5. 병렬 스캔
+        # 5. 실시간 현재가 반영 (병렬, 종목별 Gateway 조회)
+        target_codes = [code for code in watchlist if code in stock_codes_to_scan and code in daily_prices_dict]
         max_workers = min(10, len(stock_codes_to_scan))
+        live_prices = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._apply_live_price, code, daily_prices_dict[code]): code
+                       for code in target_codes}
+            for future in as_completed(futures):
+                stock_code = futures[future]
+                try:
+                    daily_prices_df, current_price = future.result()
+                except Exception as e:
+                    logger.error(f"[{stock_code}] 실시간 현재가 반영 오류: {e}")
+                    continue
+                # 일봉이 없는 종목은 분석 대상 아님 (_analyze_stock의 데이터 부족 필터와 동일)
+                if current_price is not None and not daily_prices_df.empty:
+                    live_prices[stock_code] = (daily_prices_df, current_price)
+        
+        # 6. 신호 지표를 (일자 × 종목) 패널로 전 종목 한 번에 계산
+        signal_indicators = self._compute_signal_indicators({code: df for code, (df, _) in live_prices.items()})
+        
+        # 7. 병렬 스캔
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = {}
-            for stock_code, stock_info in watchlist.items():
-                # tradable_codes에 포함된 종목만 스캔
-                if stock_code in stock_codes_to_scan and stock_code in daily_prices_dict:
-                    future = executor.submit(
-                        self._analyze_stock,
-                        stock_code,
-                        stock_info,
-                        daily_prices_dict[stock_code],
-                        current_regime,
-                        active_strategies,
-                        kospi_prices_df,
-                        bear_context
-                    )
-                    futures[future] = stock_code
+            for stock_code in target_codes:
+                if stock_code not in live_prices:
+                    continue
+                daily_prices_df, current_price = live_prices[stock_code]
+                future = executor.submit(
+                    self._analyze_stock,
+                    stock_code,
+                    watchlist[stock_code],
+                    daily_prices_df,
+                    current_price,
+                    signal_indicators[stock_code],
+                    current_regime,
+                    active_strategies,
+                    kospi_prices_df,
+                    bear_context
+                )
+                futures[future] = stock_code
             
             # 결과 수집
             for future in as_completed(futures):
@@ -385,60 +411,102 @@ class BuyScanner:
         
         return buy_candidates
     
-    def _analyze_stock(self, stock_code, stock_info, daily_prices_df, 
+    def _apply_live_price(self, stock_code, daily_prices_df) -> tuple:
+        """
+        [Fast Hands] 일봉에 실시간 현재가 반영 (In-Memory Update)
+        
+        Returns:
+            (daily_prices_df, current_price) - 데이터가 없으면 current_price는 None
+        """
+        # [Fast Hands] 1. 실시간 현재가 조회 (Gateway)
+        # DB에 있는 과거 데이터(daily_prices_df)는 어제 종가 기준일 가능성이 높음.
+        # 장중 대응을 위해 실시간 현재가를 조회하여 지표 계산에 반영해야 함.
+        current_price = 0
+        snapshot = self.kis.get_stock_snapshot(stock_code)
+        
+        if snapshot and snapshot.get('price'):
+            current_price = float(snapshot['price'])
+            
+            # [Fast Hands] 2. DataFrame에 현재가 반영 (In-Memory Update)
+            # daily_prices_df의 마지막 행이 오늘 날짜인지 확인
+            if not daily_prices_df.empty:
+                last_date = daily_prices_df['PRICE_DATE'].iloc[-1]
+                today_str = datetime.now().strftime('%Y-%m-%d')
+                last_date_str = last_date.strftime('%Y-%m-%d') if hasattr(last_date, 'strftime') else str(last_date)[:10]
+                
+                if last_date_str == today_str:
+                    # 이미 오늘 데이터가 있으면 업데이트 (종가 = 현재가)
+                    # get_daily_prices_batch 결과는 공유 DataFrame의 슬라이스이므로 복사 후 수정
+                    daily_prices_df = daily_prices_df.copy()
+                    daily_prices_df.iloc[-1, daily_prices_df.columns.get_loc('CLOSE_PRICE')] = current_price
+                    if snapshot.get('high'):
+                        daily_prices_df.iloc[-1, daily_prices_df.columns.get_loc('HIGH_PRICE')] = max(float(daily_prices_df['HIGH_PRICE'].iloc[-1]), float(snapshot['high']))
+                    if snapshot.get('low'):
+                        daily_prices_df.iloc[-1, daily_prices_df.columns.get_loc('LOW_PRICE')] = min(float(daily_prices_df['LOW_PRICE'].iloc[-1]), float(snapshot['low']))
+                else:
+                    # 오늘 데이터가 없으면 행 추가
+                    import pandas as pd
+                    new_row = pd.DataFrame([{
+                        'PRICE_DATE': datetime.now(),
+                        'STOCK_CODE': stock_code,
+                        'CLOSE_PRICE': current_price,
+                        'HIGH_PRICE': float(snapshot.get('high', current_price)),
+                        'LOW_PRICE': float(snapshot.get('low', current_price)),
+                        'OPEN_PRICE': float(snapshot.get('open', current_price)) # OPEN_PRICE 컬럼이 있다면
+                    }])
+                    # 공통 컬럼만 선택하여 병합
+                    common_cols = daily_prices_df.columns.intersection(new_row.columns)
+                    daily_prices_df = pd.concat([daily_prices_df, new_row[common_cols]], ignore_index=True)
+        else:
+            # 실시간 조회 실패 시 DB의 마지막 종가 사용 (Fallback)
+            if not daily_prices_df.empty:
+                current_price = float(daily_prices_df['CLOSE_PRICE'].iloc[-1])
+            else:
+                return daily_prices_df, None # 데이터 없음
+        
+        return daily_prices_df, current_price
+    
+    def _compute_signal_indicators(self, daily_prices_by_code: dict) -> dict:
+        """
+        실시간가를 반영한 일봉을 우측 정렬 (일자 × 종목) 패널로 쌓아 신호 지표의 최신 값을 전 종목 한 번에 계산
+        (calculate_rsi / calculate_bollinger_bands / check_golden_cross / calculate_momentum과 같은 값, 없으면 None)
+        """
+        codes = list(daily_prices_by_code)
+        if not codes:
+            return {}
+        close = right_aligned_panel([daily_prices_by_code[code]['CLOSE_PRICE'].to_numpy(dtype=float) for code in codes])
+        rsi = strategy.calculate_rsi_panel(close)
+        _, _, bollinger_lower = bollinger_panel(close, period=self.config.get_int('BUY_BOLLINGER_PERIOD', default=20))
+        golden_cross, _ = cross_panel(
+            close,
+            short_period=self.config.get_int('BUY_GOLDEN_CROSS_SHORT', default=5),
+            long_period=self.config.get_int('BUY_GOLDEN_CROSS_LONG', default=20)
+        )
+        momentum = momentum_panel(close, period=5)
+        
+        def _value(v):
+            return None if np.isnan(v) else float(v)
+        
+        return {
+            code: {
+                'rsi': _value(rsi[j]),
+                'bollinger_lower': _value(bollinger_lower[-1, j]),
+                'golden_cross': bool(golden_cross[-1, j]),
+                'momentum': _value(momentum[-1, j]),
+            }
+            for j, code in enumerate(codes)
+        }
+    
+    def _analyze_stock(self, stock_code, stock_info, daily_prices_df, current_price, signal_indicators,
                       current_regime, active_strategies, kospi_prices_df,
                       bear_context=None) -> dict:
         """
-        단일 종목 분석 (실시간 가격 반영)
+        단일 종목 분석 (실시간 가격 반영된 일봉 + 패널로 미리 계산한 신호 지표)
         
         Returns:
             buy_candidate dict or None
         """
         try:
-            # [Fast Hands] 1. 실시간 현재가 조회 (Gateway)
-            # DB에 있는 과거 데이터(daily_prices_df)는 어제 종가 기준일 가능성이 높음.
-            # 장중 대응을 위해 실시간 현재가를 조회하여 지표 계산에 반영해야 함.
-            current_price = 0
-            snapshot = self.kis.get_stock_snapshot(stock_code)
-            
-            if snapshot and snapshot.get('price'):
-                current_price = float(snapshot['price'])
-                
-                # [Fast Hands] 2. DataFrame에 현재가 반영 (In-Memory Update)
-                # daily_prices_df의 마지막 행이 오늘 날짜인지 확인
-                if not daily_prices_df.empty:
-                    last_date = daily_prices_df['PRICE_DATE'].iloc[-1]
-                    today_str = datetime.now().strftime('%Y-%m-%d')
-                    last_date_str = last_date.strftime('%Y-%m-%d') if hasattr(last_date, 'strftime') else str(last_date)[:10]
-                    
-                    if last_date_str == today_str:
-                        # 이미 오늘 데이터가 있으면 업데이트 (종가 = 현재가)
-                        daily_prices_df.iloc[-1, daily_prices_df.columns.get_loc('CLOSE_PRICE')] = current_price
-                        if snapshot.get('high'):
-                            daily_prices_df.iloc[-1, daily_prices_df.columns.get_loc('HIGH_PRICE')] = max(float(daily_prices_df['HIGH_PRICE'].iloc[-1]), float(snapshot['high']))
-                        if snapshot.get('low'):
-                            daily_prices_df.iloc[-1, daily_prices_df.columns.get_loc('LOW_PRICE')] = min(float(daily_prices_df['LOW_PRICE'].iloc[-1]), float(snapshot['low']))
-                    else:
-                        # 오늘 데이터가 없으면 행 추가
-                        import pandas as pd
-                        new_row = pd.DataFrame([{
-                            'PRICE_DATE': datetime.now(),
-                            'STOCK_CODE': stock_code,
-                            'CLOSE_PRICE': current_price,
-                            'HIGH_PRICE': float(snapshot.get('high', current_price)),
-                            'LOW_PRICE': float(snapshot.get('low', current_price)),
-                            'OPEN_PRICE': float(snapshot.get('open', current_price)) # OPEN_PRICE 컬럼이 있다면
-                        }])
-                        # 공통 컬럼만 선택하여 병합
-                        common_cols = daily_prices_df.columns.intersection(new_row.columns)
-                        daily_prices_df = pd.concat([daily_prices_df, new_row[common_cols]], ignore_index=True)
-            else:
-                # 실시간 조회 실패 시 DB의 마지막 종가 사용 (Fallback)
-                if not daily_prices_df.empty:
-                    current_price = float(daily_prices_df['CLOSE_PRICE'].iloc[-1])
-                else:
-                    return None # 데이터 없음
-            
             # 필터링: 데이터 부족
             if daily_prices_df.empty or len(daily_prices_df) < self.config.get_int('BUY_GOLDEN_CROSS_LONG', default=20):
                 return None
@@ -461,7 +529,6 @@ class BuyScanner:
             # 공통 지표 계산 (업데이트된 daily_prices_df 기반)
             # last_close_price는 이제 실시간 현재가(current_price)와 동일
             last_close_price = current_price 
-            rsi_value = strategy.calculate_rsi(daily_prices_df)
             
             # 신호 감지
             if bear_signal_payload:
@@ -474,7 +541,7 @@ class BuyScanner:
                 key_metrics_dict['llm_strategy_type'] = strategy_hint
             else:
                 buy_signal_type, key_metrics_dict = self._detect_signals(
-                    stock_code, daily_prices_df, last_close_price, rsi_value, current_regime, active_strategies, kospi_prices_df
+                    stock_code, daily_prices_df, last_close_price, signal_indicators, current_regime, active_strategies, kospi_prices_df
                 )
             
             if not buy_signal_type:
@@ -539,20 +606,19 @@ class BuyScanner:
             logger.error(f"[{stock_code}] 분석 오류: {e}")
             return None
     
-    def _detect_signals(self, stock_code, daily_prices_df, last_close_price, rsi_value, 
+    def _detect_signals(self, stock_code, daily_prices_df, last_close_price, indicators, 
                        current_regime, active_strategies, kospi_prices_df) -> tuple:
         """
-        매수 신호 감지
+        매수 신호 감지 (indicators: _compute_signal_indicators가 패널로 계산한 종목별 지표)
         
         Returns:
             (signal_type, key_metrics_dict) or (None, None)
         """
+        rsi_value = indicators['rsi']
         for strategy_type in active_strategies:
             if strategy_type == StrategySelector.STRATEGY_MEAN_REVERSION:
                 # 평균 회귀 전략
-                bollinger_lower = strategy.calculate_bollinger_bands(
-                    daily_prices_df, period=self.config.get_int('BUY_BOLLINGER_PERIOD', default=20)
-                )
+                bollinger_lower = indicators['bollinger_lower']
                 
                 if bollinger_lower:
                     bb_distance_pct = ((last_close_price - bollinger_lower) / bollinger_lower) * 100
@@ -591,11 +657,7 @@ class BuyScanner:
             
             elif strategy_type == StrategySelector.STRATEGY_TREND_FOLLOWING:
                 # 골든 크로스
-                is_golden_cross = strategy.check_golden_cross(
-                    daily_prices_df,
-                    short_period=self.config.get_int('BUY_GOLDEN_CROSS_SHORT', default=5),
-                    long_period=self.config.get_int('BUY_GOLDEN_CROSS_LONG', default=20)
-                )
+                is_golden_cross = indicators['golden_cross']
                 logger.debug(f"[{stock_code}] 골든 크로스 확인: {is_golden_cross}")
                 if is_golden_cross:
                     logger.debug(f"[{stock_code}] GOLDEN_CROSS 신호 감지.")
@@ -606,8 +668,8 @@ class BuyScanner:
             
             elif strategy_type == StrategySelector.STRATEGY_MOMENTUM:
                 # 모멘텀
-                momentum = strategy.calculate_momentum(daily_prices_df, period=5)
-                logger.debug(f"[{stock_code}] 모멘텀 (5일): {momentum:.2f}, 임계값: {self.MOMENTUM_SIGNAL_THRESHOLD}")
+                momentum = indicators['momentum']
+                logger.debug(f"[{stock_code}] 모멘텀 (5일): {momentum}, 임계값: {self.MOMENTUM_SIGNAL_THRESHOLD}")
                 if momentum and momentum >= self.MOMENTUM_SIGNAL_THRESHOLD:
                     logger.debug(f"[{stock_code}] MOMENTUM 신호 감지.")
                     return 'MOMENTUM', {
@@ -73,10 +73,12 @@ class DailyReporter:
         portfolio = database.get_active_portfolio(session)
         stock_valuation = 0
         portfolio_details = []
+        # 보유 종목 현재가를 한 번에 조회 (Gateway: 일괄 엔드포인트 1회)
+        snapshots = self.kis.get_stock_snapshots([item['code'] for item in portfolio]) if portfolio else {}
         
         for item in portfolio:
             stock_code = item['code']
-            snapshot = self.kis.get_stock_snapshot(stock_code)
+            snapshot = snapshots.get(stock_code)
             current_price = float(snapshot.get('price', item['avg_price'])) if snapshot else float(item['avg_price'])
             
             quantity = int(item['quantity'])
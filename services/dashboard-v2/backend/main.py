@@ -7,8 +7,11 @@ JWT 인증, WebSocket 실시간 업데이트, REST API
 
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from functools import partial
+from typing import Awaitable, Callable, Optional
 from contextlib import asynccontextmanager
 import asyncio
 import json
@@ -20,6 +23,7 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
 import jwt
 import redis
+import redis.asyncio as aioredis
 import httpx
 
 # --- shared 패키지 임포트 ---
@@ -28,7 +32,7 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from shared.db.connection import get_session, get_engine, ensure_engine_initialized
+from shared.db.connection import session_scope, ensure_engine_initialized
 from shared.db.repository import (
     get_portfolio_summary,
     get_portfolio_with_current_prices,
@@ -37,6 +41,15 @@ from shared.db.repository import (
     get_scheduler_jobs,
 )
 from shared.db.models import Portfolio, WatchList, TradeLog
+from shared.redis_cache import (
+    get_sentiment_scores,
+    get_top_sentiment_scores,
+    read_stream_events,
+    get_stream_last_id,
+    STREAM_EVENT_PRICE,
+    STREAM_EVENT_FILL,
+    STREAM_EVENT_PIPELINE,
+)
 
 # --- 로깅 설정 (가장 먼저!) ---
 logging.basicConfig(
@@ -154,7 +167,10 @@ class ScoutPipelineStatus(BaseModel):
     results: Optional[dict]
 
 # --- Redis 연결 ---
+# 동기 클라이언트는 shared 헬퍼(감성 점수, 스트림 읽기)용으로 스레드 풀에서만 사용하고,
+# 엔드포인트에서 직접 읽는 값은 redis.asyncio 클라이언트로 조회합니다.
 redis_client = None
+async_redis_client = None
 
 def get_redis():
     global redis_client
@@ -168,6 +184,102 @@ def get_redis():
             redis_client = None
     return redis_client
 
+def get_async_redis():
+    """redis.asyncio 클라이언트 (연결은 첫 명령에서 맺음)"""
+    global async_redis_client
+    if async_redis_client is None:
+        async_redis_client = aioredis.from_url(REDIS_URL, decode_responses=True)
+    return async_redis_client
+
+# --- 블로킹 작업 실행 (DB/동기 Redis/KIS 현재가) ---
+# 라우트는 모두 async이므로, 동기 SQLAlchemy·redis·httpx 호출은 전용 스레드 풀에서 실행해
+# 느린 조회 하나가 이벤트 루프(다른 요청, WebSocket 푸시)를 멈추지 않게 합니다.
+# 동시 실행 수는 DB 연결 풀(기본 5 + overflow 20)보다 작게 제한합니다.
+DB_EXECUTOR_WORKERS = int(os.getenv("DASHBOARD_DB_WORKERS", "8"))
+db_executor = ThreadPoolExecutor(max_workers=DB_EXECUTOR_WORKERS, thread_name_prefix="dashboard-db")
+
+async def run_blocking(fn: Callable, *args, **kwargs):
+    """동기 함수를 전용 스레드 풀에서 실행하고 결과를 기다립니다."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(db_executor, partial(fn, *args, **kwargs))
+
+# --- 외부 HTTP (Docker/RabbitMQ/Loki) ---
+http_client: Optional[httpx.AsyncClient] = None
+docker_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """keep-alive를 공유하는 httpx.AsyncClient"""
+    global http_client
+    if http_client is None:
+        http_client = httpx.AsyncClient(timeout=10.0)
+    return http_client
+
+def get_docker_client() -> httpx.AsyncClient:
+    """Docker Unix 소켓용 httpx.AsyncClient"""
+    global docker_client
+    if docker_client is None:
+        transport = httpx.AsyncHTTPTransport(uds="/var/run/docker.sock")
+        docker_client = httpx.AsyncClient(transport=transport, base_url="http://localhost", timeout=10.0)
+    return docker_client
+
+# --- 응답 캐시 ---
+# 여러 대시보드가 같은 목록을 폴링해도 TTL 동안은 DB/Gateway를 한 번만 조회합니다.
+# TTL이 0이면 저장하지 않고 동시에 들어온 같은 요청만 합칩니다.
+CACHE_TTL_SECONDS = {
+    "portfolio_summary": float(os.getenv("DASHBOARD_SUMMARY_CACHE_TTL", "5")),
+    "positions": 0,
+    "watchlist": float(os.getenv("DASHBOARD_WATCHLIST_CACHE_TTL", "30")),
+    "trades": float(os.getenv("DASHBOARD_TRADES_CACHE_TTL", "5")),
+}
+RESPONSE_CACHE_MAX_ENTRIES = 256  # 넘으면 만료된 항목 정리 (limit/offset 조합별 키)
+
+class ResponseCache:
+    """
+    엔드포인트 응답 TTL 캐시 + 동일 요청 합치기
+    
+    키는 (엔드포인트 이름, 파라미터...) 튜플입니다. 캐시에 없는 키를 여러 요청이 동시에 조회하면
+    로더는 한 번만 실행되고 나머지는 그 결과를 함께 받습니다. (요청이 끊겨도 로더는 계속 실행)
+    실패는 캐시하지 않습니다.
+    """
+
+    def __init__(self, ttl_seconds: dict[str, float]):
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[tuple, tuple[float, object]] = {}
+        self._in_flight: dict[tuple, asyncio.Future] = {}
+        self._generation = 0  # invalidate()마다 증가. 무효화 전에 시작한 조회 결과는 저장하지 않음
+
+    async def get_or_load(self, key: tuple, loader: Callable[[], Awaitable]):
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(loader())
+            self._in_flight[key] = future
+            future.add_done_callback(partial(self._on_loaded, key, self._generation))
+        return await asyncio.shield(future)
+
+    def _on_loaded(self, key: tuple, generation: int, future: asyncio.Future):
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if future.cancelled() or future.exception() is not None or generation != self._generation:
+            return
+        ttl = self.ttl_seconds.get(key[0], 0)
+        if ttl > 0:
+            now = time.monotonic()
+            if len(self._entries) >= RESPONSE_CACHE_MAX_ENTRIES:
+                self._entries = {k: v for k, v in self._entries.items() if v[0] > now}
+            self._entries[key] = (now + ttl, future.result())
+
+    def invalidate(self, *names: str):
+        """지정한 엔드포인트(없으면 전체)의 캐시 제거"""
+        self._generation += 1
+        for key in list(self._entries):
+            if not names or key[0] in names:
+                del self._entries[key]
+
+response_cache = ResponseCache(CACHE_TTL_SECONDS)
+
 # --- JWT 인증 ---
 security = HTTPBearer()
 
@@ -190,6 +302,8 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
         raise HTTPException(status_code=401, detail="Invalid token")
 
 # --- WebSocket 연결 관리 ---
+WS_SEND_TIMEOUT_SEC = 5
+
 class ConnectionManager:
     def __init__(self):
         self.active_connections: list[WebSocket] = []
@@ -205,13 +319,122 @@ class ConnectionManager:
         logger.info(f"WebSocket 해제: {len(self.active_connections)}개 활성")
     
     async def broadcast(self, message: dict):
-        for connection in self.active_connections:
+        """모든 클라이언트에 동시에 전송. 실패하거나 느린(WS_SEND_TIMEOUT_SEC 초과) 연결은 정리"""
+        connections = list(self.active_connections)
+        if not connections:
+            return
+        results = await asyncio.gather(
+            *(asyncio.wait_for(connection.send_json(message), WS_SEND_TIMEOUT_SEC) for connection in connections),
+            return_exceptions=True,
+        )
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.disconnect(connection)
+
+manager = ConnectionManager()
+
+# --- 실시간 이벤트 피드 (Redis Streams → WebSocket) ---
+LIVE_PRICE_MAX_AGE_SEC = int(os.getenv("LIVE_PRICE_MAX_AGE_SEC", "30"))
+STREAM_BLOCK_MS = 5000
+STREAM_READ_COUNT = 500
+
+class LiveFeed:
+    """
+    dashboard:events 스트림(가격 틱/체결/Scout 파이프라인)을 백엔드에서 한 번만 읽고,
+    읽은 묶음을 합쳐(종목별 최신 가격, 최신 파이프라인 상태) 모든 WebSocket 클라이언트에 보냅니다.
+    최신 가격은 /api/portfolio/positions에서도 재사용해 Gateway 호출을 줄입니다.
+    """
+
+    def __init__(self):
+        self.prices: dict[str, dict] = {}  # stock_code -> {"price", "at", "received_at"}
+        self.pipeline: Optional[dict] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def fresh_prices(self, max_age_sec: float = LIVE_PRICE_MAX_AGE_SEC) -> dict[str, float]:
+        """max_age_sec 이내에 받은 종목별 최신 가격"""
+        cutoff = datetime.now(timezone.utc).timestamp() - max_age_sec
+        return {code: tick["price"] for code, tick in self.prices.items() if tick["received_at"] >= cutoff}
+
+    def snapshot(self) -> dict:
+        """새로 연결한 클라이언트에 보내는 현재 상태"""
+        return {
+            "type": "snapshot",
+            "data": {
+                "prices": {code: tick["price"] for code, tick in self.prices.items()},
+                "pipeline": self.pipeline,
+            },
+        }
+
+    def apply(self, events: list) -> list[dict]:
+        """스트림 이벤트 묶음을 상태에 반영하고, 클라이언트에 보낼 변경분 메시지를 만듭니다."""
+        received_at = datetime.now(timezone.utc).timestamp()
+        prices, fills, pipeline = {}, [], None
+        for _, event in events:
+            data = event.get("data") or {}
+            event_type = event.get("type")
+            if event_type == STREAM_EVENT_PRICE and data.get("stock_code"):
+                prices[data["stock_code"]] = data.get("price")
+                self.prices[data["stock_code"]] = {
+                    "price": data.get("price"), "at": data.get("at"), "received_at": received_at,
+                }
+            elif event_type == STREAM_EVENT_FILL:
+                fills.append(data)
+            elif event_type == STREAM_EVENT_PIPELINE:
+                pipeline = self.pipeline = data
+
+        if fills:
+            # 체결이 있으면 요약/거래 내역 캐시를 바로 버림
+            response_cache.invalidate("portfolio_summary", "trades")
+
+        messages = []
+        if prices:
+            messages.append({"type": "prices", "data": prices})
+        messages.extend({"type": "fill", "data": fill} for fill in fills)
+        if pipeline is not None:
+            messages.append({"type": "pipeline", "data": pipeline})
+        return messages
+
+    async def run(self):
+        last_id = None
+        while True:
+            try:
+                r = await asyncio.to_thread(get_redis)
+                if r is None:
+                    await asyncio.sleep(STREAM_BLOCK_MS / 1000)
+                    continue
+                if last_id is None:
+                    last_id = await asyncio.to_thread(get_stream_last_id, redis_client=r)
+                events = await asyncio.to_thread(
+                    read_stream_events, last_id, STREAM_BLOCK_MS, STREAM_READ_COUNT, redis_client=r
+                )
+                if events is None:
+                    await asyncio.sleep(STREAM_BLOCK_MS / 1000)
+                    continue
+                if not events:
+                    continue
+                last_id = events[-1][0]
+                for message in self.apply(events):
+                    await manager.broadcast(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ 실시간 이벤트 피드 오류: {e}")
+                await asyncio.sleep(STREAM_BLOCK_MS / 1000)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
             try:
-                await connection.send_json(message)
-            except Exception:
+                await self._task
+            except asyncio.CancelledError:
                 pass
+            self._task = None
 
-manager = ConnectionManager()
+live_feed = LiveFeed()
 
 # --- Lifespan 이벤트 ---
 @asynccontextmanager
@@ -219,13 +442,22 @@ async def lifespan(app: FastAPI):
     logger.info("🚀 Dashboard V2 Backend 시작")
     # DB 엔진 초기화
     try:
-        ensure_engine_initialized()
+        await run_blocking(ensure_engine_initialized)
         logger.info("✅ DB 엔진 초기화 완료")
     except Exception as e:
         logger.error(f"❌ DB 엔진 초기화 실패: {e}")
     # Redis 연결
-    get_redis()
+    await run_blocking(get_redis)
+    # 실시간 이벤트 피드 (WebSocket 푸시)
+    live_feed.start()
     yield
+    await live_feed.stop()
+    for client in (http_client, docker_client):
+        if client is not None:
+            await client.aclose()
+    if async_redis_client is not None:
+        await async_redis_client.aclose()
+    db_executor.shutdown(wait=False)
     logger.info("👋 Dashboard V2 Backend 종료")
 
 # --- FastAPI 앱 ---
@@ -295,43 +527,55 @@ async def refresh_token(payload: dict = Depends(verify_token)):
 # 포트폴리오 API
 # =============================================================================
 
+def _load_portfolio_summary(known_prices: dict) -> PortfolioSummary:
+    with session_scope(readonly=True) as session:
+        summary = get_portfolio_summary(session, known_prices=known_prices)
+    return PortfolioSummary(
+        total_value=summary.get("total_value", 0),
+        total_invested=summary.get("total_invested", 0),
+        total_profit=summary.get("total_profit", 0),
+        profit_rate=summary.get("profit_rate", 0),
+        cash_balance=summary.get("cash_balance", 0),
+        positions_count=summary.get("positions_count", 0),
+    )
+
 @app.get("/api/portfolio/summary", response_model=PortfolioSummary)
 async def get_portfolio_summary_api(payload: dict = Depends(verify_token)):
-    """포트폴리오 요약 정보"""
+    """포트폴리오 요약 정보 (응답 캐시)"""
     try:
-        with get_session() as session:
-            summary = get_portfolio_summary(session)
-            return PortfolioSummary(
-                total_value=summary.get("total_value", 0),
-                total_invested=summary.get("total_invested", 0),
-                total_profit=summary.get("total_profit", 0),
-                profit_rate=summary.get("profit_rate", 0),
-                cash_balance=summary.get("cash_balance", 0),
-                positions_count=summary.get("positions_count", 0),
-            )
+        return await response_cache.get_or_load(
+            ("portfolio_summary",),
+            lambda: run_blocking(_load_portfolio_summary, live_feed.fresh_prices()),
+        )
     except Exception as e:
         logger.error(f"포트폴리오 요약 조회 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def _load_positions(known_prices: dict) -> list[Position]:
+    with session_scope(readonly=True) as session:
+        positions = get_portfolio_with_current_prices(session, known_prices=known_prices)
+    return [
+        Position(
+            stock_code=p["stock_code"],
+            stock_name=p["stock_name"],
+            quantity=p["quantity"],
+            avg_price=p["avg_price"],
+            current_price=p.get("current_price", p["avg_price"]),
+            profit=p.get("profit", 0),
+            profit_rate=p.get("profit_rate", 0),
+            weight=p.get("weight", 0),
+        )
+        for p in positions
+    ]
+
 @app.get("/api/portfolio/positions", response_model=list[Position])
 async def get_positions_api(payload: dict = Depends(verify_token)):
     """보유 종목 목록 (실시간 가격 포함)"""
     try:
-        with get_session() as session:
-            positions = get_portfolio_with_current_prices(session)
-            return [
-                Position(
-                    stock_code=p["stock_code"],
-                    stock_name=p["stock_name"],
-                    quantity=p["quantity"],
-                    avg_price=p["avg_price"],
-                    current_price=p.get("current_price", p["avg_price"]),
-                    profit=p.get("profit", 0),
-                    profit_rate=p.get("profit_rate", 0),
-                    weight=p.get("weight", 0),
-                )
-                for p in positions
-            ]
+        # 실시간 피드에 최근 가격이 있는 종목은 Gateway를 호출하지 않음
+        return await response_cache.get_or_load(
+            ("positions",), lambda: run_blocking(_load_positions, live_feed.fresh_prices())
+        )
     except Exception as e:
         logger.error(f"보유 종목 조회 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -340,26 +584,29 @@ async def get_positions_api(payload: dict = Depends(verify_token)):
 # Watchlist API
 # =============================================================================
 
+def _load_watchlist(limit: int) -> list[WatchlistItem]:
+    with session_scope(readonly=True) as session:
+        items = get_watchlist_all(session, limit=limit)
+        return [
+            WatchlistItem(
+                stock_code=item.stock_code,
+                stock_name=item.stock_name,
+                llm_score=item.llm_score,
+                per=item.per,
+                pbr=item.pbr,
+                is_tradable=item.is_tradable,
+            )
+            for item in items
+        ]
+
 @app.get("/api/watchlist", response_model=list[WatchlistItem])
 async def get_watchlist_api(
     limit: int = Query(50, ge=1, le=200),
     payload: dict = Depends(verify_token)
 ):
-    """관심 종목 목록"""
+    """관심 종목 목록 (응답 캐시)"""
     try:
-        with get_session() as session:
-            items = get_watchlist_all(session, limit=limit)
-            return [
-                WatchlistItem(
-                    stock_code=item.stock_code,
-                    stock_name=item.stock_name,
-                    llm_score=item.llm_score,
-                    per=item.per,
-                    pbr=item.pbr,
-                    is_tradable=item.is_tradable,
-                )
-                for item in items
-            ]
+        return await response_cache.get_or_load(("watchlist", limit), lambda: run_blocking(_load_watchlist, limit))
     except Exception as e:
         logger.error(f"Watchlist 조회 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -368,30 +615,35 @@ async def get_watchlist_api(
 # 거래 내역 API
 # =============================================================================
 
+def _load_trades(limit: int, offset: int) -> list[TradeRecord]:
+    with session_scope(readonly=True) as session:
+        trades = get_recent_trades(session, limit=limit, offset=offset)
+        return [
+            TradeRecord(
+                id=t.log_id,
+                stock_code=t.stock_code,
+                stock_name=None,  # TradeLog에는 stock_name이 없음
+                trade_type=t.trade_type,
+                quantity=t.quantity or 0,
+                price=t.price or 0,
+                total_amount=(t.quantity or 0) * (t.price or 0),
+                traded_at=t.trade_timestamp,
+                profit=None,
+            )
+            for t in trades
+        ]
+
 @app.get("/api/trades", response_model=list[TradeRecord])
 async def get_trades_api(
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
     payload: dict = Depends(verify_token)
 ):
-    """거래 내역"""
+    """거래 내역 (응답 캐시, 체결 이벤트 시 무효화)"""
     try:
-        with get_session() as session:
-            trades = get_recent_trades(session, limit=limit, offset=offset)
-            return [
-                TradeRecord(
-                    id=t.log_id,
-                    stock_code=t.stock_code,
-                    stock_name=None,  # TradeLog에는 stock_name이 없음
-                    trade_type=t.trade_type,
-                    quantity=t.quantity or 0,
-                    price=t.price or 0,
-                    total_amount=(t.quantity or 0) * (t.price or 0),
-                    traded_at=t.trade_timestamp,
-                    profit=None,
-                )
-                for t in trades
-            ]
+        return await response_cache.get_or_load(
+            ("trades", limit, offset), lambda: run_blocking(_load_trades, limit, offset)
+        )
     except Exception as e:
         logger.error(f"거래 내역 조회 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -400,22 +652,25 @@ async def get_trades_api(
 # 시스템 상태 API
 # =============================================================================
 
+def _load_scheduler_jobs() -> list[dict]:
+    with session_scope(readonly=True) as session:
+        return get_scheduler_jobs(session)
+
 @app.get("/api/system/status", response_model=list[SystemStatus])
 async def get_system_status_api(payload: dict = Depends(verify_token)):
     """시스템 서비스 상태 (Docker 컨테이너 기반)"""
     try:
-        with get_session() as session:
-            jobs = get_scheduler_jobs(session)
-            return [
-                SystemStatus(
-                    service_name=job.get("job_id", "unknown"),
-                    status="active" if job.get("enabled") else "inactive",
-                    last_run=job.get("last_run_at"),
-                    next_run=job.get("next_due_at"),
-                    message=f"Queue: {job.get('queue', 'N/A')}",
-                )
-                for job in jobs
-            ]
+        jobs = await run_blocking(_load_scheduler_jobs)
+        return [
+            SystemStatus(
+                service_name=job.get("job_id", "unknown"),
+                status="active" if job.get("enabled") else "inactive",
+                last_run=job.get("last_run_at"),
+                next_run=job.get("next_due_at"),
+                message=f"Queue: {job.get('queue', 'N/A')}",
+            )
+            for job in jobs
+        ]
     except Exception as e:
         logger.error(f"시스템 상태 조회 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -424,22 +679,20 @@ async def get_system_status_api(payload: dict = Depends(verify_token)):
 async def get_docker_status_api(payload: dict = Depends(verify_token)):
     """Docker 컨테이너 상태 (WSL2 환경) - Docker Socket API 사용"""
     try:
-        # httpx 동기 클라이언트로 Unix 소켓 통신
-        transport = httpx.HTTPTransport(uds="/var/run/docker.sock")
-        with httpx.Client(transport=transport, base_url="http://localhost") as client:
-            response = client.get("/containers/json")
-            containers_raw = response.json()
-            
-            containers = []
-            for c in containers_raw:
-                containers.append({
-                    "ID": c.get("Id", "")[:12],
-                    "Names": c.get("Names", [""])[0].lstrip("/"),
-                    "Image": c.get("Image", ""),
-                    "Status": c.get("Status", ""),
-                    "State": c.get("State", ""),
-                })
-            return {"containers": containers, "count": len(containers)}
+        # httpx 비동기 클라이언트로 Unix 소켓 통신
+        response = await get_docker_client().get("/containers/json")
+        containers_raw = response.json()
+        
+        containers = []
+        for c in containers_raw:
+            containers.append({
+                "ID": c.get("Id", "")[:12],
+                "Names": c.get("Names", [""])[0].lstrip("/"),
+                "Image": c.get("Image", ""),
+                "Status": c.get("Status", ""),
+                "State": c.get("State", ""),
+            })
+        return {"containers": containers, "count": len(containers)}
         
     except Exception as e:
         logger.error(f"Docker 상태 조회 실패: {e}")
@@ -457,84 +710,87 @@ async def get_rabbitmq_status_api(payload: dict = Depends(verify_token)):
         import base64
         auth = base64.b64encode(f"{rabbitmq_user}:{rabbitmq_pass}".encode()).decode()
         
-        async with httpx.AsyncClient() as client:
-            # 큐 목록 조회
-            response = await client.get(
-                f"{rabbitmq_url}/api/queues",
-                headers={"Authorization": f"Basic {auth}"},
-                timeout=10.0
-            )
+        client = get_http_client()
+        # 큐 목록 조회
+        response = await client.get(
+            f"{rabbitmq_url}/api/queues",
+            headers={"Authorization": f"Basic {auth}"},
+            timeout=10.0
+        )
+        
+        if response.status_code == 200:
+            queues_raw = response.json()
+            queues = []
+            for q in queues_raw:
+                queues.append({
+                    "name": q.get("name", ""),
+                    "messages": q.get("messages", 0),
+                    "messages_ready": q.get("messages_ready", 0),
+                    "messages_unacknowledged": q.get("messages_unacknowledged", 0),
+                    "consumers": q.get("consumers", 0),
+                    "state": q.get("state", "unknown")
+                })
+            return {"queues": queues, "count": len(queues)}
+        else:
+            return {"queues": [], "error": f"HTTP {response.status_code}"}
             
-            if response.status_code == 200:
-                queues_raw = response.json()
-                queues = []
-                for q in queues_raw:
-                    queues.append({
-                        "name": q.get("name", ""),
-                        "messages": q.get("messages", 0),
-                        "messages_ready": q.get("messages_ready", 0),
-                        "messages_unacknowledged": q.get("messages_unacknowledged", 0),
-                        "consumers": q.get("consumers", 0),
-                        "state": q.get("state", "unknown")
-                    })
-                return {"queues": queues, "count": len(queues)}
-            else:
-                return {"queues": [], "error": f"HTTP {response.status_code}"}
-                
     except Exception as e:
         logger.error(f"RabbitMQ 상태 조회 실패: {e}")
         return {"queues": [], "error": str(e)}
 
+def _load_scheduler_table() -> list[dict]:
+    """scheduler.jobs 테이블 조회 (스레드 풀에서 실행)"""
+    from sqlalchemy import text
+    with session_scope(readonly=True) as session:
+        # scheduler.jobs 테이블에서 작업 목록 조회
+        result = session.execute(text("""
+            SELECT 
+                job_id,
+                queue,
+                cron_expr,
+                interval_seconds,
+                enabled,
+                last_run_at,
+                last_status,
+                description,
+                created_at
+            FROM jobs
+            ORDER BY job_id
+        """))
+        
+        jobs = []
+        for row in result:
+            # interval_seconds를 사람이 읽기 쉬운 형태로 변환
+            interval = row.interval_seconds or 0
+            if interval >= 3600:
+                interval_str = f"{interval // 3600}시간"
+            elif interval >= 60:
+                interval_str = f"{interval // 60}분"
+            elif interval > 0:
+                interval_str = f"{interval}초"
+            else:
+                interval_str = row.cron_expr or "N/A"
+            
+            jobs.append({
+                "name": row.job_id,
+                "queue": row.queue,
+                "interval": interval_str,
+                "interval_seconds": interval,
+                "cron": row.cron_expr,
+                "is_active": row.enabled,
+                "last_run": row.last_run_at.isoformat() if row.last_run_at else None,
+                "last_status": row.last_status or "unknown",
+                "description": row.description,
+                "created_at": row.created_at.isoformat() if row.created_at else None
+            })
+    return jobs
+
 @app.get("/api/system/scheduler")
 async def get_scheduler_jobs_api(payload: dict = Depends(verify_token)):
     """Scheduler Jobs 상태 - DB에서 조회"""
     try:
-        from sqlalchemy import text
-        with get_session() as session:
-            # scheduler.jobs 테이블에서 작업 목록 조회
-            result = session.execute(text("""
-                SELECT 
-                    job_id,
-                    queue,
-                    cron_expr,
-                    interval_seconds,
-                    enabled,
-                    last_run_at,
-                    last_status,
-                    description,
-                    created_at
-                FROM jobs
-                ORDER BY job_id
-            """))
-            
-            jobs = []
-            for row in result:
-                # interval_seconds를 사람이 읽기 쉬운 형태로 변환
-                interval = row.interval_seconds or 0
-                if interval >= 3600:
-                    interval_str = f"{interval // 3600}시간"
-                elif interval >= 60:
-                    interval_str = f"{interval // 60}분"
-                elif interval > 0:
-                    interval_str = f"{interval}초"
-                else:
-                    interval_str = row.cron_expr or "N/A"
-                
-                jobs.append({
-                    "name": row.job_id,
-                    "queue": row.queue,
-                    "interval": interval_str,
-                    "interval_seconds": interval,
-                    "cron": row.cron_expr,
-                    "is_active": row.enabled,
-                    "last_run": row.last_run_at.isoformat() if row.last_run_at else None,
-                    "last_status": row.last_status or "unknown",
-                    "description": row.description,
-                    "created_at": row.created_at.isoformat() if row.created_at else None
-                })
-            
-            return {"jobs": jobs, "count": len(jobs)}
-            
+        jobs = await run_blocking(_load_scheduler_table)
+        return {"jobs": jobs, "count": len(jobs)}
     except Exception as e:
         logger.error(f"Scheduler Jobs 조회 실패: {e}")
         return {"jobs": [], "error": str(e)}
@@ -553,49 +809,49 @@ async def get_container_logs_api(
         # Loki 쿼리 - container 라벨로 필터링 (Promtail 설정에 따라 다름)
         query = f'{{container="{container_name}"}}'
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{loki_url}/loki/api/v1/query_range",
-                params={
-                    "query": query,
-                    "limit": limit,
-                    "since": since,
-                },
-                timeout=30.0
-            )
+        client = get_http_client()
+        response = await client.get(
+            f"{loki_url}/loki/api/v1/query_range",
+            params={
+                "query": query,
+                "limit": limit,
+                "since": since,
+            },
+            timeout=30.0
+        )
+        
+        if response.status_code == 200:
+            data = response.json()
+            logs = []
+            
+            # Loki 응답 파싱
+            results = data.get("data", {}).get("result", [])
+            for stream in results:
+                for value in stream.get("values", []):
+                    timestamp, log_line = value
+                    # 타임스탬프를 사람이 읽기 쉬운 형태로 변환
+                    from datetime import datetime
+                    ts = datetime.fromtimestamp(int(timestamp) / 1e9)
+                    logs.append({
+                        "timestamp": ts.strftime("%Y-%m-%d %H:%M:%S"),
+                        "message": log_line
+                    })
+            
+            # 시간순 정렬 (최신이 아래로)
+            logs.sort(key=lambda x: x["timestamp"])
+            
+            return {
+                "container": container_name,
+                "logs": logs[-limit:],  # 최신 limit개만
+                "count": len(logs)
+            }
+        else:
+            return {
+                "container": container_name,
+                "logs": [],
+                "error": f"Loki HTTP {response.status_code}"
+            }
             
-            if response.status_code == 200:
-                data = response.json()
-                logs = []
-                
-                # Loki 응답 파싱
-                results = data.get("data", {}).get("result", [])
-                for stream in results:
-                    for value in stream.get("values", []):
-                        timestamp, log_line = value
-                        # 타임스탬프를 사람이 읽기 쉬운 형태로 변환
-                        from datetime import datetime
-                        ts = datetime.fromtimestamp(int(timestamp) / 1e9)
-                        logs.append({
-                            "timestamp": ts.strftime("%Y-%m-%d %H:%M:%S"),
-                            "message": log_line
-                        })
-                
-                # 시간순 정렬 (최신이 아래로)
-                logs.sort(key=lambda x: x["timestamp"])
-                
-                return {
-                    "container": container_name,
-                    "logs": logs[-limit:],  # 최신 limit개만
-                    "count": len(logs)
-                }
-            else:
-                return {
-                    "container": container_name,
-                    "logs": [],
-                    "error": f"Loki HTTP {response.status_code}"
-                }
-                
     except Exception as e:
         logger.error(f"로그 조회 실패 ({container_name}): {e}")
         return {
@@ -611,12 +867,8 @@ async def get_container_logs_api(
 @app.get("/api/scout/status")
 async def get_scout_status_api(payload: dict = Depends(verify_token)):
     """Scout Pipeline 현재 상태"""
-    r = get_redis()
-    if not r:
-        return {"status": "unknown", "message": "Redis 연결 실패"}
-    
     try:
-        status = r.hgetall("scout:pipeline:status")
+        status = await get_async_redis().hgetall("scout:pipeline:status")
         return {
             "phase": int(status.get("phase", 0)),
             "phase_name": status.get("phase_name", "대기"),
@@ -627,6 +879,7 @@ async def get_scout_status_api(payload: dict = Depends(verify_token)):
             "passed_phase1": int(status.get("passed_phase1", 0)),
             "passed_phase2": int(status.get("passed_phase2", 0)),
             "final_selected": int(status.get("final_selected", 0)),
+            "stage_latency": json.loads(status.get("stage_latency") or "{}"),
             "last_updated": status.get("last_updated"),
         }
     except Exception as e:
@@ -636,12 +889,8 @@ async def get_scout_status_api(payload: dict = Depends(verify_token)):
 @app.get("/api/scout/results")
 async def get_scout_results_api(payload: dict = Depends(verify_token)):
     """Scout Pipeline 최근 결과"""
-    r = get_redis()
-    if not r:
-        return {"results": [], "message": "Redis 연결 실패"}
-    
     try:
-        results_json = r.get("scout:pipeline:results")
+        results_json = await get_async_redis().get("scout:pipeline:results")
         if results_json:
             return {"results": json.loads(results_json)}
         return {"results": []}
@@ -653,13 +902,8 @@ async def get_scout_results_api(payload: dict = Depends(verify_token)):
 # 뉴스 & 감성 API
 # =============================================================================
 
-@app.get("/api/news/sentiment")
-async def get_news_sentiment_api(
-    stock_code: Optional[str] = None,
-    limit: int = Query(20, ge=1, le=100),
-    payload: dict = Depends(verify_token)
-):
-    """뉴스 감성 점수 (shared/database.py의 sentiment:{code} 키 사용)"""
+def _load_news_sentiment(stock_code: Optional[str], limit: int) -> dict:
+    """감성 점수 조회 (동기 Redis 헬퍼 + WatchList 종목명, 스레드 풀에서 실행)"""
     r = get_redis()
     if not r:
         return {"items": [], "message": "Redis 연결 실패"}
@@ -667,10 +911,8 @@ async def get_news_sentiment_api(
     try:
         if stock_code:
             # 특정 종목의 감성 점수
-            data = r.get(f"sentiment:{stock_code}")
-            if data:
-                import json
-                parsed = json.loads(data)
+            parsed = get_sentiment_scores([stock_code], redis_client=r).get(stock_code)
+            if parsed:
                 return {
                     "stock_code": stock_code,
                     "stock_name": parsed.get("stock_name"),
@@ -687,55 +929,61 @@ async def get_news_sentiment_api(
                 "source_url": None,
             }
         else:
-            # 전체 감성 점수 (상위 N개) - sentiment:* 키 조회
-            keys = r.keys("sentiment:*")
-            items = []
-            import json
+            # 전체 감성 점수 (상위 N개) - 순위 zset에서 상위 N개만 조회 (KEYS + 키별 GET 제거)
+            top = get_top_sentiment_scores(limit, redis_client=r)
             
-            # [Fix] 종목명 매핑을 위해 WatchList 조회 (Redis에 없을 경우 대비)
+            # [Fix] Redis에 종목명이 없는 종목만 WatchList에서 IN 조회
+            missing_names = [code for code, parsed in top if not parsed.get("stock_name")]
             stock_names_map = {}
-            try:
-                with get_session() as session:
-                    # 간단히 모든 최근 종목 이름을 가져옴 (혹은 필요한 것만 in 절로 최적화 가능하지만 여기서 간단히)
-                    # 성능 이슈가 있다면 keys에서 code 추출 후 IN 쿼리 사용 권장
-                    w_list = session.query(WatchList.stock_code, WatchList.stock_name).all()
-                    for w in w_list:
-                        stock_names_map[w.stock_code] = w.stock_name
-            except Exception as e:
-                logger.warning(f"종목명 매핑 조회 실패: {e}")
-
-            for key in keys[:limit*2]: # Limit보다 넉넉히 조회 후 정렬
-                code = key.split(":")[-1] if isinstance(key, str) else key.decode().split(":")[-1]
-                data = r.get(key)
-                if data:
-                    parsed = json.loads(data) if isinstance(data, str) else json.loads(data.decode())
-                    
-                    # Redis에 저장된 이름 사용, 없으면 DB 매핑 사용, 없으면 코드 사용
-                    s_name = parsed.get("stock_name") or stock_names_map.get(code) or code
-                    
-                    items.append({
-                        "stock_code": code,
-                        "stock_name": s_name,
-                        "sentiment_score": parsed.get("score"),
-                        "reason": parsed.get("reason"),
-                        "source_url": parsed.get("source_url"),
-                        "updated_at": parsed.get("updated_at")
-                    })
-            items.sort(key=lambda x: x["sentiment_score"] or 0, reverse=True)
-            return {"items": items[:limit]}
+            if missing_names:
+                try:
+                    with session_scope(readonly=True) as session:
+                        w_list = (session.query(WatchList.stock_code, WatchList.stock_name)
+                                  .filter(WatchList.stock_code.in_(missing_names)).all())
+                        for w in w_list:
+                            stock_names_map[w.stock_code] = w.stock_name
+                except Exception as e:
+                    logger.warning(f"종목명 매핑 조회 실패: {e}")
+
+            items = []
+            for code, parsed in top:
+                # Redis에 저장된 이름 사용, 없으면 DB 매핑 사용, 없으면 코드 사용
+                s_name = parsed.get("stock_name") or stock_names_map.get(code) or code
+                items.append({
+                    "stock_code": code,
+                    "stock_name": s_name,
+                    "sentiment_score": parsed.get("score"),
+                    "reason": parsed.get("reason"),
+                    "source_url": parsed.get("source_url"),
+                    "updated_at": parsed.get("updated_at")
+                })
+            return {"items": items}
     except Exception as e:
         logger.error(f"뉴스 감성 조회 실패: {e}")
         return {"items": [], "error": str(e)}
 
+@app.get("/api/news/sentiment")
+async def get_news_sentiment_api(
+    stock_code: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    payload: dict = Depends(verify_token)
+):
+    """뉴스 감성 점수 (shared/redis_cache의 sentiment 해시 / sentiment_rank 순위 사용)"""
+    return await run_blocking(_load_news_sentiment, stock_code, limit)
+
 # =============================================================================
 # WebSocket 실시간 업데이트
 # =============================================================================
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
-    """실시간 업데이트 WebSocket"""
+    """
+    실시간 업데이트 WebSocket
+    연결 시 현재 상태(snapshot)를 보내고, 이후 prices/fill/pipeline 변경분을 푸시합니다.
+    """
     await manager.connect(websocket)
     try:
+        await websocket.send_json(live_feed.snapshot())
         while True:
             # 클라이언트로부터 메시지 수신 (ping/pong)
             data = await websocket.receive_text()
@@ -19,6 +19,8 @@ API 엔드포인트:
 - POST /api/order/sell: 매도 주문
 - GET /api/stock/{code}: 종목 정보
 - POST /api/market-data/snapshot: 현재가 조회
+- POST /api/market-data/snapshots: 여러 종목 현재가 일괄 조회
+- POST /api/market-data/investor-trend: 투자자별 매매 동향
 - GET /api/balance: 잔고 조회
 
 Circuit Breaker 설정:
@@ -31,6 +33,9 @@ Circuit Breaker 설정:
 - PORT: HTTP 서버 포트 (기본: 8080)
 - TRADING_MODE: REAL/MOCK
 - SECRETS_FILE: secrets.json 경로
+- SNAPSHOT_CACHE_TTL: 장중 현재가 캐시 TTL 초 (기본: 2, 0이면 캐시 안 함)
+- SNAPSHOT_CACHE_TTL_OFF_HOURS: 장외 현재가 캐시 TTL 초 (기본: 60)
+- SNAPSHOT_BATCH_MAX: 일괄 조회 최대 종목 수 (기본: 200)
 """
 
 import os
@@ -38,9 +43,11 @@ import sys
 import time
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from flask import Flask, request, jsonify
 from collections import deque
+import pytz
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from pybreaker import CircuitBreaker, CircuitBreakerError, CircuitBreakerListener
@@ -51,6 +58,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 import shared.auth as auth
 from shared.kis.client import KISClient
+from shared.kis.quote_cache import QuoteCache
 import shared.database as database
 
 # 로깅 설정
@@ -139,6 +147,39 @@ stats = {
     'request_history': deque(maxlen=100)  # 최근 100개 요청 기록
 }
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 현재가 캐시 (짧은 TTL + 동시 동일 요청 합치기)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+SNAPSHOT_CACHE_TTL = float(os.getenv('SNAPSHOT_CACHE_TTL', '2'))
+SNAPSHOT_CACHE_TTL_OFF_HOURS = float(os.getenv('SNAPSHOT_CACHE_TTL_OFF_HOURS', '60'))
+SNAPSHOT_BATCH_MAX = int(os.getenv('SNAPSHOT_BATCH_MAX', '200'))
+SNAPSHOT_BATCH_WORKERS = int(os.getenv('SNAPSHOT_BATCH_WORKERS', '4'))
+_KST = pytz.timezone('Asia/Seoul')
+
+
+def _snapshot_cache_ttl():
+    """장중(평일 09:00~15:30 KST)에는 짧게, 장외에는 길게"""
+    if SNAPSHOT_CACHE_TTL <= 0:
+        return 0
+    now = datetime.now(_KST)
+    hhmm = now.hour * 100 + now.minute
+    if now.weekday() <= 4 and 900 <= hhmm <= 1530:
+        return SNAPSHOT_CACHE_TTL
+    return max(SNAPSHOT_CACHE_TTL, SNAPSHOT_CACHE_TTL_OFF_HOURS)
+
+
+snapshot_cache = QuoteCache(ttl=_snapshot_cache_ttl)
+snapshot_executor = ThreadPoolExecutor(max_workers=SNAPSHOT_BATCH_WORKERS, thread_name_prefix="snapshot")
+
+
+def fetch_snapshot_cached(stock_code, is_index=False):
+    """캐시 경유 현재가 조회 (캐시 미스일 때만 Circuit Breaker 경유 KIS 호출)"""
+    return snapshot_cache.get_or_fetch(
+        (stock_code, bool(is_index)),
+        lambda: call_kis_api_with_breaker(kis_client.get_stock_snapshot, stock_code, is_index=is_index),
+    )
+
 
 def initialize_kis_client():
     """KIS Client 초기화"""
@@ -349,13 +390,9 @@ def get_snapshot():
             stats['failed_requests'] += 1
             return jsonify({"error": "stock_code required"}), 400
         
-        # KIS API 호출 (Circuit Breaker 적용)
+        # KIS API 호출 (캐시 → Circuit Breaker)
         logger.info(f"📊 [Gateway] Snapshot 요청: {stock_code}")
-        snapshot = call_kis_api_with_breaker(
-            kis_client.get_stock_snapshot, 
-            stock_code, 
-            is_index=is_index
-        )
+        snapshot = fetch_snapshot_cached(stock_code, is_index=is_index)
         
         if snapshot is None:
              raise Exception("Failed to get snapshot from KIS API")
@@ -388,6 +425,128 @@ def get_snapshot():
         return jsonify({"error": str(e)}), 500
 
 
+@app.route('/api/market-data/snapshots', methods=['POST'])
+@limiter.limit(GLOBAL_RATE_LIMIT)
+def get_snapshots():
+    """
+    여러 종목 현재가 일괄 조회
+    요청: {"stock_codes": [...], "is_index": false}
+    응답: {"success": true, "data": {code: snapshot}, "failed": [code, ...]}
+    """
+    start_time = time.time()
+    stats['total_requests'] += 1
+    
+    data = request.get_json() or {}
+    stock_codes = data.get('stock_codes') or []
+    is_index = data.get('is_index', False)
+    
+    if not isinstance(stock_codes, list) or not stock_codes:
+        stats['failed_requests'] += 1
+        return jsonify({"error": "stock_codes (list) required"}), 400
+    stock_codes = list(dict.fromkeys(str(code) for code in stock_codes))
+    if len(stock_codes) > SNAPSHOT_BATCH_MAX:
+        stats['failed_requests'] += 1
+        return jsonify({"error": f"too many stock_codes (max {SNAPSHOT_BATCH_MAX})"}), 400
+    
+    logger.info(f"📊 [Gateway] Snapshots 일괄 요청: {len(stock_codes)}개 종목")
+    
+    def _fetch(code):
+        try:
+            return code, fetch_snapshot_cached(code, is_index=is_index), None
+        except Exception as e:
+            return code, None, e
+    
+    results = {}
+    failed = []
+    breaker_open = False
+    for code, snapshot, error in snapshot_executor.map(_fetch, stock_codes):
+        if snapshot is None:
+            failed.append(code)
+            breaker_open = breaker_open or isinstance(error, CircuitBreakerError)
+            if error is not None and not isinstance(error, CircuitBreakerError):
+                logger.warning(f"⚠️ Snapshot 일괄 조회 중 오류 ({code}): {error}")
+        else:
+            results[code] = snapshot
+    
+    if not results and breaker_open:
+        stats['failed_requests'] += 1
+        logger.error("🚨 Circuit Breaker OPEN: Snapshots 일괄 조회 차단")
+        return jsonify({"error": "Circuit Breaker OPEN - KIS API 일시적으로 사용 불가"}), 503
+    
+    if results:
+        stats['successful_requests'] += 1
+    else:
+        stats['failed_requests'] += 1
+    
+    response_time = time.time() - start_time
+    stats['request_history'].append({
+        'endpoint': '/api/market-data/snapshots',
+        'timestamp': datetime.now().isoformat(),
+        'response_time': response_time,
+        'status': 'success' if results else 'failed',
+        'count': len(stock_codes),
+        'failed': len(failed)
+    })
+    
+    return jsonify({
+        "success": bool(results),
+        "data": results,
+        "failed": failed,
+        "response_time": response_time
+    }), 200
+
+
+@app.route('/api/market-data/investor-trend', methods=['POST'])
+@limiter.limit(GLOBAL_RATE_LIMIT)
+def get_investor_trend():
+    """투자자별(외국인/기관/개인) 매매 동향 조회 (Proxy)"""
+    start_time = time.time()
+    stats['total_requests'] += 1
+    
+    try:
+        data = request.get_json() or {}
+        stock_code = data.get('stock_code')
+        
+        if not stock_code:
+            stats['failed_requests'] += 1
+            return jsonify({"error": "stock_code required"}), 400
+        
+        logger.info(f"👥 [Gateway] Investor Trend 요청: {stock_code}")
+        trends = call_kis_api_with_breaker(
+            kis_client.market_data.get_investor_trend,
+            stock_code,
+            start_date=data.get('start_date'),
+            end_date=data.get('end_date')
+        )
+
+        stats['successful_requests'] += 1
+        
+        response_time = time.time() - start_time
+        stats['request_history'].append({
+            'endpoint': '/api/market-data/investor-trend',
+            'timestamp': datetime.now().isoformat(),
+            'response_time': response_time,
+            'status': 'success',
+            'stock_code': stock_code
+        })
+        
+        return jsonify({
+            "success": True,
+            "data": trends or [],
+            "response_time": response_time
+        }), 200
+            
+    except CircuitBreakerError as e:
+        stats['failed_requests'] += 1
+        logger.error(f"🚨 Circuit Breaker OPEN: {e}")
+        return jsonify({"error": "Circuit Breaker OPEN - KIS API 일시적으로 사용 불가"}), 503
+        
+    except Exception as e:
+        stats['failed_requests'] += 1
+        logger.error(f"❌ Investor Trend 오류: {e}", exc_info=True)
+        return jsonify({"error": str(e)}), 500
+
+
 @app.route('/api/trading/buy', methods=['POST'])
 @limiter.limit(GLOBAL_RATE_LIMIT)
 def place_buy_order():
@@ -692,6 +851,7 @@ def get_stats():
             "rate_limited": stats['rate_limited_requests'],
             "success_rate": f"{(stats['successful_requests'] / max(stats['total_requests'], 1) * 100):.1f}%"
         },
+        "snapshot_cache": snapshot_cache.get_stats(),
         "recent_requests": list(stats['request_history'])[-10:]  # 최근 10개
     }), 200
 
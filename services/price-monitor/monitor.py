@@ -8,6 +8,8 @@ import os
 from datetime import datetime
 from threading import Event
 
+import pandas as pd
+
 # shared 패키지 임포트
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
@@ -45,6 +47,13 @@ class PriceMonitor:
         logger.info(f"Price Monitor 설정: TRADING_MODE={trading_mode}, USE_WEBSOCKET={self.use_websocket}")
         
         self.portfolio_cache = {}
+        # 종목코드 -> 보유 건 리스트 (틱마다 portfolio_cache 전체를 훑지 않도록)
+        self.holdings_by_code = {}
+        # 종목별 증분 지표 상태 (구독 시점에 일봉으로 시드, 틱마다 O(1) 평가)
+        self.indicator_states = {}
+        # Dashboard 가격 틱 발행 (종목별 최소 간격, 가격이 바뀐 경우만)
+        self.tick_publish_interval = float(os.getenv("DASHBOARD_TICK_INTERVAL_SEC", "1.0"))
+        self._last_published_ticks = {}  # stock_code -> (price, published_at)
     
     def start_monitoring(self, dry_run: bool = True):
         logger.info("=== 가격 모니터링 시작 ===")
@@ -96,7 +105,9 @@ class PriceMonitor:
                     continue
                 
                 portfolio_codes = list(set(item['code'] for item in portfolio))
-                self.portfolio_cache = {item['id']: item for item in portfolio}
+                self._set_portfolio_cache(portfolio)
+                # 틱 처리 경로에서 DB를 조회하지 않도록 구독 전에 지표 상태를 한 번에 시드
+                self._seed_indicator_states(portfolio_codes)
                 
                 self.kis.websocket.start_realtime_monitoring(
                     portfolio_codes=portfolio_codes,
@@ -119,6 +130,8 @@ class PriceMonitor:
                     if now - last_status_log_time >= 600:
                         logger.info(f"   (WS) [상태 체크] 연결 유지 중, 감시: {len(self.portfolio_cache)}개")
                         last_status_log_time = now
+                    # 일 변경 시 재시드는 틱 핸들러가 아닌 이 루프에서 수행 (보유 종목은 디스패치 스레드가 제거하므로 복사본 순회)
+                    self._reseed_stale_indicator_states(list(self.holdings_by_code))
                     if now - last_alert_check >= self.alert_check_interval:
                         self._process_price_alerts()
                         last_alert_check = now
@@ -148,27 +161,34 @@ class PriceMonitor:
                     time.sleep(check_interval)
                     continue
                 
+                self._reseed_stale_indicator_states(set(item['code'] for item in portfolio))
+                
+                trading_mode = os.getenv("TRADING_MODE", "MOCK")
+                snapshots = {}
+                if trading_mode != "MOCK":
+                    # 보유 종목 현재가를 한 번에 조회 (Gateway: 일괄 엔드포인트 1회)
+                    snapshots = self.kis.get_stock_snapshots(list(dict.fromkeys(item['code'] for item in portfolio)))
+                
                 for holding in portfolio:
                     if self.stop_event.is_set(): break
                     
                     stock_code = holding['code']
-                    trading_mode = os.getenv("TRADING_MODE", "MOCK")
                     
                     if trading_mode == "MOCK":
                         with session_scope(readonly=True) as session:
                             prices = database.get_daily_prices(session, stock_code, limit=1)
                             current_price = float(prices['CLOSE_PRICE'].iloc[-1]) if not prices.empty else 0
                     else:
-                        snap = self.kis.get_stock_snapshot(stock_code)
+                        snap = snapshots.get(stock_code)
                         current_price = snap['price'] if snap else 0
                     
                     if current_price <= 0: continue
+                    self._publish_price_tick(stock_code, current_price)
                     
-                    with session_scope(readonly=True) as session: # _check_sell_signal이 session을 받도록 수정
-                        signal = self._check_sell_signal(
-                            session, stock_code, holding.get('name', stock_code),
-                            holding['avg_price'], current_price, holding
-                        )
+                    signal = self._check_sell_signal(
+                        stock_code, holding.get('name', stock_code),
+                        holding['avg_price'], current_price, holding
+                    )
                     
                     if signal:
                         logger.info(f"🔔 매도 신호 발생: {holding.get('name', stock_code)}")
@@ -185,14 +205,56 @@ class PriceMonitor:
                 logger.error(f"모니터링 루프 오류: {e}")
                 time.sleep(check_interval)
     
-    def _check_sell_signal(self, session, stock_code, stock_name, buy_price, current_price, holding):
+    # ============================================================================
+    # 증분 지표 상태 관리
+    # ============================================================================
+    def _needs_reseed(self, stock_code) -> bool:
+        state = self.indicator_states.get(stock_code)
+        return state is None or state.is_stale(datetime.now().date())
+
+    def _reseed_stale_indicator_states(self, stock_codes):
+        """구독/폴링 갱신 루프에서 호출: 상태가 없거나 전일 시드인 종목만 재시드"""
+        self._seed_indicator_states([code for code in stock_codes if self._needs_reseed(code)])
+
+    def _seed_indicator_states(self, stock_codes):
+        """
+        일봉(최근 30일)을 한 번의 배치 쿼리로 읽어 종목별 지표 상태를 (재)생성합니다.
+        구독 시점과 갱신 루프의 일 변경(day rollover) 시에만 호출되며, 틱 경로에서는 호출하지 않습니다.
+        조회 실패 시 빈 상태를 저장해 다음 갱신까지 재조회하지 않습니다 (고정 손절/목표가만 평가).
+        """
+        if not stock_codes:
+            return
+        today = datetime.now().date()
+        try:
+            with session_scope(readonly=True) as session:
+                prices_by_code = database.get_daily_prices_batch(session, list(stock_codes), limit=30)
+        except Exception as e:
+            logger.error(f"지표 상태 시드 실패: {e}")
+            prices_by_code = {}
+
+        states = dict(self.indicator_states)
+        for code in stock_codes:
+            daily_prices = prices_by_code.get(code)
+            if not isinstance(daily_prices, pd.DataFrame):
+                daily_prices = None
+            states[code] = strategy.IncrementalIndicatorState(code, daily_prices, seed_date=today)
+        # 틱 스레드가 항상 완성된 dict를 보도록 통째로 교체
+        self.indicator_states = states
+        logger.info(f"   지표 상태 시드 완료: {len(stock_codes)}개 종목")
+
+    def _get_indicator_state(self, stock_code):
+        # 틱 경로: 메모리 상태만 읽음 (시드/재시드는 갱신 루프 담당)
+        return self.indicator_states.get(stock_code)
+
+    def _check_sell_signal(self, stock_code, stock_name, buy_price, current_price, holding):
         try:
             profit_pct = ((current_price - buy_price) / buy_price) * 100
-            daily_prices = database.get_daily_prices(session, stock_code, limit=30)
+            indicators = self._get_indicator_state(stock_code)
+            bar_count = indicators.bar_count if indicators else 0
             
             # 1. ATR Trailing Stop
-            if not daily_prices.empty and len(daily_prices) >= 15:
-                atr = strategy.calculate_atr(daily_prices, period=14)
+            if bar_count >= 15:
+                atr = indicators.atr
                 if atr:
                     mult = self.config.get_float('ATR_MULTIPLIER', default=2.0)
                     stop_price = buy_price - (mult * atr)
@@ -211,9 +273,8 @@ class PriceMonitor:
                 return {"signal": True, "reason": f"Fixed Stop Loss: {profit_pct:.2f}% (Limit: {stop_loss}%)", "quantity_pct": 100.0}
 
             # 2. RSI Overbought (Scale-out)
-            if not daily_prices.empty and len(daily_prices) >= 15:
-                prices = daily_prices['CLOSE_PRICE'].tolist() + [current_price]
-                rsi = strategy.calculate_rsi(prices[::-1], period=14)
+            if bar_count >= 15:
+                rsi = indicators.rsi(current_price)
                 threshold = self.config.get_float('SELL_RSI_OVERBOUGHT_THRESHOLD', default=75.0)
                 if rsi and rsi >= threshold:
                     return {"signal": True, "reason": f"RSI Overbought ({rsi:.1f})", "quantity_pct": 50.0}
@@ -224,12 +285,8 @@ class PriceMonitor:
                 return {"signal": True, "reason": f"Target Profit: {profit_pct:.2f}%", "quantity_pct": 100.0}
             
             # 4. Death Cross
-            if not daily_prices.empty and len(daily_prices) >= 20:
-                import pandas as pd
-                new_row = pd.DataFrame([{'PRICE_DATE': datetime.now(), 'CLOSE_PRICE': current_price, 'OPEN_PRICE': current_price, 'HIGH_PRICE': current_price, 'LOW_PRICE': current_price}])
-                df = pd.concat([daily_prices, new_row], ignore_index=True)
-                if strategy.check_death_cross(df):
-                    return {"signal": True, "reason": "Death Cross", "quantity_pct": 100.0}
+            if bar_count >= 20 and indicators.is_death_cross(current_price):
+                return {"signal": True, "reason": "Death Cross", "quantity_pct": 100.0}
             
             # 5. Max Holding Days
             if holding.get('buy_date'):
@@ -242,26 +299,54 @@ class PriceMonitor:
             logger.error(f"[{stock_name}] 신호 체크 오류: {e}")
             return None
 
+    def _set_portfolio_cache(self, portfolio):
+        self.portfolio_cache = {item['id']: item for item in portfolio}
+        holdings_by_code = {}
+        for item in portfolio:
+            holdings_by_code.setdefault(item['code'], []).append(item)
+        self.holdings_by_code = holdings_by_code
+
+    def _remove_holding(self, holding):
+        self.portfolio_cache.pop(holding['id'], None)
+        remaining = [h for h in self.holdings_by_code.get(holding['code'], ()) if h['id'] != holding['id']]
+        if remaining:
+            self.holdings_by_code[holding['code']] = remaining
+        else:
+            self.holdings_by_code.pop(holding['code'], None)
+
     def _on_websocket_price_update(self, stock_code, current_price, current_high):
         try:
             # logger.debug(f"   (WS) [{stock_code}] {current_price}")
-            holdings = [h for h in self.portfolio_cache.values() if h['code'] == stock_code]
+            holdings = self.holdings_by_code.get(stock_code)
             if not holdings: return
+            self._publish_price_tick(stock_code, current_price)
             
-            for h in holdings:
-                with session_scope(readonly=True) as session:
-                    signal = self._check_sell_signal(session,
-                        stock_code, h.get('name', stock_code),
-                        h['avg_price'], current_price, h
-                    )
+            for h in list(holdings):
+                signal = self._check_sell_signal(
+                    stock_code, h.get('name', stock_code),
+                    h['avg_price'], current_price, h
+                )
                 if signal:
                     logger.info(f"🔔 (WS) 매도 신호: {h.get('name', stock_code)}")
                     self._publish_sell_order(signal, h, current_price)
                     # 중복 매도 방지 위해 캐시 제거
-                    self.portfolio_cache.pop(h['id'], None)
+                    self._remove_holding(h)
         except Exception as e:
             logger.error(f"❌ (WS) 오류: {e}")
 
+    def _publish_price_tick(self, stock_code, current_price):
+        """Dashboard 실시간 푸시용 가격 틱을 Redis 스트림에 추가 (종목별 간격 제한)"""
+        now = time.time()
+        last = self._last_published_ticks.get(stock_code)
+        if last and (last[0] == current_price or now - last[1] < self.tick_publish_interval):
+            return
+        self._last_published_ticks[stock_code] = (current_price, now)
+        redis_cache.append_stream_event(redis_cache.STREAM_EVENT_PRICE, {
+            "stock_code": stock_code,
+            "price": current_price,
+            "at": datetime.now().isoformat(),
+        })
+
     def _publish_sell_order(self, signal, holding, current_price):
         q_pct = signal.get('quantity_pct', 100.0)
         qty = int(holding['quantity'] * (q_pct / 100.0)) or 1
@@ -292,6 +377,7 @@ class PriceMonitor:
                 return
             
             trading_mode = os.getenv("TRADING_MODE", "MOCK")
+            snapshots = self.kis.get_stock_snapshots(list(alerts)) if trading_mode != "MOCK" else {}
             for code, info in alerts.items():
                 target = info.get("target_price")
                 alert_type = info.get("alert_type", "above")
@@ -303,7 +389,7 @@ class PriceMonitor:
                         prices = database.get_daily_prices(session, code, limit=1)
                         current_price = float(prices['CLOSE_PRICE'].iloc[-1]) if not prices.empty else 0
                 else:
-                    snap = self.kis.get_stock_snapshot(code)
+                    snap = snapshots.get(code)
                     current_price = snap.get("price", 0) if snap else 0
                 
                 if current_price <= 0:
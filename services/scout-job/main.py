@@ -129,6 +129,8 @@ def start_scheduler_worker():
         amqp_url=amqp_url,
         queue_name=queue_name,
         handler=handle_scheduler_job,
+        max_workers=1,  # 장시간 Scout 실행 중에도 I/O 스레드가 heartbeat 유지
+        ack_early=True,  # [v4.1] 수신 즉시 ACK (장시간 실행 중 재전달로 인한 중복 Scout 실행 방지)
     )
     scheduler_job_worker.start()
     logger.info("✅ Scout Job Scheduler Worker 시작 (queue=%s)", queue_name)
@@ -45,6 +45,7 @@ import shared.database as database
 from shared.db.connection import session_scope, ensure_engine_initialized
 from shared.kis import KISClient as KIS_API
 from shared.kis.gateway_client import KISGatewayClient
+from shared.kis.async_gateway_client import run_sync as run_gateway_async
 from shared.llm import JennieBrain
 from shared.financial_data_collector import batch_update_watchlist_financial_data
 from shared.gemini import ensure_gemini_api_key  # [v3.0] Local Gemini Auth 추가
@@ -132,12 +133,17 @@ from scout_optimizer import (
 # =============================================================================
 from scout_pipeline import (
     is_hybrid_scoring_enabled,
-    process_quant_scoring_task,
+    process_quant_scoring_batch,
     process_phase1_hunter_v5_task, process_phase23_judge_v5_task,
     process_phase1_hunter_task, process_phase23_debate_judge_task,
     process_llm_decision_task, fetch_kis_data_task,
 )
 
+# =============================================================================
+# [v1.2] Phase 1 Hunter → Phase 2-3 Debate/Judge 스트리밍 실행 (scout_stream.py)
+# =============================================================================
+from scout_stream import run_streaming_pipeline
+
 _redis_client = None  # scout_cache에서 관리하지만 호환성 유지
 
 
@@ -164,21 +170,31 @@ def prefetch_all_data(candidate_stocks: Dict[str, Dict], kis_api, vectorstore) -
     logger.info(f"   (Prefetch) KIS 스냅샷 조회 중...")
     snapshot_start = time.time()
     
-    def fetch_snapshot(code):
+    if isinstance(kis_api, KISGatewayClient):
+        # [v4.4] Gateway: 비동기 클라이언트로 일괄 조회 (동시성/속도 제한은 클라이언트가 관리)
         try:
-            if hasattr(kis_api, 'API_CALL_DELAY'):
-                time.sleep(kis_api.API_CALL_DELAY * 0.3)  # 약간의 딜레이
-            return code, kis_api.get_stock_snapshot(code)
+            snapshot_cache.update(run_gateway_async(
+                lambda client: client.get_stock_snapshots(stock_codes),
+                gateway_url=kis_api.gateway_url
+            ))
         except Exception as e:
-            logger.debug(f"   ⚠️ [{code}] Snapshot 조회 실패: {e}")
-            return code, None
-    
-    with ThreadPoolExecutor(max_workers=8) as executor:
-        futures = [executor.submit(fetch_snapshot, code) for code in stock_codes]
-        for future in as_completed(futures):
-            code, snapshot = future.result()
-            if snapshot:
-                snapshot_cache[code] = snapshot
+            logger.warning(f"   ⚠️ (Prefetch) 스냅샷 일괄 조회 실패: {e}")
+    else:
+        def fetch_snapshot(code):
+            try:
+                if hasattr(kis_api, 'API_CALL_DELAY'):
+                    time.sleep(kis_api.API_CALL_DELAY * 0.3)  # 약간의 딜레이
+                return code, kis_api.get_stock_snapshot(code)
+            except Exception as e:
+                logger.debug(f"   ⚠️ [{code}] Snapshot 조회 실패: {e}")
+                return code, None
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(fetch_snapshot, code) for code in stock_codes]
+            for future in as_completed(futures):
+                code, snapshot = future.result()
+                if snapshot:
+                    snapshot_cache[code] = snapshot
     
     snapshot_time = time.time() - snapshot_start
     logger.info(f"   (Prefetch) ✅ KIS 스냅샷 {len(snapshot_cache)}/{len(stock_codes)}개 조회 완료 ({snapshot_time:.1f}초)")
@@ -394,6 +410,32 @@ def fetch_stock_news_from_chroma(vectorstore, stock_code: str, stock_name: str,
 # - process_llm_decision_task, fetch_kis_data_task
 # =============================================================================
 
+def _stage_worker_counts(llm_max_workers: int) -> Tuple[int, int]:
+    """
+    [v1.2] 단계별 동시 실행 수 (Hunter, Debate/Judge)
+    두 단계가 겹쳐 실행되므로 모델별 Rate Limit에 맞게 따로 제한 (기본값: SCOUT_LLM_MAX_WORKERS)
+    """
+    hunter_workers = max(1, _parse_int_env(os.getenv("SCOUT_PHASE1_MAX_WORKERS"), llm_max_workers))
+    judge_workers = max(1, _parse_int_env(os.getenv("SCOUT_PHASE23_MAX_WORKERS"), llm_max_workers))
+    return hunter_workers, judge_workers
+
+
+def _stream_status_reporter(total_candidates: int, final_approved_list: List[Dict]):
+    """[v1.2] 스트리밍 진행 상황 → Dashboard 상태 (단계별 지연 시간 히스토그램 포함)"""
+    def report(stats):
+        phase, phase_name = (2, "Bull vs Bear Debate") if stats.hunter_finished else (1, "Hunter Scout")
+        update_pipeline_status(
+            phase=phase, phase_name=phase_name, status="running",
+            progress=stats.progress,
+            total_candidates=total_candidates,
+            passed_phase1=stats.hunter_passed,
+            passed_phase2=stats.judged,
+            final_selected=len(final_approved_list),
+            stage_latency=stats.latency_snapshot(),
+        )
+    return report
+
+
 def main():
     start_time = time.time()
     logger.info("--- 🤖 'Scout Job' [v3.0 Local] 실행 시작 ---")
@@ -552,46 +594,59 @@ def main():
             if 'archivist' not in locals():
                 archivist = Archivist(session_scope)
                 
-            def process_flow_data(code):
-                try:
-                    # 최근 1일치(오늘/어제) 데이터만 조회하여 현재 수급 확인
-                    # 장 중이면 오늘 잠정치/확정치, 장 마감 후면 오늘 확정치
-                    trends = kis_api.get_market_data().get_investor_trend(code, start_date=None, end_date=None)
-                    if not trends:
+            def fetch_latest_flows(codes):
+                """종목별 가장 최근(오늘) 투자자 동향 {code: latest}"""
+                # 최근 1일치(오늘/어제) 데이터만 사용하여 현재 수급 확인
+                # 장 중이면 오늘 잠정치/확정치, 장 마감 후면 오늘 확정치
+                if isinstance(kis_api, KISGatewayClient):
+                    # [v4.4] Gateway: 비동기 클라이언트로 일괄 조회
+                    trends_by_code = run_gateway_async(
+                        lambda client: client.get_investor_trends(codes),
+                        gateway_url=kis_api.gateway_url
+                    )
+                    return {code: max(trends, key=lambda row: row.get('date', ''))
+                            for code, trends in trends_by_code.items() if trends}
+                
+                def process_flow_data(code):
+                    try:
+                        trends = kis_api.market_data.get_investor_trend(code, start_date=None, end_date=None)
+                        # KIS 응답은 최신일 우선 순서이므로 날짜 기준으로 최신 행 선택
+                        return code, max(trends, key=lambda row: row.get('date', '')) if trends else None
+                    except Exception:
                         return code, None
+                
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    return {code: latest for code, latest in executor.map(process_flow_data, codes) if latest}
+
+            try:
+                latest_flows = fetch_latest_flows(list(candidate_stocks.keys()))
+            except Exception as flow_e:
+                logger.warning(f"   ⚠️ (Flow) 수급 데이터 조회 실패: {flow_e}")
+                latest_flows = {}
+
+            for code, flow_data in latest_flows.items():
+                if flow_data:
+                    investor_flow_cache[code] = flow_data
                     
-                    # 가장 최근 데이터 (오늘)
-                    latest = trends[-1]
-                    return code, latest
-                except Exception as e:
-                    return code, None
-
-            with ThreadPoolExecutor(max_workers=8) as executor:
-                futures = [executor.submit(process_flow_data, code) for code in candidate_stocks.keys()]
-                for future in as_completed(futures):
-                    code, flow_data = future.result()
-                    if flow_data:
-                        investor_flow_cache[code] = flow_data
-                        
-                        # 후보군 정보에 수급 데이터 추가 (LLM 프롬프트용)
-                        candidate_stocks[code]['market_flow'] = {
-                            'foreign_net_buy': flow_data['foreigner_net_buy'],
-                            'institution_net_buy': flow_data['institution_net_buy'],
-                            'individual_net_buy': flow_data['individual_net_buy']
-                        }
+                    # 후보군 정보에 수급 데이터 추가 (LLM 프롬프트용)
+                    candidate_stocks[code]['market_flow'] = {
+                        'foreign_net_buy': flow_data['foreigner_net_buy'],
+                        'institution_net_buy': flow_data['institution_net_buy'],
+                        'individual_net_buy': flow_data['individual_net_buy']
+                    }
+                    
+                    # Archivist에 기록 (Market Flow Snapshot)
+                    try:
+                        # flow_data는 dict 형태 (date, price, foreign..., institution...)
+                        # Archivist.log_market_flow_snapshot은 stock_code를 포함한 dict를 기대함
+                        log_payload = flow_data.copy()
+                        log_payload['stock_code'] = code
+                        # volume 필드가 get_investor_trend 결과에 없으므로 (필요시) 보완
+                        # log_payload['volume'] = ... 
                         
-                        # Archivist에 기록 (Market Flow Snapshot)
-                        try:
-                            # flow_data는 dict 형태 (date, price, foreign..., institution...)
-                            # Archivist.log_market_flow_snapshot은 stock_code를 포함한 dict를 기대함
-                            log_payload = flow_data.copy()
-                            log_payload['stock_code'] = code
-                            # volume 필드가 get_investor_trend 결과에 없으므로 (필요시) 보완
-                            # log_payload['volume'] = ... 
-                            
-                            archivist.log_market_flow_snapshot(log_payload)
-                        except Exception as log_e:
-                            logger.warning(f"Failed to log market flow for {code}: {log_e}")
+                        archivist.log_market_flow_snapshot(log_payload)
+                    except Exception as log_e:
+                        logger.warning(f"Failed to log market flow for {code}: {log_e}")
 
             logger.info(f"   (Flow) ✅ 수급 데이터 {len(investor_flow_cache)}개 종목 분석 및 기록 완료")
 
@@ -602,6 +657,9 @@ def main():
                 total_candidates=len(candidate_stocks)
             )
             
+            # [v1.2] 실행된 경로의 Hunter → Judge 스트리밍 집계 (최종 상태 보고용, 신규 LLM 호출이 없으면 None)
+            stream_stats = None
+
             # =============================================================
             # [v1.0] 하이브리드 스코어링 모드 분기
             # =============================================================
@@ -636,19 +694,9 @@ def main():
                     
                     # Step 1: 정량 점수 계산 (LLM 호출 없음, 비용 0원)
                     logger.info(f"\n   [v5 Step 1] 정량 점수 계산 ({len(candidate_stocks)}개 종목) - 비용 0원")
-                    quant_results = {}
-                    
-                    for code, info in candidate_stocks.items():
-                        if code == '0001':
-                            continue
-                        stock_info = {
-                            'code': code,
-                            'info': info,
-                            'snapshot': snapshot_cache.get(code),
-                        }
-                        quant_results[code] = process_quant_scoring_task(
-                            stock_info, quant_scorer, session, kospi_prices
-                        )
+                    quant_results = process_quant_scoring_batch(
+                        candidate_stocks, quant_scorer, session, kospi_prices, snapshot_cache
+                    )
                     
                     # Step 2: 정량 기반 1차 필터링 (하위 20% 탈락) - [v1.1] 필터링 완화
                     logger.info(f"\n   [v5 Step 2] 정량 기반 1차 필터링 (하위 20% 탈락)")
@@ -667,70 +715,52 @@ def main():
                     
                     llm_decision_records: Dict[str, Dict] = {}
                     llm_max_workers = max(1, _parse_int_env(os.getenv("SCOUT_LLM_MAX_WORKERS"), 4))
+                    hunter_workers, judge_workers = _stage_worker_counts(llm_max_workers)
                     
-                    # Phase 1: Hunter (통계 컨텍스트 포함)
-                    phase1_results = []
                     # [v6.0] Archivist 초기화 (Phase 1/2 공용)
                     archivist = Archivist(session_scope)
 
-                    with ThreadPoolExecutor(max_workers=llm_max_workers) as executor:
-                        future_to_code = {}
-                        for code in filtered_codes:
-                            info = candidate_stocks[code]
-                            quant_result = quant_results[code]
-                            payload = {'code': code, 'info': info}
-                            future = executor.submit(
-                                process_phase1_hunter_v5_task, 
-                                payload, brain, quant_result, snapshot_cache, news_cache, archivist
-                            )
-                            future_to_code[future] = code
-                        
-                        for future in as_completed(future_to_code):
-                            result = future.result()
-                            if result:
-                                phase1_results.append(result)
-                                if not result['passed']:
-                                    llm_decision_records[result['code']] = {
-                                        'code': result['code'],
-                                        'name': result['name'],
-                                        'llm_score': result['hunter_score'],
-                                        'llm_reason': result['hunter_reason'],
-                                        'is_tradable': False,
-                                        'approved': False,
-                                        'hunter_score': result['hunter_score'],
-                                        'llm_metadata': {'llm_grade': 'D', 'source': 'v5_hunter_reject'}
-                                    }
-                    
-                    phase1_passed = [r for r in phase1_results if r['passed']]
-                    logger.info(f"   ✅ v5 Hunter 통과: {len(phase1_passed)}/{len(filtered_codes)}개")
-                    
-                    # Phase 2-3: Debate + Judge (상위 종목만)
-                    PHASE2_MAX = int(os.getenv("SCOUT_PHASE2_MAX_ENTRIES", "50"))
-                    if len(phase1_passed) > PHASE2_MAX:
-                        phase1_passed_sorted = sorted(phase1_passed, key=lambda x: x['hunter_score'], reverse=True)
-                        phase1_passed = phase1_passed_sorted[:PHASE2_MAX]
-                    
-                    if phase1_passed:
-                        logger.info(f"\n   [v5 Step 4] Debate + Judge (하이브리드 점수 결합)")
-                        
-                        with ThreadPoolExecutor(max_workers=llm_max_workers) as executor:
-                            future_to_code = {}
-                            
-                            # [v6.0] Archivist 사용 (위에서 초기화됨)
-
-                            for p1_result in phase1_passed:
-                                future = executor.submit(
-                                    process_phase23_judge_v5_task, 
-                                    p1_result, brain, archivist, current_regime
-                                )
-                                future_to_code[future] = p1_result['code']
-                            
-                            for future in as_completed(future_to_code):
-                                record = future.result()
-                                if record:
-                                    llm_decision_records[record['code']] = record
-                                    if record.get('approved'):
-                                        final_approved_list.append(_record_to_watchlist_entry(record))
+                    def run_v5_hunter(code):
+                        payload = {'code': code, 'info': candidate_stocks[code]}
+                        return process_phase1_hunter_v5_task(
+                            payload, brain, quant_results[code], snapshot_cache, news_cache, archivist
+                        )
+
+                    def run_v5_judge(p1_result):
+                        return process_phase23_judge_v5_task(p1_result, brain, archivist, current_regime)
+
+                    def record_v5_hunter(result):
+                        if not result['passed']:
+                            llm_decision_records[result['code']] = {
+                                'code': result['code'],
+                                'name': result['name'],
+                                'llm_score': result['hunter_score'],
+                                'llm_reason': result['hunter_reason'],
+                                'is_tradable': False,
+                                'approved': False,
+                                'hunter_score': result['hunter_score'],
+                                'llm_metadata': {'llm_grade': 'D', 'source': 'v5_hunter_reject'}
+                            }
+
+                    def record_v5_judge(record):
+                        llm_decision_records[record['code']] = record
+                        if record.get('approved'):
+                            final_approved_list.append(_record_to_watchlist_entry(record))
+
+                    # [v1.2] Phase 1 Hunter → Phase 2-3 Debate + Judge 스트리밍
+                    # Hunter 통과 즉시 Judge 시작, Phase 2 진입은 동적 Top-K (SCOUT_PHASE2_MAX_ENTRIES)
+                    logger.info(f"\n   [v5 Step 4] Hunter → Debate + Judge 스트리밍 (Hunter {hunter_workers}개 / Judge {judge_workers}개 워커)")
+                    stream_stats = run_streaming_pipeline(
+                        sorted(filtered_codes), run_v5_hunter, run_v5_judge,
+                        max_entries=int(os.getenv("SCOUT_PHASE2_MAX_ENTRIES", "50")),
+                        hunter_workers=hunter_workers,
+                        judge_workers=judge_workers,
+                        on_hunter_result=record_v5_hunter,
+                        on_judge_result=record_v5_judge,
+                        on_progress=_stream_status_reporter(len(candidate_stocks), final_approved_list),
+                    )
+                    logger.info(f"   ✅ v5 Hunter 통과: {stream_stats.hunter_passed}/{len(filtered_codes)}개, "
+                                f"Debate + Judge: {stream_stats.admitted}개")
                     
                     logger.info(f"   ✅ v5 최종 승인: {len([r for r in llm_decision_records.values() if r.get('approved')])}개")
                     
@@ -758,6 +788,7 @@ def main():
             # =============================================================
             if not _v5_completed:
                 logger.info("   (Mode) v4.x 기존 LLM 기반 로직 실행")
+                stream_stats = None  # v5 실패 후 폴백이면 v5 집계는 버림
                 
                 # [v4.3] 새로운 캐시 시스템 - LLM_EVAL_CACHE 테이블 기반 직접 비교 (db_conn 사용)
                 llm_cache_snapshot = _load_llm_cache_from_db(session)
@@ -835,107 +866,79 @@ def main():
                     if brain is None:
                         logger.error("   (LLM) JennieBrain 초기화 실패로 신규 호출을 수행할 수 없습니다.")
                     else:
-                        # [v3.8] 2-Pass 병렬 처리 최적화
-                        # Pass 1: Phase 1 Hunter (Gemini-Flash) - 병렬로 빠르게 필터링
-                        logger.info(f"   (LLM) [Pass 1] Phase 1 Hunter 병렬 실행 시작 ({len(pending_codes)}개 종목)")
+                        # [v1.2] Phase 1 Hunter → Phase 2-3 Debate+Judge 스트리밍 (기존 [v3.8] 2-Pass 대체)
+                        # Hunter(Gemini-Flash) 통과 즉시 Debate-Judge(GPT-5-mini) 시작 → 느린 Hunter 호출이 Judge 단계를 막지 않음
+                        # Phase 2 진입 제한은 동적 Top-K (SCOUT_PHASE2_MAX_ENTRIES, [v4.1] 상위 N개 정렬 대체)
+                        # [v4.1] Claude Rate Limit 대응: 단계별 워커 수 제한 (기존 *2 제거)
+                        hunter_workers, judge_workers = _stage_worker_counts(llm_max_workers)
+                        hunter_workers = min(hunter_workers, len(pending_codes))
+                        logger.info(f"   (LLM) Phase 1 → 2-3 스트리밍 실행 시작 ({len(pending_codes)}개 종목, "
+                                    f"Hunter {hunter_workers}개 / Debate-Judge {judge_workers}개 워커)")
                         update_pipeline_status(
                             phase=1, phase_name="Hunter Scout", status="running",
                             total_candidates=len(candidate_stocks)
                         )
-                        phase1_start = time.time()
-                        
-                        phase1_results = []
-                        # [v4.1] Claude Rate Limit 대응: 워커 수 제한 (기존 *2 제거)
-                        phase1_worker_count = min(llm_max_workers, max(1, len(pending_codes)))
-                        logger.info(f"   (LLM) Phase 1 워커 수: {phase1_worker_count}개 (Rate Limit 대응)")
-                        
-                        with ThreadPoolExecutor(max_workers=phase1_worker_count) as executor:
-                            future_to_code = {}
-                            for code in pending_codes:
-                                payload = {
-                                    'code': code,
-                                    'info': candidate_stocks[code],
+                        stream_start = time.time()
+
+                        def run_hunter(code):
+                            # [v4.2] 캐시에서 데이터 조회하도록 변경 (API 호출 X)
+                            payload = {'code': code, 'info': candidate_stocks[code]}
+                            return process_phase1_hunter_task(payload, brain, snapshot_cache, news_cache)
+
+                        def record_hunter(result):
+                            # Phase 1 탈락 종목도 기록 (캐시용)
+                            if not result['passed']:
+                                llm_decision_records[result['code']] = {
+                                    'code': result['code'],
+                                    'name': result['name'],
+                                    'is_tradable': False,
+                                    'llm_score': result['hunter_score'],
+                                    'llm_reason': result['hunter_reason'] or 'Phase 1 필터링 탈락',
+                                    'approved': False,
+                                    'hunter_score': result['hunter_score'],  # [v4.3] 캐시 저장용
+                                    'llm_metadata': {
+                                        'llm_grade': 'D',
+                                        'llm_updated_at': _utcnow().isoformat(),
+                                        'source': 'llm_hunter_reject',
+                                    }
                                 }
-                                # [v4.2] 캐시에서 데이터 조회하도록 변경 (API 호출 X)
-                                future = executor.submit(process_phase1_hunter_task, payload, brain, snapshot_cache, news_cache)
-                                future_to_code[future] = code
-                            
-                            for future in as_completed(future_to_code):
-                                result = future.result()
-                                if result:
-                                    phase1_results.append(result)
-                                    # Phase 1 탈락 종목도 기록 (캐시용)
-                                    if not result['passed']:
-                                        llm_decision_records[result['code']] = {
-                                            'code': result['code'],
-                                            'name': result['name'],
-                                            'is_tradable': False,
-                                            'llm_score': result['hunter_score'],
-                                            'llm_reason': result['hunter_reason'] or 'Phase 1 필터링 탈락',
-                                            'approved': False,
-                                            'hunter_score': result['hunter_score'],  # [v4.3] 캐시 저장용
-                                            'llm_metadata': {
-                                                'llm_grade': 'D',
-                                                'llm_updated_at': _utcnow().isoformat(),
-                                                'source': 'llm_hunter_reject',
-                                            }
-                                        }
-                        
-                        phase1_passed_all = [r for r in phase1_results if r['passed']]
-                        phase1_time = time.time() - phase1_start
-                        logger.info(f"   (LLM) [Pass 1] Phase 1 완료: {len(phase1_passed_all)}/{len(pending_codes)}개 통과 ({phase1_time:.1f}초)")
-                        
-                        # [v4.1] Phase 2 진입 제한: 상위 50개만 (속도 최적화)
-                        PHASE2_MAX_ENTRIES = int(os.getenv("SCOUT_PHASE2_MAX_ENTRIES", "50"))
-                        if len(phase1_passed_all) > PHASE2_MAX_ENTRIES:
-                            phase1_passed_sorted = sorted(phase1_passed_all, key=lambda x: x['hunter_score'], reverse=True)
-                            phase1_passed = phase1_passed_sorted[:PHASE2_MAX_ENTRIES]
-                            logger.info(f"   (LLM) [속도 최적화] Phase 2 진입 제한: 상위 {PHASE2_MAX_ENTRIES}개만 선택 (전체 {len(phase1_passed_all)}개 중)")
-                        else:
-                            phase1_passed = phase1_passed_all
-                        
-                        # [v1.0] Redis 상태 업데이트 - Phase 1 완료
-                        update_pipeline_status(
-                            phase=2, phase_name="Bull vs Bear Debate", status="running",
-                            total_candidates=len(candidate_stocks),
-                            passed_phase1=len(phase1_passed_all)  # 전체 통과 수 표시
+
+                        def record_judge(record):
+                            nonlocal llm_invocation_count
+                            llm_invocation_count += 1
+                            llm_decision_records[record['code']] = record
+                            if record.get('approved'):
+                                final_approved_list.append(_record_to_watchlist_entry(record))
+
+                        stream_stats = run_streaming_pipeline(
+                            pending_codes, run_hunter,
+                            lambda phase1_result: process_phase23_debate_judge_task(phase1_result, brain),
+                            max_entries=int(os.getenv("SCOUT_PHASE2_MAX_ENTRIES", "50")),
+                            hunter_workers=hunter_workers,
+                            judge_workers=judge_workers,
+                            on_hunter_result=record_hunter,
+                            on_judge_result=record_judge,
+                            on_progress=_stream_status_reporter(len(candidate_stocks), final_approved_list),
                         )
-                        
-                        # Pass 2: Phase 2-3 Debate+Judge (GPT-5-mini) - 상위 종목만
-                        if phase1_passed:
-                            logger.info(f"   (LLM) [Pass 2] Phase 2-3 Debate-Judge 실행 ({len(phase1_passed)}개 종목)")
-                            phase23_start = time.time()
-                            
-                            phase23_worker_count = min(llm_max_workers, max(1, len(phase1_passed)))
-                            
-                            with ThreadPoolExecutor(max_workers=phase23_worker_count) as executor:
-                                future_to_code = {}
-                                for phase1_result in phase1_passed:
-                                    future = executor.submit(process_phase23_debate_judge_task, phase1_result, brain)
-                                    future_to_code[future] = phase1_result['code']
-                                
-                                for future in as_completed(future_to_code):
-                                    record = future.result()
-                                    if not record:
-                                        continue
-                                    llm_invocation_count += 1
-                                    llm_decision_records[record['code']] = record
-                                    if record.get('approved'):
-                                        final_approved_list.append(_record_to_watchlist_entry(record))
-                            
-                            phase23_time = time.time() - phase23_start
-                            logger.info(f"   (LLM) [Pass 2] Phase 2-3 완료 ({phase23_time:.1f}초)")
-                            
-                            # [v1.0] Redis 상태 업데이트 - Phase 2-3 완료
+                        stream_time = time.time() - stream_start
+                        latency = stream_stats.latency_snapshot()
+                        logger.info(f"   (LLM) Phase 1 통과: {stream_stats.hunter_passed}/{len(pending_codes)}개 "
+                                    f"(Hunter 평균 {latency['hunter']['avg_sec']}초)")
+                        logger.info(f"   (LLM) Phase 2-3 완료: {stream_stats.admitted}개 "
+                                    f"(Debate-Judge 평균 {latency['judge']['avg_sec']}초, 전체 {stream_time:.1f}초)")
+
+                        # [v1.0] Redis 상태 업데이트 - Phase 2-3 완료
+                        if stream_stats.admitted:
                             update_pipeline_status(
                                 phase=3, phase_name="Final Judge", status="running",
                                 total_candidates=len(candidate_stocks),
-                                passed_phase1=len(phase1_passed),
-                                passed_phase2=len(phase1_passed),  # Debate은 전원 참여
-                                final_selected=len(final_approved_list)
+                                passed_phase1=stream_stats.hunter_passed,
+                                passed_phase2=stream_stats.admitted,  # Debate은 진입 종목 전원 참여
+                                final_selected=len(final_approved_list),
+                                stage_latency=latency,
                             )
                         else:
-                            logger.info("   (LLM) [Pass 2] Phase 1 통과 종목 없음, Phase 2-3 건너뜀")
+                            logger.info("   (LLM) Phase 1 통과 종목 없음, Phase 2-3 건너뜀")
                 else:
                     logger.info("   (LLM) 모든 후보가 캐시로 충족되어 신규 호출이 없습니다.")
     
@@ -1013,10 +1016,11 @@ def main():
             update_pipeline_status(
                 phase=3, phase_name="Final Judge", status="completed",
                 progress=100,
-                total_candidates=len(candidate_stocks) if 'candidate_stocks' in locals() else 0,
-                passed_phase1=len(phase1_passed) if 'phase1_passed' in locals() else 0,
-                passed_phase2=len(phase1_passed) if 'phase1_passed' in locals() else 0,
-                final_selected=len(final_approved_list)
+                total_candidates=len(candidate_stocks),
+                passed_phase1=stream_stats.hunter_passed if stream_stats else 0,
+                passed_phase2=stream_stats.admitted if stream_stats else 0,
+                final_selected=len(final_approved_list),
+                stage_latency=stream_stats.latency_snapshot() if stream_stats else None,
             )
             
             # [v1.0] Redis 결과 저장 (Dashboard에서 조회용)
@@ -15,6 +15,7 @@ from typing import Dict, Tuple, List, Optional
 import redis
 
 import shared.database as database
+import shared.redis_cache as redis_cache
 
 logger = logging.getLogger(__name__)
 
@@ -62,29 +63,46 @@ def update_pipeline_status(
     total_candidates: int = 0,
     passed_phase1: int = 0,
     passed_phase2: int = 0,
-    final_selected: int = 0
+    final_selected: int = 0,
+    stage_latency: Optional[Dict] = None
 ):
     """
     [v1.0] Dashboard용 Redis 상태 업데이트
     Dashboard의 Scout Pipeline 페이지에서 실시간으로 진행 상황을 표시
+    [v1.1] 상태 해시와 함께 dashboard:events 스트림에도 추가 (WebSocket 푸시)
+    [v1.2] stage_latency: 단계별 지연 시간 히스토그램 (scout_stream.StageLatency.snapshot, 해시에는 JSON 문자열로 저장)
     """
     r = _get_redis()
     if not r:
         return
     
+    pipeline_status = {
+        "phase": phase,
+        "phase_name": phase_name,
+        "status": status,
+        "progress": progress,
+        "current_stock": current_stock or "",
+        "total_candidates": total_candidates,
+        "passed_phase1": passed_phase1,
+        "passed_phase2": passed_phase2,
+        "final_selected": final_selected,
+        "last_updated": _utcnow().isoformat(),
+    }
+    status_hash = dict(pipeline_status)
+    if stage_latency is not None:
+        pipeline_status["stage_latency"] = stage_latency
+        status_hash["stage_latency"] = json.dumps(stage_latency)
     try:
-        r.hset("scout:pipeline:status", mapping={
-            "phase": phase,
-            "phase_name": phase_name,
-            "status": status,
-            "progress": progress,
-            "current_stock": current_stock or "",
-            "total_candidates": total_candidates,
-            "passed_phase1": passed_phase1,
-            "passed_phase2": passed_phase2,
-            "final_selected": final_selected,
-            "last_updated": _utcnow().isoformat(),
-        })
+        pipe = r.pipeline(transaction=False)
+        pipe.hset("scout:pipeline:status", mapping=status_hash)
+        # [v1.1] Dashboard WebSocket 푸시용 스트림 이벤트 (같은 왕복으로 전송)
+        pipe.xadd(
+            redis_cache.DASHBOARD_EVENTS_STREAM,
+            {"type": redis_cache.STREAM_EVENT_PIPELINE, "data": json.dumps(pipeline_status)},
+            maxlen=redis_cache.DASHBOARD_STREAM_MAXLEN,
+            approximate=True,
+        )
+        pipe.execute()
     except Exception as e:
         logger.debug(f"Redis 상태 업데이트 실패: {e}")
 
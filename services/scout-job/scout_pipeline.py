@@ -26,6 +26,29 @@ def is_hybrid_scoring_enabled() -> bool:
     return os.getenv("SCOUT_V5_ENABLED", "false").lower() == "true"
 
 
+def _quant_error_result(code, name, error):
+    """정량 점수 계산 예외 시 is_valid=False 결과 (종목별/일괄 공용)"""
+    from shared.hybrid_scoring import QuantScoreResult
+    return QuantScoreResult(
+        stock_code=code,
+        stock_name=name,
+        total_score=0.0,
+        momentum_score=0.0,
+        quality_score=0.0,
+        value_score=0.0,
+        technical_score=0.0,
+        news_stat_score=0.0,
+        supply_demand_score=0.0,
+        matched_conditions=[],
+        condition_win_rate=None,
+        condition_sample_count=0,
+        condition_confidence='LOW',
+        is_valid=False,
+        invalid_reason=f'계산 오류: {str(error)[:30]}',
+        details={'error': str(error)},
+    )
+
+
 def process_quant_scoring_task(stock_info, quant_scorer, db_conn, kospi_prices_df=None):
     """
     [v1.0] Step 1: 정량 점수 계산 (LLM 호출 없음, 비용 0원)
@@ -107,25 +130,70 @@ def process_quant_scoring_task(stock_info, quant_scorer, db_conn, kospi_prices_d
         
     except Exception as e:
         logger.error(f"   ❌ [Quant] {code} 정량 점수 계산 오류: {e}")
-        from shared.hybrid_scoring import QuantScoreResult
-        return QuantScoreResult(
-            stock_code=code,
-            stock_name=info['name'],
-            total_score=0.0,
-            momentum_score=0.0,
-            quality_score=0.0,
-            value_score=0.0,
-            technical_score=0.0,
-            news_stat_score=0.0,
-            supply_demand_score=0.0,
-            matched_conditions=[],
-            condition_win_rate=None,
-            condition_sample_count=0,
-            condition_confidence='LOW',
-            is_valid=False,
-            invalid_reason=f'계산 오류: {str(e)[:30]}',
-            details={'error': str(e)},
+        return _quant_error_result(code, info['name'], e)
+
+
+def process_quant_scoring_batch(candidate_stocks, quant_scorer, db_conn, kospi_prices_df=None, snapshot_cache=None):
+    """
+    [v1.1] Step 1 일괄 버전: 후보 전체를 한 번에 정량 점수 계산
+    
+    - 일봉: get_daily_prices_batch 1회 조회 → (일자 × 종목) 패널
+    - FACTOR_PERFORMANCE / NEWS_FACTOR_STATS / 섹터: 테이블당 1회 조회 (score_universe 내부)
+    - 결과는 종목별 process_quant_scoring_task와 동일한 QuantScoreResult
+    
+    Returns:
+        {code: QuantScoreResult}
+    """
+    snapshot_cache = snapshot_cache or {}
+    codes = [code for code in candidate_stocks if code != '0001']
+    if not codes:
+        return {}
+    
+    daily_prices_by_code = database.get_daily_prices_batch(db_conn, codes, limit=150)
+    infos = [candidate_stocks[code] for code in codes]
+    snapshots = [snapshot_cache.get(code) or {} for code in codes]
+    try:
+        close_panel, volume_panel = quant_scorer.build_price_panels(daily_prices_by_code, codes, length=150)
+        results = quant_scorer.score_universe(
+            codes,
+            [info['name'] for info in infos],
+            close_panel,
+            volume_panel,
+            kospi_prices_df=kospi_prices_df,
+            pbr=[snap.get('pbr') for snap in snapshots],
+            per=[snap.get('per') for snap in snapshots],
+            sentiment_scores=[info.get('sentiment_score', 50) for info in infos],
+            foreign_net_buy=[snap.get('foreign_net_buy') for snap in snapshots],
         )
+    except Exception as e:
+        # 한 종목의 입력 오류로 일괄 계산이 실패하면 종목별 계산으로 전환 (문제 종목만 is_valid=False)
+        logger.error(f"   ❌ [Quant] 일괄 정량 점수 계산 오류 → 종목별 계산으로 전환: {e}")
+        return {
+            code: process_quant_scoring_task(
+                {'code': code, 'info': info, 'snapshot': snapshot}, quant_scorer, db_conn, kospi_prices_df
+            )
+            for code, info, snapshot in zip(codes, infos, snapshots)
+        }
+    
+    # [v1.0] 역신호 카테고리 체크 (process_quant_scoring_task와 동일)
+    REVERSE_SIGNAL_CATEGORIES = {'수주', '배당', '자사주', '주주환원', '배당락'}
+    scored = {}
+    for code, info, snapshot, result in zip(codes, infos, snapshots, results):
+        try:
+            news_category = info.get('news_category') or snapshot.get('news_category')
+            if result.is_valid and news_category in REVERSE_SIGNAL_CATEGORIES and info.get('sentiment_score', 50) >= 70:
+                logger.warning(f"   ⚠️ [v1.0] {info['name']}({code}) 역신호 카테고리({news_category}) 감지 - "
+                              f"통계상 승률 50% 미만, 점수 패널티 적용")
+                if result.details is None:
+                    result.details = {}
+                result.details['reverse_signal_category'] = news_category
+                result.details['reverse_signal_warning'] = True
+        except Exception as e:
+            logger.error(f"   ❌ [Quant] {code} 정량 점수 계산 오류: {e}")
+            result = _quant_error_result(code, info['name'], e)
+        scored[code] = result
+    
+    return scored
 
 
 def process_phase1_hunter_v5_task(stock_info, brain, quant_result, snapshot_cache=None, news_cache=None, archivist=None):
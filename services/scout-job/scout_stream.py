@@ -0,0 +1,238 @@
+# services/scout-job/scout_stream.py
+# Version: v1.0
+# Scout Job Streaming Pipeline - Phase 1 Hunter → Phase 2-3 Debate/Judge 스트리밍 실행
+#
+# Hunter 결과가 나오는 즉시 통과 종목을 Debate/Judge 풀로 넘겨 두 단계가 겹쳐 실행되도록 합니다.
+# (모든 Hunter 완료 후 상위 N개를 정렬해 넘기던 2-Pass 방식 대체)
+# - 단계별 동시 실행 수 제한 (Hunter / Judge 각자의 ThreadPoolExecutor)
+# - 동적 Top-K 진입 정책 (TopKAdmission): Phase 2 진입 수 상한 K는 유지
+# - 단계별 지연 시간 히스토그램 (StageLatency) → update_pipeline_status(stage_latency=...)
+
+import heapq
+import itertools
+import logging
+import math
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 지연 시간 히스토그램 구간 상한 (초). 마지막 구간은 'inf'
+LATENCY_BUCKETS_SEC = (1, 2, 5, 10, 20, 30, 60, 120)
+# 진행 상황 콜백 최소 간격 (초) - Redis 상태 업데이트 폭주 방지
+PROGRESS_INTERVAL_SEC = 2.0
+
+
+class StageLatency:
+    """단계별 작업 지연 시간 히스토그램 (스레드 안전)"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS_SEC):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        index = next((i for i, bound in enumerate(self.buckets) if seconds <= bound), len(self.buckets))
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._total += seconds
+            self._max = max(self._max, seconds)
+
+    def snapshot(self) -> Dict:
+        """{'count', 'avg_sec', 'max_sec', 'buckets': {'1': n, '2': n, ..., 'inf': n}} (구간별 개수, 비누적)"""
+        with self._lock:
+            labels = [f"{bound:g}" for bound in self.buckets] + ['inf']
+            return {
+                'count': self._count,
+                'avg_sec': round(self._total / self._count, 2) if self._count else 0.0,
+                'max_sec': round(self._max, 2),
+                'buckets': dict(zip(labels, self._counts)),
+            }
+
+
+class TopKAdmission:
+    """
+    Phase 2 동적 Top-K 진입 정책
+
+    Hunter 통과 종목은 먼저 대기 힙(점수 내림차순)에 들어가고, 다음 조건을 만족하면 바로 진입합니다.
+    - 지금까지 본 통과 종목 중 상위 K 안의 점수 (K번째 점수가 진입 기준선, 결과가 쌓일수록 올라감)
+    - 진입 수 < ceil(K × Hunter 완료 비율) (초반에 먼저 끝난 종목이 K개를 모두 차지하지 않도록 진행률만큼만 허용)
+    Hunter가 모두 끝나면 남은 자리를 대기 종목 중 점수 순으로 채웁니다. (drain)
+
+    통과 종목이 K개 이하이면 결국 전부 진입하고, 어떤 경우에도 진입 수는 K를 넘지 않습니다.
+
+    Args:
+        k: Phase 2 진입 최대 종목 수 (SCOUT_PHASE2_MAX_ENTRIES)
+        total: Hunter 작업 수
+    """
+
+    def __init__(self, k: int, total: int):
+        self.k = max(0, k)
+        self.total = max(1, total)
+        self.admitted = 0
+        self._top_scores: List[float] = []    # 지금까지 본 상위 K 점수 (min-heap)
+        self._waiting: List = []              # (-score, 순번, item) max-heap
+        self._seq = itertools.count()
+
+    @property
+    def threshold(self) -> float:
+        """현재 진입 기준선 (상위 K가 아직 안 찼으면 -inf)"""
+        return self._top_scores[0] if len(self._top_scores) >= self.k > 0 else -math.inf
+
+    def offer(self, item: Any, score: float):
+        """Hunter 통과 종목 등록 (진입 여부는 ready()/drain()에서 결정)"""
+        if self.k <= 0:
+            return
+        if len(self._top_scores) < self.k:
+            heapq.heappush(self._top_scores, score)
+        elif score > self._top_scores[0]:
+            heapq.heapreplace(self._top_scores, score)
+        heapq.heappush(self._waiting, (-score, next(self._seq), item))
+
+    def ready(self, done: int) -> List[Any]:
+        """Hunter done개 완료 시점에 바로 진입할 종목 (점수 내림차순)"""
+        budget = min(self.k, math.ceil(self.k * done / self.total))
+        admitted = []
+        while self._waiting and self.admitted < budget and -self._waiting[0][0] >= self.threshold:
+            admitted.append(heapq.heappop(self._waiting)[2])
+            self.admitted += 1
+        return admitted
+
+    def drain(self) -> List[Any]:
+        """Hunter 완료 후 남은 자리를 대기 종목 점수 순으로 채움 (나머지는 진입 제외)"""
+        admitted = []
+        while self._waiting and self.admitted < self.k:
+            admitted.append(heapq.heappop(self._waiting)[2])
+            self.admitted += 1
+        self._waiting.clear()
+        return admitted
+
+
+class StreamStats:
+    """스트리밍 실행 결과 집계"""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.hunter_done = 0
+        self.hunter_passed = 0
+        self.admitted = 0
+        self.judged = 0
+        self.failed = {'hunter': 0, 'judge': 0}   # 예외로 끝난 작업 수 (결과 없음으로 처리)
+        self.latency = {'hunter': StageLatency(), 'judge': StageLatency()}
+
+    @property
+    def hunter_finished(self) -> bool:
+        return self.hunter_done >= self.total
+
+    @property
+    def progress(self) -> float:
+        """전체 진행률 (%) - Hunter 작업 + 진입한 Judge 작업 기준"""
+        planned = self.total + self.admitted
+        return round((self.hunter_done + self.judged) / planned * 100, 1) if planned else 100.0
+
+    def latency_snapshot(self) -> Dict[str, Dict]:
+        return {stage: histogram.snapshot() for stage, histogram in self.latency.items()}
+
+
+def _timed(histogram: StageLatency, fn: Callable, *args):
+    """작업 실행 시간(큐 대기 제외)을 히스토그램에 기록"""
+    started = time.perf_counter()
+    try:
+        return fn(*args)
+    finally:
+        histogram.observe(time.perf_counter() - started)
+
+
+def run_streaming_pipeline(
+    items: Iterable[Any],
+    hunter_fn: Callable[[Any], Optional[Dict]],
+    judge_fn: Callable[[Dict], Optional[Dict]],
+    max_entries: int,
+    hunter_workers: int,
+    judge_workers: int,
+    on_hunter_result: Optional[Callable[[Dict], None]] = None,
+    on_judge_result: Optional[Callable[[Dict], None]] = None,
+    on_progress: Optional[Callable[[StreamStats], None]] = None,
+) -> StreamStats:
+    """
+    Hunter → Debate/Judge 스트리밍 실행
+
+    Args:
+        items: Hunter 작업 입력 목록
+        hunter_fn: item → Hunter 결과 ({'passed', 'hunter_score', ...} 또는 None)
+        judge_fn: 통과한 Hunter 결과 → Judge 결과 레코드 (또는 None)
+        max_entries: Phase 2 진입 최대 종목 수 (TopKAdmission의 K)
+        hunter_workers / judge_workers: 단계별 동시 실행 수
+        on_hunter_result / on_judge_result: 결과 콜백 (호출 스레드에서 순서대로 실행되므로 잠금 불필요)
+            작업이 예외로 끝나면 로그를 남기고 결과 없음(None)으로 처리합니다. (stats.failed)
+        on_progress: 진행 상황 콜백 (PROGRESS_INTERVAL_SEC 간격 + 단계 전환/종료 시)
+
+    Returns:
+        StreamStats (단계별 처리 수, 지연 시간 히스토그램)
+    """
+    items = list(items)
+    stats = StreamStats(len(items))
+    admission = TopKAdmission(max_entries, len(items))
+    last_progress = 0.0
+
+    def report(force: bool = False):
+        nonlocal last_progress
+        now = time.monotonic()
+        if on_progress and (force or now - last_progress >= PROGRESS_INTERVAL_SEC):
+            last_progress = now
+            on_progress(stats)
+
+    with ThreadPoolExecutor(max_workers=max(1, hunter_workers), thread_name_prefix="scout-hunter") as hunter_pool, \
+            ThreadPoolExecutor(max_workers=max(1, judge_workers), thread_name_prefix="scout-judge") as judge_pool:
+
+        # future → 단계 ('hunter' / 'judge')
+        pending: Dict = {
+            hunter_pool.submit(_timed, stats.latency['hunter'], hunter_fn, item): 'hunter' for item in items
+        }
+
+        def admit(results: List[Dict]):
+            for result in results:
+                pending[judge_pool.submit(_timed, stats.latency['judge'], judge_fn, result)] = 'judge'
+            stats.admitted += len(results)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # 한 종목의 예외로 나머지 Hunter/Judge 결과를 버리지 않도록 결과 없음으로 처리
+                    logger.error(f"   (LLM) [{stage}] 작업 실패 (결과 없음으로 처리): {e}", exc_info=True)
+                    stats.failed[stage] += 1
+                    result = None
+                if stage == 'judge':
+                    stats.judged += 1
+                    if result and on_judge_result:
+                        on_judge_result(result)
+                    continue
+
+                stats.hunter_done += 1
+                if result:
+                    if on_hunter_result:
+                        on_hunter_result(result)
+                    if result.get('passed'):
+                        stats.hunter_passed += 1
+                        admission.offer(result, result.get('hunter_score', 0))
+                admit(admission.ready(stats.hunter_done))
+                if stats.hunter_finished:
+                    admit(admission.drain())
+                    if stats.hunter_passed > stats.admitted:
+                        logger.info(f"   (LLM) [동적 Top-K] Phase 2 진입 제한: {stats.admitted}개 진입 "
+                                    f"(Hunter 통과 {stats.hunter_passed}개 중, K={admission.k})")
+                    report(force=True)
+            report()
+
+    report(force=True)
+    return stats
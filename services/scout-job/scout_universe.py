@@ -6,6 +6,7 @@
 
 import logging
 import time
+import numpy as np
 import requests
 from bs4 import BeautifulSoup
 from typing import Dict, List, Optional
@@ -112,6 +113,10 @@ def analyze_sector_momentum(kis_api, db_conn, watchlist_snapshot=None):
                 except (ValueError, TypeError):
                     continue
         
+        # FDR 미설치/실패 시: DB 종가 패널로 섹터 대표 종목의 일간 변동률 일괄 계산
+        if not sector_data and db_conn is not None:
+            sector_data = _sector_returns_from_panel(db_conn)
+        
         # 섹터별 평균 수익률 계산
         hot_sectors = {}
         for sector, data in sector_data.items():
@@ -136,6 +141,26 @@ def analyze_sector_momentum(kis_api, db_conn, watchlist_snapshot=None):
         return {}
 
 
+def _sector_returns_from_panel(db_conn, lookback_days: int = 2):
+    """SECTOR_MAPPING 종목의 최근 변동률(%)을 종가 패널에서 한 번에 계산합니다."""
+    codes = list(SECTOR_MAPPING.keys())
+    panel = database.get_close_price_panel(db_conn, codes, limit=lookback_days)
+    if panel.empty:
+        return {}
+    names = database.get_stock_names(db_conn, codes)
+    
+    returns, _ = compute_panel_returns(panel, min_count=lookback_days)
+    sector_data = {}
+    for code, change_pct in zip(panel.columns, returns):
+        if np.isnan(change_pct) or abs(change_pct) > 50:
+            continue
+        sector = SECTOR_MAPPING.get(code, '기타')
+        data = sector_data.setdefault(sector, {'stocks': [], 'returns': []})
+        data['stocks'].append({'code': code, 'name': names.get(code, code)})
+        data['returns'].append(float(change_pct))
+    return sector_data
+
+
 def get_hot_sector_stocks(sector_analysis, top_n=30):
     """
     [v3.8] 핫 섹터의 종목들을 우선 후보로 반환
@@ -251,77 +276,97 @@ def get_dynamic_blue_chips(limit=200):
     return dynamic_list
 
 
+def compute_panel_returns(close_panel, min_count: int = 1):
+    """
+    (날짜 × 종목) 종가 패널에서 종목별 기간 수익률(%)을 한 번에 계산합니다.
+    각 종목의 첫 유효 종가 → 마지막 유효 종가 기준이며, 유효 데이터가 min_count 미만이면 NaN.
+
+    Returns:
+        (returns, counts): 종목 순서대로 정렬된 np.ndarray 두 개
+    """
+    values = close_panel.to_numpy(dtype=np.float64, copy=False)
+    n_codes = values.shape[1]
+    if values.shape[0] == 0:
+        return np.full(n_codes, np.nan), np.zeros(n_codes, dtype=np.int64)
+
+    valid = ~np.isnan(values)
+    counts = valid.sum(axis=0)
+    first_idx = valid.argmax(axis=0)
+    last_idx = values.shape[0] - 1 - valid[::-1].argmax(axis=0)
+    cols = np.arange(n_codes)
+    start_prices = values[first_idx, cols]
+    end_prices = values[last_idx, cols]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        returns = (end_prices / start_prices - 1) * 100
+    returns[(counts < max(min_count, 1)) | ~(start_prices > 0)] = np.nan
+    return returns, counts
+
+
 def get_momentum_stocks(kis_api, db_conn, period_months=6, top_n=30, watchlist_snapshot=None):
     """
-    모멘텀 팩터 기반 종목 선별
+    모멘텀 팩터 기반 종목 선별 (KOSPI 대비 상대 모멘텀)
+
+    대상 종목 전체의 종가 패널(날짜 × 종목)을 한 번의 쿼리로 로드하고
+    NumPy로 상대 모멘텀을 일괄 계산합니다.
     """
     logger.info(f"   (D) 모멘텀 팩터 계산 중 (기간: {period_months}개월, 상위 {top_n}개)...")
-    momentum_scores = []
     
     try:
-        # 1. KOSPI 수익률 계산
         kospi_code = "0001"
         period_days = period_months * 30
-        kospi_prices = database.get_daily_prices(db_conn, kospi_code, limit=period_days)
-        
-        if kospi_prices.empty or len(kospi_prices) < period_days * 0.8:
-            logger.warning(f"   (D) ⚠️ KOSPI 데이터 부족 ({len(kospi_prices)}일). 모멘텀 계산 건너뜀.")
-            return []
-        
-        kospi_start_price = float(kospi_prices['CLOSE_PRICE'].iloc[0])
-        kospi_end_price = float(kospi_prices['CLOSE_PRICE'].iloc[-1])
-        kospi_return = (kospi_end_price / kospi_start_price - 1) * 100
+        min_count = period_days * 0.8
         
-        # 2. 전체 종목 또는 Watchlist에서 가져오기
-        all_codes = database.get_all_stock_codes(db_conn)
+        # 1. 전체 종목(STOCK_MASTER 종목명 포함) 또는 Watchlist에서 가져오기
+        all_names = database.get_stock_names(db_conn)
         
-        if not all_codes:
+        if not all_names:
             watchlist = watchlist_snapshot or database.get_active_watchlist(db_conn)
             if not watchlist:
                 stocks_to_check = [s for s in BLUE_CHIP_STOCKS if s.get('is_tradable', True)]
             else:
                 stocks_to_check = [{'code': code, 'name': info.get('name', code)} for code, info in watchlist.items() if info.get('is_tradable', True)]
         else:
-            stocks_to_check = [{'code': code, 'name': code} for code in all_codes]
-
-        logger.info(f"   (D) {len(stocks_to_check)}개 종목의 모멘텀 계산 중... (전체 대상)")
+            stocks_to_check = [{'code': code, 'name': name} for code, name in all_names.items()]
         
-        # 3. 각 종목의 모멘텀 계산
-        for stock in stocks_to_check:
-            try:
-                code = stock['code']
-                name = stock.get('name', code)
-                
-                stock_prices = database.get_daily_prices(db_conn, code, limit=period_days)
-                
-                if stock_prices.empty or len(stock_prices) < period_days * 0.8:
-                    continue
-                
-                stock_start_price = float(stock_prices['CLOSE_PRICE'].iloc[0])
-                stock_end_price = float(stock_prices['CLOSE_PRICE'].iloc[-1])
-                stock_return = (stock_end_price / stock_start_price - 1) * 100
-                
-                relative_momentum = stock_return - kospi_return
-                
-                momentum_scores.append({
-                    'code': code,
-                    'name': name,
-                    'momentum': relative_momentum,
-                    'absolute_return': stock_return,
-                    'kospi_return': kospi_return
-                })
-                
-                if hasattr(kis_api, 'API_CALL_DELAY'):
-                    time.sleep(kis_api.API_CALL_DELAY * 0.1)
-                
-            except Exception as e:
-                logger.debug(f"   (D) {stock.get('name', stock.get('code'))} 모멘텀 계산 오류: {e}")
-                continue
+        stock_codes = [s['code'] for s in stocks_to_check if s['code'] != kospi_code]
+        names = {s['code']: s.get('name', s['code']) for s in stocks_to_check}
+        
+        # 2. 종가 패널 일괄 로드 (KOSPI 포함)
+        panel = database.get_close_price_panel(db_conn, [kospi_code] + stock_codes, limit=period_days)
+        if panel.empty or kospi_code not in panel.columns:
+            logger.warning("   (D) ⚠️ 종가 패널 데이터 없음. 모멘텀 계산 건너뜀.")
+            return []
+        
+        returns, counts = compute_panel_returns(panel, min_count=min_count)
+        
+        # 3. KOSPI 수익률
+        if counts[0] < min_count or np.isnan(returns[0]):
+            logger.warning(f"   (D) ⚠️ KOSPI 데이터 부족 ({int(counts[0])}일). 모멘텀 계산 건너뜀.")
+            return []
+        kospi_return = float(returns[0])
+        
+        logger.info(f"   (D) {len(stock_codes)}개 종목의 모멘텀 계산 중... (전체 대상)")
+        
+        # 4. 상대 모멘텀 일괄 계산 및 상위 N개 선택
+        stock_returns = returns[1:]
+        relative_momentum = stock_returns - kospi_return
+        valid_idx = np.flatnonzero(~np.isnan(relative_momentum))
+        order = valid_idx[np.argsort(-relative_momentum[valid_idx], kind='stable')][:top_n]
         
-        momentum_scores.sort(key=lambda x: x['momentum'], reverse=True)
+        momentum_scores = [
+            {
+                'code': panel.columns[i + 1],
+                'name': names.get(panel.columns[i + 1], panel.columns[i + 1]),
+                'momentum': float(relative_momentum[i]),
+                'absolute_return': float(stock_returns[i]),
+                'kospi_return': kospi_return,
+            }
+            for i in order
+        ]
         
-        logger.info(f"   (D) ✅ 모멘텀 계산 완료. 상위 {min(top_n, len(momentum_scores))}개 반환")
-        return momentum_scores[:top_n]
+        logger.info(f"   (D) ✅ 모멘텀 계산 완료. 상위 {len(momentum_scores)}개 반환")
+        return momentum_scores
         
     except Exception as e:
         logger.error(f"   (D) ❌ 모멘텀 팩터 계산 중 오류 발생: {e}", exc_info=True)
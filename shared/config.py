@@ -12,6 +12,15 @@ shared/config.py - Ultra Jennie 설정 관리 모듈
 3. 환경 변수
 4. 기본값 (하드코딩)
 
+DB 설정 캐시 (v2.0):
+------------------
+CONFIG 테이블 전체를 한 번에 읽어 스냅샷(dict)으로 보관하고, 갱신 시 새 dict로 통째로 교체합니다.
+스냅샷에 없는 키는 "DB에 없음"으로 간주하므로(negative cache) 키마다 DB를 조회하지 않습니다.
+- set(persist_to_db=True) 등으로 CONFIG가 바뀌면 Redis 'config:changed' 채널로 바뀐 키를 알리고,
+  각 프로세스의 수신 스레드가 그 키 한 행만 다시 읽어 스냅샷에 반영합니다.
+  (키 없는 알림만 전체를 다시 읽음, CONFIG_PUBSUB_ENABLED=false로 끔)
+- 알림을 놓쳐도 cache_ttl이 지나면 다시 읽습니다.
+
 주요 설정 카테고리:
 -----------------
 1. 매수 관련: RSI 기준, 볼린저밴드, 골든크로스 등
@@ -39,14 +48,22 @@ shared/config.py - Ultra Jennie 설정 관리 모듈
 """
 
 import os
+import time
+import socket
 import logging
-from typing import Any, Optional, Dict
-from functools import lru_cache
+import threading
+import weakref
+from types import MappingProxyType
+from typing import Any, Optional, Dict, Mapping
 
 from .db.connection import session_scope
 
 logger = logging.getLogger(__name__)
 
+# 변경 알림 발신 프로세스 (로그/디버깅용)
+_PROCESS_ORIGIN = f"{socket.gethostname()}:{os.getpid()}"
+_SNAPSHOT_RETRY_SECONDS = 30  # 스냅샷 로드 실패 후 재시도 간격 (최대)
+
 
 class ConfigManager:
     """
@@ -54,7 +71,7 @@ class ConfigManager:
     
     설정값 우선순위:
     1. 메모리 캐시 (런타임 변경값)
-    2. DB CONFIG 테이블 (동적 설정)
+    2. DB CONFIG 테이블 스냅샷 (전체 일괄 로드, 없는 키도 캐시)
     3. 환경 변수
     4. 기본값 (하드코딩)
     
@@ -78,7 +95,12 @@ class ConfigManager:
         self.db_conn = None
         self.cache_ttl = cache_ttl
         self._memory_cache: Dict[str, tuple] = {}  # {key: (value, timestamp)}
-        self._db_cache: Dict[str, tuple] = {}  # {key: (value, timestamp)}
+        # CONFIG 테이블 스냅샷 {key: 변환된 값}. 제자리 수정 없이 새 dict로 교체
+        self._db_cache: Dict[str, Any] = {}
+        self._snapshot_loaded_at = 0.0  # 0이면 아직 로드 전 (또는 무효화됨)
+        self._snapshot_retry_at = 0.0
+        self._snapshot_lock = threading.Lock()
+        self._reported_keys = set()  # 기본값/누락 로그를 키별 1회만 남김
         
         # 기본값 정의 (AgentConfig에서 가져온 값들)
         self._defaults = {
@@ -127,63 +149,124 @@ class ConfigManager:
         Args:
             key: 설정 키
             default: 기본값 (없으면 _defaults에서 조회)
-            use_cache: 캐시 사용 여부
+            use_cache: 캐시 사용 여부 (False면 DB 스냅샷을 다시 읽음)
         
         Returns:
             설정값 (타입 자동 변환 시도)
         """
-        import time
         current_time = time.time()
         
         # 1. 메모리 캐시 확인
         if use_cache and key in self._memory_cache:
             value, timestamp = self._memory_cache[key]
             if current_time - timestamp < self.cache_ttl:
-                logger.debug(f"[Config] 메모리 캐시에서 '{key}' 조회: {value}")
                 return value
         
-        # 2. DB CONFIG 테이블 확인
-        # 컨텍스트 매니저가 Pool 또는 Stateless 연결을 자동으로 처리
-        try:
-            # DB 캐시 확인
-            if use_cache and key in self._db_cache:
-                value, timestamp = self._db_cache[key]
-                if current_time - timestamp < self.cache_ttl:
-                    logger.debug(f"[Config] DB 캐시에서 '{key}' 조회: {value}")
-                    return value
-            
-            # DB 조회 (Pool 또는 Stateless 모드 자동 처리)
-            from . import database
-            with session_scope(readonly=True) as session:
-                db_value = database.get_config(session, key, silent=True)
-                if db_value is not None:
-                    # DB 캐시 업데이트
-                    self._db_cache[key] = (db_value, current_time)
-                    logger.debug(f"[Config] DB에서 '{key}' 조회: {db_value}")
-                    return self._convert_type(key, db_value)
-        except Exception as e:
-            logger.warning(f"[Config] DB에서 '{key}' 조회 실패 (환경변수/기본값으로 대체): {e}")
+        # 2. DB CONFIG 스냅샷 확인 (스냅샷에 없으면 DB에도 없는 키)
+        snapshot = self._get_snapshot(current_time, force=not use_cache)
+        if snapshot is not None and key in snapshot:
+            return snapshot[key]
         
         # 3. 환경 변수 확인
         env_value = os.getenv(key)
         if env_value is not None:
-            logger.debug(f"[Config] 환경 변수에서 '{key}' 조회: {env_value}")
             return self._convert_type(key, env_value)
         
         # 4. 기본값 반환
         if default is not None:
-            logger.debug(f"[Config] 기본값 사용 '{key}': {default}")
             return default
         
         if key in self._defaults:
             default_value = self._defaults[key]
-            # 초기화 시에는 INFO 레벨로 로그 (설정값이 제대로 적용되는지 확인)
-            logger.info(f"[Config] 내장 기본값 사용 '{key}': {default_value}")
+            # 설정값이 제대로 적용되는지 확인할 수 있도록 키별 1회만 INFO 로그
+            if key not in self._reported_keys:
+                self._reported_keys.add(key)
+                logger.info(f"[Config] 내장 기본값 사용 '{key}': {default_value}")
             return default_value
         
-        logger.warning(f"[Config] 설정값 '{key}'를 찾을 수 없습니다. None 반환.")
+        if key not in self._reported_keys:
+            self._reported_keys.add(key)
+            logger.warning(f"[Config] 설정값 '{key}'를 찾을 수 없습니다. None 반환.")
         return None
     
+    # ------------------------------------------------------------------
+    # DB 스냅샷
+    # ------------------------------------------------------------------
+    
+    def _get_snapshot(self, current_time: float, force: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        현재 CONFIG 스냅샷 (로드된 적이 없고 로드도 실패하면 None)
+        TTL이 지났으면 다시 읽고, 실패하면 이전 스냅샷을 계속 사용합니다.
+        """
+        loaded_at = self._snapshot_loaded_at
+        if not force and loaded_at and current_time - loaded_at < self.cache_ttl:
+            return self._db_cache
+        if not force and current_time < self._snapshot_retry_at:
+            return self._db_cache if loaded_at else None
+        
+        # 다른 스레드가 이미 읽는 중이면 (이전 스냅샷이 있을 때) 기다리지 않음
+        if not self._snapshot_lock.acquire(blocking=not loaded_at or force):
+            return self._db_cache
+        try:
+            if force or not self._snapshot_loaded_at or current_time - self._snapshot_loaded_at >= self.cache_ttl:
+                self.reload()
+        finally:
+            self._snapshot_lock.release()
+        return self._db_cache if self._snapshot_loaded_at else None
+    
+    def reload(self) -> bool:
+        """CONFIG 테이블 전체를 다시 읽어 스냅샷을 교체합니다. 반환: 성공 여부"""
+        try:
+            from .db.models import Config
+            with session_scope(readonly=True) as session:
+                rows = session.query(Config.config_key, Config.config_value).all()
+        except Exception as e:
+            self._snapshot_retry_at = time.time() + min(self.cache_ttl, _SNAPSHOT_RETRY_SECONDS)
+            logger.warning(f"[Config] CONFIG 테이블 로드 실패 (환경변수/기본값으로 대체): {e}")
+            return False
+        
+        self._db_cache = {k: self._convert_type(k, v) for k, v in rows if v is not None}
+        self._snapshot_loaded_at = time.time()
+        self._snapshot_retry_at = 0.0
+        logger.debug(f"[Config] CONFIG 스냅샷 로드: {len(self._db_cache)}개")
+        _ensure_change_listener(self)
+        return True
+    
+    def reload_key(self, key: str) -> bool:
+        """CONFIG 한 키만 다시 읽어 스냅샷에 반영합니다. (스냅샷이 없으면 전체 로드) 반환: 성공 여부"""
+        if not self._snapshot_loaded_at:
+            return self.reload()
+        try:
+            from .db.models import Config
+            with session_scope(readonly=True) as session:
+                value = session.query(Config.config_value).filter(Config.config_key == key).scalar()
+        except Exception as e:
+            logger.warning(f"[Config] CONFIG '{key}' 로드 실패 (이전 스냅샷 유지): {e}")
+            return False
+        
+        snapshot = dict(self._db_cache)
+        if value is None:
+            snapshot.pop(key, None)
+        else:
+            snapshot[key] = self._convert_type(key, value)
+        self._db_cache = snapshot
+        logger.debug(f"[Config] CONFIG 스냅샷 키 갱신: '{key}'")
+        return True
+    
+    def snapshot(self) -> Mapping[str, Any]:
+        """현재 DB 설정 스냅샷 (읽기 전용 뷰)"""
+        return MappingProxyType(self._db_cache)
+    
+    def _on_config_changed(self, key: Optional[str]):
+        """CONFIG 변경 알림 처리 (수신 스레드에서 호출, 키가 있으면 그 키만 다시 읽음)"""
+        if key:
+            self._memory_cache.pop(key, None)
+        with self._snapshot_lock:
+            if key:
+                self.reload_key(key)
+            else:
+                self.reload()
+    
     def set(self, key: str, value: Any, persist_to_db: bool = False) -> bool:
         """
         설정값 설정 (메모리 캐시에 저장, 선택적으로 DB에도 저장)
@@ -196,7 +279,6 @@ class ConfigManager:
         Returns:
             성공 여부
         """
-        import time
         current_time = time.time()
         
         # 메모리 캐시 업데이트
@@ -209,8 +291,11 @@ class ConfigManager:
                 from . import database
                 with session_scope() as session:
                     database.set_config(session, key, str(value))
-                # DB 캐시도 업데이트
-                self._db_cache[key] = (str(value), current_time)
+                # 스냅샷도 갱신 (새 dict로 교체). 다른 프로세스 알림은 database.set_config가 발행
+                if self._snapshot_loaded_at:
+                    snapshot = dict(self._db_cache)
+                    snapshot[key] = self._convert_type(key, str(value))
+                    self._db_cache = snapshot
                 logger.info(f"[Config] DB에도 '{key}' 저장: {value}")
                 return True
             except Exception as e:
@@ -261,11 +346,12 @@ class ConfigManager:
         """
         if key:
             self._memory_cache.pop(key, None)
-            self._db_cache.pop(key, None)
+            self._snapshot_loaded_at = 0.0  # 다음 조회 시 스냅샷 다시 읽기
             logger.debug(f"[Config] 캐시 초기화: '{key}'")
         else:
             self._memory_cache.clear()
-            self._db_cache.clear()
+            self._db_cache = {}
+            self._snapshot_loaded_at = 0.0
             logger.debug("[Config] 전체 캐시 초기화")
     
     def _convert_type(self, key: str, value: Any) -> Any:
@@ -313,6 +399,47 @@ class ConfigManager:
         return all_config
 
 
+# ============================================================================
+# CONFIG 변경 알림 (Redis Pub/Sub)
+# ============================================================================
+
+_subscribers = weakref.WeakSet()  # 알림을 받을 ConfigManager들
+
+
+def _pubsub_enabled() -> bool:
+    return os.getenv('CONFIG_PUBSUB_ENABLED', 'true').lower() == 'true'
+
+
+def publish_config_changed(key: Optional[str] = None, redis_client=None) -> bool:
+    """
+    CONFIG 변경을 모든 프로세스에 알립니다. (key=None이면 전체 변경)
+    shared.database.set_config가 저장 성공 시 호출합니다. CONFIG 테이블을 다른 경로로
+    직접 수정한 코드도 이 함수를 호출하면 됩니다.
+    """
+    if not _pubsub_enabled():
+        return False
+    from .redis_cache import publish_event, CONFIG_CHANGED_CHANNEL
+    return publish_event(CONFIG_CHANGED_CHANNEL, {"key": key, "origin": _PROCESS_ORIGIN}, redis_client)
+
+
+def _ensure_change_listener(manager: ConfigManager, redis_client=None) -> bool:
+    """manager를 알림 대상에 등록하고, 프로세스당 1개인 수신 스레드가 없으면 시작합니다."""
+    if not _pubsub_enabled():
+        return False
+    _subscribers.add(manager)
+    try:
+        from .redis_cache import subscribe_channel, CONFIG_CHANGED_CHANNEL
+        return subscribe_channel(CONFIG_CHANGED_CHANNEL, _dispatch_config_changed, redis_client)
+    except Exception as e:
+        logger.warning(f"[Config] 변경 알림 구독 실패 (TTL 갱신만 사용): {e}")
+        return False
+
+
+def _dispatch_config_changed(payload: Dict[str, Any]):
+    for manager in list(_subscribers):
+        manager._on_config_changed(payload.get("key"))
+
+
 # 전역 ConfigManager 인스턴스 (선택적 사용)
 _global_config: Optional[ConfigManager] = None
 
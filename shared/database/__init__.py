@@ -8,6 +8,7 @@ shared/database/__init__.py - Ultra Jennie 데이터베이스 유틸리티 Facad
 [v5.0] 대규모 리팩터링: 도메인별 모듈을 `shared/database/` 패키지로 통합
 - core.py: 기본 연결, 설정
 - market.py: 시세, 종목정보, 뉴스
+- bulk.py: 대량 UPSERT (executemany / LOAD DATA LOCAL INFILE)
 - trading.py: 매매, 포트폴리오, 관심종목
 - rag.py: RAG 캐시
 - commands.py: Agent 명령
@@ -23,6 +24,8 @@ from shared.redis_cache import (
     get_market_regime_cache,
     set_sentiment_score,
     get_sentiment_score,
+    get_sentiment_scores,
+    get_top_sentiment_scores,
     set_redis_data,
     get_redis_data,
     set_competitor_benefit_score,
@@ -51,11 +54,19 @@ from .market import (
     get_stock_by_code,
     search_stock_by_name,
     save_all_daily_prices,
+    save_daily_ohlcv,
     update_all_stock_fundamentals,
     get_daily_prices,
     get_daily_prices_batch,
+    get_close_price_panel,
     save_news_sentiment,
-    get_all_stock_codes
+    get_all_stock_codes,
+    get_stock_names
+)
+
+from .bulk import (
+    bulk_upsert,
+    bulk_load_upsert
 )
 
 from .trading import (
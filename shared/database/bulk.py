@@ -0,0 +1,149 @@
+"""
+shared/database/bulk.py
+
+대량 UPSERT 헬퍼 (일봉/재무지표 수집 등 수천~수백만 행 저장용)
+
+- bulk_upsert: 행을 chunk_size개씩 묶어 executemany 한 번으로 보냅니다.
+  PyMySQL은 INSERT ... VALUES ... ON DUPLICATE KEY UPDATE의 executemany를
+  다중 행 VALUES 문 하나로 바꿔 보내므로, 행마다 왕복하던 것이 묶음마다 1회가 됩니다.
+- bulk_load_upsert: 백필용. 임시 CSV를 LOAD DATA LOCAL INFILE로 임시 테이블에 적재한 뒤
+  INSERT ... SELECT ... ON DUPLICATE KEY UPDATE로 합칩니다. (bulk_upsert와 같은 UPSERT 의미)
+  MariaDB 연결에 local_infile이 켜져 있어야 합니다. (MARIADB_LOCAL_INFILE=true)
+
+두 함수 모두 commit하지 않습니다. (트랜잭션 경계는 호출자가 결정)
+"""
+
+import csv
+import logging
+import math
+import os
+import tempfile
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = int(os.getenv("BULK_UPSERT_CHUNK_SIZE", "1000"))
+
+
+def _is_mysql(session) -> bool:
+    return session.get_bind().dialect.name in ("mysql", "mariadb")
+
+
+def _upsert_sql(session, table: str, columns: Sequence[str], key_columns: Sequence[str],
+                update_columns: Sequence[str]) -> str:
+    """DB 방언별 UPSERT 문 (MariaDB: ON DUPLICATE KEY UPDATE, SQLite 등: ON CONFLICT)"""
+    column_list = ", ".join(columns)
+    values = ", ".join(f":{c}" for c in columns)
+    if _is_mysql(session):
+        updates = ", ".join(f"{c} = VALUES({c})" for c in update_columns)
+        return f"INSERT INTO {table} ({column_list}) VALUES ({values}) ON DUPLICATE KEY UPDATE {updates}"
+    updates = ", ".join(f"{c} = excluded.{c}" for c in update_columns)
+    return (f"INSERT INTO {table} ({column_list}) VALUES ({values}) "
+            f"ON CONFLICT ({', '.join(key_columns)}) DO UPDATE SET {updates}")
+
+
+def bulk_upsert(
+    session,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Dict],
+    key_columns: Sequence[str],
+    update_columns: Optional[Sequence[str]] = None,
+    chunk_size: Optional[int] = None,
+) -> int:
+    """
+    행(컬럼명 → 값 dict)을 chunk_size개씩 executemany로 UPSERT합니다.
+
+    Args:
+        columns: INSERT할 컬럼
+        key_columns: 중복 판단 키 (PK/UNIQUE, ON CONFLICT용)
+        update_columns: 중복 시 갱신할 컬럼 (기본: columns - key_columns)
+        chunk_size: 한 번에 보낼 행 수 (기본: BULK_UPSERT_CHUNK_SIZE 또는 1000)
+
+    Returns:
+        보낸 행 수
+    """
+    from sqlalchemy import text
+
+    if update_columns is None:
+        update_columns = [c for c in columns if c not in key_columns]
+    chunk_size = max(1, chunk_size or DEFAULT_CHUNK_SIZE)
+    statement = text(_upsert_sql(session, table, columns, key_columns, update_columns))
+
+    written = 0
+    chunk: List[Dict] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            session.execute(statement, chunk)
+            written += len(chunk)
+            chunk = []
+    if chunk:
+        session.execute(statement, chunk)
+        written += len(chunk)
+    return written
+
+
+def _csv_value(value):
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return r"\N"
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, date):
+        return value.strftime("%Y-%m-%d")
+    return value
+
+
+def bulk_load_upsert(
+    session,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Dict],
+    key_columns: Sequence[str],
+    update_columns: Optional[Sequence[str]] = None,
+    chunk_size: Optional[int] = None,
+) -> int:
+    """
+    LOAD DATA LOCAL INFILE 기반 UPSERT (백필용)
+    MariaDB가 아니면 bulk_upsert로 대신합니다.
+    """
+    if not _is_mysql(session):
+        logger.info(f"ℹ️ DB: LOAD DATA는 MariaDB 전용이라 executemany로 저장합니다. ({table})")
+        return bulk_upsert(session, table, columns, rows, key_columns, update_columns, chunk_size)
+
+    if update_columns is None:
+        update_columns = [c for c in columns if c not in key_columns]
+    column_list = ", ".join(columns)
+    staging = f"tmp_bulk_{table}"
+
+    fd, path = tempfile.mkstemp(prefix=f"{table}_", suffix=".csv")
+    written = 0
+    try:
+        with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            for row in rows:
+                writer.writerow([_csv_value(row.get(c)) for c in columns])
+                written += 1
+        if not written:
+            return 0
+
+        conn = session.connection()
+        conn.exec_driver_sql(f"CREATE TEMPORARY TABLE IF NOT EXISTS {staging} LIKE {table}")
+        conn.exec_driver_sql(f"DELETE FROM {staging}")
+        conn.exec_driver_sql(
+            f"LOAD DATA LOCAL INFILE '{path}' INTO TABLE {staging} CHARACTER SET utf8mb4 "
+            f"FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' LINES TERMINATED BY '\\n' ({column_list})"
+        )
+        updates = ", ".join(f"{c} = VALUES({c})" for c in update_columns)
+        conn.exec_driver_sql(
+            f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {staging} "
+            f"ON DUPLICATE KEY UPDATE {updates}"
+        )
+        conn.exec_driver_sql(f"DROP TEMPORARY TABLE IF EXISTS {staging}")
+        return written
+    finally:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
@@ -153,6 +153,7 @@ def get_all_config(connection):
 def set_config(connection, config_key, config_value):
     """
     CONFIG 테이블에 설정값 저장 (SQLAlchemy ORM 사용, UPSERT)
+    저장에 성공하면 Redis 'config:changed' 채널로 변경을 알립니다.
     
     Args:
         connection: DB 연결 (Legacy, 무시됨 - SQLAlchemy 세션 사용)
@@ -164,7 +165,12 @@ def set_config(connection, config_key, config_value):
     """
     try:
         with get_session() as session:
-            return sa_repository.set_config(session, config_key, config_value)
+            saved = sa_repository.set_config(session, config_key, config_value)
     except Exception as e:
         logger.error(f"❌ DB: set_config ('{config_key}') 실패! (에러: {e})")
         return False
+    if saved:
+        # 각 프로세스의 ConfigManager 스냅샷 갱신 알림 (Redis 없으면 무시)
+        from shared.config import publish_config_changed
+        publish_config_changed(config_key)
+    return saved
@@ -7,12 +7,16 @@ shared/database/market.py
 """
 
 import logging
+import time
 from datetime import datetime
 from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
+from .bulk import bulk_load_upsert, bulk_upsert
 from .core import _get_table_name, _is_mariadb
+from .price_store import PRICE_STORE_TABLE, append_ohlcv_rows, db_last_date_cache, read_fresh_frames
 
 logger = logging.getLogger(__name__)
 
@@ -139,75 +143,129 @@ def get_all_stock_codes(connection) -> List[str]:
 # [Price] 주가/펀더멘털 조회 및 저장
 # ============================================================================
 
-def save_all_daily_prices(session, all_daily_prices_params: List[dict]):
+_DAILY_CLOSE_COLUMNS = ("STOCK_CODE", "PRICE_DATE", "CLOSE_PRICE", "HIGH_PRICE", "LOW_PRICE")
+_DAILY_OHLCV_COLUMNS = ("STOCK_CODE", "PRICE_DATE", "OPEN_PRICE", "HIGH_PRICE", "LOW_PRICE", "CLOSE_PRICE", "VOLUME")
+_FUNDAMENTAL_COLUMNS = ("STOCK_CODE", "TRADE_DATE", "PER", "PBR", "ROE", "MARKET_CAP")
+
+
+def _bulk_write(session, table, columns, key_columns, rows, chunk_size, use_infile) -> int:
+    """bulk_upsert / bulk_load_upsert 선택 실행"""
+    writer = bulk_load_upsert if use_infile else bulk_upsert
+    return writer(session, table, columns, rows, key_columns, chunk_size=chunk_size)
+
+
+def _log_bulk_result(label: str, written: int, started: float):
+    elapsed = time.perf_counter() - started
+    logger.info(f"✅ DB: {label} {written}건 Bulk 저장 완료. ({elapsed:.2f}초, {written / max(elapsed, 1e-9):,.0f}행/초)")
+
+
+def save_all_daily_prices(session, all_daily_prices_params: List[dict],
+                          chunk_size: Optional[int] = None, use_infile: bool = False) -> int:
     """
     [v5.0] 일봉 데이터 Bulk 저장 (SQLAlchemy)
-    """
-    from sqlalchemy import text
+    [v5.1] 행마다 INSERT하던 것을 chunk_size개씩 executemany(다중 행 VALUES)로 전송
+           use_infile=True면 LOAD DATA LOCAL INFILE 사용 (백필용, MariaDB)
     
+    Returns:
+        저장한 행 수 (실패 시 0)
+    """
     if not all_daily_prices_params:
-        return
+        return 0
+    
+    rows = [{
+        'STOCK_CODE': p.get('p_code', p.get('stock_code')),
+        'PRICE_DATE': p.get('p_date', p.get('price_date')),
+        'CLOSE_PRICE': p.get('p_price', p.get('close_price')),
+        'HIGH_PRICE': p.get('p_high', p.get('high_price')),
+        'LOW_PRICE': p.get('p_low', p.get('low_price')),
+    } for p in all_daily_prices_params]
     
+    started = time.perf_counter()
     try:
-        for p in all_daily_prices_params:
-            session.execute(text("""
-                INSERT INTO STOCK_DAILY_PRICES (STOCK_CODE, PRICE_DATE, CLOSE_PRICE, HIGH_PRICE, LOW_PRICE)
-                VALUES (:code, :date, :price, :high, :low)
-                ON DUPLICATE KEY UPDATE
-                    CLOSE_PRICE = VALUES(CLOSE_PRICE),
-                    HIGH_PRICE = VALUES(HIGH_PRICE),
-                    LOW_PRICE = VALUES(LOW_PRICE)
-            """), {
-                'code': p.get('p_code', p.get('stock_code')),
-                'date': p.get('p_date', p.get('price_date')),
-                'price': p.get('p_price', p.get('close_price')),
-                'high': p.get('p_high', p.get('high_price')),
-                'low': p.get('p_low', p.get('low_price'))
-            })
-        
+        written = _bulk_write(session, "STOCK_DAILY_PRICES", _DAILY_CLOSE_COLUMNS, ("STOCK_CODE", "PRICE_DATE"),
+                              rows, chunk_size, use_infile)
         session.commit()
-        logger.info(f"✅ DB: 모든 종목의 일봉 데이터 {len(all_daily_prices_params)}건 Bulk 저장 완료.")
+        # 캐시된 DB 마지막 일자 제거 → 다음 캐시 조회 때 DB와 다시 비교 (price_store)
+        db_last_date_cache.invalidate("STOCK_DAILY_PRICES", {r['STOCK_CODE'] for r in rows})
+        _log_bulk_result("모든 종목의 일봉 데이터", written, started)
+        return written
     except Exception as e:
         logger.error(f"❌ DB: 모든 종목 일봉 데이터 Bulk 저장 실패! (에러: {e})")
         session.rollback()
+        return 0
 
 
-def update_all_stock_fundamentals(session, all_fundamentals_params: List[dict]):
+def save_daily_ohlcv(session, rows: List[dict], table_name: str = "STOCK_DAILY_PRICES_3Y",
+                     chunk_size: Optional[int] = None, use_infile: bool = False,
+                     sync_store: bool = True) -> int:
+    """
+    [v5.1] 수집기용 일봉 OHLCV Bulk UPSERT (commit은 호출자가 수행)
+    rows: code, date, open, high, low, close, volume 키를 가진 dict (KIS 일봉 수집 결과 형식)
+    sync_store: 저장한 행을 로컬 가격 스토어(price_store)에도 반영.
+        commit 이후에 반영하려는 호출자는 False로 두고 commit 뒤 price_store.append_ohlcv_rows를 호출합니다.
+    
+    Returns:
+        저장한 행 수 (DB 오류는 예외로 전달)
+    """
+    rows = list(rows)
+    written = _bulk_write(session, table_name, _DAILY_OHLCV_COLUMNS, ("STOCK_CODE", "PRICE_DATE"), ({
+        'STOCK_CODE': r['code'],
+        'PRICE_DATE': r['date'],
+        'OPEN_PRICE': r.get('open'),
+        'HIGH_PRICE': r.get('high'),
+        'LOW_PRICE': r.get('low'),
+        'CLOSE_PRICE': r.get('close'),
+        'VOLUME': r.get('volume', 0),
+    } for r in rows), chunk_size, use_infile)
+    db_last_date_cache.invalidate(table_name, {r['code'] for r in rows})
+    if sync_store and table_name == PRICE_STORE_TABLE:
+        append_ohlcv_rows(rows)
+    return written
+
+
+def update_all_stock_fundamentals(session, all_fundamentals_params: List[dict],
+                                  chunk_size: Optional[int] = None, use_infile: bool = False) -> int:
     """
     [v5.0] 주요 재무지표(PER, PBR, ROE) Bulk 저장/업데이트 (SQLAlchemy)
+    [v5.1] chunk_size개씩 executemany로 전송 (save_all_daily_prices와 동일)
+    
+    Returns:
+        저장한 행 수 (실패 시 0)
     """
-    from sqlalchemy import text
+    if not all_fundamentals_params:
+        return 0
+    
+    rows = ({
+        'STOCK_CODE': p.get('stock_code'),
+        'TRADE_DATE': p.get('trade_date'),
+        'PER': p.get('per'),
+        'PBR': p.get('pbr'),
+        'ROE': p.get('roe'),
+        'MARKET_CAP': p.get('market_cap'),
+    } for p in all_fundamentals_params)
     
+    started = time.perf_counter()
     try:
-        for p in all_fundamentals_params:
-            session.execute(text("""
-                INSERT INTO STOCK_FUNDAMENTALS (STOCK_CODE, TRADE_DATE, PER, PBR, ROE, MARKET_CAP)
-                VALUES (:stock_code, :trade_date, :per, :pbr, :roe, :market_cap)
-                ON DUPLICATE KEY UPDATE
-                    PER = VALUES(PER),
-                    PBR = VALUES(PBR),
-                    ROE = VALUES(ROE),
-                    MARKET_CAP = VALUES(MARKET_CAP)
-            """), {
-                'stock_code': p.get('stock_code'),
-                'trade_date': p.get('trade_date'),
-                'per': p.get('per'),
-                'pbr': p.get('pbr'),
-                'roe': p.get('roe'),
-                'market_cap': p.get('market_cap')
-            })
-        
+        written = _bulk_write(session, "STOCK_FUNDAMENTALS", _FUNDAMENTAL_COLUMNS, ("STOCK_CODE", "TRADE_DATE"),
+                              rows, chunk_size, use_infile)
         session.commit()
-        logger.info(f"✅ DB: 재무지표 {len(all_fundamentals_params)}건 저장/업데이트 완료.")
+        _log_bulk_result("재무지표", written, started)
+        return written
     except Exception as e:
         logger.error(f"❌ DB: 재무지표 저장 실패! (에러: {e})")
         session.rollback()
+        return 0
 
 
 def get_daily_prices(connection, stock_code: str, limit: int = 30, table_name: str = "STOCK_DAILY_PRICES_3Y") -> pd.DataFrame:
     from sqlalchemy.orm import Session
     from sqlalchemy import text
     
+    # 로컬 Arrow 캐시에서 이 종목이 DB보다 뒤처지지 않았으면 DB를 거치지 않음 (shared/database/price_store.py)
+    cached = read_fresh_frames(connection, [stock_code], limit, include_code=False, table_name=table_name)
+    if stock_code in cached:
+        return cached[stock_code]
+    
     # SQLAlchemy Session인 경우
     if isinstance(connection, Session):
         result = connection.execute(text(f"""
@@ -225,8 +283,7 @@ def get_daily_prices(connection, stock_code: str, limit: int = 30, table_name: s
         df = pd.DataFrame(rows, columns=[
             "PRICE_DATE", "OPEN_PRICE", "HIGH_PRICE", "LOW_PRICE", "CLOSE_PRICE", "VOLUME"
         ])
-        df = df.iloc[::-1]  # 날짜 오름차순
-        return df
+        return _ascending_price_frame(df)
     
     # Raw connection인 경우
     cursor = connection.cursor()
@@ -249,108 +306,248 @@ def get_daily_prices(connection, stock_code: str, limit: int = 30, table_name: s
         df = pd.DataFrame(rows, columns=[
             "PRICE_DATE", "OPEN_PRICE", "HIGH_PRICE", "LOW_PRICE", "CLOSE_PRICE", "VOLUME"
         ])
-    df = df.iloc[::-1]  # 날짜 오름차순
+    return _ascending_price_frame(df)
+
+
+def _ascending_price_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """DESC로 조회한 일봉 → 날짜 오름차순, 0부터 시작하는 인덱스, PRICE_DATE는 datetime64 (캐시 경로와 동일한 형식)"""
+    df = df.iloc[::-1].reset_index(drop=True)
+    df["PRICE_DATE"] = pd.to_datetime(df["PRICE_DATE"])
     return df
 
 
-def get_daily_prices_batch(connection, stock_codes: list, limit: int = 120, table_name: str = "STOCK_DAILY_PRICES_3Y"):
+DAILY_PRICE_COLUMNS = ["STOCK_CODE", "PRICE_DATE", "OPEN_PRICE", "HIGH_PRICE", "LOW_PRICE", "CLOSE_PRICE", "VOLUME"]
+_DAILY_PRICE_FETCH_SIZE = 5000
+
+
+def _build_daily_prices_window_sql(table_name: str, placeholder: str, limit_param: str) -> str:
     """
-    여러 종목의 일봉을 한 번에 조회하여 dict[code] = DataFrame 형태로 반환
+    종목별 최근 N건만 서버에서 잘라오는 윈도우 쿼리 (MariaDB 10.2+ / SQLite 3.25+)
+    결과는 (STOCK_CODE, PRICE_DATE 오름차순)으로 정렬되어 종목별로 연속 구간을 이룹니다.
+    """
+    return f"""
+        SELECT STOCK_CODE, PRICE_DATE, OPEN_PRICE, HIGH_PRICE, LOW_PRICE, CLOSE_PRICE, VOLUME
+        FROM (
+            SELECT STOCK_CODE, PRICE_DATE, OPEN_PRICE, HIGH_PRICE, LOW_PRICE, CLOSE_PRICE, VOLUME,
+                   ROW_NUMBER() OVER (PARTITION BY STOCK_CODE ORDER BY PRICE_DATE DESC) AS RN
+            FROM {table_name}
+            WHERE STOCK_CODE IN ({placeholder})
+        ) ranked
+        WHERE RN <= {limit_param}
+        ORDER BY STOCK_CODE, PRICE_DATE
+    """
+
+
+def _load_daily_price_columns(fetchmany, capacity: int) -> Dict[str, np.ndarray]:
+    """
+    커서에서 fetchmany로 행을 끌어와 미리 할당한 NumPy 컬럼 배열에 바로 채웁니다.
+    (행 단위 dict / 종목별 DataFrame 생성 없음)
+    """
+    codes = np.empty(capacity, dtype=object)
+    dates = np.empty(capacity, dtype=object)
+    values = np.full((5, capacity), np.nan, dtype=np.float64)  # OPEN, HIGH, LOW, CLOSE, VOLUME
+
+    n = 0
+    while n < capacity:
+        rows = fetchmany(_DAILY_PRICE_FETCH_SIZE)
+        if not rows:
+            break
+        for row in rows:
+            if n >= capacity:
+                break
+            if isinstance(row, dict):
+                row = [row[col] for col in DAILY_PRICE_COLUMNS]
+            codes[n] = row[0]
+            dates[n] = row[1]
+            for j in range(5):
+                value = row[j + 2]
+                if value is not None:
+                    values[j, n] = value
+            n += 1
+
+    return {
+        "STOCK_CODE": codes[:n],
+        "PRICE_DATE": dates[:n],
+        "OPEN_PRICE": values[0, :n],
+        "HIGH_PRICE": values[1, :n],
+        "LOW_PRICE": values[2, :n],
+        "CLOSE_PRICE": values[3, :n],
+        "VOLUME": values[4, :n],
+    }
+
+
+def _split_price_frame_by_code(columns: Dict[str, np.ndarray], stock_codes: list) -> Dict[str, pd.DataFrame]:
     """
+    하나의 공유 DataFrame을 만들고 종목별 연속 구간을 iloc 슬라이스(복사 없음)로 나눠 반환합니다.
+    슬라이스는 0부터 시작하는 인덱스, PRICE_DATE는 datetime64로 캐시(price_store) 경로와 같은 형식입니다.
+    """
+    code_array = columns["STOCK_CODE"]
+    if len(code_array) == 0:
+        return {}
+    frame = pd.DataFrame(columns, columns=DAILY_PRICE_COLUMNS)
+    frame["PRICE_DATE"] = pd.to_datetime(frame["PRICE_DATE"])
+
+    # 정렬된 코드 배열에서 종목이 바뀌는 경계 위치
+    boundaries = np.flatnonzero(code_array[1:] != code_array[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [len(code_array)]))
+
+    result = {code: [] for code in stock_codes}
+    for start, end in zip(starts, ends):
+        code = code_array[start]
+        if code in result:
+            part = frame.iloc[start:end]
+            part.index = pd.RangeIndex(len(part))
+            result[code] = part
+    return result
+
+
+def _fetch_daily_price_columns(connection, stock_codes: list, limit: int, table_name: str) -> Dict[str, np.ndarray]:
+    """윈도우 쿼리를 실행하고 결과를 컬럼 배열로 반환합니다. (Session / Raw connection 공용)"""
     from sqlalchemy.orm import Session
     from sqlalchemy import text
     
-    if not stock_codes:
-        return {}
-    
-    result = {code: [] for code in stock_codes}
+    capacity = len(stock_codes) * max(int(limit), 0)
     
     # SQLAlchemy Session인 경우
     if isinstance(connection, Session):
-        # SQLAlchemy에서 IN 절 처리
         placeholder = ','.join([f':code{i}' for i in range(len(stock_codes))])
         params = {f'code{i}': code for i, code in enumerate(stock_codes)}
+        params['limit'] = int(limit)
         
-        query_result = connection.execute(text(f"""
-            SELECT STOCK_CODE, PRICE_DATE, OPEN_PRICE, HIGH_PRICE, LOW_PRICE, CLOSE_PRICE, VOLUME
-            FROM {table_name}
-            WHERE STOCK_CODE IN ({placeholder})
-            ORDER BY STOCK_CODE, PRICE_DATE DESC
-        """), params)
-        rows = query_result.fetchall()
-        
-        if not rows:
-            return {}
-        
-        for row in rows:
-            code = row[0]
-            if code in result:
-                result[code].append({
-                    "STOCK_CODE": row[0],
-                    "PRICE_DATE": row[1],
-                    "OPEN_PRICE": row[2],
-                    "HIGH_PRICE": row[3],
-                    "LOW_PRICE": row[4],
-                    "CLOSE_PRICE": row[5],
-                    "VOLUME": row[6],
-                })
-        
-        # dict -> DataFrame 변환 및 날짜 오름차순
-        for code, items in result.items():
-            if not items:
-                continue
-            df = pd.DataFrame(items)
-            df = df.iloc[::-1]
-            result[code] = df
-        
-        return result
+        query_result = connection.execute(
+            text(_build_daily_prices_window_sql(table_name, placeholder, ':limit')), params
+        )
+        return _load_daily_price_columns(query_result.fetchmany, capacity)
     
     # Raw connection인 경우
     cursor = connection.cursor()
     # MariaDB에서 리스트 파라미터 처리가 드라이버(PyMySQL/MySQLConnector)에 따라 다를 수 있어 안전하게 문자열 치환 사용
     # *주의: SQL Injection 방지를 위해 stock_codes 내용 검증 필요하나, 내부 로직상 안전하다 가정
     placeholder = ','.join(['%s'] * len(stock_codes))
-    cursor.execute(f"""
-        SELECT STOCK_CODE, PRICE_DATE, OPEN_PRICE, HIGH_PRICE, LOW_PRICE, CLOSE_PRICE, VOLUME
-        FROM {table_name}
-        WHERE STOCK_CODE IN ({placeholder})
-        ORDER BY STOCK_CODE, PRICE_DATE DESC
-    """, stock_codes)
-    rows = cursor.fetchall()
-    cursor.close()
-    
-    if not rows:
+    cursor.execute(_build_daily_prices_window_sql(table_name, placeholder, '%s'), [*stock_codes, int(limit)])
+    try:
+        return _load_daily_price_columns(cursor.fetchmany, capacity)
+    finally:
+        cursor.close()
+
+
+def get_daily_prices_batch(connection, stock_codes: list, limit: int = 120, table_name: str = "STOCK_DAILY_PRICES_3Y"):
+    """
+    여러 종목의 일봉을 한 번에 조회하여 dict[code] = DataFrame 형태로 반환
+
+    - 종목별 최근 `limit`건만 서버에서 윈도우 함수(ROW_NUMBER)로 잘라 전송량을 제한합니다.
+    - 행은 NumPy 컬럼 배열로 바로 적재되어 하나의 공유 DataFrame이 되고,
+      종목별 값은 그 DataFrame의 연속 구간 슬라이스(날짜 오름차순)입니다.
+    - 데이터가 없는 종목은 빈 리스트로 남습니다. (기존 동작 유지)
+    - 로컬 Arrow 캐시(price_store)에서 DB보다 뒤처지지 않은 종목은 mmap에서 읽고,
+      캐시에 없거나 뒤처진 종목만 SQL로 조회합니다.
+    """
+    if not stock_codes or int(limit) <= 0:
         return {}
     
-    # rows를 code별로 묶기
-    for row in rows:
-        if isinstance(row, dict):
-            code = row['STOCK_CODE']
-            result[code].append(row)
-        else:
-            # 튜플 인덱스 주의
-            code = row[0]
-            result[code].append({
-                "STOCK_CODE": row[0],
-                "PRICE_DATE": row[1],
-                "OPEN_PRICE": row[2],
-                "HIGH_PRICE": row[3],
-                "LOW_PRICE": row[4],
-                "CLOSE_PRICE": row[5],
-                "VOLUME": row[6],
-            })
-    
-    # dict -> DataFrame 변환 및 날짜 오름차순
-    for code, items in result.items():
-        if not items:
-            continue
-        df = pd.DataFrame(items)
-        df = df.iloc[::-1]
-        result[code] = df
+    stock_codes = list(dict.fromkeys(stock_codes))
+    
+    cached = read_fresh_frames(connection, stock_codes, limit, table_name=table_name)
+    if len(cached) == len(stock_codes):
+        return cached
     
+    remaining = [code for code in stock_codes if code not in cached]
+    columns = _fetch_daily_price_columns(connection, remaining, limit, table_name)
+    if len(columns["STOCK_CODE"]) == 0:
+        if not cached:
+            return {}
+        return {code: cached.get(code, []) for code in stock_codes}
+    
+    result = _split_price_frame_by_code(columns, remaining)
+    if cached:
+        result = {code: cached[code] if code in cached else result[code] for code in stock_codes}
     return result
 
 
+def get_close_price_panel(connection, stock_codes: list, limit: int = 120, table_name: str = "STOCK_DAILY_PRICES_3Y") -> pd.DataFrame:
+    """
+    여러 종목의 종가를 (날짜 × 종목) 패널로 반환합니다.
+
+    - 종목별 최근 `limit`건만 사용 (get_daily_prices_batch와 동일한 윈도우)
+    - 로컬 Arrow 캐시(price_store)에서 DB보다 뒤처지지 않은 종목은 캐시에서 읽고 나머지만 SQL로 조회
+    - index: PRICE_DATE (오름차순), columns: 요청 종목 코드 순서, 값 없는 칸은 NaN
+    """
+    if not stock_codes or int(limit) <= 0:
+        return pd.DataFrame()
+    
+    stock_codes = list(dict.fromkeys(stock_codes))
+    cached = read_fresh_frames(connection, stock_codes, limit, table_name=table_name)
+    parts = [(frame["STOCK_CODE"].to_numpy(), frame["PRICE_DATE"].to_numpy(), frame["CLOSE_PRICE"].to_numpy())
+             for frame in cached.values()]
+    remaining = [code for code in stock_codes if code not in cached]
+    if remaining:
+        columns = _fetch_daily_price_columns(connection, remaining, limit, table_name)
+        parts.append((columns["STOCK_CODE"], columns["PRICE_DATE"], columns["CLOSE_PRICE"]))
+    
+    code_array = np.concatenate([part[0] for part in parts]) if parts else np.empty(0, dtype=object)
+    if len(code_array) == 0:
+        return pd.DataFrame(columns=stock_codes, dtype=np.float64)
+    # 캐시(datetime64)와 SQL(date/datetime 객체) 일자를 같은 타입으로 맞춘 뒤 정렬
+    date_array = pd.to_datetime(np.concatenate([part[1] for part in parts])).to_numpy()
+    close_array = np.concatenate([part[2] for part in parts]).astype(np.float64, copy=False)
+    
+    dates, date_idx = np.unique(date_array, return_inverse=True)
+    code_pos = {code: i for i, code in enumerate(stock_codes)}
+    code_idx = np.fromiter((code_pos[c] for c in code_array), dtype=np.intp, count=len(code_array))
+    
+    matrix = np.full((len(dates), len(stock_codes)), np.nan, dtype=np.float64)
+    matrix[date_idx, code_idx] = close_array
+    return pd.DataFrame(matrix, index=pd.Index(dates, name="PRICE_DATE"), columns=stock_codes)
+
+
+_STOCK_NAME_CHUNK = 1000
+
+
+def get_stock_names(connection, stock_codes: Optional[List[str]] = None) -> Dict[str, str]:
+    """
+    종목 코드 → 종목명 (STOCK_MASTER). stock_codes를 주면 해당 종목만, 없으면 전체
+    (stock_codes는 _STOCK_NAME_CHUNK개씩 WHERE STOCK_CODE IN (...)으로 조회)
+    """
+    from sqlalchemy.orm import Session
+    from sqlalchemy import text
+    
+    query = "SELECT STOCK_CODE, STOCK_NAME FROM STOCK_MASTER"
+    if stock_codes is None:
+        chunks = [None]
+    else:
+        codes = list(dict.fromkeys(stock_codes))
+        chunks = [codes[i:i + _STOCK_NAME_CHUNK] for i in range(0, len(codes), _STOCK_NAME_CHUNK)]
+    
+    rows = []
+    for chunk in chunks:
+        # SQLAlchemy Session인 경우
+        if isinstance(connection, Session):
+            if chunk is None:
+                rows.extend(connection.execute(text(query)).fetchall())
+                continue
+            placeholder = ','.join([f':code{i}' for i in range(len(chunk))])
+            params = {f'code{i}': code for i, code in enumerate(chunk)}
+            rows.extend(connection.execute(
+                text(f"{query} WHERE STOCK_CODE IN ({placeholder})"), params).fetchall())
+            continue
+        # Raw connection인 경우
+        cursor = connection.cursor()
+        if chunk is None:
+            cursor.execute(query)
+        else:
+            cursor.execute(f"{query} WHERE STOCK_CODE IN ({','.join(['%s'] * len(chunk))})", chunk)
+        rows.extend(cursor.fetchall())
+        cursor.close()
+    
+    names = {}
+    for row in rows:
+        if isinstance(row, dict):
+            row = (row["STOCK_CODE"], row["STOCK_NAME"])
+        names[row[0]] = row[1] or row[0]
+    return names
+
+
 # ============================================================================
 # [News] 뉴스 감성 저장
 # ============================================================================
@@ -0,0 +1,458 @@
+"""
+shared/database/price_store.py
+
+STOCK_DAILY_PRICES_3Y 일봉의 로컬 컬럼형 캐시 (Arrow IPC, memory-mapped)
+
+- 파일 하나(`daily_prices.arrow`)에 종목별 레코드 배치 1개씩 저장합니다. (종목 = 파티션)
+  스키마 메타데이터에 종목 → 배치 번호, 종목별 마지막 일자, 전체 마지막 일자, 갱신 시각을 기록합니다.
+- 읽기는 pa.memory_map으로 열어 필요한 종목 배치만 복사 없이 꺼낸 뒤
+  한 번에 DataFrame으로 변환합니다. (파일이 바뀌지 않으면 리더를 재사용)
+- 쓰기(append_daily_prices)는 새로 받은 행만 해당 종목 배치에 병합하고,
+  변경 없는 종목 배치는 그대로 다시 씁니다. 임시 파일에 쓴 뒤 os.replace로 교체하므로
+  읽는 쪽은 항상 완전한 파일만 봅니다.
+- 활성화: 환경변수 PRICE_STORE_DIR (미설정이면 비활성 → 항상 SQL 조회)
+  신선도: 요청 종목의 DB 마지막 일자(종목별 MAX(PRICE_DATE))를 조회해 스토어의 종목별 마지막 일자와
+  비교하고, 뒤처지지 않은 종목만 캐시에서 읽습니다. 나머지는 호출자가 SQL로 조회합니다. (read_fresh_frames)
+  - (STOCK_CODE, PRICE_DATE) PK 인덱스에서 종목별로 한 번씩 seek만 하므로 일봉 조회보다 가벼움
+  - DB 마지막 일자는 (테이블, 종목)별로 PRICE_STORE_DB_CHECK_SECONDS(기본 60초) 동안 재사용 (LRU, 스레드 안전)
+  - 같은 일자 재기록/과거 구간 백필은 마지막 일자로 감지되지 않으므로, STOCK_DAILY_PRICES_3Y 쓰기 경로
+    (market.save_daily_ohlcv, utilities/data_collector, 수집 스크립트)는 DB 저장 후 같은 행을
+    append_daily_prices로 스토어에도 반영합니다.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+except ImportError:  # pragma: no cover - pyarrow 미설치 환경
+    pa = None
+    pa_ipc = None
+
+logger = logging.getLogger(__name__)
+
+PRICE_STORE_FILENAME = "daily_prices.arrow"
+PRICE_STORE_TABLE = "STOCK_DAILY_PRICES_3Y"
+PRICE_STORE_COLUMNS = ["STOCK_CODE", "PRICE_DATE", "OPEN_PRICE", "HIGH_PRICE", "LOW_PRICE", "CLOSE_PRICE", "VOLUME"]
+_VALUE_COLUMNS = PRICE_STORE_COLUMNS[2:]
+_DEFAULT_DB_CHECK_SECONDS = 60.0
+_DB_LAST_DATE_CHUNK = 500
+_DB_LAST_DATE_CACHE_SIZE = 20000
+
+_META_CODES = b"codes"
+_META_LAST_DATE = b"last_date"
+_META_CODE_LAST_DATES = b"code_last_dates"
+_META_UPDATED_AT = b"updated_at"
+
+
+def _schema():
+    fields = [pa.field("STOCK_CODE", pa.string()), pa.field("PRICE_DATE", pa.timestamp("us"))]
+    fields += [pa.field(col, pa.float64()) for col in _VALUE_COLUMNS]
+    return pa.schema(fields)
+
+
+class PriceStore:
+    """Arrow IPC 일봉 캐시 (종목별 레코드 배치, memory-mapped 읽기)"""
+
+    def __init__(self, root_dir: str):
+        if pa is None:
+            raise RuntimeError("pyarrow가 설치되어 있지 않아 PriceStore를 사용할 수 없습니다.")
+        self.root_dir = root_dir
+        self.path = os.path.join(root_dir, PRICE_STORE_FILENAME)
+        self._lock = threading.Lock()
+        self._reader = None
+        self._reader_key = None
+        self._code_index: Dict[str, int] = {}
+        self._code_last_date: Dict[str, datetime] = {}
+        self._last_date = None
+        self._updated_at = None
+
+    # ------------------------------------------------------------------
+    # 메타데이터 / 신선도
+    # ------------------------------------------------------------------
+
+    def _open(self):
+        """파일이 바뀌었을 때만 다시 mmap (파일 없으면 None)"""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        with self._lock:
+            if self._reader is None or self._reader_key != key:
+                reader = pa_ipc.open_file(pa.memory_map(self.path, "r"))
+                meta = reader.schema.metadata or {}
+                codes = json.loads(meta.get(_META_CODES, b"[]"))
+                self._code_index = {code: i for i, code in enumerate(codes)}
+                code_last_dates = json.loads(meta.get(_META_CODE_LAST_DATES, b"{}"))
+                self._code_last_date = {code: datetime.fromisoformat(value)
+                                        for code, value in code_last_dates.items()}
+                last_date = meta.get(_META_LAST_DATE, b"").decode()
+                updated_at = meta.get(_META_UPDATED_AT, b"").decode()
+                self._last_date = datetime.fromisoformat(last_date) if last_date else None
+                self._updated_at = datetime.fromisoformat(updated_at) if updated_at else None
+                self._reader = reader
+                self._reader_key = key
+            return self._reader
+
+    @property
+    def last_date(self) -> Optional[datetime]:
+        """저장된 가장 최근 PRICE_DATE"""
+        self._open()
+        return self._last_date
+
+    @property
+    def updated_at(self) -> Optional[datetime]:
+        """마지막 append 시각"""
+        self._open()
+        return self._updated_at
+
+    def codes(self) -> List[str]:
+        self._open()
+        return list(self._code_index)
+
+    def last_date_of(self, stock_code: str) -> Optional[datetime]:
+        """종목별 저장된 가장 최근 PRICE_DATE (없으면 None)"""
+        self._open()
+        return self._code_last_date.get(stock_code)
+
+    def fresh_codes(self, stock_codes: Iterable[str],
+                    db_last_dates: Optional[Dict[str, Optional[datetime]]]) -> List[str]:
+        """
+        마지막 일자가 DB보다 뒤처지지 않은 종목 (요청 순서 유지)
+        파일이 없거나 DB 마지막 일자를 모르면 빈 리스트, DB에 행이 없는 종목은 제외
+        """
+        if self._open() is None or not db_last_dates:
+            return []
+        fresh = []
+        for code in stock_codes:
+            last_date = self._code_last_date.get(code)
+            db_last_date = db_last_dates.get(code)
+            if last_date is not None and db_last_date is not None and \
+                    last_date.date() >= pd.Timestamp(db_last_date).date():
+                fresh.append(code)
+        return fresh
+
+    # ------------------------------------------------------------------
+    # 읽기
+    # ------------------------------------------------------------------
+
+    def read_batches(self, stock_codes: Iterable[str], limit: Optional[int] = None) -> Dict[str, "pa.RecordBatch"]:
+        """종목별 레코드 배치 (mmap 위의 zero-copy 슬라이스). 저장되지 않은 종목은 제외"""
+        reader = self._open()
+        if reader is None:
+            return {}
+        batches = {}
+        for code in stock_codes:
+            idx = self._code_index.get(code)
+            if idx is None:
+                continue
+            batch = reader.get_batch(idx)
+            if limit is not None and batch.num_rows > limit:
+                batch = batch.slice(batch.num_rows - limit)
+            batches[code] = batch
+        return batches
+
+    def read_frames(self, stock_codes: List[str], limit: Optional[int] = None,
+                    include_code: bool = True) -> Dict[str, pd.DataFrame]:
+        """
+        종목별 일봉 DataFrame (날짜 오름차순, RangeIndex).
+        요청 종목의 배치를 하나의 테이블로 묶어 한 번만 pandas로 변환하고,
+        종목별 결과는 그 DataFrame의 연속 구간 슬라이스입니다.
+        """
+        batches = self.read_batches(stock_codes, limit)
+        if not batches:
+            return {}
+        frame = pa.Table.from_batches(list(batches.values()), schema=_schema()).to_pandas()
+        if not include_code:
+            frame = frame.drop(columns="STOCK_CODE")
+
+        result = {}
+        start = 0
+        for code, batch in batches.items():
+            end = start + batch.num_rows
+            part = frame.iloc[start:end]
+            part.index = pd.RangeIndex(len(part))
+            result[code] = part
+            start = end
+        return result
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+
+    def append(self, rows: pd.DataFrame, now: Optional[datetime] = None) -> int:
+        """
+        새 일봉 행을 병합합니다. (STOCK_CODE, PRICE_DATE)가 겹치면 새 값이 우선합니다.
+        rows: PRICE_STORE_COLUMNS 컬럼을 가진 DataFrame
+        반환: 병합 대상이 된 종목 수
+        """
+        if rows is None or len(rows) == 0:
+            return 0
+        missing = [col for col in PRICE_STORE_COLUMNS if col not in rows.columns]
+        if missing:
+            raise ValueError(f"PriceStore.append: 누락된 컬럼 {missing}")
+
+        new_rows = rows[PRICE_STORE_COLUMNS].copy()
+        new_rows["STOCK_CODE"] = new_rows["STOCK_CODE"].astype(str)
+        new_rows["PRICE_DATE"] = pd.to_datetime(new_rows["PRICE_DATE"]).astype("datetime64[us]")
+        new_rows[_VALUE_COLUMNS] = new_rows[_VALUE_COLUMNS].astype(np.float64)
+
+        schema = _schema()
+        os.makedirs(self.root_dir, exist_ok=True)
+
+        reader = self._open()
+        code_index = dict(self._code_index) if reader is not None else {}
+        touched = pd.unique(new_rows["STOCK_CODE"])
+        old_batches = [reader.get_batch(code_index[code]) for code in touched if code in code_index]
+        if old_batches:
+            old_rows = pa.Table.from_batches(old_batches, schema=schema).to_pandas()
+            new_rows = pd.concat([old_rows, new_rows], ignore_index=True)
+        # 기존 행 뒤에 새 행을 붙였으므로 keep="last" = 새 값 우선
+        merged = (new_rows.drop_duplicates(subset=["STOCK_CODE", "PRICE_DATE"], keep="last")
+                  .sort_values(["STOCK_CODE", "PRICE_DATE"], kind="stable"))
+        merged_table = pa.Table.from_pandas(merged, schema=schema, preserve_index=False).combine_chunks()
+
+        code_array = merged["STOCK_CODE"].to_numpy()
+        boundaries = np.flatnonzero(code_array[1:] != code_array[:-1]) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [len(code_array)]))
+        merged_batches = {}
+        for start, end in zip(starts, ends):
+            merged_batches[code_array[start]] = merged_table.slice(start, end - start).to_batches()[0]
+
+        all_codes = sorted(set(code_index) | set(merged_batches))
+        code_last_date = dict(self._code_last_date) if reader is not None else {}
+        for code, batch in merged_batches.items():
+            code_last_date[code] = pd.Timestamp(batch.column(1)[-1].as_py()).to_pydatetime()
+        for code in all_codes:
+            if code not in code_last_date:
+                # 종목별 마지막 일자 메타가 없던 파일: 배치의 마지막 행에서 복원
+                batch = reader.get_batch(code_index[code])
+                code_last_date[code] = pd.Timestamp(batch.column(1)[-1].as_py()).to_pydatetime()
+        last_date = max(code_last_date.values())
+
+        metadata = {
+            _META_CODES: json.dumps(all_codes).encode(),
+            _META_CODE_LAST_DATES: json.dumps(
+                {code: code_last_date[code].isoformat() for code in all_codes}).encode(),
+            _META_LAST_DATE: last_date.isoformat().encode(),
+            _META_UPDATED_AT: (now or datetime.now()).isoformat().encode(),
+        }
+        tmp_path = f"{self.path}.tmp-{os.getpid()}-{threading.get_ident()}"
+        try:
+            with pa.OSFile(tmp_path, "wb") as sink:
+                with pa_ipc.new_file(sink, schema.with_metadata(metadata)) as writer:
+                    for code in all_codes:
+                        batch = merged_batches.get(code)
+                        if batch is None:
+                            batch = reader.get_batch(code_index[code])
+                        writer.write_batch(batch)
+            os.replace(tmp_path, self.path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        logger.info(f"✅ [PriceStore] {len(merged_batches)}개 종목 병합 (전체 {len(all_codes)}개, 마지막 일자 {last_date.date()})")
+        return len(merged_batches)
+
+
+# ============================================================================
+# 프로세스 공용 인스턴스
+# ============================================================================
+
+_store_lock = threading.Lock()
+_store: Optional[PriceStore] = None
+
+
+def get_price_store() -> Optional[PriceStore]:
+    """PRICE_STORE_DIR가 설정되어 있고 pyarrow가 있으면 공용 PriceStore, 아니면 None"""
+    global _store
+    root_dir = os.getenv("PRICE_STORE_DIR")
+    if not root_dir or pa is None:
+        return None
+    with _store_lock:
+        if _store is None or _store.root_dir != root_dir:
+            _store = PriceStore(root_dir)
+        return _store
+
+
+class DbLastDateCache:
+    """(테이블, 종목) → DB 마지막 일자 캐시 (TTL + LRU, 스레드 안전)"""
+
+    def __init__(self, maxsize=_DB_LAST_DATE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, table_name: str, stock_codes: Iterable[str],
+                 ttl: float) -> Tuple[Dict[str, Optional[datetime]], List[str]]:
+        """TTL 이내의 값과 다시 조회해야 할 종목 목록"""
+        now = time.monotonic()
+        hits = {}
+        missing = []
+        with self._lock:
+            for code in stock_codes:
+                key = (table_name, code)
+                entry = self._entries.get(key)
+                if entry is not None and now - entry[0] < ttl:
+                    self._entries.move_to_end(key)
+                    hits[code] = entry[1]
+                else:
+                    missing.append(code)
+        return hits, missing
+
+    def put_many(self, table_name: str, last_dates: Dict[str, Optional[datetime]]):
+        now = time.monotonic()
+        with self._lock:
+            for code, last_date in last_dates.items():
+                key = (table_name, code)
+                self._entries[key] = (now, last_date)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, table_name: str, stock_codes: Iterable[str]):
+        """쓰기 후 해당 종목을 다음 조회 때 다시 확인하도록 제거"""
+        with self._lock:
+            for code in stock_codes:
+                self._entries.pop((table_name, code), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+db_last_date_cache = DbLastDateCache()
+
+
+def _build_last_date_sql(table_name: str, placeholder: str) -> str:
+    return f"""
+        SELECT STOCK_CODE, MAX(PRICE_DATE)
+        FROM {table_name}
+        WHERE STOCK_CODE IN ({placeholder})
+        GROUP BY STOCK_CODE
+    """
+
+
+def _query_db_last_dates(connection, table_name: str, stock_codes: List[str]) -> Dict[str, datetime]:
+    """요청 종목의 DB 마지막 일자 (SQLAlchemy Session 또는 DB-API 연결, 행이 없는 종목은 제외)"""
+    from sqlalchemy.orm import Session
+    from sqlalchemy import text
+
+    rows = []
+    for i in range(0, len(stock_codes), _DB_LAST_DATE_CHUNK):
+        chunk = stock_codes[i:i + _DB_LAST_DATE_CHUNK]
+        if isinstance(connection, Session):
+            placeholder = ','.join(f':code{j}' for j in range(len(chunk)))
+            params = {f'code{j}': code for j, code in enumerate(chunk)}
+            rows.extend(connection.execute(text(_build_last_date_sql(table_name, placeholder)), params).fetchall())
+            continue
+        cur = connection.cursor()
+        try:
+            cur.execute(_build_last_date_sql(table_name, ','.join(['%s'] * len(chunk))), chunk)
+            rows.extend(cur.fetchall())
+        finally:
+            cur.close()
+
+    last_dates = {}
+    for row in rows:
+        if isinstance(row, dict):
+            row = list(row.values())
+        if row[1] is not None:
+            last_dates[row[0]] = pd.Timestamp(row[1]).to_pydatetime()
+    return last_dates
+
+
+def get_db_last_dates(connection, stock_codes: List[str],
+                      table_name: str = PRICE_STORE_TABLE) -> Optional[Dict[str, Optional[datetime]]]:
+    """
+    종목별 DB 마지막 PRICE_DATE (DB에 행이 없는 종목은 None)
+    PRICE_STORE_DB_CHECK_SECONDS 이내에 조회한 종목은 캐시 값을 쓰고 나머지만 조회합니다.
+    조회 실패 시 None
+    """
+    ttl = float(os.getenv("PRICE_STORE_DB_CHECK_SECONDS", _DEFAULT_DB_CHECK_SECONDS))
+    result, missing = db_last_date_cache.get_many(table_name, stock_codes, ttl)
+    if missing:
+        try:
+            fetched = _query_db_last_dates(connection, table_name, missing)
+        except Exception as e:
+            logger.debug(f"[PriceStore] DB 마지막 일자 조회 실패: {e}")
+            return None
+        fetched = {code: fetched.get(code) for code in missing}
+        db_last_date_cache.put_many(table_name, fetched)
+        result.update(fetched)
+    return result
+
+
+def read_fresh_frames(connection, stock_codes: List[str], limit: Optional[int] = None,
+                      include_code: bool = True, table_name: str = PRICE_STORE_TABLE) -> Dict[str, pd.DataFrame]:
+    """
+    스토어에서 DB보다 뒤처지지 않은 종목만 읽어 반환 (PriceStore.read_frames와 같은 형식)
+    캐시 대상 테이블이 아니거나 스토어가 없으면 빈 dict. 결과에 없는 종목은 호출자가 SQL로 조회합니다.
+    """
+    if table_name != PRICE_STORE_TABLE or not stock_codes:
+        return {}
+    store = get_price_store()
+    if store is None:
+        return {}
+    try:
+        stored = [code for code in stock_codes if store.last_date_of(code) is not None]
+        if not stored:
+            return {}
+        fresh = store.fresh_codes(stored, get_db_last_dates(connection, stored, table_name))
+        if len(fresh) < len(stock_codes):
+            logger.debug(f"[PriceStore] {len(stock_codes) - len(fresh)}개 종목이 없거나 DB보다 뒤처짐 "
+                         f"→ SQL 조회로 폴백")
+        return store.read_frames(fresh, limit, include_code) if fresh else {}
+    except Exception as e:
+        logger.warning(f"⚠️ [PriceStore] 열기 실패, SQL 조회로 폴백: {e}")
+    return {}
+
+
+def append_daily_prices(rows: pd.DataFrame) -> int:
+    """공용 스토어에 일봉 행 병합 (비활성이면 0)"""
+    store = get_price_store()
+    if store is None:
+        return 0
+    return store.append(rows)
+
+
+def ohlcv_rows_to_frame(rows: Iterable[dict]) -> pd.DataFrame:
+    """KIS 일봉 수집 결과(code, date, open, high, low, close, volume 키의 dict) → 스토어 적재용 DataFrame"""
+    frame = pd.DataFrame(list(rows), columns=["code", "date", "open", "high", "low", "close", "volume"])
+    return pd.DataFrame({
+        "STOCK_CODE": frame["code"].astype(str),
+        "PRICE_DATE": pd.to_datetime(frame["date"]),
+        "OPEN_PRICE": frame["open"],
+        "HIGH_PRICE": frame["high"],
+        "LOW_PRICE": frame["low"],
+        "CLOSE_PRICE": frame["close"],
+        "VOLUME": frame["volume"].fillna(0),
+    }, columns=PRICE_STORE_COLUMNS)
+
+
+def append_ohlcv_rows(rows: List[dict]) -> int:
+    """
+    DB에 저장한 KIS 일봉 행을 스토어에도 반영 (비활성이면 0)
+    스토어 병합에 실패하면 로그만 남기고, 해당 종목의 캐시된 DB 마지막 일자를 지워
+    다음 조회부터 DB와 다시 비교하게 합니다. (DB 저장은 이미 완료된 상태)
+    """
+    if not rows or get_price_store() is None:
+        return 0
+    try:
+        return append_daily_prices(ohlcv_rows_to_frame(rows))
+    except Exception as e:
+        logger.error(f"❌ [PriceStore] 일봉 병합 실패 (DB 저장은 완료됨): {e}")
+        db_last_date_cache.invalidate(PRICE_STORE_TABLE, {r['code'] for r in rows})
+        return 0
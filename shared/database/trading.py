@@ -367,21 +367,48 @@ def execute_trade_and_log(
 ):
     """
     거래 실행 및 로깅 (SQLAlchemy 우선, Legacy 폴백)
+    기록에 성공하면 Redis 'trading:fills' 채널로 체결 이벤트를 발행합니다.
+    (buy-executor의 매수 전 상태 캐시 무효화용)
     """
+    result = None
     if _is_sqlalchemy_ready():
         try:
             with sa_connection.session_scope() as session:
-                return _execute_trade_and_log_sqlalchemy(
+                result = _execute_trade_and_log_sqlalchemy(
                     session, trade_type, stock_info, quantity, price, llm_decision,
                     initial_stop_loss_price, strategy_signal, key_metrics_dict, market_context_dict
                 )
         except Exception as e:
             logger.error(f"❌ [SQLAlchemy] execute_trade_and_log 실패 - legacy 폴백: {e}", exc_info=True)
     
-    return _execute_trade_and_log_legacy(
-        connection, trade_type, stock_info, quantity, price, llm_decision,
-        initial_stop_loss_price, strategy_signal, key_metrics_dict, market_context_dict
-    )
+    if result is None:
+        result = _execute_trade_and_log_legacy(
+            connection, trade_type, stock_info, quantity, price, llm_decision,
+            initial_stop_loss_price, strategy_signal, key_metrics_dict, market_context_dict
+        )
+    if result:
+        _publish_trade_event(trade_type, stock_info, quantity, price)
+    return result
+
+
+def _publish_trade_event(trade_type, stock_info, quantity, price):
+    try:
+        from shared.redis_cache import (
+            publish_event, append_stream_event, TRADE_EVENTS_CHANNEL, STREAM_EVENT_FILL
+        )
+        event = {
+            "trade_type": trade_type,
+            "stock_code": stock_info.get('code'),
+            "stock_name": stock_info.get('name'),
+            "quantity": quantity,
+            "price": price,
+            "at": datetime.now(timezone.utc).isoformat(),
+        }
+        publish_event(TRADE_EVENTS_CHANNEL, event)
+        # Dashboard 실시간 푸시용 (Redis Streams)
+        append_stream_event(STREAM_EVENT_FILL, event)
+    except Exception as e:
+        logger.debug(f"체결 이벤트 발행 생략: {e}")
 
 
 def _execute_trade_and_log_sqlalchemy(
@@ -93,7 +93,9 @@ def init_engine(
             future=True,
             connect_args={
                 # GSSAPI 인증 플러그인 우회 (mysql_native_password 사용)
-                "auth_plugin_map": {"auth_gssapi_client": None}
+                "auth_plugin_map": {"auth_gssapi_client": None},
+                # LOAD DATA LOCAL INFILE 백필용 (shared/database/bulk.py)
+                "local_infile": os.getenv("MARIADB_LOCAL_INFILE", "false").lower() == "true",
             },
         )
         _session_factory = scoped_session(
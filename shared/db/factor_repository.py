@@ -17,8 +17,9 @@ factor_analyzer.py의 DB 접근 로직을 SQLAlchemy ORM으로 분리합니다.
 import logging
 from datetime import datetime, date, timedelta
 from typing import Dict, List, Optional, Tuple
+import numpy as np
 import pandas as pd
-from sqlalchemy import and_, desc, func
+from sqlalchemy import and_, desc, func, select
 from sqlalchemy.orm import Session
 
 from .models import (
@@ -36,6 +37,10 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# get_historical_price_frame: IN 쿼리 1회당 종목 수, long-format 컬럼 순서
+PRICE_BULK_CHUNK_SIZE = 500
+PRICE_FRAME_COLUMNS = ('STOCK_CODE', 'PRICE_DATE', 'CLOSE_PRICE', 'VOLUME', 'HIGH_PRICE', 'LOW_PRICE')
+
 
 class FactorRepository:
     """
@@ -100,6 +105,72 @@ class FactorRepository:
             logger.error(f"❌ [FactorRepo] 주가 데이터 조회 실패 ({stock_code}): {e}")
             return pd.DataFrame()
     
+    def get_historical_price_frame(
+        self,
+        stock_codes: List[str],
+        days: int = 504
+    ) -> pd.DataFrame:
+        """
+        여러 종목의 과거 주가를 하나의 long-format DataFrame으로 조회
+        
+        - 종목별 최근 `days`건만 윈도우 함수(ROW_NUMBER)로 서버에서 잘라옵니다.
+        - PRICE_BULK_CHUNK_SIZE개 종목씩 IN 쿼리 1회 (종목 수와 무관하게 왕복 수가 작음)
+        
+        Returns:
+            DataFrame with columns: [STOCK_CODE(categorical), PRICE_DATE, CLOSE_PRICE, VOLUME, HIGH_PRICE, LOW_PRICE]
+            (STOCK_CODE, PRICE_DATE 오름차순 정렬)
+        """
+        codes = list(dict.fromkeys(stock_codes))
+        columns = {name: [] for name in PRICE_FRAME_COLUMNS}
+        
+        for start in range(0, len(codes), PRICE_BULK_CHUNK_SIZE):
+            chunk = codes[start:start + PRICE_BULK_CHUNK_SIZE]
+            rn = func.row_number().over(
+                partition_by=StockDailyPrice.stock_code,
+                order_by=desc(StockDailyPrice.price_date),
+            ).label('rn')
+            ranked = (
+                select(
+                    StockDailyPrice.stock_code.label('stock_code'),
+                    StockDailyPrice.price_date.label('price_date'),
+                    StockDailyPrice.close_price.label('close_price'),
+                    StockDailyPrice.volume.label('volume'),
+                    StockDailyPrice.high_price.label('high_price'),
+                    StockDailyPrice.low_price.label('low_price'),
+                    rn,
+                )
+                .where(StockDailyPrice.stock_code.in_(chunk))
+                .subquery()
+            )
+            # ORM 엔티티 로딩 없이 Core select로 튜플만 수신
+            stmt = (
+                select(
+                    ranked.c.stock_code,
+                    ranked.c.price_date,
+                    ranked.c.close_price,
+                    ranked.c.volume,
+                    ranked.c.high_price,
+                    ranked.c.low_price,
+                )
+                .where(ranked.c.rn <= days)
+                .order_by(ranked.c.stock_code, ranked.c.price_date)
+            )
+            rows = self.session.execute(stmt).fetchall()
+            if not rows:
+                continue
+            for name, values in zip(PRICE_FRAME_COLUMNS, zip(*rows)):
+                columns[name].extend(values)
+        
+        frame = pd.DataFrame({
+            'STOCK_CODE': pd.Categorical(columns['STOCK_CODE'], categories=codes),
+            'PRICE_DATE': pd.to_datetime(pd.Series(columns['PRICE_DATE'], dtype=object)),
+            'CLOSE_PRICE': np.array(columns['CLOSE_PRICE'], dtype=np.float64),
+            'VOLUME': np.array(columns['VOLUME'], dtype=np.float64),
+            'HIGH_PRICE': np.array(columns['HIGH_PRICE'], dtype=np.float64),
+            'LOW_PRICE': np.array(columns['LOW_PRICE'], dtype=np.float64),
+        })
+        return frame
+    
     def get_historical_prices_bulk(
         self, 
         stock_codes: List[str], 
@@ -108,16 +179,43 @@ class FactorRepository:
         """
         여러 종목의 과거 주가 데이터 일괄 조회
         
+        [v1.2] 종목별 쿼리 루프 대신 get_historical_price_frame() 한 번으로 조회하고,
+        종목별 DataFrame은 공유 프레임의 연속 구간 뷰(데이터 복사 없음, 0부터 시작하는 인덱스)로 반환합니다.
+        
         Args:
             stock_codes: 종목 코드 리스트
             days: 조회할 일수
         
         Returns:
-            {stock_code: DataFrame} 딕셔너리
+            {stock_code: DataFrame} 딕셔너리 (get_historical_prices와 같은 컬럼, 데이터 없으면 빈 DataFrame)
         """
-        result = {}
-        for code in stock_codes:
-            result[code] = self.get_historical_prices(code, days)
+        result = {code: pd.DataFrame() for code in stock_codes}
+        if not stock_codes:
+            return result
+        
+        try:
+            frame = self.get_historical_price_frame(stock_codes, days)
+        except Exception as e:
+            # 윈도우 함수 미지원 DB 등: 종목별 조회로 폴백
+            logger.warning(f"⚠️ [FactorRepo] 주가 일괄 조회 실패, 종목별 조회로 폴백: {e}")
+            for code in stock_codes:
+                result[code] = self.get_historical_prices(code, days)
+            return result
+        
+        if frame.empty:
+            return result
+        
+        code_array = frame['STOCK_CODE'].cat.codes.to_numpy()
+        boundaries = np.flatnonzero(code_array[1:] != code_array[:-1]) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [len(code_array)]))
+        categories = frame['STOCK_CODE'].cat.categories
+        
+        for start, end in zip(starts, ends):
+            # STOCK_CODE 제외 (get_historical_prices와 같은 스키마), 슬라이스라 복사 없음
+            view = frame.iloc[start:end, 1:].copy(deep=False)
+            view.index = pd.RangeIndex(end - start)
+            result[categories[code_array[start]]] = view
         return result
     
     # =========================================================================
@@ -16,9 +16,30 @@ logger = logging.getLogger(__name__)
 # KIS Gateway 실시간 현재가 조회 (Dashboard V2용)
 # =============================================================================
 
+_gateway_client = None
+
+
+def _get_gateway_client():
+    """KIS_GATEWAY_URL용 KISGatewayClient (URL이 바뀌면 새로 생성)"""
+    global _gateway_client
+    from shared.kis.gateway_client import KISGatewayClient
+    
+    kis_gateway_url = os.getenv("KIS_GATEWAY_URL", "http://127.0.0.1:8080")
+    if _gateway_client is None or _gateway_client.gateway_url != kis_gateway_url:
+        _gateway_client = KISGatewayClient(gateway_url=kis_gateway_url, timeout=10)
+    return _gateway_client
+
+
+def _extract_snapshot_price(data) -> Optional[float]:
+    """KIS API 응답에서 현재가 추출 (stck_prpr 또는 price)"""
+    price = data.get("stck_prpr") or data.get("price") or data.get("current_price")
+    return float(price) if price else None
+
+
 def fetch_current_prices_from_kis(stock_codes: List[str]) -> Dict[str, float]:
     """
     KIS Gateway API를 통해 여러 종목의 실시간 현재가를 조회합니다.
+    KISGatewayClient.get_stock_snapshots 사용 (묶음 단위 일괄 조회, 실패한 묶음은 종목별 조회로 폴백)
     
     Args:
         stock_codes: 종목 코드 리스트
@@ -26,37 +47,20 @@ def fetch_current_prices_from_kis(stock_codes: List[str]) -> Dict[str, float]:
     Returns:
         {stock_code: current_price} 딕셔너리
     """
-    import httpx
-    
-    kis_gateway_url = os.getenv("KIS_GATEWAY_URL", "http://127.0.0.1:8080")
     prices = {}
-    
     if not stock_codes:
         return prices
     
     try:
-        with httpx.Client(timeout=10.0) as client:
-            for code in stock_codes:
-                try:
-                    # KIS Gateway의 Snapshot API 사용 (POST /api/market-data/snapshot)
-                    response = client.post(
-                        f"{kis_gateway_url}/api/market-data/snapshot",
-                        json={"stock_code": code, "is_index": False}
-                    )
-                    if response.status_code == 200:
-                        result = response.json()
-                        if result.get("success") and result.get("data"):
-                            data = result["data"]
-                            # KIS API 응답에서 현재가 추출 (stck_prpr 또는 price)
-                            price = data.get("stck_prpr") or data.get("price") or data.get("current_price")
-                            if price:
-                                prices[code] = float(price)
-                except Exception as e:
-                    logger.debug(f"종목 {code} 현재가 조회 실패: {e}")
-                    continue
+        snapshots = _get_gateway_client().get_stock_snapshots(stock_codes)
     except Exception as e:
         logger.warning(f"KIS Gateway 연결 실패: {e}")
+        return prices
     
+    for code, data in snapshots.items():
+        price = _extract_snapshot_price(data or {})
+        if price:
+            prices[code] = price
     return prices
 
 LLM_METADATA_MARKER = "[LLM_METADATA]"
@@ -277,10 +281,12 @@ def get_recently_traded_stocks_batch(session: Session, stock_codes: Iterable[str
 # Dashboard V2 API용 함수들
 # =============================================================================
 
-def get_portfolio_summary(session: Session, use_realtime: bool = True) -> dict:
+def get_portfolio_summary(session: Session, use_realtime: bool = True,
+                          known_prices: Optional[Dict[str, float]] = None) -> dict:
     """
     포트폴리오 요약 정보 (Dashboard V2용)
     실시간 현재가를 반영한 총 자산 및 수익률 계산
+    known_prices에 있는 종목은 Gateway를 호출하지 않습니다. (get_portfolio_with_current_prices 참고)
     """
     portfolio = get_active_portfolio(session)
     
@@ -295,12 +301,12 @@ def get_portfolio_summary(session: Session, use_realtime: bool = True) -> dict:
         }
     
     # 실시간 현재가 조회
-    stock_codes = [p["code"] for p in portfolio]
-    current_prices = {}
+    current_prices = dict(known_prices or {})
+    stock_codes = [p["code"] for p in portfolio if p["code"] not in current_prices]
     
-    if use_realtime:
+    if use_realtime and stock_codes:
         try:
-            current_prices = fetch_current_prices_from_kis(stock_codes)
+            current_prices.update(fetch_current_prices_from_kis(stock_codes))
         except Exception as e:
             logger.warning(f"⚠️ 실시간 현재가 조회 실패: {e}")
     
@@ -336,13 +342,16 @@ def get_portfolio_summary(session: Session, use_realtime: bool = True) -> dict:
     }
 
 
-def get_portfolio_with_current_prices(session: Session, use_realtime: bool = True) -> List[dict]:
+def get_portfolio_with_current_prices(session: Session, use_realtime: bool = True,
+                                      known_prices: Optional[Dict[str, float]] = None) -> List[dict]:
     """
     보유 종목 목록 (현재가 포함, Dashboard V2용)
     
     Args:
         session: SQLAlchemy 세션
         use_realtime: True면 KIS Gateway에서 실시간 현재가 조회
+        known_prices: 이미 알고 있는 현재가 {종목코드: 가격} (예: 대시보드 실시간 피드).
+                      여기 있는 종목은 Gateway를 호출하지 않습니다.
     """
     portfolio = get_active_portfolio(session)
     
@@ -350,14 +359,15 @@ def get_portfolio_with_current_prices(session: Session, use_realtime: bool = Tru
         return []
     
     # 실시간 현재가 조회
-    stock_codes = [p["code"] for p in portfolio]
-    current_prices = {}
+    current_prices = dict(known_prices or {})
+    stock_codes = [p["code"] for p in portfolio if p["code"] not in current_prices]
     
-    if use_realtime:
+    if use_realtime and stock_codes:
         try:
-            current_prices = fetch_current_prices_from_kis(stock_codes)
-            if current_prices:
-                logger.info(f"✅ 실시간 현재가 {len(current_prices)}개 조회 성공")
+            fetched = fetch_current_prices_from_kis(stock_codes)
+            if fetched:
+                current_prices.update(fetched)
+                logger.info(f"✅ 실시간 현재가 {len(fetched)}개 조회 성공")
         except Exception as e:
             logger.warning(f"⚠️ 실시간 현재가 조회 실패 (평균가 사용): {e}")
     
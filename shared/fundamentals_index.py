@@ -0,0 +1,179 @@
+"""
+shared/fundamentals_index.py - 시점 기준(point-in-time) 재무 데이터 인덱스
+=====================================================================
+
+분기/공시 기준일마다 바뀌는 재무 지표(PER/PBR/ROE 등)를 "그 날짜에 알 수 있었던 최신 값"으로 조회합니다.
+
+- 종목별로 기준일 오름차순 배열과 필드별 값 배열을 한 번만 만들어 두고,
+  조회는 np.searchsorted(side='right') - 1 로 as-of 위치를 찾습니다.
+  (조회마다 분기 키를 정렬하고 순회하던 방식 대체)
+- lookup(): 날짜 벡터 전체의 값을 한 번에 반환 (FactorAnalyzer 시점별 매칭)
+- as_of() / record_as_of(): 단일 날짜 조회 (백테스트, 스캐너)
+- panel(): 날짜 × 종목 as-of 패널 (factor_panel의 factor_panels 입력용)
+
+기준일보다 앞선 날짜는 값이 없습니다. (NaN / 빈 dict → 미래 데이터 참조 방지)
+같은 기준일이 여러 번이면 입력 순서상 마지막 값이 쓰입니다.
+
+사용 예시:
+---------
+>>> index = PointInTimeIndex.from_quarterly(financial_data)   # {code: {'YYYY-MM-DD': {per, pbr, roe}}}
+>>> values = index.lookup('005930', df['PRICE_DATE'])         # {'per': ndarray, 'pbr': ndarray, 'roe': ndarray}
+>>> index.as_of('005930', '2024-05-20')                       # {'per': 12.3, 'pbr': 1.1, 'roe': 9.8}
+"""
+
+import math
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+FUNDAMENTAL_FIELDS = ('per', 'pbr', 'roe')
+
+
+def _to_datetime64(dates) -> np.ndarray:
+    """날짜(문자열/date/datetime/Timestamp) 시퀀스 → datetime64[ns] 배열"""
+    if isinstance(dates, (pd.Series, pd.Index, np.ndarray)):
+        # 이미 datetime64인 가격 컬럼은 변환 없이 그대로 사용
+        if pd.api.types.is_datetime64_dtype(dates.dtype):
+            return np.asarray(dates, dtype='datetime64[ns]')
+    else:
+        dates = list(dates)
+    return pd.to_datetime(dates).to_numpy(dtype='datetime64[ns]')
+
+
+def _to_float(value) -> float:
+    if value is None:
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class PointInTimeIndex:
+    """
+    종목별 (기준일 오름차순 배열, 필드별 값 배열) as-of 인덱스
+
+    Args:
+        fields: 숫자 필드 이름 (기본: per, pbr, roe)
+    """
+
+    def __init__(self, fields: Sequence[str] = FUNDAMENTAL_FIELDS):
+        self.fields = tuple(fields)
+        self._dates: Dict[str, np.ndarray] = {}
+        self._values: Dict[str, Dict[str, np.ndarray]] = {}
+        self._records: Dict[str, List[Dict]] = {}
+
+    @classmethod
+    def from_quarterly(cls, financial_data: Dict[str, Dict[str, Dict]],
+                       fields: Sequence[str] = FUNDAMENTAL_FIELDS) -> "PointInTimeIndex":
+        """
+        {stock_code: {quarter_date: {per, pbr, roe}}} 형식에서 생성
+        (FactorAnalyzer._get_financial_data / FactorRepository.get_financial_data 반환값)
+        """
+        index = cls(fields)
+        financial_data = {code: quarters for code, quarters in financial_data.items() if quarters}
+        # 분기 날짜 문자열은 전 종목을 이어붙여 한 번만 변환
+        all_dates = _to_datetime64([q for quarters in financial_data.values() for q in quarters])
+        start = 0
+        for code, quarters in financial_data.items():
+            index.add(code, all_dates[start:start + len(quarters)], list(quarters.values()))
+            start += len(quarters)
+        return index
+
+    @classmethod
+    def from_records(cls, records: Dict[str, List[Dict]], date_key: str,
+                     fields: Sequence[str]) -> "PointInTimeIndex":
+        """
+        {stock_code: [{date_key: 기준일, field: 값, ...}, ...]} 형식에서 생성
+        원본 레코드를 보관하므로 record_as_of()로 레코드 전체를 조회할 수 있습니다.
+        """
+        index = cls(fields)
+        for code, rows in records.items():
+            rows = [row for row in rows if row.get(date_key) is not None]
+            if rows:
+                index.add(code, [row[date_key] for row in rows], rows, keep_records=True)
+        return index
+
+    def add(self, code: str, dates: Sequence, rows: Sequence[Dict], keep_records: bool = False):
+        """종목 하나의 기준일/값을 추가 (기존 값은 대체)"""
+        dates = _to_datetime64(dates)
+        order = np.argsort(dates, kind='stable')
+        self._dates[code] = dates[order]
+        self._values[code] = {
+            field: np.array([_to_float(rows[i].get(field)) for i in order], dtype=np.float64)
+            for field in self.fields
+        }
+        if keep_records:
+            self._records[code] = [rows[i] for i in order]
+
+    def __contains__(self, code: str) -> bool:
+        return code in self._dates
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    @property
+    def codes(self) -> List[str]:
+        return list(self._dates)
+
+    def positions(self, code: str, dates: Iterable) -> np.ndarray:
+        """날짜별 as-of 위치 (해당 날짜 이전 기준일이 없으면 -1)"""
+        targets = _to_datetime64(dates)
+        if code not in self._dates:
+            return np.full(len(targets), -1)
+        return np.searchsorted(self._dates[code], targets, side='right') - 1
+
+    def _position(self, code: str, date) -> int:
+        """단일 날짜의 as-of 위치 (종목이 없거나 이전 기준일이 없으면 -1)"""
+        if code not in self._dates:
+            return -1
+        target = pd.Timestamp(date).to_datetime64().astype('datetime64[ns]')
+        return int(np.searchsorted(self._dates[code], target, side='right')) - 1
+
+    def lookup(self, code: str, dates: Iterable,
+               fields: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        날짜 벡터 전체의 as-of 값
+
+        Returns:
+            {field: float 배열 (dates와 같은 길이, 값이 없으면 NaN)}
+        """
+        fields = tuple(fields or self.fields)
+        pos = self.positions(code, dates)
+        found = pos >= 0
+        results = {}
+        for field in fields:
+            values = np.full(len(pos), np.nan)
+            if code in self._values and found.any():
+                values[found] = self._values[code][field][pos[found]]
+            results[field] = values
+        return results
+
+    def as_of(self, code: str, date, fill_first: bool = False) -> Dict[str, Optional[float]]:
+        """
+        단일 날짜의 as-of 값 ({field: float 또는 None}, 기준일이 없으면 빈 dict)
+
+        fill_first=True면 첫 기준일보다 앞선 날짜에도 가장 오래된 값을 반환합니다. (기존 동작 호환용)
+        """
+        pos = self._position(code, date)
+        if pos < 0:
+            if not fill_first or code not in self._dates:
+                return {}
+            pos = 0
+        values = {field: float(self._values[code][field][pos]) for field in self.fields}
+        return {field: None if math.isnan(value) else value for field, value in values.items()}
+
+    def record_as_of(self, code: str, date) -> Dict:
+        """단일 날짜의 as-of 원본 레코드 (from_records로 만든 경우, 없으면 빈 dict)"""
+        if code not in self._records:
+            return {}
+        pos = self._position(code, date)
+        return self._records[code][pos] if pos >= 0 else {}
+
+    def panel(self, field: str, dates: Iterable, codes: Sequence[str]) -> pd.DataFrame:
+        """날짜 × 종목 as-of 패널 (값이 없으면 NaN)"""
+        index = pd.DatetimeIndex(_to_datetime64(dates))
+        values = np.column_stack([self.lookup(code, index, [field])[field] for code in codes]) \
+            if len(codes) else np.empty((len(index), 0))
+        return pd.DataFrame(values, index=index, columns=list(codes))
@@ -0,0 +1,225 @@
+"""
+shared/hybrid_scoring/condition_panel.py
+
+FactorAnalyzer 복합 조건(뉴스 + 수급 + 기술적) 분석용 컬럼형 패널
+
+- 전 종목의 가격/수급/뉴스 감성 이력을 (종목, 거래일) 한 행으로 정렬한 long-format 패널로 한 번만 맞춥니다.
+  (수급은 거래일 기준, 뉴스는 같은 날 최고 감성 점수로 합쳐서 결합)
+- RSI, 20일 평균 거래량, D+N 수익률도 패널 전체에 한 번에 계산하고, 종목 경계를 넘는 값은 NaN 처리합니다.
+- 복합 조건은 패널 컬럼(numpy 배열)에 대한 불리언 마스크 식이며,
+  조건을 만족한 날짜의 미래 수익률은 인덱스 배열로 한 번에 모읍니다. (조건 추가 비용이 작음)
+"""
+
+from datetime import datetime
+from typing import Callable, Dict, List, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+# 종목별 최소 가격 이력 (기존 analyze_compound_conditions 기준과 동일)
+MIN_HISTORY_DAYS = 30
+RSI_PERIOD = 14
+VOLUME_MA_WINDOW = 20
+
+# 패널 컬럼
+PANEL_COLUMNS = [
+    'STOCK_CODE', 'PRICE_DATE', 'CLOSE_PRICE', 'VOLUME',
+    'RSI', 'VOLUME_MA20', 'FOREIGN_NET', 'INST_NET', 'NEWS_SCORE', 'FORWARD_RETURN',
+]
+
+# 조건 평가에 쓰는 숫자 컬럼
+CONDITION_COLUMNS = ('CLOSE_PRICE', 'VOLUME', 'RSI', 'VOLUME_MA20',
+                     'FOREIGN_NET', 'INST_NET', 'NEWS_SCORE', 'FORWARD_RETURN')
+
+
+class ConditionSamples(NamedTuple):
+    """조건 충족 시점의 미래 수익률"""
+    returns: np.ndarray         # 전체 기간
+    recent_returns: np.ndarray  # 최근 구간 (recent_cutoff 이후)
+
+
+def _day_index(values: pd.Series) -> pd.Series:
+    """날짜/일시 → 자정 기준 Timestamp (뉴스 일시와 거래일을 같은 날로 맞춤)"""
+    return pd.to_datetime(values).dt.normalize()
+
+
+def _long_frame(frames: Dict[str, pd.DataFrame], columns: Dict[str, str]) -> pd.DataFrame:
+    """{종목: DataFrame} → STOCK_CODE 컬럼을 가진 long-format (columns: 원본 → 패널 컬럼명)"""
+    targets = list(dict.fromkeys(columns.values()))
+    codes, lengths = [], []
+    values = {name: [] for name in targets}
+    for code, df in frames.items():
+        if df is None or df.empty:
+            continue
+        available = {dst: src for src, dst in columns.items() if src in df.columns}
+        if not available:
+            continue
+        codes.append(code)
+        lengths.append(len(df))
+        # 종목별 DataFrame 연산 없이 컬럼 배열만 모아 마지막에 한 번 이어붙임
+        for name in targets:
+            values[name].append(df[available[name]].to_numpy() if name in available
+                                else np.full(len(df), np.nan))
+    if not codes:
+        return pd.DataFrame(columns=['STOCK_CODE', *targets])
+    frame = {'STOCK_CODE': np.repeat(np.array(codes, dtype=object), lengths)}
+    frame.update({name: np.concatenate(arrays) for name, arrays in values.items()})
+    return pd.DataFrame(frame)
+
+
+def _rolling_within_stock(values: pd.Series, window: int, position: np.ndarray, offset: int) -> np.ndarray:
+    """long 배열 전체에 rolling mean 후, 종목 내 위치가 offset 미만인 칸(이전 종목과 섞인 창)은 NaN"""
+    result = values.rolling(window=window).mean().to_numpy(copy=True)
+    result[position < offset] = np.nan
+    return result
+
+
+def build_condition_panel(price_data: Dict[str, pd.DataFrame],
+                          supply_data: Dict[str, pd.DataFrame],
+                          news_data: Dict[str, pd.DataFrame],
+                          forward_days: int = 5,
+                          min_history: int = MIN_HISTORY_DAYS) -> pd.DataFrame:
+    """
+    가격/수급/뉴스 이력을 (종목, 거래일) 기준 컬럼형 패널 하나로 정렬
+
+    Returns:
+        PANEL_COLUMNS 컬럼의 DataFrame (STOCK_CODE, PRICE_DATE 오름차순)
+        수급이 없는 날은 FOREIGN_NET/INST_NET가 NaN, 뉴스가 없는 날은 NEWS_SCORE가 NaN
+    """
+    prices = _long_frame(
+        {code: df for code, df in price_data.items() if df is not None and len(df) >= min_history},
+        {'PRICE_DATE': 'PRICE_DATE', 'CLOSE_PRICE': 'CLOSE_PRICE', 'VOLUME': 'VOLUME'},
+    )
+    if prices.empty:
+        return pd.DataFrame(columns=PANEL_COLUMNS)
+    prices['PRICE_DATE'] = _day_index(prices['PRICE_DATE'])
+    prices = prices.sort_values(['STOCK_CODE', 'PRICE_DATE'], kind='stable').reset_index(drop=True)
+
+    # 종목 내 위치 (0부터) / 종목 길이 → 종목 경계를 넘는 rolling·shift 값 제거용
+    codes = prices['STOCK_CODE'].to_numpy()
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    lengths = np.diff(np.r_[starts, len(codes)])
+    position = np.arange(len(codes)) - np.repeat(starts, lengths)
+    remaining = np.repeat(lengths, lengths) - position - 1
+
+    close = prices['CLOSE_PRICE'].astype(np.float64)
+    volume = prices['VOLUME'].astype(np.float64)
+
+    # 종목 첫날의 변화량은 0 (종목별 diff 후 where(delta > 0, 0)과 동일)
+    delta = close.diff()
+    delta[position == 0] = 0.0
+    gain = _rolling_within_stock(delta.clip(lower=0), RSI_PERIOD, position, RSI_PERIOD - 1)
+    loss = _rolling_within_stock(-delta.clip(upper=0), RSI_PERIOD, position, RSI_PERIOD - 1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        prices['RSI'] = 100 - (100 / (1 + gain / loss))
+    prices['VOLUME_MA20'] = _rolling_within_stock(volume, VOLUME_MA_WINDOW, position, VOLUME_MA_WINDOW - 1)
+
+    close_values = close.to_numpy()
+    forward = np.full(len(close_values), np.nan)
+    if forward_days < len(close_values):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            forward[:-forward_days] = (close_values[forward_days:] / close_values[:-forward_days] - 1) * 100
+    forward[remaining < forward_days] = np.nan
+    prices['FORWARD_RETURN'] = forward
+
+    # 수급: 거래일별 1행 (중복 시 마지막 값)
+    supply = _long_frame(supply_data, {
+        'TRADE_DATE': 'PRICE_DATE',
+        'FOREIGN_NET': 'FOREIGN_NET', 'FOREIGN_NET_BUY': 'FOREIGN_NET',
+        'INST_NET': 'INST_NET', 'INSTITUTION_NET_BUY': 'INST_NET',
+    })
+    if not supply.empty and 'PRICE_DATE' in supply.columns:
+        supply['PRICE_DATE'] = _day_index(supply['PRICE_DATE'])
+        supply = supply.drop_duplicates(['STOCK_CODE', 'PRICE_DATE'], keep='last')
+        prices = prices.merge(supply, on=['STOCK_CODE', 'PRICE_DATE'], how='left')
+
+    # 뉴스: 같은 날 여러 건이면 최고 점수 (조건 "점수 N 이상 뉴스가 있음"과 동일)
+    news = _long_frame(news_data, {'NEWS_DATE': 'PRICE_DATE', 'SENTIMENT_SCORE': 'NEWS_SCORE'})
+    if not news.empty and 'NEWS_SCORE' in news.columns:
+        news['PRICE_DATE'] = _day_index(news['PRICE_DATE'])
+        news['NEWS_SCORE'] = pd.to_numeric(news['NEWS_SCORE'], errors='coerce')
+        news = news.groupby(['STOCK_CODE', 'PRICE_DATE'], as_index=False, sort=False)['NEWS_SCORE'].max()
+        prices = prices.merge(news, on=['STOCK_CODE', 'PRICE_DATE'], how='left')
+
+    for column in ('FOREIGN_NET', 'INST_NET', 'NEWS_SCORE'):
+        prices[column] = pd.to_numeric(prices[column], errors='coerce') if column in prices.columns else np.nan
+    return prices[PANEL_COLUMNS]
+
+
+def panel_arrays(panel: pd.DataFrame, recent_cutoff: datetime) -> Dict[str, np.ndarray]:
+    """
+    패널 → 조건 평가용 numpy 컬럼 (숫자 컬럼은 float64, IS_RECENT는 recent_cutoff 이후 여부)
+
+    병렬 분석(parallel_analysis)에서는 이 배열들을 공유 메모리에 올려 워커가 그대로 읽습니다.
+    """
+    arrays = {name: panel[name].to_numpy(dtype=np.float64, na_value=np.nan) for name in CONDITION_COLUMNS}
+    arrays['IS_RECENT'] = (panel['PRICE_DATE'] >= pd.Timestamp(recent_cutoff)).to_numpy(dtype=bool)
+    return arrays
+
+
+def condition_samples(arrays: Dict[str, np.ndarray], mask: Callable) -> ConditionSamples:
+    """조건 마스크를 평가하고, 충족 시점의 미래 수익률을 인덱스 배열로 모음 (미래 수익률이 없는 시점 제외)"""
+    forward = arrays['FORWARD_RETURN']
+    with np.errstate(invalid='ignore'):
+        idx = np.flatnonzero(mask(arrays) & np.isfinite(forward))
+    return ConditionSamples(forward[idx], forward[idx[arrays['IS_RECENT'][idx]]])
+
+
+# 복합 조건 정의: 패널 컬럼(numpy 배열) → 불리언 마스크 (NaN 비교는 False → 데이터 없는 날은 미충족)
+COMPOUND_CONDITIONS: List[Dict] = [
+    {
+        'key': 'news_70_foreign_buy',
+        'desc': '뉴스점수 70↑ + 외국인 순매수',
+        'mask': lambda c: (c['NEWS_SCORE'] >= 70) & (c['FOREIGN_NET'] > 0),
+    },
+    {
+        'key': 'news_70_inst_buy',
+        'desc': '뉴스점수 70↑ + 기관 순매수',
+        'mask': lambda c: (c['NEWS_SCORE'] >= 70) & (c['INST_NET'] > 0),
+    },
+    {
+        'key': 'rsi_oversold_foreign_buy',
+        'desc': 'RSI 과매도 + 외국인 순매수',
+        'mask': lambda c: (c['RSI'] < 30) & (c['FOREIGN_NET'] > 0),
+    },
+    {
+        'key': 'volume_surge_foreign_buy',
+        'desc': '거래량 급증 + 외국인 순매수',
+        'mask': lambda c: (c['VOLUME'] > c['VOLUME_MA20'] * 2) & (c['FOREIGN_NET'] > 0),
+    },
+    {
+        'key': 'news_80_all_buy',
+        'desc': '뉴스점수 80↑ + 외국인+기관 동시 순매수',
+        'mask': lambda c: (c['NEWS_SCORE'] >= 80) & (c['FOREIGN_NET'] > 0) & (c['INST_NET'] > 0),
+    },
+]
+
+# 기본 조건 (run_full_analysis Step 2, 종목별 평가). 설명은 기존 FACTOR_PERFORMANCE 저장값대로 키를 그대로 사용
+BASIC_CONDITIONS: List[Dict] = [
+    {
+        'key': 'rsi_oversold_30',
+        'desc': 'rsi_oversold_30',
+        'mask': lambda c: c['RSI'] < 30,
+    },
+    {
+        'key': 'volume_surge_2x',
+        'desc': 'volume_surge_2x',
+        'mask': lambda c: c['VOLUME'] > c['VOLUME_MA20'] * 2,
+    },
+]
+
+# 조건 키 → 정의 (워커 프로세스는 마스크 함수 대신 키만 전달받음)
+CONDITIONS_BY_KEY: Dict[str, Dict] = {cond['key']: cond for cond in COMPOUND_CONDITIONS + BASIC_CONDITIONS}
+
+
+def evaluate_conditions(panel: pd.DataFrame,
+                        conditions: List[Dict],
+                        recent_cutoff: datetime) -> Dict[str, ConditionSamples]:
+    """
+    조건별 마스크를 평가하고, 충족 시점의 미래 수익률을 인덱스 배열로 모읍니다.
+
+    Returns:
+        {condition_key: ConditionSamples} (미래 수익률이 없는 시점은 제외)
+    """
+    arrays = panel_arrays(panel, recent_cutoff)
+    return {cond['key']: condition_samples(arrays, cond['mask']) for cond in conditions}
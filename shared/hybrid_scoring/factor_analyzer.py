@@ -13,6 +13,9 @@ Scout v1.0 FactorAnalyzer - 오프라인 팩터 분석 배치 작업
 5. [v1.0.2] 뉴스+수급 복합 조건 분석
 6. [v1.0.2] NEWS_FACTOR_STATS 테이블 채우기
 7. [v1.0.2] Recency Weighting 가중치 반영
+8. [v1.2] 패널(날짜 × 종목) 기반 일별 횡단면 Rank IC (factor_panel)
+9. [v1.3] (팩터, 섹터, 보유기간) 작업 프로세스 병렬 실행 (parallel_analysis, 공유 메모리 패널)
+10. [v1.3] 시점 기준 재무 인덱스로 PER/PBR/ROE 날짜 벡터 매칭 (shared.fundamentals_index)
 
 분석 결과는 DB에 저장되어 QuantScorer에서 활용됩니다.
 
@@ -45,7 +48,18 @@ from .factor_constants import (
     MARKET_REGIME_THRESHOLDS,
     STOCK_GROUP_THRESHOLDS,
 )
+from .condition_panel import (
+    BASIC_CONDITIONS,
+    COMPOUND_CONDITIONS,
+    ConditionSamples,
+    build_condition_panel,
+    evaluate_conditions,
+    panel_arrays,
+)
+from .factor_panel import ICSummary, build_close_panel, compute_panel_ic
+from .parallel_analysis import AnalysisPanels, ConditionJob, ICJob, resolve_workers, run_jobs
 from shared.database import _is_mariadb
+from shared.fundamentals_index import PointInTimeIndex
 
 # [v1.1] SQLAlchemy Repository 지원 (테스트 용이성)
 if TYPE_CHECKING:
@@ -97,6 +111,10 @@ class FactorAnalyzer:
     DISCLOSURE_TABLE = 'STOCK_DISCLOSURES'
     MARKET_REGIME_THRESHOLDS = MARKET_REGIME_THRESHOLDS
     STOCK_GROUP_THRESHOLDS = STOCK_GROUP_THRESHOLDS
+    # [v1.3] 분기 재무 데이터로 계산하는 팩터 → 재무 지표 필드
+    FINANCIAL_FACTOR_FIELDS = {'value_per': 'per', 'value_pbr': 'pbr', 'quality_roe': 'roe'}
+    # [v1.3] 일별 수급 데이터로 계산하는 팩터 → _get_supply_demand_data 컬럼
+    SUPPLY_FACTOR_FIELDS = {'supply_foreign_buy': 'FOREIGN_NET'}
     
     def __init__(self, db_conn=None, *, repository: "FactorRepository" = None):
         """
@@ -135,6 +153,12 @@ class FactorAnalyzer:
         # [v1.0.5] 시장 국면 캐시
         self._market_regime_cache = None
         self._stock_group_cache = {}
+        # [v1.2] 종가 패널 캐시 {days: (로드한 종목 set, 날짜 × 종목 패널)}
+        self._price_panel_cache = {}
+        # [v1.3] 재무 인덱스 캐시 (로드한 종목 set, PointInTimeIndex)
+        self._fundamentals_cache = None
+        # [v1.3] 수급 데이터 캐시 (조회 일수, 로드한 종목 set, {종목: DataFrame})
+        self._supply_demand_cache = None
         
         logger.info("✅ FactorAnalyzer 초기화 완료")
     
@@ -347,36 +371,41 @@ class FactorAnalyzer:
     def analyze_by_sector(self, 
                           stock_codes: List[str],
                           factor_key: str = 'technical_rsi_oversold',
-                          forward_days: int = 5) -> Dict[str, Dict]:
+                          forward_days: int = 5,
+                          workers: int = 1) -> Dict[str, Dict]:
         """
         [v1.0.6 Phase B] 섹터별 팩터 분석
+        [v1.3] 섹터별 작업을 analyze_factor_jobs로 한 번에 실행 (workers > 1이면 프로세스 병렬)
         
         Returns:
             {sector: {ic_mean, hit_rate, sample_count, ...}}
         """
-        logger.info(f"   📊 섹터별 {factor_key} 분석 (D+{forward_days})")
-        
         sector_groups = self.group_stocks_by_sector(stock_codes)
+        jobs = [(factor_key, sector, forward_days)
+                for sector, codes in sector_groups.items() if len(codes) >= 5]  # 최소 5개 종목 이상
+        factor_panels = self._external_factor_panels(self._get_price_panel(stock_codes), [factor_key])
+        factor_results = self.analyze_factor_jobs(stock_codes, jobs, sector_groups, workers, factor_panels)
+        return self._summarize_sectors(sector_groups, factor_results, factor_key, forward_days)
+    
+    def _summarize_sectors(self,
+                           sector_groups: Dict[str, List[str]],
+                           factor_results: Dict[Tuple[str, str, int], FactorAnalysisResult],
+                           factor_key: str,
+                           forward_days: int) -> Dict[str, Dict]:
+        """analyze_factor_jobs 결과 → 섹터별 요약 (표본 30개 이상, sector_groups 순서)"""
+        logger.info(f"   📊 섹터별 {factor_key} 분석 (D+{forward_days})")
         results = {}
-        
         for sector, codes in sector_groups.items():
-            if len(codes) < 5:  # 최소 5개 종목 이상
-                continue
-            
-            try:
-                result = self.analyze_factor(codes, factor_key, forward_days)
-                if result and result.sample_count >= 30:
-                    results[sector] = {
-                        'ic_mean': result.ic_mean,
-                        'hit_rate': result.hit_rate,
-                        'sample_count': result.sample_count,
-                        'stock_count': len(codes),
-                    }
-                    logger.info(f"      {sector} ({len(codes)}개): "
-                               f"IC={result.ic_mean:.4f}, 적중률={result.hit_rate:.1%}")
-            except Exception as e:
-                logger.debug(f"      {sector} 분석 실패: {e}")
-        
+            result = factor_results.get((factor_key, sector, forward_days))
+            if result and result.sample_count >= 30:
+                results[sector] = {
+                    'ic_mean': result.ic_mean,
+                    'hit_rate': result.hit_rate,
+                    'sample_count': result.sample_count,
+                    'stock_count': len(codes),
+                }
+                logger.info(f"      {sector} ({len(codes)}개): "
+                           f"IC={result.ic_mean:.4f}, 적중률={result.hit_rate:.1%}")
         return results
     
     def _is_mariadb(self) -> bool:
@@ -547,100 +576,158 @@ class FactorAnalyzer:
         
         return float(ic), float(ic_std), float(ir)
     
-    def analyze_factor(self,
-                       stock_codes: List[str],
-                       factor_key: str,
-                       forward_days: int = 5) -> FactorAnalysisResult:
+    @staticmethod
+    def _recommend_weight(ir: float) -> float:
+        """추천 가중치 (IR 기반: 0.5 이상이면 높은 가중치, 0 이하면 낮은 가중치)"""
+        if ir >= 0.5:
+            return min(0.20, 0.10 + ir * 0.1)
+        if ir >= 0:
+            return 0.10
+        return max(0.02, 0.05 + ir * 0.05)
+    
+    def _get_price_panel(self, stock_codes: List[str], days: int = 504) -> pd.DataFrame:
         """
-        단일 팩터의 예측력 분석
+        [v1.2] 날짜 × 종목 종가 패널 (run_full_analysis 동안 재사용)
+        
+        이미 로드한 종목의 부분집합(섹터별 분석 등)이면 DB를 다시 조회하지 않고 열만 골라 반환합니다.
+        """
+        cached = self._price_panel_cache.get(days)
+        if cached is None or not set(stock_codes) <= cached[0]:
+            price_data = self._get_historical_prices(stock_codes, days)
+            cached = (set(stock_codes), build_close_panel(price_data))
+            self._price_panel_cache[days] = cached
+        panel = cached[1]
+        return panel[[code for code in dict.fromkeys(stock_codes) if code in panel.columns]]
+    
+    def analyze_factors_panel(self,
+                              stock_codes: List[str],
+                              factor_keys: List[str] = None,
+                              forward_days: int = 5,
+                              factor_panels: Dict[str, pd.DataFrame] = None) -> Dict[str, FactorAnalysisResult]:
+        """
+        [v1.2] 여러 팩터의 예측력을 패널 기반 횡단면 Rank IC로 한 번에 분석
+        
+        날짜 × 종목 종가/미래 수익률 패널을 한 번 만든 뒤, 팩터마다 날짜별 종목 간 순위 상관(IC)을
+        벡터 연산으로 계산하고 IC 시계열에서 평균/표준편차/IR/적중률을 구합니다. (factor_panel 참고)
         
         Args:
             stock_codes: 분석 대상 종목 코드 리스트
-            factor_key: 팩터 키 (예: 'momentum_6m')
+            factor_keys: 팩터 키 리스트 (None이면 FACTOR_DEFINITIONS 전체)
             forward_days: 미래 수익률 측정 기간
+            factor_panels: 종가로 계산할 수 없는 팩터(재무/수급)의 날짜 × 종목 패널 (선택)
         
         Returns:
-            FactorAnalysisResult 객체
+            {factor_key: FactorAnalysisResult} (표본 부족 팩터는 기본값 결과)
         """
-        factor_def = self.FACTOR_DEFINITIONS.get(factor_key)
-        if not factor_def:
-            raise ValueError(f"Unknown factor: {factor_key}")
+        factor_keys = list(factor_keys or self.FACTOR_DEFINITIONS.keys())
+        for factor_key in factor_keys:
+            if factor_key not in self.FACTOR_DEFINITIONS:
+                raise ValueError(f"Unknown factor: {factor_key}")
         
-        logger.info(f"   (FactorAnalyzer) {factor_def['name']} 분석 중...")
-        
-        # 가격 데이터 조회
-        price_data = self._get_historical_prices(stock_codes)
-        
-        all_factors = []
-        all_returns = []
+        close = self._get_price_panel(stock_codes)
+        summaries = compute_panel_ic(close, factor_keys, forward_days, factor_panels) if not close.empty else {}
         
-        for code, df in price_data.items():
-            if len(df) < 150:  # 최소 데이터 요구
-                continue
-            
-            # 팩터 계산
-            calc_func = getattr(self, factor_def['calc_func'])
-            factor_values = calc_func(df)
-            
-            # 미래 수익률 계산
-            forward_returns = self._calculate_forward_returns(df, forward_days)
-            
-            # 두 시리즈를 합쳐서 동시에 유효한 인덱스만 추출
-            combined = pd.DataFrame({
-                'factor': factor_values,
-                'return': forward_returns
-            }).dropna()
-            
-            all_factors.extend(combined['factor'].tolist())
-            all_returns.extend(combined['return'].tolist())
+        return {factor_key: self._result_from_summary(factor_key, summaries.get(factor_key))
+                for factor_key in factor_keys}
+    
+    def _result_from_summary(self, factor_key: str, summary: Optional[ICSummary]) -> FactorAnalysisResult:
+        """IC 요약 → FactorAnalysisResult (표본 부족이면 기본값 결과)"""
+        factor_name = self.FACTOR_DEFINITIONS[factor_key]['name']
+        sample_count = summary.sample_count if summary else 0
         
-        if len(all_factors) < 100:
-            logger.warning(f"   (FactorAnalyzer) {factor_key} 표본 부족 ({len(all_factors)}개)")
+        if summary is None or sample_count < 100 or summary.date_count < 2:
+            logger.warning(f"   (FactorAnalyzer) {factor_key} 표본 부족 ({sample_count}개)")
             return FactorAnalysisResult(
                 factor_key=factor_key,
-                factor_name=factor_def['name'],
+                factor_name=factor_name,
                 ic_mean=0.0,
                 ic_std=1.0,
                 ir=0.0,
                 hit_rate=0.5,
                 recommended_weight=0.05,
-                sample_count=len(all_factors),
+                sample_count=sample_count,
             )
         
-        # IC 계산
-        factor_series = pd.Series(all_factors)
-        return_series = pd.Series(all_returns)
-        ic_mean, ic_std, ir = self.calculate_ic(factor_series, return_series)
+        logger.info(f"   ✅ {factor_name}: IC={summary.ic_mean:.4f}, IR={summary.ir:.4f}, "
+                   f"적중률={summary.hit_rate:.1%}, 표본={sample_count} ({summary.date_count}일)")
+        return FactorAnalysisResult(
+            factor_key=factor_key,
+            factor_name=factor_name,
+            ic_mean=round(summary.ic_mean, 4),
+            ic_std=round(summary.ic_std, 4),
+            ir=round(summary.ir, 4),
+            hit_rate=round(summary.hit_rate, 4),
+            recommended_weight=round(self._recommend_weight(summary.ir), 4),
+            sample_count=sample_count,
+        )
+    
+    def analyze_factor_jobs(self,
+                            stock_codes: List[str],
+                            jobs: List[Tuple[str, str, int]],
+                            sector_groups: Dict[str, List[str]] = None,
+                            workers: int = 1,
+                            factor_panels: Dict[str, pd.DataFrame] = None) -> Dict[Tuple[str, str, int], FactorAnalysisResult]:
+        """
+        [v1.3] (팩터, 섹터, 보유기간) 작업을 한 번에 실행
         
-        # 적중률 계산 (팩터 상위 20%의 평균 수익률이 양수인 비율)
-        combined = pd.DataFrame({'factor': all_factors, 'return': all_returns}).dropna()
-        top_quantile = combined[combined['factor'] >= combined['factor'].quantile(0.8)]
-        hit_rate = (top_quantile['return'] > 0).mean() if len(top_quantile) > 0 else 0.5
+        종가 패널은 stock_codes 전체로 한 번만 만들고, 섹터 작업은 그 패널의 종목 열 위치만 받습니다.
+        workers > 1이면 패널을 공유 메모리에 올려 ProcessPoolExecutor로 나눠 실행합니다. (parallel_analysis 참고)
         
-        # 추천 가중치 계산 (IR 기반)
-        # IR이 0.5 이상이면 높은 가중치, 0 이하면 낮은 가중치
-        if ir >= 0.5:
-            recommended_weight = min(0.20, 0.10 + ir * 0.1)
-        elif ir >= 0:
-            recommended_weight = 0.10
-        else:
-            recommended_weight = max(0.02, 0.05 + ir * 0.05)
+        Args:
+            stock_codes: 분석 대상 종목 코드 리스트
+            jobs: (factor_key, sector, forward_days) 리스트 (sector='ALL'이면 전체 종목)
+            sector_groups: {섹터: 종목 코드 리스트} (None이면 group_stocks_by_sector)
+            workers: 프로세스 수 (0이면 CPU 코어 수)
+            factor_panels: 종가로 계산할 수 없는 팩터(재무/수급)의 날짜 × 종목 패널 (선택, 종가 패널과 함께 공유)
         
-        result = FactorAnalysisResult(
-            factor_key=factor_key,
-            factor_name=factor_def['name'],
-            ic_mean=round(ic_mean, 4),
-            ic_std=round(ic_std, 4),
-            ir=round(ir, 4),
-            hit_rate=round(hit_rate, 4),
-            recommended_weight=round(recommended_weight, 4),
-            sample_count=len(all_factors),
-        )
+        Returns:
+            {(factor_key, sector, forward_days): FactorAnalysisResult} (jobs 순서)
+        """
+        for factor_key, _, _ in jobs:
+            if factor_key not in self.FACTOR_DEFINITIONS:
+                raise ValueError(f"Unknown factor: {factor_key}")
+        if not jobs:
+            return {}
+        if sector_groups is None and any(sector != 'ALL' for _, sector, _ in jobs):
+            sector_groups = self.group_stocks_by_sector(stock_codes)
+        
+        close = self._get_price_panel(stock_codes)
+        positions = {code: i for i, code in enumerate(close.columns)}
+        ic_jobs = []
+        for factor_key, sector, forward_days in jobs:
+            columns = None
+            if sector != 'ALL':
+                columns = tuple(positions[code] for code in sector_groups.get(sector, []) if code in positions)
+            ic_jobs.append(ICJob(factor_key, sector, forward_days, columns))
+        
+        summaries = run_jobs(AnalysisPanels(close=close, factor_panels=factor_panels), ic_jobs,
+                             resolve_workers(workers))
+        return {job: self._result_from_summary(job[0], summary) for job, summary in zip(jobs, summaries)}
+    
+    def analyze_factor(self,
+                       stock_codes: List[str],
+                       factor_key: str,
+                       forward_days: int = 5) -> FactorAnalysisResult:
+        """
+        단일 팩터의 예측력 분석
         
-        logger.info(f"   ✅ {factor_def['name']}: IC={ic_mean:.4f}, IR={ir:.4f}, "
-                   f"적중률={hit_rate:.1%}, 표본={len(all_factors)}")
+        [v1.2] 종목별 값을 이어붙인 풀링 상관 대신 패널 기반 일별 횡단면 Rank IC 사용
+               (analyze_factors_panel 참고, 적중률 = IC > 0인 날짜 비율)
         
-        return result
+        Args:
+            stock_codes: 분석 대상 종목 코드 리스트
+            factor_key: 팩터 키 (예: 'momentum_6m')
+            forward_days: 미래 수익률 측정 기간
+        
+        Returns:
+            FactorAnalysisResult 객체
+        """
+        factor_def = self.FACTOR_DEFINITIONS.get(factor_key)
+        if not factor_def:
+            raise ValueError(f"Unknown factor: {factor_key}")
+        
+        logger.info(f"   (FactorAnalyzer) {factor_def['name']} 분석 중...")
+        return self.analyze_factors_panel(stock_codes, [factor_key], forward_days)[factor_key]
     
     def analyze_condition_performance(self,
                                       stock_code: str,
@@ -816,12 +903,21 @@ class FactorAnalyzer:
         
         GPT 피드백: "PER/PBR/ROE 데이터 입력 없음" 해결
         [v1.0.3] FINANCIAL_METRICS_QUARTERLY 테이블에서 분기별 데이터 조회
+        [v1.3] Repository 모드 지원
         
         Returns:
             {stock_code: {quarter_date_str: {'per': float, 'pbr': float, 'roe': float}}}
         """
         result = {}
         
+        if self.repository is not None:
+            for code, quarters in self.repository.get_financial_data(stock_codes).items():
+                result[code] = {
+                    q_date_str: {key: float(value) if value else None for key, value in metrics.items()}
+                    for q_date_str, metrics in quarters.items()
+                }
+            return result
+        
         try:
             cursor = self.db_conn.cursor()
             
@@ -884,59 +980,60 @@ class FactorAnalyzer:
         
         return result
     
-    def _get_financial_at_date(self, financial_data: Dict, stock_code: str, target_date) -> Dict:
+    def _get_fundamentals_index(self, stock_codes: List[str]) -> PointInTimeIndex:
+        """
+        [v1.3] 종목별 분기 재무 데이터의 시점 기준 인덱스 (run_full_analysis 동안 재사용)
+        
+        이미 로드한 종목의 부분집합이면 DB를 다시 조회하지 않습니다.
+        """
+        cached = self._fundamentals_cache
+        if cached is None or not set(stock_codes) <= cached[0]:
+            cached = (set(stock_codes), PointInTimeIndex.from_quarterly(self._get_financial_data(stock_codes)))
+            self._fundamentals_cache = cached
+        return cached[1]
+    
+    def _get_financial_at_date(self, financial_data, stock_code: str, target_date) -> Dict:
         """
         [v1.0.3] 특정 날짜에 해당하는 분기의 재무 데이터 반환
+        [v1.3] PointInTimeIndex as-of 조회 (날짜 벡터는 PointInTimeIndex.lookup 사용)
         
         Args:
-            financial_data: _get_financial_data()의 반환값
+            financial_data: PointInTimeIndex 또는 _get_financial_data()의 반환값
             stock_code: 종목 코드
             target_date: 대상 날짜 (datetime 또는 str)
         
         Returns:
             {'per': float, 'pbr': float, 'roe': float} 또는 빈 딕셔너리
+            (해당 날짜 이전 분기가 없으면 가장 오래된 분기)
         """
-        if stock_code not in financial_data:
-            return {}
-        
-        quarters = financial_data[stock_code]
-        if not quarters:
-            return {}
-        
-        # 날짜를 문자열로 변환
-        if hasattr(target_date, 'strftime'):
-            target_str = target_date.strftime('%Y-%m-%d')
-        else:
-            target_str = str(target_date)[:10]
-        
-        # 해당 날짜 이전의 가장 최근 분기 찾기
-        sorted_quarters = sorted(quarters.keys())
-        applicable_quarter = None
-        
-        for q_date in sorted_quarters:
-            if q_date <= target_str:
-                applicable_quarter = q_date
-            else:
-                break
-        
-        if applicable_quarter:
-            return quarters[applicable_quarter]
-        
-        # 해당 날짜 이전 분기가 없으면 가장 오래된 분기 반환
-        if sorted_quarters:
-            return quarters[sorted_quarters[0]]
-        
-        return {}
+        if not isinstance(financial_data, PointInTimeIndex):
+            financial_data = PointInTimeIndex.from_quarterly({stock_code: financial_data.get(stock_code, {})})
+        return financial_data.as_of(stock_code, target_date, fill_first=True)
     
     def _get_supply_demand_data(self, stock_codes: List[str], days: int = 504) -> Dict[str, pd.DataFrame]:
         """
         [v1.0.2] 종목별 외국인/기관 수급 데이터 조회
-        
-        GPT 피드백: "외국인/기관 수급 조건 분석" 추가
+        [v1.3] run_full_analysis 동안 재사용 (수급 팩터 패널과 Step 4 복합 조건이 같은 데이터 사용)
         
         Returns:
             {stock_code: DataFrame with TRADE_DATE, FOREIGN_NET, INST_NET}
         """
+        cached = self._supply_demand_cache
+        if cached is None or cached[0] != days or not set(stock_codes) <= cached[1]:
+            cached = (days, set(stock_codes), self._load_supply_demand_data(stock_codes, days))
+            self._supply_demand_cache = cached
+        return {code: cached[2][code] for code in dict.fromkeys(stock_codes) if code in cached[2]}
+    
+    def _load_supply_demand_data(self, stock_codes: List[str], days: int = 504) -> Dict[str, pd.DataFrame]:
+        """_get_supply_demand_data의 DB 조회 (GPT 피드백: "외국인/기관 수급 조건 분석" 추가)"""
+        # [v1.2] Repository 모드 우선 (컬럼명은 레거시 모드와 같게 정규화)
+        if self.repository is not None:
+            return {
+                code: df.rename(columns={'FOREIGN_NET_BUY': 'FOREIGN_NET', 'INSTITUTION_NET_BUY': 'INST_NET'})
+                for code, df in self.repository.get_supply_demand_data(stock_codes, days).items()
+                if not df.empty
+            }
+        
         result = {}
         
         try:
@@ -986,6 +1083,11 @@ class FactorAnalyzer:
         Returns:
             {stock_code: DataFrame with NEWS_DATE, SENTIMENT_SCORE, CATEGORY}
         """
+        # [v1.2] Repository 모드 우선
+        if self.repository is not None:
+            return {code: df for code, df in self.repository.get_news_sentiment_history(stock_codes, days).items()
+                    if not df.empty}
+        
         result = {}
         
         try:
@@ -1356,334 +1458,97 @@ class FactorAnalyzer:
     def analyze_compound_conditions(self, stock_codes: List[str]) -> List[ConditionPerformance]:
         """
         [v1.0.2] 복합 조건 분석 (뉴스점수 70↑ + 외국인 순매수 등)
+        [v1.2] 가격/수급/뉴스를 (종목, 거래일) 컬럼형 패널로 한 번 정렬하고,
+               조건은 불리언 마스크로 평가 (condition_panel.COMPOUND_CONDITIONS)
         
         GPT 피드백: "뉴스 및 수급 조건 분석 미흡" 해결
         
         분석 대상 복합 조건:
-        1. 뉴스점수 70↑ + 외국인 순매수 5일 연속
+        1. 뉴스점수 70↑ + 외국인 순매수
         2. 뉴스점수 70↑ + 기관 순매수
         3. RSI 과매도 + 외국인 순매수
         4. 거래량 급증 + 외국인 순매수
+        5. 뉴스점수 80↑ + 외국인+기관 동시 순매수
         """
-        logger.info(f"   [v1.0.2] 복합 조건 분석 시작 ({len(stock_codes)}개 종목)")
+        logger.info(f"   [v1.2] 복합 조건 분석 시작 ({len(stock_codes)}개 종목)")
         
         results = []
         
-        price_data = self._get_historical_prices(stock_codes)
-        supply_data = self._get_supply_demand_data(stock_codes)
-        news_data = self._get_news_sentiment_history(stock_codes)
-        
-        # 복합 조건 정의
-        compound_conditions = [
-            {
-                'key': 'news_70_foreign_buy',
-                'desc': '뉴스점수 70↑ + 외국인 순매수',
-                'check': lambda p, s, n, d: self._check_news_foreign_condition(p, s, n, d, 70, True),
-            },
-            {
-                'key': 'news_70_inst_buy',
-                'desc': '뉴스점수 70↑ + 기관 순매수',
-                'check': lambda p, s, n, d: self._check_news_inst_condition(p, s, n, d, 70, True),
-            },
-            {
-                'key': 'rsi_oversold_foreign_buy',
-                'desc': 'RSI 과매도 + 외국인 순매수',
-                'check': lambda p, s, n, d: self._check_rsi_foreign_condition(p, s, n, d),
-            },
-            {
-                'key': 'volume_surge_foreign_buy',
-                'desc': '거래량 급증 + 외국인 순매수',
-                'check': lambda p, s, n, d: self._check_volume_foreign_condition(p, s, n, d),
-            },
-            {
-                'key': 'news_80_all_buy',
-                'desc': '뉴스점수 80↑ + 외국인+기관 동시 순매수',
-                'check': lambda p, s, n, d: self._check_news_all_buy_condition(p, s, n, d, 80),
-            },
-        ]
+        panel = build_condition_panel(
+            self._get_historical_prices(stock_codes),
+            self._get_supply_demand_data(stock_codes),
+            self._get_news_sentiment_history(stock_codes),
+            forward_days=5,
+        )
+        samples = evaluate_conditions(panel, COMPOUND_CONDITIONS, datetime.now() - timedelta(days=90))
         
-        for cond in compound_conditions:
-            all_returns = []
-            recent_returns = []
-            recent_cutoff = datetime.now() - timedelta(days=90)
-            
-            for code in stock_codes:
-                if code not in price_data:
-                    continue
-                
-                prices_df = price_data[code]
-                supply_df = supply_data.get(code, pd.DataFrame())
-                news_df = news_data.get(code, pd.DataFrame())
-                
-                if len(prices_df) < 30:
-                    continue
-                
-                # 조건 충족 시점 찾기
-                condition_dates = cond['check'](prices_df, supply_df, news_df, code)
-                
-                if not condition_dates:
-                    continue
-                
-                # 미래 수익률 계산
-                forward_returns = self._calculate_forward_returns(prices_df, 5)
-                
-                for date in condition_dates:
-                    price_idx = prices_df[prices_df['PRICE_DATE'] == date].index
-                    if len(price_idx) == 0:
-                        continue
-                    
-                    idx = price_idx[0]
-                    if idx >= len(forward_returns):
-                        continue
-                    
-                    ret = forward_returns.iloc[idx]
-                    if pd.isna(ret):
-                        continue
-                    
-                    all_returns.append(ret)
-                    if date >= recent_cutoff:
-                        recent_returns.append(ret)
-            
-            if len(all_returns) >= 5:
-                returns_arr = np.array(all_returns)
-                win_rate = (returns_arr > 0).mean()
-                avg_return = returns_arr.mean()
-                recent_win_rate = (np.array(recent_returns) > 0).mean() if len(recent_returns) > 0 else win_rate
-                
-                result = ConditionPerformance(
-                    target_type='ALL',
-                    target_code='ALL',
-                    condition_key=cond['key'],
-                    condition_desc=cond['desc'],
-                    win_rate=round(win_rate, 4),
-                    avg_return=round(avg_return, 4),
-                    sample_count=len(all_returns),
-                    recent_win_rate=round(recent_win_rate, 4),
-                    recent_sample_count=len(recent_returns),
-                )
+        for cond in COMPOUND_CONDITIONS:
+            result = self._condition_result('ALL', 'ALL', cond, samples[cond['key']])
+            if result:
                 results.append(result)
                 self.save_factor_performance(result)
                 
-                logger.info(f"   🔗 {cond['desc']}: 승률={win_rate:.1%}, "
-                           f"평균수익률={avg_return:.2f}%, 표본={len(all_returns)}")
+                logger.info(f"   🔗 {cond['desc']}: 승률={result.win_rate:.1%}, "
+                           f"평균수익률={result.avg_return:.2f}%, 표본={result.sample_count}")
         
         return results
     
-    def _check_news_foreign_condition(self, prices_df, supply_df, news_df, code, 
-                                      threshold=70, foreign_buy=True) -> List:
-        """뉴스점수 + 외국인 순매수 조건 체크"""
-        condition_dates = []
-        
-        if news_df.empty or supply_df.empty:
-            return condition_dates
-        
-        # [v1.0.5] 날짜 형식 정규화
-        if 'TRADE_DATE' not in supply_df.columns:
-            return condition_dates
-        
-        # 수급 데이터 날짜를 date로 변환
-        supply_dates = {}
-        for _, row in supply_df.iterrows():
-            trade_date = row['TRADE_DATE']
-            trade_date_only = trade_date.date() if hasattr(trade_date, 'date') else trade_date
-            supply_dates[trade_date_only] = row
-        
-        for _, news_row in news_df.iterrows():
-            sentiment = news_row.get('SENTIMENT_SCORE', 0)
-            news_date_raw = news_row.get('NEWS_DATE')
-            
-            if sentiment < threshold:
-                continue
-            
-            # [v1.0.5] 뉴스 날짜도 date로 변환
-            news_date = news_date_raw.date() if hasattr(news_date_raw, 'date') else news_date_raw
-            
-            # 해당 날짜 외국인 순매수 확인
-            if news_date not in supply_dates:
-                continue
-            
-            supply_row = supply_dates[news_date]
-            foreign_net = supply_row.get('FOREIGN_NET', 0)
-            if foreign_net is None:
-                foreign_net = 0
-            
-            if foreign_buy and foreign_net > 0:
-                condition_dates.append(news_date_raw)  # 원본 날짜 반환
-        
-        return condition_dates
-    
-    def _check_news_inst_condition(self, prices_df, supply_df, news_df, code,
-                                   threshold=70, inst_buy=True) -> List:
-        """뉴스점수 + 기관 순매수 조건 체크"""
-        condition_dates = []
-        
-        if news_df.empty or supply_df.empty:
-            return condition_dates
-        
-        # [v1.0.5] 날짜 형식 정규화
-        if 'TRADE_DATE' not in supply_df.columns:
-            return condition_dates
-        
-        supply_dates = {}
-        for _, row in supply_df.iterrows():
-            trade_date = row['TRADE_DATE']
-            trade_date_only = trade_date.date() if hasattr(trade_date, 'date') else trade_date
-            supply_dates[trade_date_only] = row
-        
-        for _, news_row in news_df.iterrows():
-            sentiment = news_row.get('SENTIMENT_SCORE', 0)
-            news_date_raw = news_row.get('NEWS_DATE')
-            
-            if sentiment < threshold:
-                continue
-            
-            news_date = news_date_raw.date() if hasattr(news_date_raw, 'date') else news_date_raw
-            
-            if news_date not in supply_dates:
-                continue
-            
-            supply_row = supply_dates[news_date]
-            inst_net = supply_row.get('INST_NET', 0)
-            if inst_net is None:
-                inst_net = 0
-            
-            if inst_buy and inst_net > 0:
-                condition_dates.append(news_date_raw)
-        
-        return condition_dates
-    
-    def _check_rsi_foreign_condition(self, prices_df, supply_df, news_df, code) -> List:
-        """RSI 과매도 + 외국인 순매수 조건 체크"""
-        condition_dates = []
-        
-        if supply_df.empty or len(prices_df) < 20:
-            return condition_dates
-        
-        # [v1.0.5] 수급 데이터 날짜 인덱싱
-        if 'TRADE_DATE' not in supply_df.columns:
-            return condition_dates
-        
-        supply_dates = {}
-        for _, row in supply_df.iterrows():
-            trade_date = row['TRADE_DATE']
-            trade_date_only = trade_date.date() if hasattr(trade_date, 'date') else trade_date
-            supply_dates[trade_date_only] = row
-        
-        # RSI 계산
-        close = prices_df['CLOSE_PRICE']
-        delta = close.diff()
-        gain = delta.where(delta > 0, 0).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        for i, (_, row) in enumerate(prices_df.iterrows()):
-            if i >= len(rsi) or pd.isna(rsi.iloc[i]):
-                continue
-            
-            if rsi.iloc[i] >= 30:  # RSI 30 이상이면 과매도 아님
-                continue
-            
-            price_date_raw = row['PRICE_DATE']
-            price_date = price_date_raw.date() if hasattr(price_date_raw, 'date') else price_date_raw
-            
-            if price_date not in supply_dates:
-                continue
-            
-            supply_row = supply_dates[price_date]
-            foreign_net = supply_row.get('FOREIGN_NET', 0)
-            if foreign_net is None:
-                foreign_net = 0
-            
-            if foreign_net > 0:
-                condition_dates.append(price_date_raw)
+    @staticmethod
+    def _condition_result(target_type: str,
+                          target_code: str,
+                          cond: Dict,
+                          samples: ConditionSamples) -> Optional[ConditionPerformance]:
+        """조건 충족 시점 수익률 → ConditionPerformance (표본 5개 미만이면 None)"""
+        all_returns, recent_returns = samples
+        if len(all_returns) < 5:
+            return None
         
-        return condition_dates
+        win_rate = float((all_returns > 0).mean())
+        recent_win_rate = float((recent_returns > 0).mean()) if len(recent_returns) > 0 else win_rate
+        return ConditionPerformance(
+            target_type=target_type,
+            target_code=target_code,
+            condition_key=cond['key'],
+            condition_desc=cond['desc'],
+            win_rate=round(win_rate, 4),
+            avg_return=round(float(all_returns.mean()), 4),
+            sample_count=len(all_returns),
+            recent_win_rate=round(recent_win_rate, 4),
+            recent_sample_count=len(recent_returns),
+        )
     
-    def _check_volume_foreign_condition(self, prices_df, supply_df, news_df, code) -> List:
-        """거래량 급증 + 외국인 순매수 조건 체크"""
-        condition_dates = []
-        
-        if supply_df.empty or 'VOLUME' not in prices_df.columns or len(prices_df) < 25:
-            return condition_dates
-        
-        # [v1.0.5] 수급 데이터 날짜 인덱싱
-        if 'TRADE_DATE' not in supply_df.columns:
-            return condition_dates
+    def analyze_basic_conditions(self, stock_codes: List[str], workers: int = 1) -> List[ConditionPerformance]:
+        """
+        [v1.3] 기본 조건(RSI 과매도, 거래량 급증)의 종목별 성과 (run_full_analysis Step 2)
         
-        supply_dates = {}
-        for _, row in supply_df.iterrows():
-            trade_date = row['TRADE_DATE']
-            trade_date_only = trade_date.date() if hasattr(trade_date, 'date') else trade_date
-            supply_dates[trade_date_only] = row
+        종목마다 가격을 다시 조회하던 방식 대신 가격 이력을 한 번 조회해 조건 패널을 만들고,
+        (조건, 종목) 작업을 패널 행 범위로 나눠 실행합니다. (workers > 1이면 프로세스 병렬)
         
-        vol_ma = prices_df['VOLUME'].rolling(20).mean()
+        Returns:
+            ConditionPerformance 리스트 (종목 순서 → 조건 순서, 표본 5개 미만 제외)
+        """
+        panel = build_condition_panel(self._get_historical_prices(stock_codes), {}, {},
+                                      forward_days=5, min_history=1)
+        if panel.empty:
+            return []
         
-        for i, (_, row) in enumerate(prices_df.iterrows()):
-            if i >= len(vol_ma) or pd.isna(vol_ma.iloc[i]):
-                continue
-            
-            if row['VOLUME'] <= vol_ma.iloc[i] * 2:  # 거래량 2배 미만
-                continue
-            
-            price_date_raw = row['PRICE_DATE']
-            price_date = price_date_raw.date() if hasattr(price_date_raw, 'date') else price_date_raw
-            
-            if price_date not in supply_dates:
-                continue
-            
-            supply_row = supply_dates[price_date]
-            foreign_net = supply_row.get('FOREIGN_NET', 0)
-            if foreign_net is None:
-                foreign_net = 0
-            
-            if foreign_net > 0:
-                condition_dates.append(price_date_raw)
+        # 패널은 종목별로 연속된 행 → 종목별 [start, stop) 범위
+        codes = panel['STOCK_CODE'].to_numpy()
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        ranges = dict(zip(codes[starts], zip(starts, np.r_[starts[1:], len(codes)])))
         
-        return condition_dates
-    
-    def _check_news_all_buy_condition(self, prices_df, supply_df, news_df, code, threshold=80) -> List:
-        """뉴스점수 + 외국인+기관 동시 순매수 조건 체크"""
-        condition_dates = []
-        
-        if news_df.empty or supply_df.empty:
-            return condition_dates
-        
-        # [v1.0.5] 날짜 형식 정규화
-        if 'TRADE_DATE' not in supply_df.columns:
-            return condition_dates
-        
-        supply_dates = {}
-        for _, row in supply_df.iterrows():
-            trade_date = row['TRADE_DATE']
-            trade_date_only = trade_date.date() if hasattr(trade_date, 'date') else trade_date
-            supply_dates[trade_date_only] = row
-        
-        for _, news_row in news_df.iterrows():
-            sentiment = news_row.get('SENTIMENT_SCORE', 0)
-            news_date_raw = news_row.get('NEWS_DATE')
-            
-            if sentiment < threshold:
-                continue
-            
-            news_date = news_date_raw.date() if hasattr(news_date_raw, 'date') else news_date_raw
-            
-            if news_date not in supply_dates:
-                continue
-            
-            supply_row = supply_dates[news_date]
-            foreign_net = supply_row.get('FOREIGN_NET', 0)
-            inst_net = supply_row.get('INST_NET', 0)
-            
-            if foreign_net is None:
-                foreign_net = 0
-            if inst_net is None:
-                inst_net = 0
-            
-            if foreign_net > 0 and inst_net > 0:
-                condition_dates.append(news_date_raw)
+        jobs = [ConditionJob(cond['key'], 'STOCK', code, int(ranges[code][0]), int(ranges[code][1]))
+                for code in dict.fromkeys(stock_codes) if code in ranges
+                for cond in BASIC_CONDITIONS]
+        conditions = {cond['key']: cond for cond in BASIC_CONDITIONS}
+        panels = AnalysisPanels(condition_arrays=panel_arrays(panel, datetime.now() - timedelta(days=90)))
         
-        return condition_dates
+        results = []
+        for job, samples in zip(jobs, run_jobs(panels, jobs, resolve_workers(workers))):
+            result = self._condition_result(job.target_type, job.target_code, conditions[job.condition_key], samples)
+            if result:
+                results.append(result)
+        return results
     
     def analyze_factor_with_financials(self,
                                        stock_codes: List[str],
@@ -1694,6 +1559,8 @@ class FactorAnalyzer:
         
         GPT 피드백: "PER/PBR/ROE 데이터 입력 없음" 해결
         [v1.0.3] 각 날짜에 해당하는 분기의 PER/PBR/ROE 사용
+        [v1.3] 재무 팩터도 PointInTimeIndex.panel()로 날짜 × 종목 패널을 만들어
+               다른 팩터와 같은 일별 횡단면 Rank IC로 분석 (적중률 = IC > 0인 날짜 비율)
         """
         factor_def = self.FACTOR_DEFINITIONS.get(factor_key)
         if not factor_def:
@@ -1701,119 +1568,59 @@ class FactorAnalyzer:
         
         logger.info(f"   (FactorAnalyzer) {factor_def['name']} 분석 중 (분기별 재무 데이터 매칭)...")
         
-        # 가격 데이터 및 분기별 재무 데이터 조회
-        price_data = self._get_historical_prices(stock_codes)
-        financial_data = self._get_financial_data(stock_codes)
-        
-        all_factors = []
-        all_returns = []
-        
-        for code, df in price_data.items():
-            if len(df) < 150:
+        close = self._get_price_panel(stock_codes)
+        factor_panels = None
+        if factor_key in self.FINANCIAL_FACTOR_FIELDS and not close.empty:
+            factor_panels = {factor_key: self._financial_factor_panel(close, factor_key)}
+        summaries = compute_panel_ic(close, [factor_key], forward_days, factor_panels) if not close.empty else {}
+        return self._result_from_summary(factor_key, summaries.get(factor_key))
+    
+    def _financial_factor_panel(self, close: pd.DataFrame, factor_key: str) -> pd.DataFrame:
+        """
+        종가 패널과 같은 모양의 재무 팩터 패널 (거래일 기준 as-of, 이전 분기가 없으면 NaN → 미래 분기 참조 없음)
+        PER/PBR은 낮을수록 좋으므로 양수만 부호를 바꿔 사용, ROE는 그대로
+        """
+        fundamentals = self._get_fundamentals_index(list(close.columns))
+        field = self.FINANCIAL_FACTOR_FIELDS[factor_key]
+        panel = fundamentals.panel(field, close.index, [code for code in close.columns if code in fundamentals])
+        if factor_key == 'quality_roe':
+            return panel
+        return -panel.where(panel > 0)
+    
+    def _external_factor_panels(self, close: pd.DataFrame, factor_keys) -> Optional[Dict[str, pd.DataFrame]]:
+        """종가로 계산할 수 없는 팩터(재무/수급)만 골라 종가 패널 모양의 팩터 패널로 (없으면 None)"""
+        if close.empty:
+            return None
+        panels = {}
+        for factor_key in dict.fromkeys(factor_keys):
+            if factor_key in self.FINANCIAL_FACTOR_FIELDS:
+                panels[factor_key] = self._financial_factor_panel(close, factor_key)
+            elif factor_key in self.SUPPLY_FACTOR_FIELDS:
+                panels[factor_key] = self._supply_factor_panel(close, factor_key)
+        return panels or None
+    
+    def _supply_factor_panel(self, close: pd.DataFrame, factor_key: str) -> pd.DataFrame:
+        """
+        종가 패널과 같은 모양의 수급 팩터 패널 (거래일별 순매수, 수급 데이터가 없는 날짜/종목은 NaN)
+        """
+        field = self.SUPPLY_FACTOR_FIELDS[factor_key]
+        columns = {}
+        for code, df in self._get_supply_demand_data(list(close.columns)).items():
+            if df is None or df.empty or field not in df.columns:
                 continue
-            
-            # 재무 팩터의 경우: 각 날짜에 해당하는 분기의 값 사용
-            calc_func = getattr(self, factor_def['calc_func'])
-            
-            if factor_key in ['value_per', 'value_pbr', 'quality_roe']:
-                # [v1.0.3] 시점별 재무 데이터 매칭
-                factor_values = []
-                valid_indices = []
-                
-                for idx, row in df.iterrows():
-                    # 해당 날짜의 재무 데이터 조회
-                    fin = self._get_financial_at_date(financial_data, code, idx)
-                    
-                    if factor_key == 'value_per':
-                        val = fin.get('per')
-                        if val and val > 0:
-                            factor_values.append(-val)  # 낮을수록 좋으므로 음수
-                            valid_indices.append(idx)
-                    elif factor_key == 'value_pbr':
-                        val = fin.get('pbr')
-                        if val and val > 0:
-                            factor_values.append(-val)  # 낮을수록 좋으므로 음수
-                            valid_indices.append(idx)
-                    elif factor_key == 'quality_roe':
-                        val = fin.get('roe')
-                        if val is not None:
-                            factor_values.append(val)  # 높을수록 좋음
-                            valid_indices.append(idx)
-                
-                if len(factor_values) < 50:
-                    continue
-                
-                factor_series = pd.Series(factor_values, index=valid_indices)
-                forward_returns = self._calculate_forward_returns(df, forward_days)
-                
-                # 공통 인덱스에서만 값 추출
-                common_idx = factor_series.index.intersection(forward_returns.index)
-                if len(common_idx) < 50:
-                    continue
-                
-                all_factors.extend(factor_series.loc[common_idx].tolist())
-                all_returns.extend(forward_returns.loc[common_idx].tolist())
-            else:
-                factor_values = calc_func(df)
-                forward_returns = self._calculate_forward_returns(df, forward_days)
-                
-                # 동일 길이 보장
-                combined = pd.DataFrame({'factor': factor_values, 'return': forward_returns}).dropna()
-                all_factors.extend(combined['factor'].tolist())
-                all_returns.extend(combined['return'].tolist())
-        
-        if len(all_factors) < 100:
-            logger.warning(f"   (FactorAnalyzer) {factor_key} 표본 부족 ({len(all_factors)}개)")
-            return FactorAnalysisResult(
-                factor_key=factor_key,
-                factor_name=factor_def['name'],
-                ic_mean=0.0,
-                ic_std=1.0,
-                ir=0.0,
-                hit_rate=0.5,
-                recommended_weight=0.05,
-                sample_count=len(all_factors),
-            )
-        
-        # IC 계산
-        factor_series = pd.Series(all_factors)
-        return_series = pd.Series(all_returns)
-        ic_mean, ic_std, ir = self.calculate_ic(factor_series, return_series)
-        
-        # 적중률 계산
-        combined = pd.DataFrame({'factor': all_factors, 'return': all_returns}).dropna()
-        top_quantile = combined[combined['factor'] >= combined['factor'].quantile(0.8)]
-        hit_rate = (top_quantile['return'] > 0).mean() if len(top_quantile) > 0 else 0.5
-        
-        # 추천 가중치 계산
-        if ir >= 0.5:
-            recommended_weight = min(0.20, 0.10 + ir * 0.1)
-        elif ir >= 0:
-            recommended_weight = 0.10
-        else:
-            recommended_weight = max(0.02, 0.05 + ir * 0.05)
-        
-        result = FactorAnalysisResult(
-            factor_key=factor_key,
-            factor_name=factor_def['name'],
-            ic_mean=round(ic_mean, 4),
-            ic_std=round(ic_std, 4),
-            ir=round(ir, 4),
-            hit_rate=round(hit_rate, 4),
-            recommended_weight=round(recommended_weight, 4),
-            sample_count=len(all_factors),
-        )
-        
-        logger.info(f"   ✅ {factor_def['name']}: IC={ic_mean:.4f}, IR={ir:.4f}, "
-                   f"적중률={hit_rate:.1%}, 표본={len(all_factors)}")
-        
-        return result
+            series = pd.Series(pd.to_numeric(df[field], errors='coerce').to_numpy(dtype=np.float64),
+                               index=pd.DatetimeIndex(pd.to_datetime(df['TRADE_DATE'])).normalize())
+            columns[code] = series[~series.index.duplicated(keep='last')]
+        if not columns:
+            return pd.DataFrame(np.nan, index=close.index, columns=close.columns)
+        return pd.DataFrame(columns).reindex(index=close.index, columns=close.columns)
     
     def run_full_analysis(self, 
                           stock_codes: List[str] = None,
                           market_regime: str = 'ALL',
                           lookback_days: int = 730,
-                          force_refresh: bool = False) -> Dict:
+                          force_refresh: bool = False,
+                          workers: int = 1) -> Dict:
         """
         전체 팩터 분석 실행 (배치 작업)
         
@@ -1822,11 +1629,15 @@ class FactorAnalyzer:
         - 뉴스 카테고리별 영향도 분석
         - 복합 조건 분석 (뉴스+수급)
         
+        [v1.3] Step 1/6/8의 종가 패널 (팩터, 섹터, 보유기간) 작업과 Step 2의 (조건, 종목) 작업을
+               workers개 프로세스로 나눠 실행 (패널은 공유 메모리, 결과는 작업 순서대로 병합)
+        
         Args:
             stock_codes: 분석 대상 종목 (None이면 전체)
             market_regime: 시장 국면
             lookback_days: 분석 기간 (일)
             force_refresh: True면 캐시 무시하고 전체 재분석
+            workers: 병렬 프로세스 수 (1: 순차 실행, 0: CPU 코어 수)
         
         Returns:
             분석 결과 요약
@@ -1858,17 +1669,52 @@ class FactorAnalyzer:
         logger.info("\n   [Step 1] 팩터 예측력 분석 (재무 데이터 연동)")
         
         # 재무 관련 팩터는 재무 데이터를 포함하여 분석
-        financial_factors = ['value_per', 'value_pbr', 'quality_roe']
+        financial_factors = list(self.FINANCIAL_FACTOR_FIELDS)
+        
+        long_term_factors = ['technical_rsi_oversold', 'quality_roe', 'value_per']
+        sector_factors = [
+            ('rsi_oversold', 'technical_rsi_oversold', 'RSI 과매도'),
+            ('quality_roe', 'quality_roe', 'ROE'),
+            ('momentum_1m', 'momentum_1m', '모멘텀'),
+        ]
+        
+        # [v1.2] 종가 패널을 한 번 만들어 Step 1/6/8에서 재사용
+        # [v1.3] 재무 인덱스도 한 번 만들어 재무 팩터(Step 1/6)에서 재사용
+        self._fundamentals_cache = None
+        # [v1.3] 수급 데이터도 한 번 조회해 수급 팩터 패널(Step 1)과 복합 조건(Step 4)에서 재사용
+        self._supply_demand_cache = None
+        # [v1.3] Step 1(D+5 전체), Step 6(D+20/D+60), Step 8(섹터별 D+5)의 종가 패널 작업을 한 번에 실행
+        #        (재무 팩터의 전체 종목 작업은 analyze_factor_with_financials, 섹터 작업은 재무 패널을 함께 공유)
+        self._price_panel_cache = {}
+        sector_groups = self.group_stocks_by_sector(stock_codes)
+        factor_jobs = [(k, 'ALL', 5) for k in self.FACTOR_DEFINITIONS if k not in financial_factors]
+        factor_jobs += [(k, 'ALL', days) for days in (20, 60) for k in long_term_factors if k not in financial_factors]
+        factor_jobs += [(k, sector, 5) for _, k, _ in sector_factors
+                        for sector, codes in sector_groups.items() if len(codes) >= 5]
+        factor_results = {}
+        try:
+            factor_panels = self._external_factor_panels(self._get_price_panel(stock_codes),
+                                                         [k for k, _, _ in factor_jobs])
+            factor_results = self.analyze_factor_jobs(stock_codes, factor_jobs, sector_groups, workers, factor_panels)
+        except Exception as e:
+            logger.error(f"   ❌ 패널 IC 분석 실패: {e}")
+            results['errors'].append({'step': 'panel_ic', 'error': str(e)})
         
         for factor_key in self.FACTOR_DEFINITIONS.keys():
             try:
                 if factor_key in financial_factors:
                     # [v1.0.2] 재무 데이터 포함 분석
                     result = self.analyze_factor_with_financials(stock_codes, factor_key)
+                elif (factor_key, 'ALL', 5) in factor_results:
+                    result = factor_results[(factor_key, 'ALL', 5)]
                 else:
-                    result = self.analyze_factor(stock_codes, factor_key)
+                    continue
                 
                 results['factor_analysis'].append(result)
+                if result.sample_count == 0:
+                    # 팩터 값이 하나도 없으면 기본값으로 운영 가중치를 덮어쓰지 않음
+                    logger.warning(f"   ⚠️ {factor_key} 팩터 데이터 없음 → FACTOR_METADATA 유지")
+                    continue
                 self.save_factor_metadata(result, market_regime)
             except Exception as e:
                 logger.error(f"   ❌ {factor_key} 분석 실패: {e}")
@@ -1877,39 +1723,14 @@ class FactorAnalyzer:
         # 2. 기본 조건부 성과 분석
         logger.info("\n   [Step 2] 기본 조건부 성과 분석")
         
-        # RSI 과매도 조건
-        def rsi_oversold_condition(df):
-            close = df['CLOSE_PRICE']
-            delta = close.diff()
-            gain = delta.where(delta > 0, 0).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            return rsi < 30
-        
-        # 거래량 급증 조건
-        def volume_surge_condition(df):
-            if 'VOLUME' not in df.columns:
-                return pd.Series([False] * len(df))
-            vol_ma = df['VOLUME'].rolling(20).mean()
-            return df['VOLUME'] > vol_ma * 2
-        
-        conditions = {
-            'rsi_oversold_30': rsi_oversold_condition,
-            'volume_surge_2x': volume_surge_condition,
-        }
-        
-        for code in stock_codes[:50]:  # 상위 50개 종목만 분석
-            for cond_key, cond_func in conditions.items():
-                try:
-                    result = self.analyze_condition_performance(
-                        code, cond_key, cond_func
-                    )
-                    if result:
-                        results['condition_analysis'].append(result)
-                        self.save_factor_performance(result)
-                except Exception as e:
-                    logger.debug(f"   {code}/{cond_key} 분석 실패: {e}")
+        # [v1.3] 상위 50개 종목 × (RSI 과매도, 거래량 급증)을 조건 패널 한 번으로 평가
+        try:
+            for result in self.analyze_basic_conditions(stock_codes[:50], workers):
+                results['condition_analysis'].append(result)
+                self.save_factor_performance(result)
+        except Exception as e:
+            logger.error(f"   ❌ 기본 조건 분석 실패: {e}")
+            results['errors'].append({'step': 'basic_conditions', 'error': str(e)})
         
         # 3. [v1.0.2] 뉴스 카테고리별 영향도 분석
         logger.info("\n   [Step 3] 뉴스 카테고리별 영향도 분석")
@@ -1948,11 +1769,11 @@ class FactorAnalyzer:
         # D+20 분석
         try:
             logger.info("   📈 D+20 수익률 분석 중...")
-            for factor_key in ['technical_rsi_oversold', 'quality_roe', 'value_per']:
+            for factor_key in long_term_factors:
                 if factor_key in financial_factors:
                     result = self.analyze_factor_with_financials(stock_codes, factor_key, forward_days=20)
                 else:
-                    result = self.analyze_factor(stock_codes, factor_key, forward_days=20)
+                    result = factor_results.get((factor_key, 'ALL', 20))
                 
                 if result:
                     results['long_term_analysis']['D+20'].append({
@@ -1969,11 +1790,11 @@ class FactorAnalyzer:
         # D+60 분석
         try:
             logger.info("   📈 D+60 수익률 분석 중...")
-            for factor_key in ['technical_rsi_oversold', 'quality_roe', 'value_per']:
+            for factor_key in long_term_factors:
                 if factor_key in financial_factors:
                     result = self.analyze_factor_with_financials(stock_codes, factor_key, forward_days=60)
                 else:
-                    result = self.analyze_factor(stock_codes, factor_key, forward_days=60)
+                    result = factor_results.get((factor_key, 'ALL', 60))
                 
                 if result:
                     results['long_term_analysis']['D+60'].append({
@@ -2010,25 +1831,18 @@ class FactorAnalyzer:
         results['sector_analysis'] = {}
         
         try:
-            # RSI 과매도 전략의 섹터별 효과
-            logger.info("   🏭 RSI 과매도 전략 섹터별 분석...")
-            rsi_by_sector = self.analyze_by_sector(stock_codes, 'technical_rsi_oversold', forward_days=5)
-            results['sector_analysis']['rsi_oversold'] = rsi_by_sector
-            
-            # ROE 전략의 섹터별 효과
-            logger.info("   🏭 ROE 전략 섹터별 분석...")
-            roe_by_sector = self.analyze_by_sector(stock_codes, 'quality_roe', forward_days=5)
-            results['sector_analysis']['quality_roe'] = roe_by_sector
-            
-            # 모멘텀 전략의 섹터별 효과
-            logger.info("   🏭 모멘텀 전략 섹터별 분석...")
-            momentum_by_sector = self.analyze_by_sector(stock_codes, 'momentum_1m', forward_days=5)
-            results['sector_analysis']['momentum_1m'] = momentum_by_sector
-            
+            for label, factor_key, desc in sector_factors:
+                logger.info(f"   🏭 {desc} 전략 섹터별 분석...")
+                results['sector_analysis'][label] = self._summarize_sectors(
+                    sector_groups, factor_results, factor_key, forward_days=5
+                )
         except Exception as e:
             logger.error(f"   ❌ 섹터별 분석 실패: {e}")
             results['errors'].append({'step': 'sector_analysis', 'error': str(e)})
         
+        self._price_panel_cache = {}
+        self._fundamentals_cache = None
+        self._supply_demand_cache = None
         elapsed = (datetime.now() - start_time).total_seconds()
         
         logger.info("\n" + "=" * 60)
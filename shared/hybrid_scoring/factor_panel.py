@@ -0,0 +1,174 @@
+"""
+shared/hybrid_scoring/factor_panel.py
+
+FactorAnalyzer용 패널(날짜 × 종목) 기반 횡단면 IC 엔진
+
+- 종목별 가격 DataFrame을 한 번에 날짜 × 종목 종가 패널로 펼치고,
+  팩터 패널과 미래 수익률 패널도 같은 모양으로 한 번에 계산합니다.
+- 일별 횡단면 Rank IC: 두 패널을 날짜(행)마다 순위화(axis=1)한 뒤 행 단위 상관계수를 한 번에 계산
+  (종목·날짜를 섞어 이어붙인 풀링 상관 대신, 같은 날짜의 종목 간 순위 상관)
+- IC 평균/표준편차/IR/적중률(IC > 0인 날짜 비율)은 일별 IC 시계열에서 계산합니다.
+"""
+
+from typing import Callable, Dict, Iterable, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from shared.strategy_panel import momentum_panel
+
+# 일별 IC를 계산할 최소 종목 수 (그보다 적은 날짜는 제외)
+MIN_STOCKS_PER_DATE = 5
+# 패널에 포함할 종목별 최소 가격 이력 (기존 analyze_factor의 150일 기준과 동일)
+MIN_HISTORY_DAYS = 150
+
+
+class ICSummary(NamedTuple):
+    """일별 횡단면 IC 요약"""
+    ic_mean: float
+    ic_std: float
+    ir: float
+    hit_rate: float      # IC > 0인 날짜 비율
+    sample_count: int    # IC 계산에 쓰인 (날짜, 종목) 쌍 수
+    date_count: int      # IC가 계산된 날짜 수
+
+
+def build_close_panel(price_data: Dict[str, pd.DataFrame],
+                      min_history: int = MIN_HISTORY_DAYS) -> pd.DataFrame:
+    """
+    {종목: 가격 DataFrame(PRICE_DATE, CLOSE_PRICE)} → 날짜 × 종목 종가 패널
+
+    이력이 min_history일 미만인 종목은 제외합니다. (종목마다 없는 날짜는 NaN)
+    """
+    codes, date_columns, close_arrays = [], [], []
+    for code, df in price_data.items():
+        if df is None or len(df) < min_history:
+            continue
+        codes.append(code)
+        date_columns.append(df['PRICE_DATE'])
+        close_arrays.append(df['CLOSE_PRICE'].to_numpy(dtype=np.float64))
+    if not codes:
+        return pd.DataFrame(dtype=np.float64)
+
+    # 날짜 변환은 전 종목을 이어붙여 한 번만 수행
+    all_dates = pd.to_datetime(pd.concat(date_columns, ignore_index=True)).to_numpy(dtype='datetime64[ns]')
+    dates = np.unique(all_dates)
+    positions = np.searchsorted(dates, all_dates)
+
+    # 종목별 Series를 concat하면 종목마다 블록이 생겨 이후 연산이 느려지므로, 2차원 배열 하나에 채움
+    values = np.full((len(dates), len(codes)), np.nan)
+    start = 0
+    for col, closes in enumerate(close_arrays):
+        # 같은 날짜가 중복되면 마지막 값 사용
+        values[positions[start:start + len(closes)], col] = closes
+        start += len(closes)
+    return pd.DataFrame(values, index=pd.DatetimeIndex(dates), columns=codes)
+
+
+def forward_return_panel(close: pd.DataFrame, forward_days: int) -> pd.DataFrame:
+    """D+forward_days 수익률(%) 패널 (FactorAnalyzer._calculate_forward_returns와 같은 정의)"""
+    return (close.shift(-forward_days) / close - 1) * 100
+
+
+def _momentum(close: pd.DataFrame, periods: int) -> pd.DataFrame:
+    # 날짜 × 종목 패널 그대로 strategy_panel 커널에 전달 (calculate_momentum과 같은 정의)
+    return pd.DataFrame(momentum_panel(close, periods), index=close.index, columns=close.columns)
+
+
+def _rsi_oversold(close: pd.DataFrame, period: int = 14) -> pd.DataFrame:
+    delta = close.diff()
+    gain = delta.clip(lower=0).rolling(window=period).mean()
+    loss = (-delta.clip(upper=0)).rolling(window=period).mean()
+    rsi = 100 - (100 / (1 + gain / loss))
+    return 100 - rsi
+
+
+# 종가 패널만으로 계산되는 팩터 (FactorAnalyzer._calc_* 의 패널 버전)
+PRICE_PANEL_FACTORS: Dict[str, Callable[[pd.DataFrame], pd.DataFrame]] = {
+    'momentum_6m': lambda close: _momentum(close, 120),
+    'momentum_1m': lambda close: _momentum(close, 20),
+    'technical_rsi_oversold': _rsi_oversold,
+}
+
+
+def _rank_rows(values: np.ndarray) -> np.ndarray:
+    """행(날짜)별 평균 순위 (NaN 유지)"""
+    return pd.DataFrame(values).rank(axis=1, method='average').to_numpy()
+
+
+def cross_sectional_rank_ic(factor: pd.DataFrame,
+                            forward_returns: pd.DataFrame,
+                            min_stocks: int = MIN_STOCKS_PER_DATE) -> pd.Series:
+    """
+    날짜별 횡단면 Rank IC (Spearman) 시계열
+
+    두 패널은 같은 모양(날짜 × 종목)이어야 하며, 둘 다 값이 있는 칸만 사용합니다.
+    유효 종목이 min_stocks 미만이거나 순위가 모두 같은 날짜는 NaN입니다.
+    """
+    f = factor.to_numpy(dtype=np.float64, na_value=np.nan)
+    r = forward_returns.to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = np.isfinite(f) & np.isfinite(r)
+    n = valid.sum(axis=1)
+
+    f_rank = _rank_rows(np.where(valid, f, np.nan))
+    r_rank = _rank_rows(np.where(valid, r, np.nan))
+    # 유효 칸의 평균 순위는 (n + 1) / 2
+    center = ((n + 1) / 2.0)[:, None]
+    f_dev = np.where(valid, f_rank - center, 0.0)
+    r_dev = np.where(valid, r_rank - center, 0.0)
+
+    cov = (f_dev * r_dev).sum(axis=1)
+    denom = np.sqrt((f_dev * f_dev).sum(axis=1) * (r_dev * r_dev).sum(axis=1))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ic = np.where((n >= min_stocks) & (denom > 0), cov / denom, np.nan)
+    return pd.Series(ic, index=factor.index)
+
+
+def summarize_ic(ic: pd.Series, sample_count: int = 0) -> ICSummary:
+    """일별 IC 시계열 → IC 평균/표준편차/IR/적중률"""
+    ic = ic.dropna()
+    if len(ic) < 2:
+        return ICSummary(0.0, 1.0, 0.0, 0.5, sample_count, len(ic))
+    ic_mean = float(ic.mean())
+    ic_std = float(ic.std())
+    if not np.isfinite(ic_std) or ic_std <= 0:
+        ir, ic_std = 0.0, 1.0
+    else:
+        ir = ic_mean / ic_std
+    return ICSummary(ic_mean, ic_std, ir, float((ic > 0).mean()), sample_count, len(ic))
+
+
+def compute_panel_ic(close: pd.DataFrame,
+                     factor_keys: Iterable[str],
+                     forward_days: int = 5,
+                     factor_panels: Optional[Dict[str, pd.DataFrame]] = None,
+                     min_stocks: int = MIN_STOCKS_PER_DATE) -> Dict[str, Optional[ICSummary]]:
+    """
+    여러 팩터의 일별 횡단면 IC를 한 번에 계산
+
+    Args:
+        close: 날짜 × 종목 종가 패널 (build_close_panel)
+        factor_keys: 계산할 팩터 키
+        forward_days: 미래 수익률 기간
+        factor_panels: 종가로 계산할 수 없는 팩터(재무/수급 등)의 날짜 × 종목 패널 (선택)
+
+    Returns:
+        {factor_key: ICSummary} (패널을 만들 수 없는 팩터는 None)
+    """
+    factor_panels = factor_panels or {}
+    returns = forward_return_panel(close, forward_days)
+    results = {}
+    for key in factor_keys:
+        if key in factor_panels:
+            panel = factor_panels[key].reindex(index=close.index, columns=close.columns)
+        elif key in PRICE_PANEL_FACTORS:
+            panel = PRICE_PANEL_FACTORS[key](close)
+        else:
+            results[key] = None
+            continue
+        ic = cross_sectional_rank_ic(panel, returns, min_stocks)
+        used = np.isfinite(panel.to_numpy(dtype=np.float64, na_value=np.nan)) & \
+            np.isfinite(returns.to_numpy(dtype=np.float64, na_value=np.nan))
+        sample_count = int(used[ic.notna().to_numpy()].sum())
+        results[key] = summarize_ic(ic, sample_count)
+    return results
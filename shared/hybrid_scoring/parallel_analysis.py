@@ -0,0 +1,200 @@
+"""
+shared/hybrid_scoring/parallel_analysis.py
+
+FactorAnalyzer 배치의 (팩터, 섹터, 보유기간) / (조건, 종목) 작업 병렬 실행
+
+- 로드한 패널(날짜 × 종목 종가 패널, (종목, 거래일) 조건 패널 컬럼)의 numpy 배열을
+  multiprocessing.shared_memory 블록 하나에 한 번만 복사합니다.
+  워커는 초기화 때 블록 이름으로 붙어(attach) 복사 없이 배열 뷰로 읽으므로, 작업마다 DataFrame을 pickle하지 않습니다.
+  (작업은 키와 종목 열 위치/행 범위만 담은 작은 튜플)
+- 결과는 작업 목록 순서대로 반환합니다. (워커 수·완료 순서와 무관하게 같은 결과)
+- workers <= 1이면 같은 작업 함수를 현재 프로세스에서 차례로 실행합니다. (공유 메모리 미사용)
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .condition_panel import CONDITIONS_BY_KEY, ConditionSamples, condition_samples
+from .factor_panel import ICSummary, compute_panel_ic
+
+logger = logging.getLogger(__name__)
+
+# workers=0(자동)일 때 최대 프로세스 수 (backtest와 같은 상한)
+MAX_AUTO_WORKERS = 16
+# 공유 메모리 안 배열 시작 위치 정렬 (바이트)
+_ALIGNMENT = 64
+
+
+class ICJob(NamedTuple):
+    """종가 패널의 일별 횡단면 IC 작업"""
+    factor_key: str
+    sector: str                           # 전체 종목이면 'ALL'
+    forward_days: int
+    columns: Optional[Tuple[int, ...]]    # 종가 패널 열 위치 (None이면 전체)
+
+
+class ConditionJob(NamedTuple):
+    """조건 패널의 조건 충족 시점 미래 수익률 작업"""
+    condition_key: str
+    target_type: str                      # STOCK, ALL
+    target_code: str
+    start: int                            # 조건 패널 행 범위 [start, stop)
+    stop: int
+
+
+Job = Union[ICJob, ConditionJob]
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """워커 수 결정 (None: 1, 0 이하: CPU 코어 수(최대 MAX_AUTO_WORKERS))"""
+    if workers is None:
+        return 1
+    if workers <= 0:
+        return min(os.cpu_count() or 1, MAX_AUTO_WORKERS)
+    return workers
+
+
+class AnalysisPanels:
+    """
+    작업이 읽는 패널 묶음
+
+    Args:
+        close: 날짜 × 종목 종가 패널 (build_close_panel)
+        factor_panels: 종가로 계산할 수 없는 팩터의 날짜 × 종목 패널 (close와 같은 모양으로 맞춤)
+        condition_arrays: 조건 패널 컬럼 (condition_panel.panel_arrays)
+    """
+
+    def __init__(self,
+                 close: Optional[pd.DataFrame] = None,
+                 factor_panels: Optional[Dict[str, pd.DataFrame]] = None,
+                 condition_arrays: Optional[Dict[str, np.ndarray]] = None):
+        self.arrays: Dict[str, np.ndarray] = {}
+        # 워커 초기화 때 한 번만 전달되는 작은 메타데이터 (날짜/종목 라벨)
+        self.meta: Dict = {'dates': None, 'codes': [], 'factor_keys': []}
+
+        if close is not None:
+            self.arrays['close'] = close.to_numpy(dtype=np.float64, na_value=np.nan)
+            self.meta['dates'] = close.index.to_numpy(dtype='datetime64[ns]')
+            self.meta['codes'] = list(close.columns)
+            for key, panel in (factor_panels or {}).items():
+                aligned = panel.reindex(index=close.index, columns=close.columns)
+                self.arrays[f'factor:{key}'] = aligned.to_numpy(dtype=np.float64, na_value=np.nan)
+                self.meta['factor_keys'].append(key)
+        for name, values in (condition_arrays or {}).items():
+            self.arrays[f'condition:{name}'] = np.ascontiguousarray(values)
+
+
+class SharedArrays:
+    """numpy 배열 묶음을 공유 메모리 블록 하나에 올림 (만든 프로세스가 close()로 해제)"""
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        layout, offset = {}, 0
+        for name, values in arrays.items():
+            layout[name] = (offset, values.shape, values.dtype.str)
+            offset += -(-values.nbytes // _ALIGNMENT) * _ALIGNMENT
+        self._shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        self.spec = (self._shm.name, layout)
+        for name, view in _views(self._shm, layout).items():
+            view[...] = arrays[name]
+
+    def close(self):
+        self._shm.close()
+        self._shm.unlink()
+
+
+def _views(shm: shared_memory.SharedMemory, layout: Dict) -> Dict[str, np.ndarray]:
+    return {name: np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+            for name, (offset, shape, dtype) in layout.items()}
+
+
+class _JobContext:
+    """작업 실행에 필요한 배열 + 라벨 (종가/팩터 DataFrame은 배열을 복사하지 않고 감쌈)"""
+
+    def __init__(self, arrays: Dict[str, np.ndarray], meta: Dict):
+        self.arrays = arrays
+        self.close = None
+        self.factor_panels = {}
+        if 'close' in arrays:
+            index = pd.DatetimeIndex(meta['dates'])
+            self.close = pd.DataFrame(arrays['close'], index=index, columns=meta['codes'], copy=False)
+            self.factor_panels = {
+                key: pd.DataFrame(arrays[f'factor:{key}'], index=index, columns=meta['codes'], copy=False)
+                for key in meta['factor_keys']
+            }
+        self.condition_arrays = {name[len('condition:'):]: values for name, values in arrays.items()
+                                 if name.startswith('condition:')}
+
+
+def run_job(context: _JobContext, job: Job) -> Union[Optional[ICSummary], ConditionSamples]:
+    """작업 하나 실행 (ICJob → ICSummary 또는 None, ConditionJob → ConditionSamples)"""
+    if isinstance(job, ConditionJob):
+        arrays = {name: values[job.start:job.stop] for name, values in context.condition_arrays.items()}
+        return condition_samples(arrays, CONDITIONS_BY_KEY[job.condition_key]['mask'])
+
+    close = context.close
+    if close is None:
+        return None
+    factor_panels = {job.factor_key: context.factor_panels[job.factor_key]} \
+        if job.factor_key in context.factor_panels else {}
+    if job.columns is not None:
+        columns = list(job.columns)
+        close = close.iloc[:, columns]
+        factor_panels = {key: panel.iloc[:, columns] for key, panel in factor_panels.items()}
+    if close.empty:
+        return None
+    return compute_panel_ic(close, [job.factor_key], job.forward_days, factor_panels)[job.factor_key]
+
+
+# 워커 프로세스 상태 (initializer에서 한 번 설정)
+_worker_state: Dict = {}
+
+
+def _init_worker(spec: Tuple[str, Dict], meta: Dict):
+    name, layout = spec
+    shm = shared_memory.SharedMemory(name=name)
+    arrays = _views(shm, layout)
+    for values in arrays.values():
+        values.flags.writeable = False
+    # 공유 메모리 참조를 유지해야 배열 뷰가 유효함
+    _worker_state['shm'] = shm
+    _worker_state['context'] = _JobContext(arrays, meta)
+
+
+def _run_job_in_worker(job: Job):
+    return run_job(_worker_state['context'], job)
+
+
+def run_jobs(panels: AnalysisPanels, jobs: Sequence[Job], workers: int = 1) -> List:
+    """
+    작업 목록 실행
+
+    Args:
+        panels: 작업이 읽는 패널
+        jobs: ICJob / ConditionJob 목록
+        workers: 프로세스 수 (1 이하면 현재 프로세스에서 실행)
+
+    Returns:
+        jobs와 같은 순서의 결과 리스트
+    """
+    jobs = list(jobs)
+    workers = min(workers, len(jobs))
+    if workers <= 1:
+        context = _JobContext(panels.arrays, panels.meta)
+        return [run_job(context, job) for job in jobs]
+
+    logger.info(f"   🔥 ProcessPoolExecutor {workers}개 워커로 {len(jobs)}개 작업 실행 (공유 메모리 패널)")
+    shared = SharedArrays(panels.arrays)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(shared.spec, panels.meta)) as executor:
+            # map은 제출 순서대로 결과를 돌려주므로 병합 순서가 고정됨
+            chunksize = max(1, len(jobs) // (workers * 4))
+            return list(executor.map(_run_job_in_worker, jobs, chunksize=chunksize))
+    finally:
+        shared.close()
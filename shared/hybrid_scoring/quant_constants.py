@@ -16,6 +16,7 @@ class StrategyMode(Enum):
 # 기본값
 DEFAULT_FILTER_CUTOFF = 0.2  # [v1.1] 0.5→0.2 완화 (하위 20% 탈락)
 DEFAULT_HOLDING_DAYS = 5
+MIN_PRICE_DATA_DAYS = 30  # 점수 계산에 필요한 최소 일봉 수
 
 # 섹터별 RSI 가중치
 SECTOR_RSI_MULTIPLIER = {
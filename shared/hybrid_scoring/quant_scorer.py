@@ -21,6 +21,7 @@ Scout v1.0 QuantScorer - 정량 점수 계산 엔진 (Dual Track)
 """
 
 import logging
+import warnings
 import pandas as pd
 import numpy as np
 from enum import Enum
@@ -52,6 +53,7 @@ from .quant_constants import (
     StrategyMode,
     DEFAULT_FILTER_CUTOFF as QC_DEFAULT_FILTER_CUTOFF,
     DEFAULT_HOLDING_DAYS as QC_DEFAULT_HOLDING_DAYS,
+    MIN_PRICE_DATA_DAYS,
     SECTOR_RSI_MULTIPLIER as QC_SECTOR_RSI_MULTIPLIER,
     NEWS_LONG_TERM_POSITIVE as QC_NEWS_LONG_TERM_POSITIVE,
     SHORT_TERM_WEIGHTS as QC_SHORT_TERM_WEIGHTS,
@@ -369,6 +371,146 @@ class QuantScorer:
         self._news_stats_cache[cache_key] = result
         return result
     
+    def prefetch_universe_stats(self, stock_codes: List[str]) -> None:
+        """
+        여러 종목의 FACTOR_PERFORMANCE / NEWS_FACTOR_STATS / 섹터 정보를 테이블당 한 번의 쿼리로 읽어
+        종목별 캐시(_factor_performance_cache, _news_stats_cache, _sector_cache)를 채웁니다.
+        이후 _load_factor_performance / _load_news_stats / _get_stock_sector는 DB를 조회하지 않습니다.
+        """
+        codes = [c for c in dict.fromkeys(stock_codes)]
+        if self.db_conn is None or not codes:
+            return
+        
+        self._prefetch_factor_performance([c for c in codes if c not in self._factor_performance_cache])
+        self._prefetch_news_stats([c for c in codes if f"{c}:ALL" not in self._news_stats_cache])
+        self._prefetch_sectors([c for c in codes if c not in self._sector_cache])
+    
+    @staticmethod
+    def _row_values(row, keys: List[str]) -> tuple:
+        if isinstance(row, dict):
+            return tuple(row.get(k) for k in keys)
+        return tuple(row)
+    
+    def _prefetch_factor_performance(self, stock_codes: List[str]) -> None:
+        if not stock_codes:
+            return
+        try:
+            cursor = self.db_conn.cursor()
+            placeholder = ','.join(['%s'] * len(stock_codes))
+            cursor.execute(f"""
+                SELECT TARGET_CODE, CONDITION_KEY, CONDITION_DESC, WIN_RATE, AVG_RETURN,
+                       SAMPLE_COUNT, CONFIDENCE_LEVEL, RECENT_WIN_RATE
+                FROM FACTOR_PERFORMANCE
+                WHERE TARGET_TYPE = 'STOCK' AND TARGET_CODE IN ({placeholder})
+                AND HOLDING_DAYS = %s
+                ORDER BY TARGET_CODE, WIN_RATE DESC
+            """, (*stock_codes, self.DEFAULT_HOLDING_DAYS))
+            rows = cursor.fetchall()
+            cursor.close()
+        except Exception as e:
+            logger.debug(f"   (QuantScorer) 조건부 승률 일괄 로드 실패: {e}")
+            return
+        
+        keys = ['TARGET_CODE', 'CONDITION_KEY', 'CONDITION_DESC', 'WIN_RATE', 'AVG_RETURN',
+                'SAMPLE_COUNT', 'CONFIDENCE_LEVEL', 'RECENT_WIN_RATE']
+        grouped: Dict[str, List[Dict]] = {code: [] for code in stock_codes}
+        for row in rows:
+            code, key, desc, win_rate, avg_return, sample_count, confidence, recent = self._row_values(row, keys)
+            conditions = grouped.setdefault(code, [])
+            if len(conditions) >= 5:  # 종목별 상위 5개 (단건 조회의 LIMIT 5와 동일)
+                continue
+            conditions.append({
+                'key': key,
+                'desc': desc,
+                'win_rate': float(win_rate) if win_rate else 0,
+                'avg_return': float(avg_return) if avg_return else 0,
+                'sample_count': sample_count or 0,
+                'confidence': confidence or 'LOW',
+                'recent_win_rate': float(recent) if recent else None,
+            })
+        
+        for code, conditions in grouped.items():
+            result = {'conditions': conditions, 'best_win_rate': None, 'sample_count': 0, 'confidence': 'LOW'}
+            if conditions:
+                best = max(conditions, key=lambda x: x['win_rate'])
+                result['best_win_rate'] = best['win_rate']
+                result['sample_count'] = best['sample_count']
+                result['confidence'] = best['confidence']
+            self._factor_performance_cache[code] = result
+    
+    def _prefetch_news_stats(self, stock_codes: List[str]) -> None:
+        """긍정 뉴스 통계를 한 번에 읽어 카테고리별 / 전체(ALL) 캐시를 모두 채웁니다."""
+        if not stock_codes:
+            return
+        try:
+            cursor = self.db_conn.cursor()
+            placeholder = ','.join(['%s'] * len(stock_codes))
+            cursor.execute(f"""
+                SELECT TARGET_CODE, NEWS_CATEGORY, WIN_RATE_D5, RETURN_D5, SAMPLE_COUNT, CONFIDENCE_LEVEL
+                FROM NEWS_FACTOR_STATS
+                WHERE TARGET_CODE IN ({placeholder}) AND SENTIMENT = 'POSITIVE'
+            """, tuple(stock_codes))
+            rows = cursor.fetchall()
+            cursor.close()
+        except Exception as e:
+            logger.debug(f"   (QuantScorer) 뉴스 통계 일괄 로드 실패: {e}")
+            return
+        
+        keys = ['TARGET_CODE', 'NEWS_CATEGORY', 'WIN_RATE_D5', 'RETURN_D5', 'SAMPLE_COUNT', 'CONFIDENCE_LEVEL']
+        grouped: Dict[str, List[tuple]] = {code: [] for code in stock_codes}
+        for row in rows:
+            values = self._row_values(row, keys)
+            grouped.setdefault(values[0], []).append(values[1:])
+        
+        for code, items in grouped.items():
+            # 카테고리별 (단건 조회의 fetchone과 동일하게 첫 행 사용)
+            for category, win_rate, ret, sample_count, confidence in items:
+                cache_key = f"{code}:{category}"
+                if cache_key in self._news_stats_cache:
+                    continue
+                self._news_stats_cache[cache_key] = {
+                    'win_rate_d5': float(win_rate) if win_rate else None,
+                    'avg_return_d5': float(ret) if ret else None,
+                    'sample_count': sample_count or 0,
+                    'confidence': confidence or 'LOW',
+                }
+            
+            # 전체 (AVG / SUM / MAX 집계, NULL 제외)
+            win_rates = [float(i[1]) for i in items if i[1] is not None]
+            returns = [float(i[2]) for i in items if i[2] is not None]
+            samples = [i[3] for i in items if i[3] is not None]
+            confidences = [i[4] for i in items if i[4] is not None]
+            avg_win = sum(win_rates) / len(win_rates) if win_rates else None
+            avg_ret = sum(returns) / len(returns) if returns else None
+            self._news_stats_cache[f"{code}:ALL"] = {
+                'win_rate_d5': avg_win if avg_win else None,
+                'avg_return_d5': avg_ret if avg_ret else None,
+                'sample_count': sum(samples) if samples else 0,
+                'confidence': max(confidences) if confidences else 'LOW',
+            }
+    
+    def _prefetch_sectors(self, stock_codes: List[str]) -> None:
+        if not stock_codes:
+            return
+        try:
+            cursor = self.db_conn.cursor()
+            placeholder = ','.join(['%s'] * len(stock_codes))
+            cursor.execute(f"""
+                SELECT STOCK_CODE, SECTOR_KOSPI200 FROM STOCK_MASTER
+                WHERE STOCK_CODE IN ({placeholder})
+            """, tuple(stock_codes))
+            rows = cursor.fetchall()
+            cursor.close()
+        except Exception as e:
+            logger.debug(f"   (QuantScorer) 섹터 일괄 조회 실패: {e}")
+            return
+        
+        for code in stock_codes:
+            self._sector_cache[code] = '미분류'
+        for row in rows:
+            code, sector = self._row_values(row, ['STOCK_CODE', 'SECTOR_KOSPI200'])
+            self._sector_cache[code] = sector or '미분류'
+    
     def _get_stock_sector(self, stock_code: str) -> str:
         """
         [v1.0.6] STOCK_MASTER에서 종목의 섹터 정보 로드
@@ -464,99 +606,12 @@ class QuantScorer:
         
         [v1.0.3] Claude Opus 4.5 피드백: KOSPI 벤치마크 폴백 로직 추가
         - KOSPI 데이터 없으면 절대 모멘텀으로 계산 (중립 대신)
+        [v1.1] 점수 규칙은 _momentum_factors (score_universe와 공용)
         """
         try:
-            factors = {}
-            total_score = 0.0
-            
-            # 1. 6개월 모멘텀 (15점)
-            # [v1.0.3] KOSPI 데이터 없으면 절대 모멘텀으로 폴백
-            if len(daily_prices_df) >= 120:
-                stock_start = float(daily_prices_df['CLOSE_PRICE'].iloc[-120])
-                stock_end = float(daily_prices_df['CLOSE_PRICE'].iloc[-1])
-                stock_return = (stock_end / stock_start - 1) * 100
-                
-                if kospi_prices_df is not None and len(kospi_prices_df) >= 120:
-                    # 상대 모멘텀 (KOSPI 대비)
-                    kospi_start = float(kospi_prices_df['CLOSE_PRICE'].iloc[-120])
-                    kospi_end = float(kospi_prices_df['CLOSE_PRICE'].iloc[-1])
-                    kospi_return = (kospi_end / kospi_start - 1) * 100
-                    
-                    relative_momentum_6m = stock_return - kospi_return
-                    
-                    # -30% ~ +30%를 0~15점으로 연속 매핑
-                    momentum_6m_score = max(0, min(15, 7.5 + relative_momentum_6m * 0.25))
-                    
-                    factors['relative_momentum_6m'] = round(relative_momentum_6m, 2)
-                    factors['momentum_type'] = 'relative'
-                else:
-                    # [v1.0.3] 폴백: 절대 모멘텀 사용
-                    absolute_momentum_6m = stock_return
-                    
-                    # -20% ~ +40%를 0~15점으로 연속 매핑 (상승에 더 긍정적)
-                    momentum_6m_score = max(0, min(15, 5 + absolute_momentum_6m * 0.25))
-                    
-                    factors['absolute_momentum_6m'] = round(absolute_momentum_6m, 2)
-                    factors['momentum_type'] = 'absolute (KOSPI 없음)'
-                
-                total_score += momentum_6m_score
-                factors['momentum_6m_score'] = round(momentum_6m_score, 2)
-            else:
-                total_score += 7.5  # 데이터 부족시만 중립
-                factors['momentum_6m_score'] = 7.5
-                factors['momentum_6m_note'] = '데이터 부족 (120일 미만)'
-            
-            # 2. 1개월 단기 모멘텀 (5점)
-            # [v1.0.3] KOSPI 없어도 절대 모멘텀으로 계산
-            if len(daily_prices_df) >= 20:
-                stock_return_1m = (daily_prices_df['CLOSE_PRICE'].iloc[-1] / daily_prices_df['CLOSE_PRICE'].iloc[-20] - 1) * 100
-                
-                if kospi_prices_df is not None and len(kospi_prices_df) >= 20:
-                    kospi_return_1m = (kospi_prices_df['CLOSE_PRICE'].iloc[-1] / kospi_prices_df['CLOSE_PRICE'].iloc[-20] - 1) * 100
-                    relative_momentum_1m = stock_return_1m - kospi_return_1m
-                    
-                    # -10% ~ +10%를 0~5점으로 연속 매핑
-                    momentum_1m_score = max(0, min(5, 2.5 + relative_momentum_1m * 0.25))
-                    factors['relative_momentum_1m'] = round(relative_momentum_1m, 2)
-                else:
-                    # [v1.0.3] 폴백: 절대 모멘텀
-                    momentum_1m_score = max(0, min(5, 2.5 + stock_return_1m * 0.25))
-                    factors['absolute_momentum_1m'] = round(stock_return_1m, 2)
-                
-                total_score += momentum_1m_score
-                factors['momentum_1m_score'] = round(momentum_1m_score, 2)
-            else:
-                total_score += 2.5
-                factors['momentum_1m_score'] = 2.5
-            
-            # 3. 모멘텀 안정성 (5점)
-            if len(daily_prices_df) >= 120:
-                monthly_returns = []
-                for i in range(6):
-                    start_idx = -120 + i * 20
-                    end_idx = -120 + (i + 1) * 20 if i < 5 else -1
-                    if abs(start_idx) <= len(daily_prices_df) and abs(end_idx) <= len(daily_prices_df):
-                        start_price = daily_prices_df['CLOSE_PRICE'].iloc[start_idx]
-                        end_price = daily_prices_df['CLOSE_PRICE'].iloc[end_idx]
-                        monthly_return = (end_price / start_price - 1) * 100
-                        monthly_returns.append(monthly_return)
-                
-                if monthly_returns:
-                    positive_months = sum(1 for r in monthly_returns if r > 0)
-                    consistency = positive_months / len(monthly_returns)
-                    consistency_score = consistency * 5
-                    total_score += consistency_score
-                    
-                    factors['momentum_consistency'] = round(consistency, 2)
-                    factors['consistency_score'] = round(consistency_score, 2)
-                else:
-                    total_score += 2.5
-                    factors['consistency_score'] = 2.5
-            else:
-                total_score += 2.5
-                factors['consistency_score'] = 2.5
-            
-            return total_score, factors
+            close, _, counts = self._single_stock_panel(daily_prices_df)
+            factors = self._momentum_factors(close, counts, self._kospi_close(kospi_prices_df))
+            return float(factors['total'][0]), self._momentum_details(factors, 0)
             
         except Exception as e:
             logger.error(f"   (QuantScorer) 모멘텀 점수 계산 오류: {e}", exc_info=True)
@@ -576,63 +631,11 @@ class QuantScorer:
         - 이익 안정성: 3점
         """
         try:
-            factors = {}
-            total_score = 0.0
-            
-            # 1. ROE (수익성) - 10점
-            if roe is not None:
-                # ROE: -20% ~ +40%를 0~10점으로 연속 매핑
-                roe_score = max(0, min(10, 5 + roe * 0.167))
-                total_score += roe_score
-                
-                factors['roe'] = round(roe, 2)
-                factors['roe_score'] = round(roe_score, 2)
-            else:
-                total_score += 5  # 중립
-                factors['roe_score'] = 5
-                factors['roe_note'] = '데이터 없음'
-            
-            # 2. 성장성 (매출 + EPS) - 7점
-            growth_score = 0.0
-            
-            # 2-1. 매출 성장률 (3.5점)
-            if sales_growth is not None:
-                sales_score = max(0, min(3.5, 1.75 + sales_growth * 0.0875))
-                growth_score += sales_score
-                factors['sales_growth'] = round(sales_growth, 2)
-                factors['sales_score'] = round(sales_score, 2)
-            else:
-                growth_score += 1.75
-                factors['sales_score'] = 1.75
-            
-            # 2-2. EPS 성장률 (3.5점)
-            if eps_growth is not None:
-                eps_score = max(0, min(3.5, 1.75 + eps_growth * 0.058))
-                growth_score += eps_score
-                factors['eps_growth'] = round(eps_growth, 2)
-                factors['eps_score'] = round(eps_score, 2)
-            else:
-                growth_score += 1.75
-                factors['eps_score'] = 1.75
-            
-            total_score += growth_score
-            
-            # 3. 이익 안정성 (3점) - 가격 변동성으로 대체
-            if len(daily_prices_df) >= 60:
-                returns = daily_prices_df['CLOSE_PRICE'].pct_change().dropna()
-                volatility = returns.std() * 100
-                
-                # 변동성: 0~5%를 3~0점으로 매핑 (낮을수록 좋음)
-                stability_score = max(0, 3 - volatility * 0.6)
-                total_score += stability_score
-                
-                factors['volatility'] = round(volatility, 2)
-                factors['stability_score'] = round(stability_score, 2)
-            else:
-                total_score += 1.5
-                factors['stability_score'] = 1.5
-            
-            return total_score, factors
+            close, _, counts = self._single_stock_panel(daily_prices_df)
+            factors = self._quality_factors(close, counts, self._as_float_array([roe], 1),
+                                            self._as_float_array([sales_growth], 1),
+                                            self._as_float_array([eps_growth], 1))
+            return float(factors['total'][0]), self._quality_details(factors, 0)
             
         except Exception as e:
             logger.error(f"   (QuantScorer) 품질 점수 계산 오류: {e}", exc_info=True)
@@ -649,37 +652,8 @@ class QuantScorer:
         - PER: 7.5점
         """
         try:
-            factors = {}
-            total_score = 0.0
-            
-            # 1. PBR (7.5점) - 낮을수록 좋음
-            if pbr is not None and pbr > 0:
-                # PBR: 0.5~3.0을 7.5~0점으로 연속 매핑
-                pbr_score = max(0, min(7.5, 7.5 - (pbr - 0.5) * 3))
-                total_score += pbr_score
-                
-                factors['pbr'] = round(pbr, 2)
-                factors['pbr_score'] = round(pbr_score, 2)
-            else:
-                total_score += 3.75  # 중립
-                factors['pbr_score'] = 3.75
-                factors['pbr_note'] = '데이터 없음'
-            
-            # 2. PER (7.5점) - 낮을수록 좋음 (적자 기업 제외)
-            if per is not None and per > 0:
-                # PER: 5~30을 7.5~0점으로 연속 매핑
-                per_score = max(0, min(7.5, 7.5 - (per - 5) * 0.3))
-                total_score += per_score
-                
-                factors['per'] = round(per, 2)
-                factors['per_score'] = round(per_score, 2)
-            else:
-                # 적자 기업 또는 데이터 없음 (0점)
-                total_score += 0
-                factors['per_score'] = 0
-                factors['per_note'] = '적자 또는 데이터 없음'
-            
-            return total_score, factors
+            factors = self._value_factors(self._as_float_array([pbr], 1), self._as_float_array([per], 1))
+            return float(factors['total'][0]), self._value_details(factors, 0)
             
         except Exception as e:
             logger.error(f"   (QuantScorer) 가치 점수 계산 오류: {e}", exc_info=True)
@@ -702,109 +676,15 @@ class QuantScorer:
         - 건설기계: x0.7 (49.8% 적중률)
         """
         try:
-            factors = {}
-            total_score = 0.0
-            
-            # 1. 거래량 추세 (4점)
-            if 'VOLUME' in daily_prices_df.columns and len(daily_prices_df) >= 25:
-                recent_volume = daily_prices_df['VOLUME'].tail(5).mean()
-                past_volume = daily_prices_df['VOLUME'].iloc[-25:-5].mean()
-                
-                if past_volume > 0:
-                    volume_ratio = recent_volume / past_volume
-                    # 0.5배~3.0배를 0~4점으로 연속 매핑
-                    volume_score = max(0, min(4, (volume_ratio - 0.5) * 1.6))
-                    total_score += volume_score
-                    
-                    factors['volume_ratio'] = round(volume_ratio, 2)
-                    factors['volume_score'] = round(volume_score, 2)
-                else:
-                    total_score += 2
-                    factors['volume_score'] = 2
-            else:
-                total_score += 2
-                factors['volume_score'] = 2
-            
-            # 2. RSI (3점)
-            try:
-                from shared import strategy
-                rsi = strategy.calculate_rsi(daily_prices_df, period=14)
-            except:
-                rsi = self._calculate_rsi(daily_prices_df, period=14)
-            
-            if rsi is not None:
-                # RSI 과매도 구간(30~40)에 높은 점수
-                if rsi <= 30:
-                    rsi_score = 3
-                elif rsi <= 50:
-                    rsi_score = 3 - (rsi - 30) * 0.075
-                elif rsi <= 70:
-                    rsi_score = 1.5 - (rsi - 50) * 0.05
-                else:
-                    rsi_score = max(0, 0.5 - (rsi - 70) * 0.025)
-                
-                # [v1.0.6] 섹터별 RSI 가중치 적용
-                sector_multiplier = self.SECTOR_RSI_MULTIPLIER.get(sector, 1.0)
-                rsi_score_adjusted = min(3.0, rsi_score * sector_multiplier)  # 최대 3점 유지
-                
-                total_score += rsi_score_adjusted
-                factors['rsi'] = round(rsi, 2)
-                factors['rsi_score_raw'] = round(rsi_score, 2)
-                factors['rsi_score'] = round(rsi_score_adjusted, 2)
-                factors['sector'] = sector
-                factors['sector_rsi_multiplier'] = sector_multiplier
-                
-                if sector_multiplier != 1.0:
-                    logger.debug(f"   (QuantScorer) 섹터별 RSI 조정: {sector} x{sector_multiplier}")
-            else:
-                total_score += 1.5
-                factors['rsi_score'] = 1.5
-            
-            # 3. 볼린저 밴드 (3점)
-            if len(daily_prices_df) >= 20:
-                close_prices = daily_prices_df['CLOSE_PRICE']
-                ma20 = close_prices.rolling(window=20).mean().iloc[-1]
-                std20 = close_prices.rolling(window=20).std().iloc[-1]
-                
-                bb_upper = ma20 + 2 * std20
-                bb_lower = ma20 - 2 * std20
-                current_price = close_prices.iloc[-1]
-                
-                if bb_upper > bb_lower:
-                    bb_position = (current_price - bb_lower) / (bb_upper - bb_lower)
-                    # 하단에 가까울수록 높은 점수
-                    bb_score = max(0, 3 - bb_position * 3)
-                    total_score += bb_score
-                    
-                    factors['bb_position'] = round(bb_position, 2)
-                    factors['bb_score'] = round(bb_score, 2)
-                else:
-                    total_score += 1.5
-                    factors['bb_score'] = 1.5
-            else:
-                total_score += 1.5
-                factors['bb_score'] = 1.5
-            
-            return total_score, factors
+            close, volume, counts = self._single_stock_panel(daily_prices_df)
+            sector_mult = np.array([self.SECTOR_RSI_MULTIPLIER.get(sector, 1.0)])
+            factors = self._technical_factors(close, volume, counts, sector_mult)
+            return float(factors['total'][0]), self._technical_details(factors, 0, sector)
             
         except Exception as e:
             logger.error(f"   (QuantScorer) 기술적 점수 계산 오류: {e}", exc_info=True)
             return 5.0, {'error': str(e)}
     
-    def _calculate_rsi(self, df: pd.DataFrame, period: int = 14) -> Optional[float]:
-        """RSI 직접 계산 (strategy 모듈 임포트 실패 시 폴백)"""
-        try:
-            close = df['CLOSE_PRICE']
-            delta = close.diff()
-            gain = delta.where(delta > 0, 0).rolling(window=period).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-            
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            return float(rsi.iloc[-1])
-        except:
-            return None
-    
     # [v1.0.5] 뉴스 역신호 카테고리 (팩터 분석 결과)
     # 수주: 43.7% 승률 (역신호)
     # 배당: 37.6% 승률 (강한 역신호)
@@ -978,70 +858,13 @@ class QuantScorer:
         - 개선: 평균 거래량 대비 비율로 정규화
         """
         try:
-            factors = {}
-            total_score = 0.0
-            
-            # [v1.0.3] 거래량 대비 정규화 기준 설정
-            # avg_volume이 있으면 거래량 대비 비율로, 없으면 기존 절대값 방식
-            use_volume_normalized = avg_volume is not None and avg_volume > 0
-            
-            # 1. 외국인 순매수 (7점)
-            if foreign_net_buy is not None:
-                if use_volume_normalized:
-                    # [v1.0.3] 거래량 대비 비율로 정규화
-                    # 평균 거래량의 -5% ~ +5%를 0~7점으로 매핑
-                    foreign_ratio = foreign_net_buy / avg_volume
-                    foreign_score = max(0, min(7, 3.5 + foreign_ratio / 0.05 * 3.5))
-                    factors['foreign_ratio'] = round(foreign_ratio * 100, 2)
-                    factors['normalize_method'] = 'volume_ratio'
-                else:
-                    # 기존 방식: 절대 주수 기준
-                    # 순매수: -100만주 ~ +100만주를 0~7점으로 매핑
-                    foreign_score = max(0, min(7, 3.5 + foreign_net_buy / 1_000_000 * 3.5))
-                    factors['normalize_method'] = 'absolute'
-                
-                total_score += foreign_score
-                factors['foreign_net_buy'] = foreign_net_buy
-                factors['foreign_score'] = round(foreign_score, 2)
-            else:
-                total_score += 3.5  # 중립
-                factors['foreign_score'] = 3.5
-            
-            # 2. 기관 순매수 (5점)
-            if institution_net_buy is not None:
-                if use_volume_normalized:
-                    # [v1.0.3] 거래량 대비 비율로 정규화
-                    # 평균 거래량의 -3% ~ +3%를 0~5점으로 매핑
-                    inst_ratio = institution_net_buy / avg_volume
-                    institution_score = max(0, min(5, 2.5 + inst_ratio / 0.03 * 2.5))
-                    factors['institution_ratio'] = round(inst_ratio * 100, 2)
-                else:
-                    # 기존 방식
-                    institution_score = max(0, min(5, 2.5 + institution_net_buy / 500_000 * 2.5))
-                
-                total_score += institution_score
-                factors['institution_net_buy'] = institution_net_buy
-                factors['institution_score'] = round(institution_score, 2)
-            else:
-                total_score += 2.5  # 중립
-                factors['institution_score'] = 2.5
-            
-            # 3. 외국인 보유비중 (3점)
-            if foreign_holding_ratio is not None:
-                # 보유비중: 0~50%를 0~3점으로 매핑
-                holding_score = min(3, foreign_holding_ratio / 50 * 3)
-                total_score += holding_score
-                
-                factors['foreign_holding_ratio'] = round(foreign_holding_ratio, 2)
-                factors['holding_score'] = round(holding_score, 2)
-            else:
-                total_score += 1.5  # 중립
-                factors['holding_score'] = 1.5
-            
-            if use_volume_normalized:
-                factors['avg_volume'] = avg_volume
-            
-            return total_score, factors
+            factors = self._supply_factors(
+                self._as_float_array([foreign_net_buy], 1),
+                self._as_float_array([institution_net_buy], 1),
+                self._as_float_array([foreign_holding_ratio], 1),
+                self._as_float_array([avg_volume], 1),
+            )
+            return float(factors['total'][0]), self._supply_details(factors, 0, foreign_net_buy, institution_net_buy)
             
         except Exception as e:
             logger.error(f"   (QuantScorer) 수급 점수 계산 오류: {e}", exc_info=True)
@@ -1075,300 +898,744 @@ class QuantScorer:
         
         [v1.0.1] Gemini 피드백 반영:
         - 데이터 부족 시 is_valid=False 설정하여 "묻어가기" 합격 방지
+        [v1.1] 한 종목짜리 패널로 score_universe와 같은 계산(_score_panel)을 사용
         
         Returns:
             QuantScoreResult 객체
         """
         # [v1.0.1] 필수 데이터 유효성 검사
-        MIN_PRICE_DATA_DAYS = 30  # 최소 30일 데이터 필요
-        
         if daily_prices_df is None or daily_prices_df.empty:
             logger.debug(f"   ⚠️ [Quant] {stock_name}({stock_code}) 일봉 데이터 없음 → is_valid=False")
-            return QuantScoreResult(
-                stock_code=stock_code,
-                stock_name=stock_name,
-                total_score=0.0,  # 데이터 없으면 0점 (중립 50점 아님!)
-                momentum_score=0.0,
-                quality_score=0.0,
-                value_score=0.0,
-                technical_score=0.0,
-                news_stat_score=0.0,
-                supply_demand_score=0.0,
-                matched_conditions=[],
-                condition_win_rate=None,
-                condition_sample_count=0,
-                condition_confidence='LOW',
-                is_valid=False,
-                invalid_reason='일봉 데이터 없음',
-                details={'error': '일봉 데이터 없음'},
-            )
+            # 데이터 없으면 0점 (중립 50점 아님!)
+            return self._make_invalid_result(stock_code, stock_name, '일봉 데이터 없음', {'error': '일봉 데이터 없음'})
         
         if len(daily_prices_df) < MIN_PRICE_DATA_DAYS:
             logger.debug(f"   ⚠️ [Quant] {stock_name}({stock_code}) 데이터 부족 ({len(daily_prices_df)}일 < {MIN_PRICE_DATA_DAYS}일) → is_valid=False")
-            return QuantScoreResult(
-                stock_code=stock_code,
-                stock_name=stock_name,
-                total_score=0.0,  # 데이터 부족하면 0점
-                momentum_score=0.0,
-                quality_score=0.0,
-                value_score=0.0,
-                technical_score=0.0,
-                news_stat_score=0.0,
-                supply_demand_score=0.0,
-                matched_conditions=[],
-                condition_win_rate=None,
-                condition_sample_count=0,
-                condition_confidence='LOW',
-                is_valid=False,
-                invalid_reason=f'데이터 부족 ({len(daily_prices_df)}일)',
-                details={'error': f'데이터 부족 ({len(daily_prices_df)}일 < {MIN_PRICE_DATA_DAYS}일)'},
+            return self._make_invalid_result(
+                stock_code, stock_name, f'데이터 부족 ({len(daily_prices_df)}일)',
+                {'error': f'데이터 부족 ({len(daily_prices_df)}일 < {MIN_PRICE_DATA_DAYS}일)'},
             )
         
         try:
-            all_details = {}
-            
-            # 1. 모멘텀 점수 (25점)
-            momentum_score, momentum_details = self.calculate_momentum_score(
-                daily_prices_df, kospi_prices_df
-            )
-            all_details['momentum'] = momentum_details
-            
-            # 2. 품질 점수 (20점)
-            quality_score, quality_details = self.calculate_quality_score(
-                roe, sales_growth, eps_growth, daily_prices_df
-            )
-            all_details['quality'] = quality_details
-            
-            # 3. 가치 점수 (15점)
-            value_score, value_details = self.calculate_value_score(pbr, per)
-            all_details['value'] = value_details
-            
-            # [v1.0.6] 섹터 정보 조회 (RSI 가중치용)
-            sector = self._get_stock_sector(stock_code)
-            
-            # 4. 기술적 점수 (10점) - 섹터별 RSI 가중치 적용
-            technical_score, technical_details = self.calculate_technical_score(daily_prices_df, sector)
-            all_details['technical'] = technical_details
-            
-            # 5. 뉴스 통계 점수 (15점)
-            news_stat_score, news_details = self.calculate_news_stat_score(
-                stock_code, current_sentiment_score, news_category
-            )
-            all_details['news'] = news_details
-            
-            # 6. 수급 점수 (15점)
-            # [v1.0.3] 종목별 평균 거래량 계산 (정규화용)
-            avg_volume = None
-            if 'VOLUME' in daily_prices_df.columns and len(daily_prices_df) >= 20:
-                avg_volume = daily_prices_df['VOLUME'].iloc[-20:].mean()
-            
-            supply_demand_score, supply_details = self.calculate_supply_demand_score(
-                foreign_net_buy, institution_net_buy, foreign_holding_ratio, avg_volume
-            )
-            all_details['supply_demand'] = supply_details
-            
-            # [v1.0.6] 복합조건 보너스 계산
-            rsi = technical_details.get('rsi')
-            compound_bonus, compound_details = self.calculate_compound_condition_bonus(
-                rsi, foreign_net_buy, avg_volume
-            )
-            all_details['compound_condition'] = compound_details
-            
-            # 총점 계산 (100점 만점 + 복합조건 보너스 최대 5점)
-            total_score = (
-                momentum_score +
-                quality_score +
-                value_score +
-                technical_score +
-                news_stat_score +
-                supply_demand_score +
-                compound_bonus  # [v1.0.6] 복합조건 보너스
-            )
-            
-            # [v1.0.6] 장기 보유 추천 플래그
-            # 단기(D+5)에서는 역신호지만 장기(D+60)에서 호재인 뉴스
-            is_long_term_hold_recommended = (
-                news_category in self.NEWS_LONG_TERM_POSITIVE and
-                current_sentiment_score >= 70
-            )
-            all_details['long_term_hold_recommended'] = is_long_term_hold_recommended
-            all_details['sector'] = sector
-            
-            # 조건부 승률 정보 로드
-            factor_perf = self._load_factor_performance(stock_code)
-            matched_conditions = [c['key'] for c in factor_perf['conditions']]
-            
-            # [v1.0.2] 뉴스 통계 정보 추출 (GPT 피드백 반영)
-            news_win_rate = news_details.get('news_win_rate')
-            news_sample = news_details.get('news_sample_count', 0)
-            news_conf = news_details.get('news_confidence', 'LOW')
-            
-            # ==========================================================
-            # [v1.0] Dual Track 점수 계산 (3 AI 합의)
-            # ==========================================================
-            
-            # 뉴스 시간축 판단
-            news_timing_signal, news_timing_reason, recommended_holding = self.calculate_news_timing_signal(
-                news_category or '기타', current_sentiment_score
-            )
-            
-            # --- 단기 스나이퍼 점수 (D+5) ---
-            # RSI+외인 복합조건 중심 (승률 55.5%)
-            is_rsi_oversold = rsi is not None and rsi < 30
-            is_foreign_buying = compound_details.get('is_foreign_buying', False)
-            
-            short_term_score = 0.0
-            # 복합조건 충족 시 대폭 가산 (35점)
-            if is_rsi_oversold and is_foreign_buying:
-                short_term_score += 35
-            elif is_rsi_oversold:
-                short_term_score += 20
-            elif is_foreign_buying:
-                short_term_score += 15
-            
-            # 섹터별 RSI 효과 (금융/조선 우대)
-            sector_rsi_mult = self.SECTOR_RSI_MULTIPLIER.get(sector, 1.0)
-            if sector_rsi_mult >= 1.2:  # 금융, 조선운송
-                short_term_score += 10
-            elif sector_rsi_mult <= 0.8:  # 건설기계
-                short_term_score -= 10
-            
-            # 수급 (20점)
-            short_term_score += supply_demand_score * (20/15)
-            
-            # ROE (10점)
-            short_term_score += quality_score * (10/20)
-            
-            # 뉴스 단기 패널티 (역신호!)
-            if news_category in self.NEWS_REVERSE_SIGNAL_CATEGORIES and current_sentiment_score >= 70:
-                short_term_score -= 15  # 단기 추격매수 페널티
-            
-            short_term_score = max(0, min(100, short_term_score))
-            
-            # --- 장기 헌터 점수 (D+60) ---
-            # ROE + 뉴스 눌림목 중심 (승률 65~72%)
-            long_term_score = 0.0
-            
-            # ROE (30점) - D+60 적중률 65.6%
-            roe_val = quality_details.get('roe', 0)
-            if roe_val is not None and roe_val > 15:
-                long_term_score += 30
-            elif roe_val is not None and roe_val > 10:
-                long_term_score += 20
-            elif roe_val is not None and roe_val > 5:
-                long_term_score += 10
-            
-            # 뉴스 장기효과 (25점) - 수주 72.7%, 실적 64.8%
-            if news_category in self.NEWS_TIME_EFFECT:
-                effect = self.NEWS_TIME_EFFECT[news_category]
-                d60_win = effect['d60_win_rate']
-                if d60_win >= 0.70:
-                    long_term_score += 25
-                elif d60_win >= 0.60:
-                    long_term_score += 18
-                elif d60_win >= 0.55:
-                    long_term_score += 10
-            
-            # RSI (15점) - D+60 적중률 60.1%
-            if is_rsi_oversold:
-                long_term_score += 15
-            elif rsi is not None and rsi < 40:
-                long_term_score += 8
-            
-            # PER 가치 (10점) - D+60 적중률 59.9%
-            per_val = value_details.get('per', 0)
-            if per_val is not None and 5 < per_val < 15:
-                long_term_score += 10
-            elif per_val is not None and per_val < 20:
-                long_term_score += 5
-            
-            # 수급 (10점)
-            long_term_score += supply_demand_score * (10/15)
-            
-            long_term_score = max(0, min(100, long_term_score))
-            
-            # --- 등급 및 추천 부여 ---
-            def get_grade_and_rec(score):
-                if score >= 80: return "A", "강력매수"
-                elif score >= 65: return "B", "매수"
-                elif score >= 50: return "C", "관망"
-                elif score >= 35: return "D", "주의"
-                else: return "F", "회피"
-            
-            short_grade, short_rec = get_grade_and_rec(short_term_score)
-            long_grade, long_rec = get_grade_and_rec(long_term_score)
-            
-            # 눌림목 대기 시그널이면 단기 추천 하향
-            if news_timing_signal == "WAIT_DIP":
-                short_rec = "⚠️ 눌림목 대기"
-                recommended_holding = 60
-            
-            all_details['dual_track'] = {
-                'short_term_score': round(short_term_score, 2),
-                'short_term_grade': short_grade,
-                'long_term_score': round(long_term_score, 2),
-                'long_term_grade': long_grade,
-                'news_timing_signal': news_timing_signal,
-                'recommended_holding_days': recommended_holding,
-            }
-            
-            return QuantScoreResult(
-                stock_code=stock_code,
-                stock_name=stock_name,
-                total_score=round(total_score, 2),
-                momentum_score=round(momentum_score, 2),
-                quality_score=round(quality_score, 2),
-                value_score=round(value_score, 2),
-                technical_score=round(technical_score, 2),
-                news_stat_score=round(news_stat_score, 2),
-                supply_demand_score=round(supply_demand_score, 2),
-                matched_conditions=matched_conditions,
-                condition_win_rate=factor_perf['best_win_rate'],
-                condition_sample_count=factor_perf['sample_count'],
-                condition_confidence=factor_perf['confidence'],
-                news_stat_win_rate=news_win_rate,
-                news_stat_sample_count=news_sample,
-                news_stat_confidence=news_conf,
-                # [v1.0.6] 복합조건 및 섹터
-                compound_bonus=round(compound_bonus, 2),
-                compound_conditions=compound_details.get('compound_conditions_met', []),
-                sector=sector,
-                is_long_term_hold_recommended=is_long_term_hold_recommended,
-                # [v1.0] Dual Track 점수 (3 AI 합의)
-                short_term_score=round(short_term_score, 2),
-                short_term_grade=short_grade,
-                short_term_recommendation=short_rec,
-                long_term_score=round(long_term_score, 2),
-                long_term_grade=long_grade,
-                long_term_recommendation=long_rec,
-                news_timing_signal=news_timing_signal,
-                news_timing_reason=news_timing_reason,
-                recommended_holding_days=recommended_holding,
-                details=all_details,
-            )
+            close, volume, _ = self._single_stock_panel(daily_prices_df)
+            return self._score_panel(
+                [stock_code], [stock_name], close, volume, kospi_prices_df,
+                roe=[roe], sales_growth=[sales_growth], eps_growth=[eps_growth], pbr=[pbr], per=[per],
+                sentiment_scores=[current_sentiment_score], news_categories=[news_category],
+                foreign_net_buy=[foreign_net_buy], institution_net_buy=[institution_net_buy],
+                foreign_holding_ratio=[foreign_holding_ratio],
+            )[0]
             
         except Exception as e:
             logger.error(f"   (QuantScorer) {stock_code} 종합 점수 계산 오류: {e}", exc_info=True)
-            # [v1.0.1] 예외 발생 시에도 is_valid=False 설정
-            return QuantScoreResult(
-                stock_code=stock_code,
-                stock_name=stock_name,
-                total_score=0.0,  # 오류 시 0점 (중립 50점 아님!)
-                momentum_score=0.0,
-                quality_score=0.0,
-                value_score=0.0,
-                technical_score=0.0,
-                news_stat_score=0.0,
-                supply_demand_score=0.0,
-                matched_conditions=[],
-                condition_win_rate=None,
-                condition_sample_count=0,
-                condition_confidence='LOW',
-                is_valid=False,
-                invalid_reason=f'계산 오류: {str(e)[:50]}',
-                details={'error': str(e)},
+            # [v1.0.1] 예외 발생 시에도 is_valid=False 설정 (0점, 중립 50점 아님!)
+            return self._make_invalid_result(stock_code, stock_name, f'계산 오류: {str(e)[:50]}', {'error': str(e)})
+    
+    def _build_quant_result(self,
+                            stock_code: str,
+                            stock_name: str,
+                            all_details: Dict,
+                            momentum_score: float,
+                            quality_score: float,
+                            value_score: float,
+                            technical_score: float,
+                            news_stat_score: float,
+                            supply_demand_score: float,
+                            sector: str,
+                            avg_volume: Optional[float],
+                            foreign_net_buy: Optional[int],
+                            current_sentiment_score: float,
+                            news_category: Optional[str]) -> QuantScoreResult:
+        """
+        팩터별 점수로부터 복합조건 보너스, Dual Track 점수를 계산하여 QuantScoreResult를 조립합니다.
+        (calculate_total_quant_score / score_universe 공용)
+        """
+        quality_details = all_details['quality']
+        value_details = all_details['value']
+        technical_details = all_details['technical']
+        news_details = all_details['news']
+        
+        # [v1.0.6] 복합조건 보너스 계산
+        rsi = technical_details.get('rsi')
+        compound_bonus, compound_details = self.calculate_compound_condition_bonus(
+            rsi, foreign_net_buy, avg_volume
+        )
+        all_details['compound_condition'] = compound_details
+        
+        # 총점 계산 (100점 만점 + 복합조건 보너스 최대 5점)
+        total_score = (
+            momentum_score +
+            quality_score +
+            value_score +
+            technical_score +
+            news_stat_score +
+            supply_demand_score +
+            compound_bonus  # [v1.0.6] 복합조건 보너스
+        )
+        
+        # [v1.0.6] 장기 보유 추천 플래그
+        # 단기(D+5)에서는 역신호지만 장기(D+60)에서 호재인 뉴스
+        is_long_term_hold_recommended = (
+            news_category in self.NEWS_LONG_TERM_POSITIVE and
+            current_sentiment_score >= 70
+        )
+        all_details['long_term_hold_recommended'] = is_long_term_hold_recommended
+        all_details['sector'] = sector
+        
+        # 조건부 승률 정보 로드
+        factor_perf = self._load_factor_performance(stock_code)
+        matched_conditions = [c['key'] for c in factor_perf['conditions']]
+        
+        # [v1.0.2] 뉴스 통계 정보 추출 (GPT 피드백 반영)
+        news_win_rate = news_details.get('news_win_rate')
+        news_sample = news_details.get('news_sample_count', 0)
+        news_conf = news_details.get('news_confidence', 'LOW')
+        
+        # ==========================================================
+        # [v1.0] Dual Track 점수 계산 (3 AI 합의)
+        # ==========================================================
+        
+        # 뉴스 시간축 판단
+        news_timing_signal, news_timing_reason, recommended_holding = self.calculate_news_timing_signal(
+            news_category or '기타', current_sentiment_score
+        )
+        
+        # --- 단기 스나이퍼 점수 (D+5) ---
+        # RSI+외인 복합조건 중심 (승률 55.5%)
+        is_rsi_oversold = rsi is not None and rsi < 30
+        is_foreign_buying = compound_details.get('is_foreign_buying', False)
+        
+        short_term_score = 0.0
+        # 복합조건 충족 시 대폭 가산 (35점)
+        if is_rsi_oversold and is_foreign_buying:
+            short_term_score += 35
+        elif is_rsi_oversold:
+            short_term_score += 20
+        elif is_foreign_buying:
+            short_term_score += 15
+        
+        # 섹터별 RSI 효과 (금융/조선 우대)
+        sector_rsi_mult = self.SECTOR_RSI_MULTIPLIER.get(sector, 1.0)
+        if sector_rsi_mult >= 1.2:  # 금융, 조선운송
+            short_term_score += 10
+        elif sector_rsi_mult <= 0.8:  # 건설기계
+            short_term_score -= 10
+        
+        # 수급 (20점)
+        short_term_score += supply_demand_score * (20/15)
+        
+        # ROE (10점)
+        short_term_score += quality_score * (10/20)
+        
+        # 뉴스 단기 패널티 (역신호!)
+        if news_category in self.NEWS_REVERSE_SIGNAL_CATEGORIES and current_sentiment_score >= 70:
+            short_term_score -= 15  # 단기 추격매수 페널티
+        
+        short_term_score = max(0, min(100, short_term_score))
+        
+        # --- 장기 헌터 점수 (D+60) ---
+        # ROE + 뉴스 눌림목 중심 (승률 65~72%)
+        long_term_score = 0.0
+        
+        # ROE (30점) - D+60 적중률 65.6%
+        roe_val = quality_details.get('roe', 0)
+        if roe_val is not None and roe_val > 15:
+            long_term_score += 30
+        elif roe_val is not None and roe_val > 10:
+            long_term_score += 20
+        elif roe_val is not None and roe_val > 5:
+            long_term_score += 10
+        
+        # 뉴스 장기효과 (25점) - 수주 72.7%, 실적 64.8%
+        if news_category in self.NEWS_TIME_EFFECT:
+            effect = self.NEWS_TIME_EFFECT[news_category]
+            d60_win = effect['d60_win_rate']
+            if d60_win >= 0.70:
+                long_term_score += 25
+            elif d60_win >= 0.60:
+                long_term_score += 18
+            elif d60_win >= 0.55:
+                long_term_score += 10
+        
+        # RSI (15점) - D+60 적중률 60.1%
+        if is_rsi_oversold:
+            long_term_score += 15
+        elif rsi is not None and rsi < 40:
+            long_term_score += 8
+        
+        # PER 가치 (10점) - D+60 적중률 59.9%
+        per_val = value_details.get('per', 0)
+        if per_val is not None and 5 < per_val < 15:
+            long_term_score += 10
+        elif per_val is not None and per_val < 20:
+            long_term_score += 5
+        
+        # 수급 (10점)
+        long_term_score += supply_demand_score * (10/15)
+        
+        long_term_score = max(0, min(100, long_term_score))
+        
+        # --- 등급 및 추천 부여 ---
+        def get_grade_and_rec(score):
+            if score >= 80: return "A", "강력매수"
+            elif score >= 65: return "B", "매수"
+            elif score >= 50: return "C", "관망"
+            elif score >= 35: return "D", "주의"
+            else: return "F", "회피"
+        
+        short_grade, short_rec = get_grade_and_rec(short_term_score)
+        long_grade, long_rec = get_grade_and_rec(long_term_score)
+        
+        # 눌림목 대기 시그널이면 단기 추천 하향
+        if news_timing_signal == "WAIT_DIP":
+            short_rec = "⚠️ 눌림목 대기"
+            recommended_holding = 60
+        
+        all_details['dual_track'] = {
+            'short_term_score': round(short_term_score, 2),
+            'short_term_grade': short_grade,
+            'long_term_score': round(long_term_score, 2),
+            'long_term_grade': long_grade,
+            'news_timing_signal': news_timing_signal,
+            'recommended_holding_days': recommended_holding,
+        }
+        
+        return QuantScoreResult(
+            stock_code=stock_code,
+            stock_name=stock_name,
+            total_score=round(total_score, 2),
+            momentum_score=round(momentum_score, 2),
+            quality_score=round(quality_score, 2),
+            value_score=round(value_score, 2),
+            technical_score=round(technical_score, 2),
+            news_stat_score=round(news_stat_score, 2),
+            supply_demand_score=round(supply_demand_score, 2),
+            matched_conditions=matched_conditions,
+            condition_win_rate=factor_perf['best_win_rate'],
+            condition_sample_count=factor_perf['sample_count'],
+            condition_confidence=factor_perf['confidence'],
+            news_stat_win_rate=news_win_rate,
+            news_stat_sample_count=news_sample,
+            news_stat_confidence=news_conf,
+            # [v1.0.6] 복합조건 및 섹터
+            compound_bonus=round(compound_bonus, 2),
+            compound_conditions=compound_details.get('compound_conditions_met', []),
+            sector=sector,
+            is_long_term_hold_recommended=is_long_term_hold_recommended,
+            # [v1.0] Dual Track 점수 (3 AI 합의)
+            short_term_score=round(short_term_score, 2),
+            short_term_grade=short_grade,
+            short_term_recommendation=short_rec,
+            long_term_score=round(long_term_score, 2),
+            long_term_grade=long_grade,
+            long_term_recommendation=long_rec,
+            news_timing_signal=news_timing_signal,
+            news_timing_reason=news_timing_reason,
+            recommended_holding_days=recommended_holding,
+            details=all_details,
+        )
+    
+    # =========================================================================
+    # [Batch] 후보 유니버스 일괄 점수 계산 (행렬 연산)
+    # =========================================================================
+    
+    @staticmethod
+    def build_price_panels(daily_prices_by_code: Dict[str, pd.DataFrame],
+                           stock_codes: List[str],
+                           length: int = 150) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        종목별 일봉 DataFrame을 우측 정렬된 (일자 × 종목) 종가/거래량 패널로 변환합니다.
+        
+        마지막 행이 각 종목의 최신 일봉이며, 데이터가 짧은 종목은 앞쪽이 NaN으로 채워집니다.
+        (get_daily_prices_batch 결과를 그대로 넣으면 됨)
+        """
+        close_panel = np.full((length, len(stock_codes)), np.nan)
+        volume_panel = np.full((length, len(stock_codes)), np.nan)
+        for j, code in enumerate(stock_codes):
+            df = daily_prices_by_code.get(code)
+            if not isinstance(df, pd.DataFrame) or df.empty:
+                continue
+            tail = df.tail(length)
+            n = len(tail)
+            close_panel[length - n:, j] = pd.to_numeric(tail['CLOSE_PRICE'], errors='coerce').to_numpy(dtype=np.float64)
+            if 'VOLUME' in tail.columns:
+                volume_panel[length - n:, j] = pd.to_numeric(tail['VOLUME'], errors='coerce').to_numpy(dtype=np.float64)
+        return close_panel, volume_panel
+    
+    @staticmethod
+    def _as_float_array(values, size: int) -> np.ndarray:
+        """None을 NaN으로 바꾼 float 배열 (values가 None이면 전부 NaN)"""
+        if values is None:
+            return np.full(size, np.nan)
+        return np.array([np.nan if v is None else float(v) for v in values], dtype=np.float64)
+    
+    @staticmethod
+    def _opt(array: np.ndarray, i: int) -> Optional[float]:
+        value = array[i]
+        return None if np.isnan(value) else float(value)
+    
+    @classmethod
+    def _single_stock_panel(cls, daily_prices_df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """종목 하나의 일봉 → (T × 1) 종가/거래량 패널과 유효 일수 (종목별 점수 메서드용)"""
+        close, volume = cls.build_price_panels({'': daily_prices_df}, [''], length=len(daily_prices_df))
+        return close, volume, (~np.isnan(close)).sum(axis=0)
+    
+    @staticmethod
+    def _kospi_close(kospi_prices_df: Optional[pd.DataFrame]) -> Optional[np.ndarray]:
+        if kospi_prices_df is None:
+            return None
+        return pd.to_numeric(kospi_prices_df['CLOSE_PRICE'], errors='coerce').to_numpy(dtype=np.float64)
+    
+    # -------------------------------------------------------------------------
+    # 팩터별 점수 규칙 (종목별 calculate_* 메서드와 score_universe 공용)
+    # 입력은 (일자 × 종목) 우측 정렬 패널 / 종목별 배열, 반환은 'total'과 중간값 배열 dict
+    # -------------------------------------------------------------------------
+    
+    @staticmethod
+    def _momentum_factors(close: np.ndarray, counts: np.ndarray, kospi_close: Optional[np.ndarray]) -> Dict:
+        """모멘텀 (25점): 6개월 상대/절대 15점 + 1개월 5점 + 월별 안정성 5점"""
+        n_codes = close.shape[1]
+        
+        def at(offset: int) -> np.ndarray:
+            """우측 정렬 패널에서 iloc[offset] (음수) 값"""
+            return close[offset] if close.shape[0] >= -offset else np.full(n_codes, np.nan)
+        
+        last = at(-1)
+        # [v1.0.3] KOSPI 데이터 없으면 절대 모멘텀으로 폴백
+        kospi_6m = (kospi_close[-1] / kospi_close[-120] - 1) * 100 if kospi_close is not None and len(kospi_close) >= 120 else None
+        kospi_1m = (kospi_close[-1] / kospi_close[-20] - 1) * 100 if kospi_close is not None and len(kospi_close) >= 20 else None
+        
+        has_6m = counts >= 120
+        has_1m = counts >= 20
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return_6m = (last / at(-120) - 1) * 100
+            return_1m = (last / at(-20) - 1) * 100
+            if kospi_6m is not None:
+                # 상대 모멘텀: -30% ~ +30%를 0~15점으로 연속 매핑
+                momentum_6m = np.clip(7.5 + (return_6m - kospi_6m) * 0.25, 0, 15)
+            else:
+                # 절대 모멘텀: -20% ~ +40%를 0~15점으로 연속 매핑 (상승에 더 긍정적)
+                momentum_6m = np.clip(5 + return_6m * 0.25, 0, 15)
+            momentum_6m = np.where(has_6m, momentum_6m, 7.5)  # 데이터 부족시만 중립
+            # 1개월: -10% ~ +10%를 0~5점으로 연속 매핑
+            base_1m = return_1m - kospi_1m if kospi_1m is not None else return_1m
+            momentum_1m = np.where(has_1m, np.clip(2.5 + base_1m * 0.25, 0, 5), 2.5)
+            
+            month_bounds = [(-120 + i * 20, -120 + (i + 1) * 20 if i < 5 else -1) for i in range(6)]
+            positive_months = sum(((at(end) / at(start) - 1) * 100 > 0).astype(int) for start, end in month_bounds)
+        consistency = positive_months / 6
+        consistency_score = np.where(has_6m, consistency * 5, 2.5)
+        return {
+            'total': momentum_6m + momentum_1m + consistency_score,
+            'has_6m': has_6m, 'has_1m': has_1m, 'return_6m': return_6m, 'return_1m': return_1m,
+            'kospi_6m': kospi_6m, 'kospi_1m': kospi_1m, 'momentum_6m': momentum_6m, 'momentum_1m': momentum_1m,
+            'consistency': consistency, 'consistency_score': consistency_score,
+        }
+    
+    @staticmethod
+    def _quality_factors(close: np.ndarray, counts: np.ndarray, roe_arr: np.ndarray,
+                         sales_arr: np.ndarray, eps_arr: np.ndarray) -> Dict:
+        """품질 (20점): ROE 10점 + 매출/EPS 성장 7점 + 이익 안정성(가격 변동성) 3점"""
+        # ROE: -20% ~ +40%를 0~10점으로 연속 매핑 (없으면 중립)
+        roe_score = np.where(np.isnan(roe_arr), 5, np.clip(5 + roe_arr * 0.167, 0, 10))
+        sales_score = np.where(np.isnan(sales_arr), 1.75, np.clip(1.75 + sales_arr * 0.0875, 0, 3.5))
+        eps_score = np.where(np.isnan(eps_arr), 1.75, np.clip(1.75 + eps_arr * 0.058, 0, 3.5))
+        with np.errstate(all='ignore'), warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)  # 데이터 없는 종목의 빈 구간
+            daily_returns = close[1:] / close[:-1] - 1
+            volatility = np.nanstd(daily_returns, axis=0, ddof=1) * 100
+        has_60 = counts >= 60
+        # 변동성: 0~5%를 3~0점으로 매핑 (낮을수록 좋음)
+        stability_score = np.where(has_60, np.maximum(0, 3 - volatility * 0.6), 1.5)
+        return {
+            'total': roe_score + sales_score + eps_score + stability_score,
+            'roe': roe_arr, 'roe_score': roe_score, 'sales': sales_arr, 'sales_score': sales_score,
+            'eps': eps_arr, 'eps_score': eps_score, 'has_60': has_60, 'volatility': volatility,
+            'stability_score': stability_score,
+        }
+    
+    @staticmethod
+    def _value_factors(pbr_arr: np.ndarray, per_arr: np.ndarray) -> Dict:
+        """가치 (15점): PBR 7.5점 + PER 7.5점 (낮을수록 좋음, 적자 기업 PER 0점)"""
+        with np.errstate(invalid='ignore'):
+            pbr_ok = pbr_arr > 0
+            per_ok = per_arr > 0
+        # PBR: 0.5~3.0을 7.5~0점, PER: 5~30을 7.5~0점으로 연속 매핑
+        pbr_score = np.where(pbr_ok, np.clip(7.5 - (pbr_arr - 0.5) * 3, 0, 7.5), 3.75)
+        per_score = np.where(per_ok, np.clip(7.5 - (per_arr - 5) * 0.3, 0, 7.5), 0)
+        return {
+            'total': pbr_score + per_score,
+            'pbr_ok': pbr_ok, 'pbr': pbr_arr, 'pbr_score': pbr_score,
+            'per_ok': per_ok, 'per': per_arr, 'per_score': per_score,
+        }
+    
+    @staticmethod
+    def _technical_factors(close: np.ndarray, volume: Optional[np.ndarray], counts: np.ndarray,
+                           sector_mult: np.ndarray) -> Dict:
+        """기술적 (10점): 거래량 추세 4점 + RSI 3점(섹터별 가중치) + 볼린저 밴드 3점"""
+        n_codes = close.shape[1]
+        has_20 = counts >= 20
+        with np.errstate(all='ignore'), warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            if volume is not None and volume.shape[0] >= 25:
+                recent_volume = np.nanmean(volume[-5:], axis=0)
+                past_volume = np.nanmean(volume[-25:-5], axis=0)
+                volume_ratio = recent_volume / past_volume
+                volume_ok = (counts >= 25) & (past_volume > 0)
+                # 0.5배~3.0배를 0~4점으로 연속 매핑
+                volume_score = np.where(volume_ok, np.clip((volume_ratio - 0.5) * 1.6, 0, 4), 2)
+            else:
+                volume_ratio = np.full(n_codes, np.nan)
+                volume_ok = np.zeros(n_codes, dtype=bool)
+                volume_score = np.full(n_codes, 2.0)
+            
+            # RSI 과매도 구간(30~40)에 높은 점수
+            from shared import strategy
+            rsi = strategy.calculate_rsi_panel(close, period=14)
+            rsi_raw = np.select(
+                [rsi <= 30, rsi <= 50, rsi <= 70],
+                [3, 3 - (rsi - 30) * 0.075, 1.5 - (rsi - 50) * 0.05],
+                np.maximum(0, 0.5 - (rsi - 70) * 0.025),
             )
+            has_rsi = ~np.isnan(rsi)
+            # [v1.0.6] 섹터별 RSI 가중치 (최대 3점 유지)
+            rsi_score = np.where(has_rsi, np.minimum(3.0, rsi_raw * sector_mult), 1.5)
+            
+            # 볼린저 밴드: 하단에 가까울수록 높은 점수
+            window20 = close[-20:] if close.shape[0] >= 20 else close
+            ma20 = window20.mean(axis=0)
+            std20 = window20.std(axis=0, ddof=1)
+            bb_upper = ma20 + 2 * std20
+            bb_lower = ma20 - 2 * std20
+            bb_position = (close[-1] - bb_lower) / (bb_upper - bb_lower) if close.shape[0] else np.full(n_codes, np.nan)
+            bb_ok = has_20 & (bb_upper > bb_lower)
+            bb_score = np.where(bb_ok, np.maximum(0, 3 - bb_position * 3), 1.5)
+        return {
+            'total': volume_score + rsi_score + bb_score,
+            'volume_ok': volume_ok, 'volume_ratio': volume_ratio, 'volume_score': volume_score,
+            'has_rsi': has_rsi, 'rsi': rsi, 'rsi_raw': rsi_raw, 'rsi_score': rsi_score, 'sector_mult': sector_mult,
+            'bb_ok': bb_ok, 'bb_position': bb_position, 'bb_score': bb_score,
+        }
     
+    @staticmethod
+    def _average_volume(volume: Optional[np.ndarray], counts: np.ndarray) -> np.ndarray:
+        """[v1.0.3] 종목별 최근 20일 평균 거래량 (수급 정규화용, 데이터 부족 시 NaN)"""
+        if volume is None or volume.shape[0] < 20:
+            return np.full(len(counts), np.nan)
+        with np.errstate(all='ignore'), warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            avg_volume = np.nanmean(volume[-20:], axis=0)
+        return np.where(counts >= 20, avg_volume, np.nan)
+    
+    @staticmethod
+    def _supply_factors(foreign_arr: np.ndarray, inst_arr: np.ndarray, holding_arr: np.ndarray,
+                        avg_volume: np.ndarray) -> Dict:
+        """
+        수급 (15점): 외국인 순매수 7점 + 기관 순매수 5점 + 외국인 보유비중 3점
+        평균 거래량이 있으면 거래량 대비 비율로, 없으면 절대 주수로 정규화
+        """
+        normalized = avg_volume > 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            foreign_ratio = foreign_arr / avg_volume
+            inst_ratio = inst_arr / avg_volume
+            # 외국인: 거래량의 -5% ~ +5% 또는 -100만주 ~ +100만주를 0~7점으로 매핑
+            foreign_score = np.where(
+                normalized,
+                np.clip(3.5 + foreign_ratio / 0.05 * 3.5, 0, 7),
+                np.clip(3.5 + foreign_arr / 1_000_000 * 3.5, 0, 7),
+            )
+            # 기관: 거래량의 -3% ~ +3% 또는 -50만주 ~ +50만주를 0~5점으로 매핑
+            inst_score = np.where(
+                normalized,
+                np.clip(2.5 + inst_ratio / 0.03 * 2.5, 0, 5),
+                np.clip(2.5 + inst_arr / 500_000 * 2.5, 0, 5),
+            )
+        foreign_score = np.where(np.isnan(foreign_arr), 3.5, foreign_score)
+        inst_score = np.where(np.isnan(inst_arr), 2.5, inst_score)
+        # 보유비중: 0~50%를 0~3점으로 매핑
+        holding_score = np.where(np.isnan(holding_arr), 1.5, np.minimum(3, holding_arr / 50 * 3))
+        return {
+            'total': foreign_score + inst_score + holding_score,
+            'foreign': foreign_arr, 'inst': inst_arr, 'holding': holding_arr, 'normalized': normalized,
+            'foreign_ratio': foreign_ratio, 'foreign_score': foreign_score, 'inst_ratio': inst_ratio,
+            'inst_score': inst_score, 'holding_score': holding_score, 'avg_volume': avg_volume,
+        }
+    
+    def score_universe(self,
+                       stock_codes: List[str],
+                       stock_names: List[str],
+                       close_panel: np.ndarray,
+                       volume_panel: Optional[np.ndarray] = None,
+                       kospi_prices_df: Optional[pd.DataFrame] = None,
+                       roe=None,
+                       sales_growth=None,
+                       eps_growth=None,
+                       pbr=None,
+                       per=None,
+                       sentiment_scores=None,
+                       news_categories=None,
+                       foreign_net_buy=None,
+                       institution_net_buy=None,
+                       foreign_holding_ratio=None) -> List[QuantScoreResult]:
+        """
+        후보 전체를 (일자 × 종목) 패널로 받아 모든 팩터 점수를 벡터 연산으로 한 번에 계산합니다.
+        
+        종목별 calculate_total_quant_score와 같은 점수 규칙(_score_panel)을 쓰므로 결과도 같고,
+        filter_candidates / save_daily_scores를 그대로 사용할 수 있습니다.
+        
+        Args:
+            stock_codes / stock_names: 종목 코드 / 이름 (길이 N)
+            close_panel / volume_panel: (T × N) 우측 정렬 패널 (build_price_panels 참고)
+            kospi_prices_df: KOSPI 일봉 (상대 모멘텀용)
+            roe ~ foreign_holding_ratio: 길이 N 시퀀스 (값 없음은 None), 생략 시 전부 None
+            sentiment_scores: 길이 N (생략 시 50), news_categories: 길이 N (생략 시 None)
+        """
+        if len(stock_codes) == 0:
+            return []
+        
+        self.prefetch_universe_stats(stock_codes)
+        results = self._score_panel(
+            stock_codes, stock_names, close_panel, volume_panel, kospi_prices_df,
+            roe=roe, sales_growth=sales_growth, eps_growth=eps_growth, pbr=pbr, per=per,
+            sentiment_scores=sentiment_scores, news_categories=news_categories,
+            foreign_net_buy=foreign_net_buy, institution_net_buy=institution_net_buy,
+            foreign_holding_ratio=foreign_holding_ratio,
+        )
+        logger.info(f"   (QuantScorer) 일괄 점수 계산 완료: {len(stock_codes)}개 종목")
+        return results
+    
+    def _score_panel(self,
+                     stock_codes: List[str],
+                     stock_names: List[str],
+                     close_panel: np.ndarray,
+                     volume_panel: Optional[np.ndarray],
+                     kospi_prices_df: Optional[pd.DataFrame],
+                     roe=None,
+                     sales_growth=None,
+                     eps_growth=None,
+                     pbr=None,
+                     per=None,
+                     sentiment_scores=None,
+                     news_categories=None,
+                     foreign_net_buy=None,
+                     institution_net_buy=None,
+                     foreign_holding_ratio=None) -> List[QuantScoreResult]:
+        """패널 → 팩터별 점수 배열 → 종목별 QuantScoreResult (score_universe / calculate_total_quant_score 공용)"""
+        n_codes = len(stock_codes)
+        close = np.asarray(close_panel, dtype=np.float64)
+        volume = None if volume_panel is None else np.asarray(volume_panel, dtype=np.float64)
+        counts = (~np.isnan(close)).sum(axis=0)
+        
+        sectors = [self._get_stock_sector(code) for code in stock_codes]
+        sector_mult = np.array([self.SECTOR_RSI_MULTIPLIER.get(sec, 1.0) for sec in sectors])
+        
+        momentum = self._momentum_factors(close, counts, self._kospi_close(kospi_prices_df))
+        quality = self._quality_factors(close, counts, self._as_float_array(roe, n_codes),
+                                        self._as_float_array(sales_growth, n_codes),
+                                        self._as_float_array(eps_growth, n_codes))
+        value = self._value_factors(self._as_float_array(pbr, n_codes), self._as_float_array(per, n_codes))
+        technical = self._technical_factors(close, volume, counts, sector_mult)
+        avg_volume = self._average_volume(volume, counts)
+        supply = self._supply_factors(self._as_float_array(foreign_net_buy, n_codes),
+                                      self._as_float_array(institution_net_buy, n_codes),
+                                      self._as_float_array(foreign_holding_ratio, n_codes), avg_volume)
+        
+        # ---- 종목별 결과 조립 (뉴스 통계는 캐시 조회, 나머지는 위 배열에서) ----
+        results = []
+        for i, code in enumerate(stock_codes):
+            name = stock_names[i]
+            n = int(counts[i])
+            if n == 0:
+                results.append(self._make_invalid_result(code, name, '일봉 데이터 없음', {'error': '일봉 데이터 없음'}))
+                continue
+            if n < MIN_PRICE_DATA_DAYS:
+                results.append(self._make_invalid_result(
+                    code, name, f'데이터 부족 ({n}일)',
+                    {'error': f'데이터 부족 ({n}일 < {MIN_PRICE_DATA_DAYS}일)'},
+                ))
+                continue
+            
+            sentiment = sentiment_scores[i] if sentiment_scores is not None and sentiment_scores[i] is not None else 50
+            category = news_categories[i] if news_categories is not None else None
+            foreign_value = foreign_net_buy[i] if foreign_net_buy is not None else None
+            inst_value = institution_net_buy[i] if institution_net_buy is not None else None
+            try:
+                details = {
+                    'momentum': self._momentum_details(momentum, i),
+                    'quality': self._quality_details(quality, i),
+                    'value': self._value_details(value, i),
+                    'technical': self._technical_details(technical, i, sectors[i]),
+                }
+                news_stat_score, details['news'] = self.calculate_news_stat_score(code, sentiment, category)
+                details['supply_demand'] = self._supply_details(supply, i, foreign_value, inst_value)
+                
+                results.append(self._build_quant_result(
+                    code, name, details,
+                    float(momentum['total'][i]), float(quality['total'][i]), float(value['total'][i]),
+                    float(technical['total'][i]), news_stat_score, float(supply['total'][i]),
+                    sector=sectors[i],
+                    avg_volume=self._opt(avg_volume, i),
+                    foreign_net_buy=None if np.isnan(supply['foreign'][i]) else foreign_value,
+                    current_sentiment_score=sentiment,
+                    news_category=category,
+                ))
+            except Exception as e:
+                logger.error(f"   (QuantScorer) {code} 종합 점수 계산 오류: {e}", exc_info=True)
+                results.append(self._make_invalid_result(
+                    code, name, f'계산 오류: {str(e)[:50]}', {'error': str(e)}
+                ))
+        return results
+    
+    @staticmethod
+    def _make_invalid_result(stock_code: str, stock_name: str, reason: str, details: Dict) -> QuantScoreResult:
+        return QuantScoreResult(
+            stock_code=stock_code,
+            stock_name=stock_name,
+            total_score=0.0,
+            momentum_score=0.0,
+            quality_score=0.0,
+            value_score=0.0,
+            technical_score=0.0,
+            news_stat_score=0.0,
+            supply_demand_score=0.0,
+            matched_conditions=[],
+            condition_win_rate=None,
+            condition_sample_count=0,
+            condition_confidence='LOW',
+            is_valid=False,
+            invalid_reason=reason,
+            details=details,
+        )
+    
+    @staticmethod
+    def _momentum_details(f: Dict, i: int) -> Dict:
+        factors = {}
+        if f['has_6m'][i]:
+            if f['kospi_6m'] is not None:
+                factors['relative_momentum_6m'] = round(float(f['return_6m'][i] - f['kospi_6m']), 2)
+                factors['momentum_type'] = 'relative'
+            else:
+                factors['absolute_momentum_6m'] = round(float(f['return_6m'][i]), 2)
+                factors['momentum_type'] = 'absolute (KOSPI 없음)'
+            factors['momentum_6m_score'] = round(float(f['momentum_6m'][i]), 2)
+        else:
+            factors['momentum_6m_score'] = 7.5
+            factors['momentum_6m_note'] = '데이터 부족 (120일 미만)'
+        
+        if f['has_1m'][i]:
+            if f['kospi_1m'] is not None:
+                factors['relative_momentum_1m'] = round(float(f['return_1m'][i] - f['kospi_1m']), 2)
+            else:
+                factors['absolute_momentum_1m'] = round(float(f['return_1m'][i]), 2)
+            factors['momentum_1m_score'] = round(float(f['momentum_1m'][i]), 2)
+        else:
+            factors['momentum_1m_score'] = 2.5
+        
+        if f['has_6m'][i]:
+            factors['momentum_consistency'] = round(float(f['consistency'][i]), 2)
+            factors['consistency_score'] = round(float(f['consistency_score'][i]), 2)
+        else:
+            factors['consistency_score'] = 2.5
+        return factors
+    
+    @staticmethod
+    def _quality_details(f: Dict, i: int) -> Dict:
+        factors = {}
+        if not np.isnan(f['roe'][i]):
+            factors['roe'] = round(float(f['roe'][i]), 2)
+            factors['roe_score'] = round(float(f['roe_score'][i]), 2)
+        else:
+            factors['roe_score'] = 5
+            factors['roe_note'] = '데이터 없음'
+        if not np.isnan(f['sales'][i]):
+            factors['sales_growth'] = round(float(f['sales'][i]), 2)
+            factors['sales_score'] = round(float(f['sales_score'][i]), 2)
+        else:
+            factors['sales_score'] = 1.75
+        if not np.isnan(f['eps'][i]):
+            factors['eps_growth'] = round(float(f['eps'][i]), 2)
+            factors['eps_score'] = round(float(f['eps_score'][i]), 2)
+        else:
+            factors['eps_score'] = 1.75
+        if f['has_60'][i]:
+            factors['volatility'] = round(float(f['volatility'][i]), 2)
+            factors['stability_score'] = round(float(f['stability_score'][i]), 2)
+        else:
+            factors['stability_score'] = 1.5
+        return factors
+    
+    @staticmethod
+    def _value_details(f: Dict, i: int) -> Dict:
+        factors = {}
+        if f['pbr_ok'][i]:
+            factors['pbr'] = round(float(f['pbr'][i]), 2)
+            factors['pbr_score'] = round(float(f['pbr_score'][i]), 2)
+        else:
+            factors['pbr_score'] = 3.75
+            factors['pbr_note'] = '데이터 없음'
+        if f['per_ok'][i]:
+            factors['per'] = round(float(f['per'][i]), 2)
+            factors['per_score'] = round(float(f['per_score'][i]), 2)
+        else:
+            factors['per_score'] = 0
+            factors['per_note'] = '적자 또는 데이터 없음'
+        return factors
+    
+    @staticmethod
+    def _technical_details(f: Dict, i: int, sector: str) -> Dict:
+        factors = {}
+        if f['volume_ok'][i]:
+            factors['volume_ratio'] = round(float(f['volume_ratio'][i]), 2)
+            factors['volume_score'] = round(float(f['volume_score'][i]), 2)
+        else:
+            factors['volume_score'] = 2
+        if f['has_rsi'][i]:
+            factors['rsi'] = round(float(f['rsi'][i]), 2)
+            factors['rsi_score_raw'] = round(float(f['rsi_raw'][i]), 2)
+            factors['rsi_score'] = round(float(f['rsi_score'][i]), 2)
+            factors['sector'] = sector
+            factors['sector_rsi_multiplier'] = float(f['sector_mult'][i])
+        else:
+            factors['rsi_score'] = 1.5
+        if f['bb_ok'][i]:
+            factors['bb_position'] = round(float(f['bb_position'][i]), 2)
+            factors['bb_score'] = round(float(f['bb_score'][i]), 2)
+        else:
+            factors['bb_score'] = 1.5
+        return factors
+    
+    @staticmethod
+    def _supply_details(f: Dict, i: int, foreign_net_buy, institution_net_buy) -> Dict:
+        """foreign_net_buy / institution_net_buy: 입력 원값 (details에 그대로 기록)"""
+        factors = {}
+        normalized = f['normalized'][i]
+        if not np.isnan(f['foreign'][i]):
+            if normalized:
+                factors['foreign_ratio'] = round(float(f['foreign_ratio'][i]) * 100, 2)
+                factors['normalize_method'] = 'volume_ratio'
+            else:
+                factors['normalize_method'] = 'absolute'
+            factors['foreign_net_buy'] = foreign_net_buy
+            factors['foreign_score'] = round(float(f['foreign_score'][i]), 2)
+        else:
+            factors['foreign_score'] = 3.5
+        if not np.isnan(f['inst'][i]):
+            if normalized:
+                factors['institution_ratio'] = round(float(f['inst_ratio'][i]) * 100, 2)
+            factors['institution_net_buy'] = institution_net_buy
+            factors['institution_score'] = round(float(f['inst_score'][i]), 2)
+        else:
+            factors['institution_score'] = 2.5
+        if not np.isnan(f['holding'][i]):
+            factors['foreign_holding_ratio'] = round(float(f['holding'][i]), 2)
+            factors['holding_score'] = round(float(f['holding_score'][i]), 2)
+        else:
+            factors['holding_score'] = 1.5
+        if normalized:
+            factors['avg_volume'] = float(f['avg_volume'][i])
+        return factors
+    
+
     def filter_candidates(self, 
                           results: List[QuantScoreResult],
                           cutoff_ratio: float = None) -> List[QuantScoreResult]:
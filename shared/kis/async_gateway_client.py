@@ -0,0 +1,250 @@
+# shared/kis/async_gateway_client.py
+# Version: v1.0
+# KIS Gateway 비동기 클라이언트 - 여러 종목 조회를 asyncio로 동시에 수행
+#
+# - httpx.AsyncClient 하나(keep-alive)를 공유하고, 동시 요청 수(Semaphore)와
+#   초당 요청 수(토큰 버킷)를 함께 제한합니다. (KISGatewayClient의 고정 sleep 대신)
+# - get_stock_snapshots / get_investor_trends / get_daily_prices_many는
+#   종목 리스트를 받아 한 번의 await로 {종목코드: 결과}를 돌려줍니다. (실패 종목은 제외)
+#
+# 사용 예:
+#     async with AsyncKISGatewayClient() as client:
+#         snapshots = await client.get_stock_snapshots(codes)
+#
+#     # 동기 코드에서
+#     snapshots = run_sync(lambda c: c.get_stock_snapshots(codes))
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GATEWAY_URL = 'https://kis-gateway-641885523217.asia-northeast3.run.app'
+SNAPSHOT_BATCH_SIZE = 100          # Gateway SNAPSHOT_BATCH_MAX(기본 200) 이하
+_AUTH_TOKEN_TTL_SECONDS = 50 * 60  # Cloud Run ID 토큰 유효기간(1시간)보다 짧게
+
+
+class AsyncRateLimiter:
+    """asyncio용 토큰 버킷 (초당 rate개, 최대 burst개)"""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be greater than zero")
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+
+class AsyncKISGatewayClient:
+    """
+    KIS Gateway 비동기 클라이언트
+
+    Args:
+        gateway_url: Gateway URL (기본: 환경 변수 KIS_GATEWAY_URL)
+        timeout: 요청 타임아웃 (초)
+        max_concurrency: 동시에 진행할 최대 요청 수 (기본: GATEWAY_MAX_CONCURRENCY 또는 8)
+        rate_per_sec: 초당 최대 요청 수 (기본: GATEWAY_RATE_LIMIT_PER_SEC 또는 20)
+    """
+
+    def __init__(self, gateway_url: Optional[str] = None, timeout: float = 30,
+                 max_concurrency: Optional[int] = None, rate_per_sec: Optional[float] = None):
+        self.gateway_url = gateway_url or os.getenv('KIS_GATEWAY_URL', DEFAULT_GATEWAY_URL)
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency or int(os.getenv('GATEWAY_MAX_CONCURRENCY', '8'))
+        rate = rate_per_sec or float(os.getenv('GATEWAY_RATE_LIMIT_PER_SEC', '20'))
+        self.use_auth = os.getenv('USE_GATEWAY_AUTH', 'true').lower() == 'true'
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._limiter = AsyncRateLimiter(rate)
+        self._auth_token: Optional[str] = None
+        self._auth_token_expires = 0.0
+        self._auth_lock = asyncio.Lock()
+        self._batch_supported = True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            limits = httpx.Limits(max_connections=self.max_concurrency,
+                                  max_keepalive_connections=self.max_concurrency)
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=limits)
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _get_auth_token(self) -> Optional[str]:
+        """Cloud Run 인증 토큰 (만료 전까지 재사용)"""
+        if not self.use_auth:
+            return None
+        async with self._auth_lock:
+            if self._auth_token and time.monotonic() < self._auth_token_expires:
+                return self._auth_token
+            try:
+                response = await self._get_client().get(
+                    "http://metadata.google.internal/computeMetadata/v1/instance/service-accounts/default/identity",
+                    params={'audience': self.gateway_url},
+                    headers={'Metadata-Flavor': 'Google'},
+                    timeout=5,
+                )
+                if response.status_code == 200:
+                    self._auth_token = response.text
+                    self._auth_token_expires = time.monotonic() + _AUTH_TOKEN_TTL_SECONDS
+                    return self._auth_token
+                logger.warning(f"Metadata Server 토큰 획득 실패: {response.status_code}")
+            except Exception as e:
+                logger.warning(f"인증 토큰 획득 실패 (로컬 환경일 수 있음): {e}")
+            # 로컬 환경 등: 매 요청마다 재시도하지 않도록 인증 없이 진행
+            self.use_auth = False
+            return None
+
+    async def _request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
+        """Gateway에 HTTP 요청 전송 (동시성/속도 제한 적용). 실패 시 None"""
+        url = f"{self.gateway_url}{endpoint}"
+        headers = {'Content-Type': 'application/json'}
+        token = await self._get_auth_token()
+        if token:
+            headers['Authorization'] = f'Bearer {token}'
+
+        async with self._semaphore:
+            await self._limiter.acquire()
+            try:
+                response = await self._get_client().request(method, url, headers=headers, json=data)
+                if response.status_code == 404 and endpoint == '/api/market-data/snapshots':
+                    self._batch_supported = False
+                    return None
+                response.raise_for_status()
+                return response.json()
+            except httpx.TimeoutException:
+                logger.error(f"❌ Gateway 타임아웃: {url}")
+            except httpx.HTTPStatusError as e:
+                logger.error(f"❌ Gateway HTTP 오류: {e.response.status_code} - {e.response.text}")
+            except Exception as e:
+                logger.error(f"❌ Gateway 요청 실패: {e}")
+            return None
+
+    async def _gather_by_code(self, codes: List[str], fetch_one: Callable) -> Dict[str, Any]:
+        """종목별 코루틴을 동시에 실행해 {code: 결과} (None 결과 제외)"""
+        codes = list(dict.fromkeys(codes))
+        results = await asyncio.gather(*(fetch_one(code) for code in codes))
+        return {code: result for code, result in zip(codes, results) if result is not None}
+
+    # ------------------------------------------------------------------
+    # 시세
+    # ------------------------------------------------------------------
+
+    async def get_stock_snapshot(self, stock_code: str, is_index: bool = False) -> Optional[Dict[str, Any]]:
+        """주식 현재가 조회"""
+        response = await self._request('POST', '/api/market-data/snapshot', {
+            'stock_code': stock_code,
+            'is_index': is_index
+        })
+        if response and response.get('success'):
+            return response.get('data')
+        logger.debug(f"⚠️ Snapshot 조회 실패: {stock_code}")
+        return None
+
+    async def get_stock_snapshots(self, stock_codes: List[str], is_index: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 종목 현재가 조회
+        Gateway 일괄 조회 API를 SNAPSHOT_BATCH_SIZE 단위로 동시에 호출하고,
+        지원하지 않는 Gateway(404)면 종목별 조회로 폴백합니다.
+        """
+        stock_codes = list(dict.fromkeys(stock_codes))
+        if not stock_codes:
+            return {}
+
+        if self._batch_supported:
+            chunks = [stock_codes[i:i + SNAPSHOT_BATCH_SIZE] for i in range(0, len(stock_codes), SNAPSHOT_BATCH_SIZE)]
+            responses = await asyncio.gather(*(
+                self._request('POST', '/api/market-data/snapshots', {'stock_codes': chunk, 'is_index': is_index})
+                for chunk in chunks
+            ))
+            if self._batch_supported:
+                snapshots = {}
+                for response in responses:
+                    if response and response.get('data'):
+                        snapshots.update(response['data'])
+                return snapshots
+            logger.info("ℹ️ Gateway가 일괄 조회를 지원하지 않아 종목별 조회로 전환합니다.")
+
+        return await self._gather_by_code(stock_codes, lambda code: self.get_stock_snapshot(code, is_index))
+
+    async def get_investor_trend(self, stock_code: str, start_date: Optional[str] = None,
+                                 end_date: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        """투자자별 매매 동향 (일자 오름차순 리스트, KIS 응답은 최신일 우선이므로 정렬해서 반환)"""
+        response = await self._request('POST', '/api/market-data/investor-trend', {
+            'stock_code': stock_code,
+            'start_date': start_date,
+            'end_date': end_date
+        })
+        if response and response.get('success'):
+            return sorted(response.get('data') or [], key=lambda row: row.get('date', ''))
+        logger.debug(f"⚠️ Investor Trend 조회 실패: {stock_code}")
+        return None
+
+    async def get_investor_trends(self, stock_codes: List[str], start_date: Optional[str] = None,
+                                  end_date: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """여러 종목 투자자별 매매 동향"""
+        return await self._gather_by_code(
+            stock_codes, lambda code: self.get_investor_trend(code, start_date, end_date)
+        )
+
+    async def get_stock_daily_prices(self, stock_code: str, num_days_to_fetch: int = 30) -> Optional[Any]:
+        """일봉 데이터 조회 (KISGatewayClient와 같이 DataFrame으로 반환)"""
+        response = await self._request('POST', '/api/market-data/daily-prices', {
+            'stock_code': stock_code,
+            'num_days_to_fetch': num_days_to_fetch
+        })
+        if response and response.get('success'):
+            data = response.get('data')
+            try:
+                import pandas as pd
+                return pd.DataFrame(data) if isinstance(data, list) else data
+            except ImportError:
+                return data
+        logger.debug(f"⚠️ Daily Prices 조회 실패: {stock_code}")
+        return None
+
+    async def get_daily_prices_many(self, stock_codes: List[str], num_days_to_fetch: int = 30) -> Dict[str, Any]:
+        """여러 종목 일봉 데이터"""
+        return await self._gather_by_code(
+            stock_codes, lambda code: self.get_stock_daily_prices(code, num_days_to_fetch)
+        )
+
+
+def run_sync(fn: Callable, **client_kwargs):
+    """
+    동기 코드에서 비동기 클라이언트 작업 1회 실행
+    fn: AsyncKISGatewayClient를 받아 코루틴을 돌려주는 함수
+    """
+    async def _main():
+        async with AsyncKISGatewayClient(**client_kwargs) as client:
+            return await fn(client)
+
+    return asyncio.run(_main())
@@ -17,6 +17,7 @@ class KISClient:
     한국투자증권(KIS) API와의 모든 상호작용을 캡슐화하는 메인 클라이언트입니다.
     """
     # Rate Limit 안전성을 위해 딜레이 증가 (0.3초)
+    # KIS 호출 스케줄러의 기본 초당 호출 수(1 / API_CALL_DELAY)로 사용 (KIS_RATE_LIMIT_PER_SEC로 조정)
     API_CALL_DELAY_REAL = 0.3
     API_CALL_DELAY_MOCK = 0.5
     TIMEOUT = 5
@@ -64,9 +65,9 @@ class KISClient:
             return True
         return False
 
-    def request(self, method, url, headers=None, params=None, data=None, tr_id=""):
-        """모든 API 요청을 위한 중앙 래퍼 메소드"""
-        return safe_request(self, method, url, headers, params, data, tr_id)
+    def request(self, method, url, headers=None, params=None, data=None, tr_id="", priority=None):
+        """모든 API 요청을 위한 중앙 래퍼 메소드 (priority: shared.kis.scheduler.PRIORITY_*)"""
+        return safe_request(self, method, url, headers, params, data, tr_id, priority)
 
     # --- 편의를 위한 바로가기(Shortcut) 메소드 ---
     # 기존 KIS_API 클래스와의 호환성을 위해 자주 사용하는 메소드들을 바로 호출할 수 있도록 연결합니다.
@@ -74,6 +75,16 @@ class KISClient:
     def get_stock_daily_prices(self, *args, **kwargs): return self.market_data.get_stock_daily_prices(*args, **kwargs)
     def get_stock_snapshot(self, *args, **kwargs): return self.market_data.get_stock_snapshot(*args, **kwargs)
     def get_overseas_stock_price(self, *args, **kwargs): return self.market_data.get_overseas_stock_price(*args, **kwargs)
+
+    def get_stock_snapshots(self, stock_codes, is_index=False):
+        """여러 종목 현재가 (KISGatewayClient.get_stock_snapshots와 같은 형식, 종목별 조회, 실패 종목 제외)"""
+        snapshots = {}
+        for code in dict.fromkeys(stock_codes):
+            snapshot = self.market_data.get_stock_snapshot(code, is_index=is_index)
+            if snapshot:
+                snapshots[code] = snapshot
+        return snapshots
+
     def place_buy_order(self, *args, **kwargs): return self.trading.place_buy_order(*args, **kwargs)
     def place_sell_order(self, *args, **kwargs): return self.trading.place_sell_order(*args, **kwargs)
     def start_realtime_monitoring(self, *args, **kwargs): return self.websocket.start_realtime_monitoring(*args, **kwargs)
\ No newline at end of file
@@ -5,10 +5,13 @@
 import os
 import logging
 import requests
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 logger = logging.getLogger(__name__)
 
+# 일괄 조회 1회당 종목 수 (Gateway SNAPSHOT_BATCH_MAX(기본 200) 이하, 초과 시 400)
+SNAPSHOT_BATCH_SIZE = 200
+
 class KISGatewayClient:
     """
     KIS Gateway를 통해 KIS API를 호출하는 클라이언트
@@ -39,6 +42,9 @@ class KISGatewayClient:
         # Rate Limit 방지를 위한 클라이언트 측 딜레이 (Gateway 제한: 20req/sec -> 0.05s)
         self.API_CALL_DELAY = 0.05
         
+        # 일괄 조회 API 미지원(404) Gateway면 False → 이후 종목별 조회
+        self._batch_supported = True
+        
         logger.info(f"✅ KIS Gateway Client 초기화: {self.gateway_url}")
     
     def _get_auth_token(self) -> Optional[str]:
@@ -104,6 +110,9 @@ class KISGatewayClient:
             logger.error(f"❌ Gateway 타임아웃: {url}")
             return None
         except requests.exceptions.HTTPError as e:
+            if e.response.status_code == 404 and endpoint == '/api/market-data/snapshots':
+                self._batch_supported = False
+                return None
             logger.error(f"❌ Gateway HTTP 오류: {e.response.status_code} - {e.response.text}")
             return None
         except Exception as e:
@@ -139,6 +148,45 @@ class KISGatewayClient:
             logger.error(f"❌ Snapshot 조회 실패: {stock_code}")
             return None
     
+    def get_stock_snapshots(self, stock_codes: List[str], is_index: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 종목 현재가 일괄 조회 (Gateway 측 캐시/요청 합치기 사용)
+        SNAPSHOT_BATCH_SIZE 단위로 나눠 호출하고, 일괄 조회가 실패한 묶음(404 미지원, 400, 503 등)은
+        종목별 조회(get_stock_snapshot)로 폴백합니다.
+        
+        Returns:
+            {stock_code: 현재가 정보} (조회 실패 종목은 제외)
+        """
+        stock_codes = list(dict.fromkeys(stock_codes))
+        if not stock_codes:
+            return {}
+        logger.debug(f"📊 [Gateway] Snapshots 일괄 요청: {len(stock_codes)}개")
+        
+        snapshots = {}
+        fallback_codes = []
+        for i in range(0, len(stock_codes), SNAPSHOT_BATCH_SIZE):
+            chunk = stock_codes[i:i + SNAPSHOT_BATCH_SIZE]
+            response = None
+            if self._batch_supported:
+                response = self._request('POST', '/api/market-data/snapshots', {
+                    'stock_codes': chunk,
+                    'is_index': is_index
+                })
+            if response and response.get('success'):
+                if response.get('failed'):
+                    logger.warning(f"⚠️ Snapshot 일괄 조회 일부 실패: {response['failed']}")
+                snapshots.update(response.get('data') or {})
+            else:
+                fallback_codes.extend(chunk)
+        
+        if fallback_codes:
+            logger.warning(f"⚠️ Snapshot 일괄 조회 실패, 종목별 조회로 폴백: {len(fallback_codes)}개")
+            for code in fallback_codes:
+                snapshot = self.get_stock_snapshot(code, is_index)
+                if snapshot:
+                    snapshots[code] = snapshot
+        return snapshots
+    
     def place_buy_order(self, stock_code: str, quantity: int, price: int = 0) -> Optional[str]:
         """
         매수 주문 (Gateway를 통해)
@@ -418,10 +418,7 @@ class MarketData:
                 "FID_ORG_ADJ_PRC": "1"
             }
             
-            # 잦은 호출 방지
-            import time
-            time.sleep(0.1)
-            
+            # 호출 간격은 KIS 호출 스케줄러(safe_request)가 조절
             res_data = self.client.request('GET', URL, params=params, tr_id=tr_id)
             
             if res_data and res_data.get('output2'):
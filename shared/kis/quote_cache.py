@@ -0,0 +1,105 @@
+# shared/kis/quote_cache.py
+# Version: v1.0
+# [모듈] 짧은 TTL 시세 캐시 + 동일 요청 합치기(coalescing)
+#
+# - 같은 종목 시세를 TTL(장중 1~3초) 동안 재사용합니다.
+# - 캐시에 없는 종목을 여러 스레드가 동시에 요청하면 첫 요청만 KIS를 호출하고,
+#   나머지는 그 결과를 기다렸다가 함께 받습니다. (single-flight)
+# - 실패(None/예외)는 캐시하지 않습니다. 기다리던 요청은 같은 실패를 받습니다.
+
+import threading
+import time
+
+
+class _InFlight:
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class QuoteCache:
+    """
+    키별 TTL 캐시 + single-flight
+
+    ttl: 초 단위 숫자 또는 현재 TTL을 돌려주는 함수 (장중/장외 구분 등). 0 이하이면 캐시하지 않음
+    """
+
+    def __init__(self, ttl=2.0, max_entries=5000):
+        self._ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = {}  # key -> (expires_at, value)
+        self._in_flight = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @property
+    def ttl(self):
+        return self._ttl() if callable(self._ttl) else self._ttl
+
+    def get_or_fetch(self, key, fetch):
+        """캐시 값 또는 fetch() 결과 (동시 요청은 fetch 1회로 합침)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                return entry[1]
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _InFlight()
+                self._in_flight[key] = flight
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = fetch()
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                ttl = self.ttl
+                if flight.error is None and flight.value is not None and ttl > 0:
+                    if len(self._entries) >= self.max_entries:
+                        self._evict_expired(time.monotonic())
+                    self._entries[key] = (time.monotonic() + ttl, flight.value)
+                del self._in_flight[key]
+            flight.event.set()
+        return flight.value
+
+    def _evict_expired(self, now):
+        expired = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        if len(self._entries) >= self.max_entries:
+            self._entries.clear()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                "ttl_seconds": self.ttl,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                # 합쳐진 요청도 KIS 호출 없이 처리된 것이므로 적중으로 계산
+                "hit_rate": f"{((self.hits + self.coalesced) / max(lookups, 1) * 100):.1f}%",
+            }
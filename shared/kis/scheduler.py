@@ -0,0 +1,202 @@
+# shared/kis/scheduler.py
+# Version: v1.0
+# [모듈] KIS API 호출 스케줄러 (토큰 버킷 + 우선순위 대기열 + HTTP keep-alive 세션)
+#
+# - 계좌(APP_KEY) 단위 전체 버킷 1개 + TR_ID 계열(quote/account/order)별 버킷으로 호출 속도를 제한합니다.
+#   호출 후 고정 sleep 대신, 예산이 남아 있으면 바로 보내고 없을 때만 기다립니다.
+# - 대기 중인 요청은 우선순위 순으로 토큰을 받습니다.
+#   매도/정정·취소 주문 > 매수 주문 > 계좌 조회 > 시세 조회 (대량 스냅샷/투자자 동향은 가장 뒤)
+# - 시세 계열 기본 한도는 전체의 80%로, 대량 시세 조회 중에도 주문/계좌 조회용 여유분이 남습니다.
+#
+# 환경변수 (초당 호출 수, 미설정 시 클라이언트 API_CALL_DELAY에서 유도)
+#   KIS_RATE_LIMIT_PER_SEC, KIS_RATE_LIMIT_QUOTE_PER_SEC,
+#   KIS_RATE_LIMIT_ACCOUNT_PER_SEC, KIS_RATE_LIMIT_ORDER_PER_SEC, KIS_HTTP_POOL_SIZE
+
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+FAMILY_QUOTE = "quote"
+FAMILY_ACCOUNT = "account"
+FAMILY_ORDER = "order"
+
+# 숫자가 작을수록 먼저 처리
+PRIORITY_SELL = 0
+PRIORITY_ORDER = 1
+PRIORITY_ACCOUNT = 2
+PRIORITY_QUOTE = 3
+
+_SELL_TR_IDS = {"TTTC0011U", "VTTC0011U", "TTTC0013U", "VTTC0013U"}  # 매도, 정정/취소
+_QUOTE_FAMILY_SHARE = 0.8
+
+
+def classify_tr_id(tr_id):
+    """TR_ID → (계열, 기본 우선순위)"""
+    tr_id = tr_id or ""
+    if tr_id in _SELL_TR_IDS:
+        return FAMILY_ORDER, PRIORITY_SELL
+    if tr_id[1:4] == "TTC" and tr_id.endswith("U"):
+        return FAMILY_ORDER, PRIORITY_ORDER
+    if tr_id[1:4] == "TTC" or tr_id.startswith("CTCA") or tr_id == "KIS-WS-AUTH":
+        return FAMILY_ACCOUNT, PRIORITY_ACCOUNT
+    return FAMILY_QUOTE, PRIORITY_QUOTE
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 capacity개까지 쌓이는 토큰 버킷 (잠금은 호출자가 담당)"""
+
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError("rate must be greater than zero")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now):
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self._updated = now
+
+    def wait_time(self, now):
+        """토큰 1개를 쓰기까지 남은 시간 (초)"""
+        self._refill(now)
+        if self.tokens >= 1.0:
+            return 0.0
+        return (1.0 - self.tokens) / self.rate
+
+    def consume(self, now):
+        self._refill(now)
+        self.tokens -= 1.0
+
+
+class KISRequestScheduler:
+    """계좌 단위 KIS 호출 스케줄러 (전체 버킷 + 계열별 버킷, 우선순위 대기열)"""
+
+    def __init__(self, rate_per_sec, family_rates=None, burst=None):
+        self.rate_per_sec = float(rate_per_sec)
+        self._global = TokenBucket(rate_per_sec, burst)
+        family_rates = family_rates or {}
+        self._families = {
+            FAMILY_QUOTE: TokenBucket(family_rates.get(FAMILY_QUOTE, rate_per_sec * _QUOTE_FAMILY_SHARE)),
+            FAMILY_ACCOUNT: TokenBucket(family_rates.get(FAMILY_ACCOUNT, rate_per_sec)),
+            FAMILY_ORDER: TokenBucket(family_rates.get(FAMILY_ORDER, rate_per_sec)),
+        }
+        self._cond = threading.Condition()
+        self._waiters = []  # heap of (priority, seq)
+        self._seq = itertools.count()
+        self._stats = {
+            family: {"requests": 0, "waited": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0}
+            for family in self._families
+        }
+
+    def acquire(self, tr_id="", priority=None):
+        """
+        호출 예산을 1개 확보할 때까지 대기합니다.
+        같은 시점에 기다리는 요청 중 우선순위가 가장 높은(숫자가 작은) 요청부터 토큰을 받습니다.
+        반환: 대기한 시간 (초)
+        """
+        family, default_priority = classify_tr_id(tr_id)
+        ticket = (default_priority if priority is None else priority, next(self._seq))
+        bucket = self._families[family]
+        started = time.monotonic()
+
+        with self._cond:
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    if self._waiters[0] == ticket:
+                        delay = max(self._global.wait_time(now), bucket.wait_time(now))
+                        if delay <= 0:
+                            self._global.consume(now)
+                            bucket.consume(now)
+                            break
+                        self._cond.wait(delay)
+                    else:
+                        # 앞선 요청이 토큰을 받으면 notify_all로 깨어남
+                        self._cond.wait()
+            finally:
+                if self._waiters and self._waiters[0] == ticket:
+                    heapq.heappop(self._waiters)
+                elif ticket in self._waiters:
+                    self._waiters.remove(ticket)
+                    heapq.heapify(self._waiters)
+                self._cond.notify_all()
+
+            waited = time.monotonic() - started
+            stats = self._stats[family]
+            stats["requests"] += 1
+            if waited > 0.001:
+                stats["waited"] += 1
+                stats["wait_seconds"] += waited
+                stats["max_wait_seconds"] = max(stats["max_wait_seconds"], waited)
+        return waited
+
+    def get_stats(self):
+        with self._cond:
+            return {
+                "rate_per_sec": self.rate_per_sec,
+                "family_rates": {family: bucket.rate for family, bucket in self._families.items()},
+                "queued": len(self._waiters),
+                "families": {family: dict(stats) for family, stats in self._stats.items()},
+            }
+
+
+# ============================================================================
+# 클라이언트별 공유 인스턴스 (계좌 단위 스케줄러, keep-alive 세션)
+# ============================================================================
+
+_registry_lock = threading.Lock()
+_schedulers = {}
+
+
+def _env_rate(name, default):
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+def get_scheduler(client):
+    """같은 계좌(APP_KEY, 모드)를 쓰는 클라이언트들이 공유하는 스케줄러"""
+    key = (getattr(client, "APP_KEY", None), getattr(client, "TRADING_MODE", None))
+    with _registry_lock:
+        scheduler = _schedulers.get(key)
+        if scheduler is None:
+            delay = getattr(client, "API_CALL_DELAY", None)
+            default_rate = 1.0 / delay if delay else 10.0
+            rate = _env_rate("KIS_RATE_LIMIT_PER_SEC", default_rate)
+            family_rates = {
+                FAMILY_QUOTE: _env_rate("KIS_RATE_LIMIT_QUOTE_PER_SEC", rate * _QUOTE_FAMILY_SHARE),
+                FAMILY_ACCOUNT: _env_rate("KIS_RATE_LIMIT_ACCOUNT_PER_SEC", rate),
+                FAMILY_ORDER: _env_rate("KIS_RATE_LIMIT_ORDER_PER_SEC", rate),
+            }
+            scheduler = KISRequestScheduler(rate, family_rates)
+            _schedulers[key] = scheduler
+            logger.info(f"✅ KIS 호출 스케줄러 생성 (초당 {rate:.1f}회, 계열별 {family_rates})")
+        return scheduler
+
+
+def get_http_session(client):
+    """클라이언트 전용 keep-alive requests.Session (연결 풀 재사용)"""
+    session = getattr(client, "_http_session", None)
+    if session is not None:
+        return session
+    with _registry_lock:
+        session = getattr(client, "_http_session", None)
+        if session is None:
+            pool_size = int(os.getenv("KIS_HTTP_POOL_SIZE", "10"))
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            client._http_session = session
+        return session
@@ -0,0 +1,149 @@
+# shared/kis/tick_decoder.py
+# Version: v1.0
+# [모듈] KIS 실시간 체결(H0STCNT0) 프레임 디코더 + 종목별 최신 틱 합치기
+#
+# - 프레임 형식: "{암호화}|{TR_ID}|{건수}|{레코드1}^{레코드2}..." (레코드당 46개 필드, '^' 구분)
+#   한 프레임에 여러 건이 올 수 있으므로 건수만큼 모두 Tick으로 꺼냅니다.
+# - 데이터 부분은 split('^') 한 번(C 구현)으로 나누고, 레코드 간격(46)으로 필요한 필드만 읽습니다.
+#   (find 기반 스캐너나 정규식보다 빨라 이 방식을 사용. scripts/benchmark_ws_ticks.py 참고)
+# - TickCoalescer는 수신 스레드와 처리 스레드를 분리하고, 처리가 밀리면 종목별 마지막 틱만 처리합니다.
+
+import logging
+import threading
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+TR_ID_STOCK_EXECUTION = "H0STCNT0"  # 주식 현재가(체결)
+H0STCNT0_FIELD_COUNT = 46
+
+# H0STCNT0 필드 위치
+_CODE = 0     # MKSC_SHRN_ISCD 종목코드
+_TIME = 1     # STCK_CNTG_HOUR 체결 시간 (HHMMSS)
+_PRICE = 2    # STCK_PRPR 현재가
+_HIGH = 8     # STCK_HGPR 고가
+_VOLUME = 13  # ACML_VOL 누적 거래량
+
+
+class Tick(NamedTuple):
+    """체결 틱 1건"""
+    code: str
+    price: float
+    high: float
+    volume: int   # 누적 거래량
+    time: str     # 체결 시간 (HHMMSS)
+
+
+def decode_frame(message: str) -> List[Tick]:
+    """
+    웹소켓 프레임에서 체결 틱을 모두 꺼냅니다.
+    H0STCNT0 데이터 프레임이 아니면(JSON 제어 메시지, PINGPONG 등) 빈 리스트를 돌려주고,
+    필드가 모자란 마지막 레코드는 버립니다.
+    """
+    if not message or message[0] not in "01":
+        return []
+    p1 = message.find("|")
+    p2 = message.find("|", p1 + 1)
+    p3 = message.find("|", p2 + 1)
+    if p3 < 0 or message[p1 + 1:p2] != TR_ID_STOCK_EXECUTION:
+        return []
+
+    fields = message[p3 + 1:].split("^")
+    try:
+        count = int(message[p2 + 1:p3])
+    except ValueError:
+        count = 0
+    available = len(fields) // H0STCNT0_FIELD_COUNT
+    if count <= 0 or count > available:
+        if count > available:
+            logger.warning(f"   (WS) 체결 레코드 부족: 건수 {count}, 수신 {available}건")
+        count = available
+
+    ticks = []
+    for base in range(0, count * H0STCNT0_FIELD_COUNT, H0STCNT0_FIELD_COUNT):
+        try:
+            ticks.append(Tick(
+                fields[base + _CODE],
+                float(fields[base + _PRICE]),
+                float(fields[base + _HIGH]),
+                int(fields[base + _VOLUME] or 0),
+                fields[base + _TIME],
+            ))
+        except ValueError:
+            logger.warning(f"   (WS) 체결 레코드 해석 실패: {fields[base + _CODE]}")
+    return ticks
+
+
+class TickCoalescer:
+    """
+    틱 처리 스레드 (종목별 최신 틱만 처리)
+
+    push()는 수신 스레드에서 호출되며 종목별 마지막 틱만 보관하고 바로 반환합니다.
+    처리 스레드는 쌓인 틱을 한 번에 가져가 handler(tick)를 호출합니다.
+    handler가 느려 그 사이 같은 종목 틱이 여러 번 오면 마지막 것만 처리됩니다.
+    """
+
+    def __init__(self, handler: Callable[[Tick], None], name: str = "tick-dispatch"):
+        self._handler = handler
+        self._name = name
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Tick] = {}
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.received = 0
+        self.dispatched = 0
+        self.coalesced = 0
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 2.0):
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+
+    def push(self, ticks: List[Tick]):
+        if not ticks:
+            return
+        with self._lock:
+            pending = self._pending
+            for tick in ticks:
+                if tick.code in pending:
+                    self.coalesced += 1
+                pending[tick.code] = tick
+            self.received += len(ticks)
+        self._wakeup.set()
+
+    def drain(self) -> int:
+        """쌓인 틱을 현재 스레드에서 처리 (처리 건수 반환)"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._wakeup.clear()
+        for tick in pending.values():
+            try:
+                self._handler(tick)
+            except Exception as e:
+                logger.error(f"❌ (WS) 틱 처리 중 오류 [{tick.code}]: {e}", exc_info=True)
+        self.dispatched += len(pending)
+        return len(pending)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait(1.0)
+            self.drain()
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "received": self.received,
+                "dispatched": self.dispatched,
+                "coalesced": self.coalesced,
+                "pending": len(self._pending),
+            }
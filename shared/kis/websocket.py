@@ -1,6 +1,8 @@
 # youngs75_jennie/kis/websocket.py
-# Version: v3.5
+# Version: v3.6
 # [모듈] KIS API 실시간 웹소켓
+# [v3.6] 프레임의 체결 레코드를 모두 해석(tick_decoder)하고, 콜백은 별도 스레드에서
+#        종목별 최신 틱만 처리(TickCoalescer)하여 수신 스레드가 밀리지 않게 함
 
 import logging
 import websocket
@@ -9,6 +11,8 @@ import json
 import time
 import os
 
+from .tick_decoder import Tick, TickCoalescer, decode_frame
+
 logger = logging.getLogger(__name__)
 
 class WebsocketManager:
@@ -27,6 +31,7 @@ class WebsocketManager:
         self.connection_start_time = None  # 연결 시작 시간
         self.ping_thread = None  # Keepalive ping 스레드
         self.ping_interval = 30  # 30초마다 ping 전송
+        self.tick_dispatcher = None  # on_price_func 호출 스레드 (TickCoalescer)
         
         # Mock 모드 관련
         self.mock_mode = os.getenv('MOCK_SKIP_TIME_CHECK', 'false').lower() == 'true'
@@ -85,8 +90,25 @@ class WebsocketManager:
             self.is_ws_connected = False
             self.connection_event.clear()
 
+    def _start_tick_dispatcher(self, on_price_func):
+        """on_price_func(stock_code, price, high)를 호출할 틱 처리 스레드를 (다시) 시작합니다."""
+        self._stop_tick_dispatcher()
+        if on_price_func:
+            self.tick_dispatcher = TickCoalescer(
+                lambda tick: on_price_func(tick.code, tick.price, tick.high)
+            ).start()
+
+    def _stop_tick_dispatcher(self):
+        if self.tick_dispatcher is not None:
+            self.tick_dispatcher.stop()
+            self.tick_dispatcher = None
+
     def start_realtime_monitoring(self, portfolio_codes, on_price_func):
-        """실시간 데이터 수신을 위한 웹소켓 스레드를 시작합니다."""
+        """
+        실시간 데이터 수신을 위한 웹소켓 스레드를 시작합니다.
+        on_price_func는 틱 처리 스레드에서 호출되며, 처리가 밀리면 종목별 마지막 틱만 전달됩니다.
+        """
+        self._start_tick_dispatcher(on_price_func)
         
         # [Mock 모드] Flask-SocketIO 웹소켓 연결
         if self.mock_mode:
@@ -145,20 +167,10 @@ class WebsocketManager:
                     self.message_count += 1
                     self.last_message_time = time.time()
                     
-                    if message[0] in ['0', '1']:
-                        parts = message.split('|')
-                        if len(parts) >= 4:
-                            data_part = parts[3]
-                            fields = data_part.split('^')
-                            if len(fields) >= 6:
-                                stock_code = fields[0]
-                                current_price = float(fields[2])
-                                current_high = float(fields[5])
-                                
-                                if on_price_func:
-                                    on_price_func(stock_code, current_price, current_high)
-                            else:
-                                logger.warning(f"   (WS) 메시지 필드 수 부족: {len(fields)}개")
+                    # 한 프레임의 체결 레코드를 모두 꺼내 처리 스레드로 넘김 (여기서는 블로킹하지 않음)
+                    dispatcher = self.tick_dispatcher
+                    if dispatcher is not None:
+                        dispatcher.push(decode_frame(message))
                 except Exception as e:
                     logger.error(f"❌ (WS) 메시지 처리 중 오류: {e}", exc_info=True)
 
@@ -221,6 +233,7 @@ class WebsocketManager:
         self.is_ws_connected = False
         self.connection_event.clear()
         self._stop_ping_thread()
+        self._stop_tick_dispatcher()
         
         if self.ws:
             try:
@@ -284,9 +297,11 @@ class WebsocketManager:
                 current_price = float(data.get('current_price', 0))
                 current_high = float(data.get('high', current_price))
                 
-                # 매도 핸들러 콜백 호출
-                if on_price_func and stock_code and current_price > 0:
-                    on_price_func(stock_code, current_price, current_high)
+                # 매도 핸들러 콜백 호출 (틱 처리 스레드 경유)
+                dispatcher = self.tick_dispatcher
+                if dispatcher is not None and stock_code and current_price > 0:
+                    dispatcher.push([Tick(stock_code, current_price, current_high,
+                                          int(data.get('volume', 0) or 0), str(data.get('time', '')))])
                     
                     # 가격 업데이트 로그 (처음 5회는 매번, 이후 1분마다)
                     if self.message_count <= 5 or self.message_count % 12 == 0:  # 처음 5회 또는 1분마다
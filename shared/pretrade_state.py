@@ -0,0 +1,280 @@
+# shared/pretrade_state.py
+# Version: v1.0
+# [모듈] 매수 전 상태 스냅샷 (포트폴리오 / 오늘 매수 건수·금액 / 최근 거래 종목 / 가용 현금)
+#
+# - 매수 신호마다 차례로 하던 DB 조회와 Gateway 현금 조회를 스레드 풀에서 동시에 수행합니다.
+#   (DB 조회는 작업마다 별도 세션 사용)
+# - 계좌 상태(포트폴리오, 오늘 매수 건수·금액, 현금)는 신호 사이에 재사용하고,
+#   체결 이벤트(Redis 'trading:fills', execute_trade_and_log가 발행) 또는 invalidate() 호출 시 버립니다.
+#   이벤트를 놓쳐도 PRETRADE_STATE_MAX_AGE_SEC(기본 30초)가 지나거나 날짜가 바뀌면 다시 읽습니다.
+# - 구독 후 Redis 연결이 끊겨 수신 스레드가 종료되면, 다음 get()에서 캐시를 버리고 재구독합니다.
+#   (재구독 전까지는 계좌 상태를 재사용하지 않음, 재시도 간격 RESUBSCRIBE_INTERVAL_SEC)
+# - 최근 거래 여부는 후보 종목이 신호마다 달라 get_recently_traded_stocks_batch 1회로 매번 확인합니다.
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional
+
+from shared.db.connection import session_scope
+from shared.db import repository as repo
+
+logger = logging.getLogger(__name__)
+
+RECENT_TRADE_WINDOW_HOURS = 0.17  # 10분 (중복 주문 방지)
+RESUBSCRIBE_INTERVAL_SEC = 5.0  # 체결 이벤트 재구독 최소 간격
+
+
+@dataclass(frozen=True)
+class AccountState:
+    """신호 사이에 재사용하는 계좌 상태"""
+    portfolio: List[dict]
+    today_buy_count: int
+    today_buy_amount: float
+    cash: float
+    loaded_at: float
+    trade_date: str  # UTC 날짜 (오늘 매수 건수 기준일)
+
+
+@dataclass(frozen=True)
+class PreTradeState:
+    """매수 판단에 필요한 상태 (신호 1건 기준)"""
+    account: AccountState
+    recently_traded: FrozenSet[str]
+    warm: bool  # 캐시된 계좌 상태를 재사용했는지
+    timings: Dict[str, float] = field(default_factory=dict)  # 조회별 소요 시간 (초)
+
+    @property
+    def portfolio(self) -> List[dict]:
+        return self.account.portfolio
+
+    @property
+    def holding_codes(self) -> FrozenSet[str]:
+        return frozenset(p['code'] for p in self.account.portfolio)
+
+    @property
+    def today_buy_count(self) -> int:
+        return self.account.today_buy_count
+
+    @property
+    def today_buy_amount(self) -> float:
+        return self.account.today_buy_amount
+
+    @property
+    def cash(self) -> float:
+        return self.account.cash
+
+
+def _utc_date() -> str:
+    return datetime.now(timezone.utc).strftime('%Y%m%d')
+
+
+def _timed(timings: Dict[str, float], name: str, fn: Callable):
+    started = time.perf_counter()
+    try:
+        return fn()
+    finally:
+        timings[name] = time.perf_counter() - started
+
+
+class StageTimer:
+    """매수 처리 단계별 소요 시간 기록"""
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - started
+
+    def as_ms(self) -> Dict[str, float]:
+        result = {name: round(sec * 1000, 1) for name, sec in self.timings.items()}
+        result['total'] = round((time.perf_counter() - self._started) * 1000, 1)
+        return result
+
+    def summary(self) -> str:
+        return ", ".join(f"{name}={ms:.0f}ms" for name, ms in self.as_ms().items())
+
+
+class PreTradeStateProvider:
+    """
+    매수 전 상태 조회기
+
+    Args:
+        get_cash_balance: 가용 현금 조회 함수 (예: kis.get_cash_balance)
+        max_age_sec: 계좌 상태 재사용 최대 시간 (기본: PRETRADE_STATE_MAX_AGE_SEC 또는 30)
+        max_workers: 동시 조회 스레드 수
+    """
+
+    def __init__(self, get_cash_balance: Callable[[], float], max_age_sec: Optional[float] = None,
+                 max_workers: int = 4):
+        self._get_cash_balance = get_cash_balance
+        self.max_age_sec = max_age_sec if max_age_sec is not None else float(
+            os.getenv('PRETRADE_STATE_MAX_AGE_SEC', '30'))
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pretrade")
+        self._lock = threading.Lock()
+        self._account: Optional[AccountState] = None
+        self._generation = 0  # invalidate()마다 증가. 조회 중 무효화되면 결과를 캐시하지 않음
+        self._rewarming = False
+        self._events_wanted = False  # subscribe_trade_events() 호출 여부
+        self._events_redis = None
+        self._resubscribe_at = 0.0
+
+    # ------------------------------------------------------------------
+    # 무효화
+    # ------------------------------------------------------------------
+
+    def invalidate(self, reason: str = "", rewarm: bool = True):
+        """계좌 상태를 버리고, rewarm이면 다음 신호 전에 백그라운드에서 다시 읽어 둡니다."""
+        with self._lock:
+            self._generation += 1
+            self._account = None
+            start_rewarm = rewarm and not self._rewarming
+            if start_rewarm:
+                self._rewarming = True
+        logger.debug(f"[PreTrade] 계좌 상태 무효화: {reason}")
+        if start_rewarm:
+            self._pool.submit(self._rewarm)
+
+    def _rewarm(self):
+        """백그라운드 갱신 (동시에 1개만, 갱신 중 다시 무효화되면 한 번 더 읽음)"""
+        while True:
+            with self._lock:
+                generation = self._generation
+            try:
+                account = self._load_account({})
+            except Exception as e:
+                logger.debug(f"[PreTrade] 백그라운드 갱신 실패 (다음 신호에서 재시도): {e}")
+                account = None
+            with self._lock:
+                if account is None or self._generation == generation:
+                    if account is not None and account.cash > 0:
+                        self._account = account
+                    self._rewarming = False
+                    return
+
+    def _store(self, account: AccountState, generation: int):
+        with self._lock:
+            # 조회 중 체결 이벤트가 왔거나 현금 조회가 실패(0)했으면 캐시하지 않음
+            if self._generation == generation and account.cash > 0:
+                self._account = account
+
+    def on_trade_event(self, payload: dict):
+        """Redis 체결 이벤트 콜백"""
+        self.invalidate(f"{payload.get('trade_type')} {payload.get('stock_code')}")
+
+    def subscribe_trade_events(self, redis_client=None) -> bool:
+        """
+        체결 이벤트 구독 (Redis 없으면 False)
+        구독이 동작하지 않는 동안은 계좌 상태를 재사용하지 않고, get()마다 재구독을 시도합니다.
+        """
+        self._events_wanted = True
+        self._events_redis = redis_client
+        self._resubscribe_at = time.monotonic() + RESUBSCRIBE_INTERVAL_SEC
+        return self._subscribe()
+
+    def _subscribe(self) -> bool:
+        try:
+            from shared.redis_cache import subscribe_channel, TRADE_EVENTS_CHANNEL
+            return subscribe_channel(TRADE_EVENTS_CHANNEL, self.on_trade_event, self._events_redis)
+        except Exception as e:
+            logger.warning(f"⚠️ [PreTrade] 체결 이벤트 구독 실패: {e}")
+            return False
+
+    def _ensure_subscription(self) -> bool:
+        """
+        체결 이벤트 수신 중인지 확인 (구독하지 않았으면 True → max_age 기준 재사용)
+        수신 스레드가 종료되었으면 그 사이 체결을 놓쳤을 수 있으므로 계좌 상태를 버리고 재구독합니다.
+        """
+        if not self._events_wanted:
+            return True
+        from shared.redis_cache import is_channel_listening, TRADE_EVENTS_CHANNEL
+        if is_channel_listening(TRADE_EVENTS_CHANNEL):
+            return True
+        self.invalidate("체결 이벤트 수신 중단", rewarm=False)
+        now = time.monotonic()
+        if now < self._resubscribe_at:
+            return False
+        self._resubscribe_at = now + RESUBSCRIBE_INTERVAL_SEC
+        if self._subscribe():
+            logger.info("✅ [PreTrade] 체결 이벤트 재구독")
+            return True
+        return False
+
+    def _cached_account(self) -> Optional[AccountState]:
+        account = self._account
+        if account is None:
+            return None
+        if time.time() - account.loaded_at > self.max_age_sec or account.trade_date != _utc_date():
+            return None
+        return account
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def get(self, candidate_codes: Iterable[str]) -> PreTradeState:
+        """
+        후보 종목 기준 매수 전 상태. 계좌 상태가 캐시에 없으면 최근 거래 조회와 함께 동시에 읽습니다.
+        DB/Gateway 조회 실패는 예외로 전달됩니다.
+        """
+        codes = [c for c in dict.fromkeys(candidate_codes) if c]
+        timings: Dict[str, float] = {}
+        started = time.perf_counter()
+        self._ensure_subscription()
+
+        with self._lock:
+            generation = self._generation
+            account = self._cached_account()
+
+        recent_future = self._pool.submit(_timed, timings, 'recent_trades', lambda: self._load_recent(codes))
+        warm = account is not None
+        if not warm:
+            account = self._load_account(timings)
+            self._store(account, generation)
+        recently_traded = recent_future.result()
+
+        timings['total'] = time.perf_counter() - started
+        return PreTradeState(account=account, recently_traded=recently_traded, warm=warm, timings=timings)
+
+    def _load_account(self, timings: Dict[str, float]) -> AccountState:
+        trade_date = _utc_date()
+        portfolio_f = self._pool.submit(_timed, timings, 'portfolio', self._load_portfolio)
+        buys_f = self._pool.submit(_timed, timings, 'today_buys', self._load_today_buys)
+        cash_f = self._pool.submit(_timed, timings, 'cash', self._get_cash_balance)
+        today_buy_count, today_buy_amount = buys_f.result()
+        return AccountState(
+            portfolio=portfolio_f.result(),
+            today_buy_count=today_buy_count,
+            today_buy_amount=today_buy_amount,
+            cash=cash_f.result(),
+            loaded_at=time.time(),
+            trade_date=trade_date,
+        )
+
+    @staticmethod
+    def _load_portfolio() -> List[dict]:
+        with session_scope(readonly=True) as session:
+            return repo.get_active_portfolio(session)
+
+    @staticmethod
+    def _load_today_buys():
+        with session_scope(readonly=True) as session:
+            return repo.get_today_buy_count(session), repo.get_today_total_buy_amount(session)
+
+    @staticmethod
+    def _load_recent(codes: List[str]) -> FrozenSet[str]:
+        if not codes:
+            return frozenset()
+        with session_scope(readonly=True) as session:
+            return frozenset(repo.get_recently_traded_stocks_batch(session, codes, hours=RECENT_TRADE_WINDOW_HOURS))
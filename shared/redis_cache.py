@@ -35,8 +35,11 @@ database.py에서 분리되어 단일 책임 원칙(SRP)을 준수하며,
 import json
 import logging
 import os
+import threading
+import time
+import weakref
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Iterable, List, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +55,10 @@ def get_redis_connection(redis_client=None):
     """
     Redis 연결 객체를 반환합니다.
     
+    [v2.0] 연결 풀을 공유하는 클라이언트를 한 번만 만들고, 호출마다 ping하지 않습니다.
+    끊어진 연결은 redis-py 연결 풀이 다음 명령에서 다시 맺습니다.
+    (유휴 연결은 health_check_interval마다 점검)
+    
     Args:
         redis_client: 테스트용 Redis 클라이언트 (의존성 주입)
                      None이면 전역 싱글톤 사용
@@ -64,13 +71,8 @@ def get_redis_connection(redis_client=None):
         return redis_client
     
     global _redis_client
-    if _redis_client:
-        try:
-            _redis_client.ping()
-            return _redis_client
-        except Exception:
-            logger.warning("⚠️ Redis 연결이 끊겨 재연결을 시도합니다.")
-            _redis_client = None
+    if _redis_client is not None:
+        return _redis_client
 
     # 지연 import (redis가 설치되지 않은 환경 대응)
     try:
@@ -83,14 +85,17 @@ def get_redis_connection(redis_client=None):
     redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
     
     try:
-        _redis_client = redis.from_url(
+        client = redis.from_url(
             redis_url,
             db=0,
             socket_timeout=0.5,  # Fast fail
             socket_connect_timeout=0.5,
+            health_check_interval=30,
+            retry_on_timeout=True,
             decode_responses=True  # 문자열로 자동 디코딩
         )
-        _redis_client.ping()
+        client.ping()  # 최초 생성 시에만 확인
+        _redis_client = client
         logger.info(f"✅ Redis 연결 성공 ({redis_url})")
         return _redis_client
     except Exception as e:
@@ -98,6 +103,159 @@ def get_redis_connection(redis_client=None):
         return None
 
 
+# ============================================================================
+# 해시 기반 종목별 엔트리 저장소 (감성 점수 / 경쟁사 수혜 / 가격 알림)
+# ============================================================================
+# [v2.0] 종목마다 문자열 키를 두고 KEYS + 키별 GET으로 읽던 구조를 바꿉니다.
+#   {base}         HASH  stock_code -> JSON
+#   {base}_expiry  ZSET  stock_code -> 만료 시각(epoch 초)  (필드별 TTL 대용)
+#   {rank_key}     ZSET  stock_code -> 점수              (감성 점수 순위용, 선택)
+# 쓰기는 MULTI 파이프라인 1회, 전체 조회는 HGETALL + 만료 목록을 파이프라인 1회로 읽습니다.
+# 만료된 엔트리는 읽을 때 정리합니다.
+# 기존 '{base}:{code}' 문자열 키(레거시)는 첫 조회 때 클라이언트별로 한 번 SCAN해서 새 구조로 옮기고,
+# 이후 조회는 해시만 읽습니다. (미스마다 레거시 키를 다시 확인하지 않음)
+
+_legacy_migrated = weakref.WeakKeyDictionary()  # client -> {base, ...}
+
+
+def _expiry_key(base: str) -> str:
+    return f"{base}_expiry"
+
+
+def _legacy_key(base: str, stock_code: str) -> str:
+    return f"{base}:{stock_code}"
+
+
+def _hash_put(r, base: str, stock_code: str, data: Dict[str, Any], ttl: int,
+              rank_key: Optional[str] = None, rank_score: Optional[float] = None, pipe=None):
+    """엔트리 저장 (pipe가 주어지면 명령만 쌓고 실행은 호출자가 담당)"""
+    own_pipe = pipe is None
+    if own_pipe:
+        pipe = r.pipeline(transaction=True)
+    pipe.hset(base, stock_code, json.dumps(data, default=str))
+    pipe.zadd(_expiry_key(base), {stock_code: time.time() + ttl})
+    if rank_key is not None and rank_score is not None:
+        pipe.zadd(rank_key, {stock_code: rank_score})
+    pipe.delete(_legacy_key(base, stock_code))
+    if own_pipe:
+        pipe.execute()
+
+
+def _hash_delete(r, base: str, stock_codes: Iterable[str], rank_key: Optional[str] = None) -> int:
+    """엔트리 삭제 (레거시 키 포함). 반환: 삭제된 엔트리 수"""
+    stock_codes = list(stock_codes)
+    if not stock_codes:
+        return 0
+    pipe = r.pipeline(transaction=True)
+    pipe.hdel(base, *stock_codes)
+    pipe.zrem(_expiry_key(base), *stock_codes)
+    if rank_key is not None:
+        pipe.zrem(rank_key, *stock_codes)
+    pipe.delete(*[_legacy_key(base, code) for code in stock_codes])
+    results = pipe.execute()
+    return int(results[0] or 0) + int(results[-1] or 0)
+
+
+def _hash_get(r, base: str, stock_code: str, rank_key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """단건 조회 (만료/없음이면 None)"""
+    _migrate_legacy_entries(r, base, rank_key)
+    pipe = r.pipeline(transaction=False)
+    pipe.hget(base, stock_code)
+    pipe.zscore(_expiry_key(base), stock_code)
+    raw, expires_at = pipe.execute()
+    if raw is None:
+        return None
+    if expires_at is not None and expires_at <= time.time():
+        _hash_delete(r, base, [stock_code], rank_key)
+        return None
+    return json.loads(raw)
+
+
+def _hash_get_many(r, base: str, stock_codes: List[str],
+                   rank_key: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """여러 종목 조회 (HMGET + ZMSCORE, 왕복 1회). 없거나 만료된 종목은 제외"""
+    if not stock_codes:
+        return {}
+    _migrate_legacy_entries(r, base, rank_key)
+    pipe = r.pipeline(transaction=False)
+    pipe.hmget(base, stock_codes)
+    pipe.zmscore(_expiry_key(base), stock_codes)
+    raws, expiries = pipe.execute()
+    now = time.time()
+    return {
+        code: json.loads(raw)
+        for code, raw, expires_at in zip(stock_codes, raws, expiries)
+        if raw is not None and (expires_at is None or expires_at > now)
+    }
+
+
+def _hash_get_all(r, base: str, rank_key: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """전체 조회 (HGETALL + 만료 목록, 왕복 1회). 만료 엔트리는 제외 후 정리"""
+    _migrate_legacy_entries(r, base, rank_key)
+    pipe = r.pipeline(transaction=False)
+    pipe.hgetall(base)
+    pipe.zrangebyscore(_expiry_key(base), "-inf", time.time())
+    entries, expired = pipe.execute()
+    if expired:
+        _hash_delete(r, base, expired, rank_key)
+        expired = set(expired)
+    return {code: json.loads(raw) for code, raw in entries.items() if code not in expired}
+
+
+def _prune_expired(r, base: str, rank_key: Optional[str] = None) -> int:
+    expired = r.zrangebyscore(_expiry_key(base), "-inf", time.time())
+    return _hash_delete(r, base, expired, rank_key) if expired else 0
+
+
+def _migrate_legacy_entries(r, base: str, rank_key: Optional[str] = None, default_ttl: int = 604800) -> int:
+    """
+    레거시 '{base}:{code}' 키를 해시 구조로 옮깁니다. (클라이언트별 1회, SCAN 사용)
+    반환: 옮긴 엔트리 수
+    """
+    try:
+        done = _legacy_migrated.setdefault(r, set())
+    except TypeError:  # weakref 불가 객체 (Mock 등)
+        done = set()
+    if base in done:
+        return 0
+    done.add(base)
+
+    moved = 0
+    batch = []
+    for key in r.scan_iter(match=f"{base}:*", count=500):
+        batch.append(key)
+        if len(batch) >= 500:
+            moved += _migrate_legacy_batch(r, base, batch, rank_key, default_ttl)
+            batch = []
+    if batch:
+        moved += _migrate_legacy_batch(r, base, batch, rank_key, default_ttl)
+    if moved:
+        logger.info(f"✅ [Redis] 레거시 '{base}:*' 키 {moved}개를 해시 구조로 이전")
+    return moved
+
+
+def _migrate_legacy_batch(r, base, keys, rank_key, default_ttl) -> int:
+    read = r.pipeline(transaction=False)
+    for key in keys:
+        read.get(key)
+        read.ttl(key)
+    values = read.execute()
+    write = r.pipeline(transaction=True)
+    moved = 0
+    for i, key in enumerate(keys):
+        raw, ttl = values[2 * i], values[2 * i + 1]
+        if not raw:
+            continue
+        stock_code = key[len(base) + 1:]
+        data = json.loads(raw)
+        score = data.get("score") if rank_key is not None else None
+        _hash_put(r, base, stock_code, data, ttl if ttl and ttl > 0 else default_ttl,
+                  rank_key, score, pipe=write)
+        moved += 1
+    write.execute()
+    return moved
+
+
 def reset_redis_connection():
     """
     Redis 연결을 리셋합니다. (테스트용)
@@ -192,6 +350,11 @@ def get_market_regime_cache(
 # 뉴스 감성 점수 (Sentiment Score) 캐시
 # ============================================================================
 
+SENTIMENT_HASH_KEY = "sentiment"
+SENTIMENT_RANK_KEY = "sentiment_rank"
+SENTIMENT_TTL_SECONDS = 604800  # 7일
+
+
 def set_sentiment_score(
     stock_code: str, 
     score: int, 
@@ -220,17 +383,14 @@ def set_sentiment_score(
     if not r:
         return False
     
-    key = f"sentiment:{stock_code}"
-    
     # 기존 점수 조회
     old_score = 50
-    old_data_json = None
+    old_data = None
     existing_url = None
     existing_name = None
     try:
-        old_data_json = r.get(key)
-        if old_data_json:
-            old_data = json.loads(old_data_json)
+        old_data = _hash_get(r, SENTIMENT_HASH_KEY, stock_code, SENTIMENT_RANK_KEY)
+        if old_data:
             old_score = old_data.get('score', 50)
             existing_url = old_data.get('source_url')
             existing_name = old_data.get('stock_name')
@@ -238,7 +398,7 @@ def set_sentiment_score(
         pass
 
     # EMA 계산 (기존 데이터가 없으면 신규 점수 100% 반영)
-    if old_data_json:
+    if old_data:
         final_score = (old_score * 0.5) + (score * 0.5)
         # 이유도 합침 (최신 이유 + 기존 이유 요약)
         final_reason = f"[New: {score}점] {reason} | [Old: {old_score:.1f}점]" # type: ignore
@@ -255,8 +415,9 @@ def set_sentiment_score(
     }
     
     try:
-        # 해시(Hash) 대신 JSON 문자열로 저장 (간편함)
-        r.setex(key, 604800, json.dumps(data))  # 7일(604800초) 유효
+        # [v2.0] sentiment 해시 + sentiment_rank 순위 zset에 함께 저장 (7일 유효)
+        _hash_put(r, SENTIMENT_HASH_KEY, stock_code, data, SENTIMENT_TTL_SECONDS,
+                  SENTIMENT_RANK_KEY, data["score"])
         logger.debug(f"✅ [Redis] 감성 점수 업데이트: {stock_code} -> {final_score:.1f}점 (Input: {score})")
         return True
     except Exception as e:
@@ -284,17 +445,60 @@ def get_sentiment_score(
     if not r:
         return default_result
     
-    key = f"sentiment:{stock_code}"
     try:
-        data_json = r.get(key)
-        if data_json:
-            return json.loads(data_json)
-        return default_result
+        data = _hash_get(r, SENTIMENT_HASH_KEY, stock_code, SENTIMENT_RANK_KEY)
+        return data if data else default_result
     except Exception as e:
         logger.error(f"❌ [Redis] 감성 점수 조회 실패: {e}")
         return default_result
 
 
+def get_sentiment_scores(
+    stock_codes: List[str],
+    redis_client=None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    [Redis] 여러 종목의 감성 점수를 한 번에 조회합니다. (HMGET, 왕복 1회)
+    
+    Returns:
+        {stock_code: {score, reason, ...}} (데이터가 없는 종목은 제외)
+    """
+    r = get_redis_connection(redis_client)
+    if not r:
+        return {}
+    
+    try:
+        return _hash_get_many(r, SENTIMENT_HASH_KEY, list(dict.fromkeys(stock_codes)), SENTIMENT_RANK_KEY)
+    except Exception as e:
+        logger.error(f"❌ [Redis] 감성 점수 일괄 조회 실패: {e}")
+        return {}
+
+
+def get_top_sentiment_scores(
+    limit: int = 20,
+    redis_client=None
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    [Redis] 감성 점수 상위 종목을 조회합니다. (sentiment_rank zset → HMGET)
+    
+    Returns:
+        [(stock_code, {score, reason, ...}), ...] 점수 내림차순
+    """
+    r = get_redis_connection(redis_client)
+    if not r:
+        return []
+    
+    try:
+        _migrate_legacy_entries(r, SENTIMENT_HASH_KEY, SENTIMENT_RANK_KEY)
+        _prune_expired(r, SENTIMENT_HASH_KEY, SENTIMENT_RANK_KEY)
+        codes = r.zrevrange(SENTIMENT_RANK_KEY, 0, max(limit, 0) - 1)
+        entries = _hash_get_many(r, SENTIMENT_HASH_KEY, codes, SENTIMENT_RANK_KEY)
+        return [(code, entries[code]) for code in codes if code in entries]
+    except Exception as e:
+        logger.error(f"❌ [Redis] 감성 점수 순위 조회 실패: {e}")
+        return []
+
+
 # ============================================================================
 # 일반 데이터 캐시
 # ============================================================================
@@ -362,6 +566,9 @@ def get_redis_data(
 # 경쟁사 수혜 점수 (Competitor Benefit Score) 캐시
 # ============================================================================
 
+COMPETITOR_BENEFIT_HASH_KEY = "competitor_benefit"
+
+
 def set_competitor_benefit_score(
     stock_code: str, 
     score: int, 
@@ -390,7 +597,6 @@ def set_competitor_benefit_score(
     if not r:
         return False
     
-    key = f"competitor_benefit:{stock_code}"
     data = {
         "score": score,
         "reason": reason,
@@ -401,14 +607,12 @@ def set_competitor_benefit_score(
     
     try:
         # 기존 점수가 있으면 더 높은 점수 유지
-        existing = r.get(key)
-        if existing:
-            existing_data = json.loads(existing)
-            if existing_data.get("score", 0) > score:
-                logger.debug(f"ℹ️ [Redis] 경쟁사 수혜: {stock_code} 기존 점수가 더 높음 (Skip)")
-                return True
+        existing_data = _hash_get(r, COMPETITOR_BENEFIT_HASH_KEY, stock_code)
+        if existing_data and existing_data.get("score", 0) > score:
+            logger.debug(f"ℹ️ [Redis] 경쟁사 수혜: {stock_code} 기존 점수가 더 높음 (Skip)")
+            return True
         
-        r.setex(key, ttl, json.dumps(data))
+        _hash_put(r, COMPETITOR_BENEFIT_HASH_KEY, stock_code, data, ttl)
         logger.info(f"✅ [Redis] 경쟁사 수혜 저장: {stock_code} +{score}점 ({reason})")
         return True
     except Exception as e:
@@ -436,12 +640,9 @@ def get_competitor_benefit_score(
     if not r:
         return default_result
     
-    key = f"competitor_benefit:{stock_code}"
     try:
-        data_json = r.get(key)
-        if data_json:
-            return json.loads(data_json)
-        return default_result
+        data = _hash_get(r, COMPETITOR_BENEFIT_HASH_KEY, stock_code)
+        return data if data else default_result
     except Exception as e:
         logger.error(f"❌ [Redis] 경쟁사 수혜 조회 실패: {e}")
         return default_result
@@ -462,14 +663,7 @@ def get_all_competitor_benefits(redis_client=None) -> Dict[str, Dict[str, Any]]:
         return {}
     
     try:
-        keys = r.keys("competitor_benefit:*")
-        results = {}
-        for key in keys:
-            stock_code = key.replace("competitor_benefit:", "")
-            data_json = r.get(key)
-            if data_json:
-                results[stock_code] = json.loads(data_json)
-        return results
+        return _hash_get_all(r, COMPETITOR_BENEFIT_HASH_KEY)
     except Exception as e:
         logger.error(f"❌ [Redis] 경쟁사 수혜 전체 조회 실패: {e}")
         return {}
@@ -803,7 +997,8 @@ def clear_notification_mute(redis_client=None) -> bool:
 # 가격 알림 (Price Alert)
 # ============================================================================
 
-PRICE_ALERT_PREFIX = "price_alert:"
+PRICE_ALERT_PREFIX = "price_alert:"  # 레거시 문자열 키 접두사
+PRICE_ALERT_HASH_KEY = "price_alert"
 
 
 def set_price_alert(
@@ -833,7 +1028,6 @@ def set_price_alert(
         return False
     
     try:
-        key = f"{PRICE_ALERT_PREFIX}{stock_code}"
         data = {
             "stock_code": stock_code,
             "stock_name": stock_name,
@@ -842,7 +1036,7 @@ def set_price_alert(
             "created_at": datetime.now(timezone.utc).isoformat(),
             "triggered": False
         }
-        r.setex(key, ttl_seconds, json.dumps(data))
+        _hash_put(r, PRICE_ALERT_HASH_KEY, stock_code, data, ttl_seconds)
         logger.info(f"⏰ [Redis] 가격 알림 설정: {stock_name}({stock_code}) {target_price:,.0f}원 {alert_type}")
         return True
     except Exception as e:
@@ -862,14 +1056,7 @@ def get_price_alerts(redis_client=None) -> Dict[str, Dict[str, Any]]:
         return {}
     
     try:
-        keys = r.keys(f"{PRICE_ALERT_PREFIX}*")
-        results = {}
-        for key in keys:
-            stock_code = key.replace(PRICE_ALERT_PREFIX, "")
-            data_json = r.get(key)
-            if data_json:
-                results[stock_code] = json.loads(data_json)
-        return results
+        return _hash_get_all(r, PRICE_ALERT_HASH_KEY)
     except Exception as e:
         logger.error(f"❌ [Redis] 가격 알림 조회 실패: {e}")
         return {}
@@ -891,8 +1078,7 @@ def delete_price_alert(stock_code: str, redis_client=None) -> bool:
         return False
     
     try:
-        key = f"{PRICE_ALERT_PREFIX}{stock_code}"
-        deleted = r.delete(key)
+        deleted = _hash_delete(r, PRICE_ALERT_HASH_KEY, [stock_code])
         if deleted:
             logger.info(f"🗑️ [Redis] 가격 알림 삭제: {stock_code}")
             return True
@@ -900,3 +1086,210 @@ def delete_price_alert(stock_code: str, redis_client=None) -> bool:
     except Exception as e:
         logger.error(f"❌ [Redis] 가격 알림 삭제 실패: {e}")
         return False
+
+
+# ============================================================================
+# Pub/Sub 이벤트 채널 (프로세스 간 캐시 무효화 알림)
+# ============================================================================
+
+CONFIG_CHANGED_CHANNEL = "config:changed"  # CONFIG 테이블 변경 (shared/config.py)
+TRADE_EVENTS_CHANNEL = "trading:fills"     # 매수/매도 체결 기록 (shared/database/trading.py)
+
+_channel_lock = threading.Lock()
+_channel_callbacks: Dict[str, List[Callable[[Dict[str, Any]], None]]] = {}
+_channel_threads: Dict[str, threading.Thread] = {}
+_channel_stop = threading.Event()
+
+
+def publish_event(channel: str, payload: Dict[str, Any], redis_client=None) -> bool:
+    """
+    [Redis] 채널에 JSON 이벤트를 발행합니다. (Redis 없으면 False)
+    """
+    r = get_redis_connection(redis_client)
+    if not r:
+        return False
+    try:
+        r.publish(channel, json.dumps(payload, default=str))
+        return True
+    except Exception as e:
+        logger.warning(f"⚠️ [Redis] 이벤트 발행 실패 ({channel}): {e}")
+        return False
+
+
+def subscribe_channel(
+    channel: str,
+    callback: Callable[[Dict[str, Any]], None],
+    redis_client=None
+) -> bool:
+    """
+    [Redis] 채널 이벤트를 callback(payload)로 전달합니다.
+    채널당 수신 스레드 1개를 공유하며, 같은 callback은 한 번만 등록됩니다.
+    연결이 끊겨 스레드가 종료되면 다음 subscribe_channel 호출 때 다시 구독합니다.
+    
+    Returns:
+        수신 스레드 동작 여부 (Redis 연결 실패 시 False)
+    """
+    with _channel_lock:
+        callbacks = _channel_callbacks.setdefault(channel, [])
+        if callback not in callbacks:
+            callbacks.append(callback)
+        thread = _channel_threads.get(channel)
+        if thread is not None and thread.is_alive():
+            return True
+
+        r = get_redis_connection(redis_client)
+        if not r:
+            return False
+        try:
+            pubsub = r.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(channel)
+        except Exception as e:
+            logger.warning(f"⚠️ [Redis] 채널 구독 실패 ({channel}): {e}")
+            return False
+
+        _channel_stop.clear()
+        thread = threading.Thread(
+            target=_listen_channel, args=(channel, pubsub), name=f"redis-sub-{channel}", daemon=True
+        )
+        _channel_threads[channel] = thread
+        thread.start()
+        logger.info(f"✅ [Redis] 채널 구독 시작: {channel}")
+        return True
+
+
+def is_channel_listening(channel: str) -> bool:
+    """채널 수신 스레드가 동작 중인지 (연결이 끊겨 종료되었으면 False → subscribe_channel로 재구독)"""
+    with _channel_lock:
+        thread = _channel_threads.get(channel)
+        return thread is not None and thread.is_alive()
+
+
+def _listen_channel(channel: str, pubsub):
+    try:
+        while not _channel_stop.is_set():
+            message = pubsub.get_message(timeout=1.0)
+            if not message or message.get("type") != "message":
+                continue
+            try:
+                payload = json.loads(message["data"])
+            except (TypeError, ValueError):
+                payload = {}
+            for callback in list(_channel_callbacks.get(channel, ())):
+                try:
+                    callback(payload)
+                except Exception as e:
+                    logger.warning(f"⚠️ [Redis] 이벤트 처리 실패 ({channel}): {e}")
+    except Exception as e:
+        logger.warning(f"⚠️ [Redis] 채널 수신 중단 ({channel}): {e}")
+    finally:
+        try:
+            pubsub.close()
+        except Exception:
+            pass
+        with _channel_lock:
+            if _channel_threads.get(channel) is threading.current_thread():
+                del _channel_threads[channel]
+
+
+def stop_channel_listeners(timeout: float = 5.0):
+    """모든 채널 수신 스레드 종료 및 콜백 해제 (테스트용)"""
+    _channel_stop.set()
+    with _channel_lock:
+        threads = list(_channel_threads.values())
+        _channel_callbacks.clear()
+    for thread in threads:
+        thread.join(timeout)
+
+
+# ============================================================================
+# Redis Streams 이벤트 (대시보드 실시간 푸시)
+# ============================================================================
+# 가격 틱(price-monitor), 체결(execute_trade_and_log), Scout 파이프라인 상태를
+# 하나의 스트림에 쌓고, Dashboard 백엔드가 한 번 읽어 WebSocket 클라이언트 전체에 보냅니다.
+# Pub/Sub과 달리 백엔드가 재시작·재연결되어도 마지막 ID부터 이어 읽을 수 있고,
+# MAXLEN(근사)으로 길이를 제한합니다.
+
+DASHBOARD_EVENTS_STREAM = "dashboard:events"
+DASHBOARD_STREAM_MAXLEN = 10000
+
+STREAM_EVENT_PRICE = "price"
+STREAM_EVENT_FILL = "fill"
+STREAM_EVENT_PIPELINE = "pipeline"
+
+
+def append_stream_event(
+    event_type: str,
+    data: Dict[str, Any],
+    stream: str = DASHBOARD_EVENTS_STREAM,
+    maxlen: int = DASHBOARD_STREAM_MAXLEN,
+    redis_client=None
+) -> Optional[str]:
+    """
+    [Redis] 스트림에 이벤트를 추가합니다. (XADD, MAXLEN ~ maxlen)
+    
+    Returns:
+        엔트리 ID 또는 None (Redis 없음/실패)
+    """
+    r = get_redis_connection(redis_client)
+    if not r:
+        return None
+    try:
+        return r.xadd(
+            stream,
+            {"type": event_type, "data": json.dumps(data, default=str)},
+            maxlen=maxlen,
+            approximate=True,
+        )
+    except Exception as e:
+        logger.debug(f"[Redis] 스트림 이벤트 추가 실패 ({stream}): {e}")
+        return None
+
+
+def read_stream_events(
+    last_id: str = "$",
+    block_ms: Optional[int] = None,
+    count: int = 500,
+    stream: str = DASHBOARD_EVENTS_STREAM,
+    redis_client=None
+) -> Optional[List[Tuple[str, Dict[str, Any]]]]:
+    """
+    [Redis] last_id 이후의 스트림 이벤트를 읽습니다. (XREAD)
+    
+    block_ms를 주면 새 이벤트가 올 때까지 최대 block_ms 동안 기다립니다.
+    전역 클라이언트는 socket_timeout이 0.5초이므로, 블로킹 읽기에는
+    타임아웃이 block_ms보다 긴 클라이언트를 redis_client로 넘기세요.
+    
+    Returns:
+        [(엔트리 ID, {"type": ..., "data": {...}})] (새 이벤트 없으면 빈 리스트)
+        Redis 없음/실패 시 None
+    """
+    r = get_redis_connection(redis_client)
+    if not r:
+        return None
+    try:
+        response = r.xread({stream: last_id}, count=count, block=block_ms)
+    except Exception as e:
+        logger.warning(f"⚠️ [Redis] 스트림 읽기 실패 ({stream}): {e}")
+        return None
+
+    events = []
+    for _, entries in response or ():
+        for entry_id, fields in entries:
+            try:
+                data = json.loads(fields.get("data") or "{}")
+            except (TypeError, ValueError):
+                data = {}
+            events.append((entry_id, {"type": fields.get("type"), "data": data}))
+    return events
+
+
+def get_stream_last_id(stream: str = DASHBOARD_EVENTS_STREAM, redis_client=None) -> str:
+    """스트림의 마지막 엔트리 ID (비어 있거나 Redis 없으면 '0-0')"""
+    r = get_redis_connection(redis_client)
+    if not r:
+        return "0-0"
+    try:
+        entries = r.xrevrange(stream, count=1)
+        return entries[0][0] if entries else "0-0"
+    except Exception:
+        return "0-0"
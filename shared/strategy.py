@@ -3,11 +3,15 @@
 # [모듈] 순수한 '전략' 계산(RSI, 수익률 등)을 담당합니다.
 
 import logging
-import math
 import os
+import threading
+from collections import OrderedDict
 
+import numpy as np
 import pandas as pd
 
+from shared.strategy_panel import atr_panel, rsi_panel
+
 # "youngs75_jennie.strategy" 이름으로 로거 생성
 logger = logging.getLogger(__name__) 
 
@@ -28,24 +32,20 @@ if _RUST_BACKEND_ENABLED:
 
 
 def _prepare_sequence(values, *, reverse: bool = False):
+    """Rust 함수 입력용 float 리스트로 변환 (NaN/변환 불가 값이 있으면 None)"""
     if values is None:
         return None
-    cleaned = []
     try:
-        for value in values:
-            float_value = float(value)
-            if math.isnan(float_value):
-                return None
-            cleaned.append(float_value)
+        array = np.asarray(values, dtype=np.float64)
     except (TypeError, ValueError):
         return None
 
-    if not cleaned:
+    if array.ndim != 1 or array.size == 0 or np.isnan(array).any():
         return None
 
     if reverse:
-        cleaned.reverse()
-    return cleaned
+        array = array[::-1]
+    return array.tolist()
 
 # --- (기존: calculate_cumulative_return, calculate_moving_average) ---
 def calculate_cumulative_return(prices_list):
@@ -132,6 +132,51 @@ def calculate_rsi(data, period=14):
         logger.error(f"❌ (RSI) RSI 계산 중 오류 발생: {e}", exc_info=True)
         return None
 
+def calculate_rsi_panel(close_panel, period=14):
+    """
+    (일자 × 종목) 종가 패널에서 종목별 최신 RSI를 한 번에 계산합니다.
+    - close_panel: 2-D 배열, 행=일자(오름차순), 열=종목. 각 종목의 데이터 시작 전 구간은 NaN
+    - 반환: 종목별 RSI (np.ndarray, 데이터 부족 시 NaN)
+
+    calculate_rsi와 같은 값을 냅니다: Rust 백엔드 활성 시 Wilder(단순평균 시드),
+    아니면 pandas ewm(com=period-1, adjust=True)과 동일한 가중 평균.
+    """
+    prices = np.asarray(close_panel, dtype=np.float64)
+    if prices.ndim != 2 or prices.shape[0] < 2:
+        return np.full(prices.shape[-1] if prices.ndim else 0, np.nan)
+
+    if _RUST_BACKEND_ENABLED and _rust_rsi:
+        # Wilder: 첫 period개 변화량 단순평균 → 이후 재귀 평활 (패널 커널 재사용)
+        return rsi_panel(prices, period)[-1]
+
+    deltas = prices[1:] - prices[:-1]
+    valid = ~np.isnan(deltas)
+    gains = np.where(valid, np.maximum(deltas, 0.0), 0.0)
+    losses = np.where(valid, np.maximum(-deltas, 0.0), 0.0)
+    n_codes = prices.shape[1]
+
+    # pandas ewm(adjust=True): sum(w^i * x) / sum(w^i)
+    decay = 1.0 - 1.0 / period
+    num_gain = np.zeros(n_codes)
+    num_loss = np.zeros(n_codes)
+    den = np.zeros(n_codes)
+    for t in range(deltas.shape[0]):
+        v = valid[t]
+        num_gain[v] = num_gain[v] * decay + gains[t, v]
+        num_loss[v] = num_loss[v] * decay + losses[t, v]
+        den[v] = den[v] * decay + 1.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        avg_gain = num_gain / den
+        avg_loss = num_loss / den
+    count = valid.sum(axis=0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    flat = avg_loss == 0
+    rsi[flat] = np.where(avg_gain[flat] > 0, 100.0, 50.0)
+    rsi[count < period] = np.nan
+    return rsi
+
 # --- (기존: calculate_atr) ---
 def calculate_atr(daily_prices_df, period=14):
     """
@@ -416,3 +461,281 @@ def check_long_term_trend(current_price, ma_value):
     if ma_value is None or ma_value == 0:
         return False
     return current_price >= ma_value
+
+
+# -----------------------------------------------------------
+# 전체 시계열 지표 (백테스트/팩터 분석용)
+# -----------------------------------------------------------
+# 위의 calculate_*/check_* 함수는 마지막 값만 반환하므로, 날짜별로 잘라가며 호출하면
+# 전체 기간에 대해 O(N²)이 됩니다. 아래 *_series 함수는 전체 구간을 O(N)으로 한 번 계산하며,
+# t번째 값은 daily_prices_df.iloc[:t+1]로 같은 함수를 호출한 결과와 같습니다.
+# (daily_prices_df: 날짜 오름차순 정렬, 결측 없는 일봉 가정. 반환 인덱스 = 입력 인덱스)
+
+def calculate_rsi_series(daily_prices_df, period=14):
+    """calculate_rsi의 전체 시계열 버전 (데이터 부족 구간은 NaN)"""
+    closes = daily_prices_df['CLOSE_PRICE'].astype(float)
+    if _RUST_BACKEND_ENABLED and _rust_rsi:
+        values = rsi_panel(closes.to_numpy(), period)[:, 0]
+        return pd.Series(values, index=daily_prices_df.index, name='RSI')
+
+    delta = closes.diff(1)
+    gain = delta.where(delta > 0, 0).iloc[1:]
+    loss = (-delta.where(delta < 0, 0)).iloc[1:]
+    avg_gain = gain.ewm(com=period - 1, min_periods=period).mean()
+    avg_loss = loss.ewm(com=period - 1, min_periods=period).mean()
+    rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+    flat = avg_loss == 0
+    rsi[flat] = np.where(avg_gain[flat] > 0, 100.0, 50.0)
+    return rsi.reindex(daily_prices_df.index).rename('RSI')
+
+
+def calculate_atr_series(daily_prices_df, period=14):
+    """calculate_atr의 전체 시계열 버전 (데이터 부족 구간은 NaN)"""
+    highs = daily_prices_df['HIGH_PRICE'].astype(float)
+    lows = daily_prices_df['LOW_PRICE'].astype(float)
+    closes = daily_prices_df['CLOSE_PRICE'].astype(float)
+    prev_close = closes.shift(1)
+    tr = pd.concat([highs - lows, (highs - prev_close).abs(), (lows - prev_close).abs()], axis=1).max(axis=1)
+    atr = tr.ewm(com=period - 1, min_periods=period).mean()
+
+    if _RUST_BACKEND_ENABLED and _rust_atr:
+        # Rust 스칼라 경로는 period+1개 이상에서만 값이 있고, 그 전은 pandas 경로로 폴백
+        wilder = atr_panel(highs.to_numpy(), lows.to_numpy(), closes.to_numpy(), period)[:, 0]
+        atr = pd.Series(np.where(np.isnan(wilder), atr.to_numpy(), wilder), index=daily_prices_df.index)
+    return atr.rename('ATR')
+
+
+def calculate_moving_average_series(daily_prices_df, period=20):
+    """종가 단순 이동평균 전체 시계열"""
+    return daily_prices_df['CLOSE_PRICE'].astype(float).rolling(window=period).mean().rename(f'MA_{period}')
+
+
+def calculate_bollinger_series(daily_prices_df, period=20, std_dev=2):
+    """볼린저 밴드 전체 시계열 (BB_MIDDLE/BB_UPPER/BB_LOWER, BB_LOWER = calculate_bollinger_bands)"""
+    closes = daily_prices_df['CLOSE_PRICE'].astype(float)
+    rolling_mean = closes.rolling(window=period).mean()
+    rolling_std = closes.rolling(window=period).std()
+    return pd.DataFrame({
+        'BB_MIDDLE': rolling_mean,
+        'BB_UPPER': rolling_mean + (rolling_std * std_dev),
+        'BB_LOWER': rolling_mean - (rolling_std * std_dev),
+    }, index=daily_prices_df.index)
+
+
+def calculate_cross_series(daily_prices_df, short_period=5, long_period=20):
+    """골든/데드 크로스 발생 여부 전체 시계열 (check_golden_cross / check_death_cross와 같은 판정)"""
+    closes = daily_prices_df['CLOSE_PRICE'].astype(float)
+    short_ma = closes.rolling(window=short_period).mean()
+    long_ma = closes.rolling(window=long_period).mean()
+    prev_short, prev_long = short_ma.shift(1), long_ma.shift(1)
+    return pd.DataFrame({
+        'GOLDEN_CROSS': (prev_short <= prev_long) & (short_ma > long_ma),
+        'DEATH_CROSS': (prev_short >= prev_long) & (short_ma < long_ma),
+    }, index=daily_prices_df.index)
+
+
+INDICATOR_SERIES_FUNCTIONS = {
+    'rsi': calculate_rsi_series,
+    'atr': calculate_atr_series,
+    'ma': calculate_moving_average_series,
+    'bollinger': calculate_bollinger_series,
+    'cross': calculate_cross_series,
+}
+
+
+class IndicatorSeriesCache:
+    """
+    (종목, 지표, 파라미터)별 전체 시계열 캐시 (LRU, 스레드 안전).
+    입력 일봉의 길이/첫·마지막 날짜/마지막 종가가 바뀌면 다시 계산합니다.
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _fingerprint(daily_prices_df):
+        if daily_prices_df is None or daily_prices_df.empty:
+            return (0,)
+        return (
+            len(daily_prices_df),
+            daily_prices_df.index[0],
+            daily_prices_df.index[-1],
+            float(daily_prices_df['CLOSE_PRICE'].iloc[-1]),
+        )
+
+    def get(self, stock_code, daily_prices_df, indicator, **params):
+        func = INDICATOR_SERIES_FUNCTIONS.get(indicator)
+        if func is None:
+            raise ValueError(f"지원하지 않는 지표: {indicator}")
+        if daily_prices_df is None or daily_prices_df.empty:
+            return pd.Series(dtype=float)
+
+        key = (stock_code, indicator, tuple(sorted(params.items())))
+        fingerprint = self._fingerprint(daily_prices_df)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == fingerprint:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        series = func(daily_prices_df, **params)
+        with self._lock:
+            self._entries[key] = (fingerprint, series)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return series
+
+    def invalidate(self, stock_code):
+        """특정 종목의 캐시 제거"""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == stock_code]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+indicator_series_cache = IndicatorSeriesCache()
+
+
+def get_indicator_series(stock_code, daily_prices_df, indicator, **params):
+    """
+    캐시된 전체 시계열 지표를 반환합니다.
+    예: get_indicator_series('005930', df, 'atr', period=14).loc[current_date]
+    """
+    return indicator_series_cache.get(stock_code, daily_prices_df, indicator, **params)
+
+
+# -----------------------------------------------------------
+# 실시간 틱용 증분 지표 상태 (Price Monitor)
+# -----------------------------------------------------------
+class IncrementalIndicatorState:
+    """
+    일봉으로 한 번 시드(seed)한 뒤, 실시간 틱마다 O(1)로 지표를 평가하는 종목별 상태입니다.
+
+    - ATR: 일봉만으로 계산되므로 시드 시점에 확정 (장중 불변)
+    - RSI: 마지막 일봉 종가까지의 Wilder 평균 상승/하락폭을 보관하고, 틱 가격으로 한 스텝만 진행
+    - 데드 크로스: 단기/장기 이평선의 꼬리 합계(N-1일)를 보관하고, 틱 가격을 더해 오늘 이평선 산출
+
+    RSI/ATR은 Wilder 방식(단순평균 시드 후 재귀 평활)으로 Rust strategy_core와 동일한 값을 냅니다.
+    (daily_prices_df: 날짜 오름차순 정렬)
+    """
+
+    __slots__ = (
+        "stock_code", "seed_date", "rsi_period", "atr_period", "short_period", "long_period",
+        "bar_count", "last_close", "atr", "_avg_gain", "_avg_loss",
+        "_short_tail_sum", "_long_tail_sum", "_prev_short_ma", "_prev_long_ma",
+    )
+
+    def __init__(self, stock_code, daily_prices_df, seed_date=None,
+                 rsi_period=14, atr_period=14, short_period=5, long_period=20):
+        self.stock_code = stock_code
+        self.seed_date = seed_date
+        self.rsi_period = rsi_period
+        self.atr_period = atr_period
+        self.short_period = short_period
+        self.long_period = long_period
+
+        self.bar_count = 0
+        self.last_close = None
+        self.atr = None
+        self._avg_gain = None
+        self._avg_loss = None
+        self._short_tail_sum = None
+        self._long_tail_sum = None
+        self._prev_short_ma = None
+        self._prev_long_ma = None
+
+        if daily_prices_df is None or len(daily_prices_df) == 0:
+            return
+
+        closes = _prepare_sequence(daily_prices_df['CLOSE_PRICE'].tolist())
+        if not closes:
+            return
+        self.bar_count = len(closes)
+        self.last_close = closes[-1]
+
+        # 1. ATR (Wilder) - 장중에는 변하지 않음
+        if 'HIGH_PRICE' in daily_prices_df.columns and 'LOW_PRICE' in daily_prices_df.columns:
+            highs = _prepare_sequence(daily_prices_df['HIGH_PRICE'].tolist())
+            lows = _prepare_sequence(daily_prices_df['LOW_PRICE'].tolist())
+            if highs and lows and len(highs) == len(lows) == len(closes):
+                self.atr = self._wilder_atr(highs, lows, closes, atr_period)
+
+        # 2. RSI (Wilder) - 마지막 일봉 종가 기준 평균 상승/하락폭
+        if len(closes) >= rsi_period + 1:
+            avg_gain = 0.0
+            avg_loss = 0.0
+            for i in range(1, rsi_period + 1):
+                delta = closes[i] - closes[i - 1]
+                if delta >= 0:
+                    avg_gain += delta
+                else:
+                    avg_loss -= delta
+            avg_gain /= rsi_period
+            avg_loss /= rsi_period
+            for i in range(rsi_period + 1, len(closes)):
+                delta = closes[i] - closes[i - 1]
+                avg_gain = ((rsi_period - 1) * avg_gain + max(delta, 0.0)) / rsi_period
+                avg_loss = ((rsi_period - 1) * avg_loss + max(-delta, 0.0)) / rsi_period
+            self._avg_gain = avg_gain
+            self._avg_loss = avg_loss
+
+        # 3. 이평선 꼬리 합계 (오늘 이평선 = (꼬리 합 + 현재가) / N)
+        if len(closes) >= long_period:
+            self._short_tail_sum = sum(closes[len(closes) - (short_period - 1):]) if short_period > 1 else 0.0
+            self._long_tail_sum = sum(closes[len(closes) - (long_period - 1):]) if long_period > 1 else 0.0
+            self._prev_short_ma = sum(closes[-short_period:]) / short_period
+            self._prev_long_ma = sum(closes[-long_period:]) / long_period
+
+    @staticmethod
+    def _wilder_atr(highs, lows, closes, period):
+        if len(closes) < period + 1:
+            return None
+        trs = []
+        for i in range(1, len(closes)):
+            trs.append(max(
+                highs[i] - lows[i],
+                abs(highs[i] - closes[i - 1]),
+                abs(lows[i] - closes[i - 1]),
+            ))
+        atr = sum(trs[:period]) / period
+        for tr in trs[period:]:
+            atr = ((period - 1) * atr + tr) / period
+        return atr
+
+    def is_stale(self, today) -> bool:
+        """시드 일자가 오늘과 다르면(일 변경) 재시드가 필요합니다."""
+        return self.seed_date != today
+
+    def rsi(self, current_price):
+        """마지막 일봉 종가 → 현재가 한 스텝을 반영한 RSI"""
+        if self._avg_gain is None or current_price is None:
+            return None
+        period = self.rsi_period
+        delta = float(current_price) - self.last_close
+        avg_gain = ((period - 1) * self._avg_gain + max(delta, 0.0)) / period
+        avg_loss = ((period - 1) * self._avg_loss + max(-delta, 0.0)) / period
+        if avg_loss == 0:
+            return 100.0 if avg_gain > 0 else 50.0
+        rs = avg_gain / avg_loss
+        return 100 - (100 / (1 + rs))
+
+    def is_death_cross(self, current_price) -> bool:
+        """현재가를 오늘 종가로 간주했을 때 단기 이평선이 장기 이평선을 하향 돌파했는지"""
+        if self._prev_long_ma is None or current_price is None:
+            return False
+        price = float(current_price)
+        today_short_ma = (self._short_tail_sum + price) / self.short_period
+        today_long_ma = (self._long_tail_sum + price) / self.long_period
+        return self._prev_short_ma >= self._prev_long_ma and today_short_ma < today_long_ma
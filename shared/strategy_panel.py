@@ -0,0 +1,200 @@
+# shared/strategy_panel.py
+# Version: v1.0
+# [모듈] (일자 × 종목) 패널 단위 기술 지표 계산 (MA, RSI, ATR, 볼린저, 모멘텀, 골든/데드 크로스)
+#
+# - 입력: 2-D 배열 (행=일자 오름차순, 열=종목). 상장 전/데이터 없는 구간은 NaN
+#   (factor_panel / QuantScorer.build_price_panels와 같은 방향, DataFrame은 .to_numpy() 값 사용)
+# - 출력: 입력과 같은 shape의 전체 시계열. 값을 정의할 수 없는 위치는 NaN
+# - 종목 축은 NumPy로 한 번에 벡터화하고, Wilder 재귀만 일자 축으로 순회합니다.
+# - RSI/ATR은 Wilder 방식(단순평균 시드 후 재귀 평활)으로 shared.strategy의
+#   Rust 스칼라 경로와 같은 값을 냅니다.
+
+import numpy as np
+
+
+def _as_panel(values):
+    """입력을 float64 2-D 배열로 변환 (1-D는 종목 1개 패널로 취급)"""
+    if hasattr(values, "to_numpy"):
+        values = values.to_numpy()
+    panel = np.asarray(values, dtype=np.float64)
+    if panel.ndim == 1:
+        panel = panel[:, np.newaxis]
+    if panel.ndim != 2:
+        raise ValueError(f"(일자 × 종목) 2-D 배열이 필요합니다: shape={panel.shape}")
+    return panel
+
+
+def _validate_period(period):
+    if period <= 0:
+        raise ValueError("period must be greater than zero")
+
+
+# ============================================================================
+# NumPy 구현
+# ============================================================================
+
+def _moving_average_numpy(prices, period):
+    out = np.full(prices.shape, np.nan)
+    if prices.shape[0] >= period:
+        windows = np.lib.stride_tricks.sliding_window_view(prices, period, axis=0)
+        out[period - 1:] = windows.sum(axis=-1) / period
+    return out
+
+
+def _wilder_numpy(values, valid, ready_mask, period):
+    """
+    Wilder 평활 (종목 벡터화, 일자 루프).
+    values[t]: t 시점 입력(변화량/TR), valid: 유효 여부 (무효 값은 건너뜀)
+    반환: 평활 평균 시계열 (시드 전 또는 ready_mask=False 위치는 NaN)
+    """
+    n_steps, n_codes = values.shape
+    avg = np.zeros(n_codes)
+    seen = np.zeros(n_codes, dtype=np.int64)
+    out = np.full((n_steps, n_codes), np.nan)
+    for t in range(n_steps):
+        v = valid[t]
+        seen += v
+        x = values[t]
+        seeding = v & (seen <= period)
+        avg[seeding] += x[seeding]
+        seeded = v & (seen == period)
+        avg[seeded] /= period
+        rolling = v & (seen > period)
+        avg[rolling] = ((period - 1) * avg[rolling] + x[rolling]) / period
+        ready = (seen >= period) & ready_mask[t]
+        out[t, ready] = avg[ready]
+    return out
+
+
+def _rsi_numpy(prices, period):
+    out = np.full(prices.shape, np.nan)
+    if prices.shape[0] < 2:
+        return out
+    deltas = prices[1:] - prices[:-1]
+    valid = ~np.isnan(deltas)
+    ready_mask = ~np.isnan(prices[1:])
+    gains = np.where(valid, np.maximum(deltas, 0.0), 0.0)
+    losses = np.where(valid, np.maximum(-deltas, 0.0), 0.0)
+    avg_gain = _wilder_numpy(gains, valid, ready_mask, period)
+    avg_loss = _wilder_numpy(losses, valid, ready_mask, period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    flat = avg_loss == 0
+    rsi[flat] = np.where(avg_gain[flat] == 0, 50.0, 100.0)
+    out[1:] = rsi
+    return out
+
+
+def _atr_numpy(high, low, close, period):
+    out = np.full(close.shape, np.nan)
+    if close.shape[0] < 2:
+        return out
+    h, l, c, prev_close = high[1:], low[1:], close[1:], close[:-1]
+    valid = ~(np.isnan(h) | np.isnan(l) | np.isnan(c) | np.isnan(prev_close))
+    with np.errstate(invalid="ignore"):
+        tr = np.maximum.reduce([h - l, np.abs(h - prev_close), np.abs(l - prev_close)])
+    tr = np.where(valid, np.abs(tr), 0.0)
+    out[1:] = _wilder_numpy(tr, valid, ~np.isnan(c), period)
+    return out
+
+
+def _bollinger_numpy(prices, period, num_std):
+    mid = np.full(prices.shape, np.nan)
+    upper = mid.copy()
+    lower = mid.copy()
+    if prices.shape[0] >= period:
+        windows = np.lib.stride_tricks.sliding_window_view(prices, period, axis=0)
+        mean = windows.sum(axis=-1) / period
+        # 표본 표준편차 (pandas rolling().std()와 동일, ddof=1)
+        std = np.sqrt(((windows - mean[..., np.newaxis]) ** 2).sum(axis=-1) / (period - 1))
+        mid[period - 1:] = mean
+        upper[period - 1:] = mean + num_std * std
+        lower[period - 1:] = mean - num_std * std
+    return mid, upper, lower
+
+
+def _momentum_numpy(prices, period):
+    out = np.full(prices.shape, np.nan)
+    if prices.shape[0] > period:
+        past = prices[:-period]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            momentum = (prices[period:] - past) / past * 100.0
+        out[period:] = np.where(past != 0, momentum, np.nan)
+    return out
+
+
+def _cross_numpy(prices, short_period, long_period):
+    short_ma = _moving_average_numpy(prices, short_period)
+    long_ma = _moving_average_numpy(prices, long_period)
+    golden = np.zeros(prices.shape, dtype=bool)
+    death = np.zeros(prices.shape, dtype=bool)
+    s0, l0, s1, l1 = short_ma[:-1], long_ma[:-1], short_ma[1:], long_ma[1:]
+    # check_golden_cross / check_death_cross와 같은 비교 (NaN이면 False)
+    golden[1:] = (s0 <= l0) & (s1 > l1)
+    death[1:] = (s0 >= l0) & (s1 < l1)
+    return golden, death
+
+
+# ============================================================================
+# 공개 API
+# ============================================================================
+
+def right_aligned_panel(columns, length=None):
+    """
+    종목별 시계열(일자 오름차순) 리스트 → 마지막 행이 각 종목의 최신 값인 (일자 × 종목) 패널
+    길이가 짧은 종목은 앞쪽이 NaN (length를 주면 각 종목의 최근 length개만 사용)
+    """
+    columns = [np.asarray(col, dtype=np.float64) for col in columns]
+    if length is None:
+        length = max((len(col) for col in columns), default=0)
+    panel = np.full((length, len(columns)), np.nan)
+    for j, col in enumerate(columns):
+        tail = col[len(col) - min(len(col), length):]
+        panel[length - len(tail):, j] = tail
+    return panel
+
+
+def moving_average_panel(prices, period=20):
+    """종목별 단순 이동평균 시계열"""
+    _validate_period(period)
+    prices = _as_panel(prices)
+    return _moving_average_numpy(prices, period)
+
+
+def rsi_panel(prices, period=14):
+    """종목별 Wilder RSI 시계열 (유효 변화량이 period개 미만인 구간은 NaN)"""
+    _validate_period(period)
+    prices = _as_panel(prices)
+    return _rsi_numpy(prices, period)
+
+
+def atr_panel(high, low, close, period=14):
+    """종목별 Wilder ATR 시계열"""
+    _validate_period(period)
+    high, low, close = _as_panel(high), _as_panel(low), _as_panel(close)
+    if not (high.shape == low.shape == close.shape):
+        raise ValueError("high, low, close must have the same shape")
+    return _atr_numpy(high, low, close, period)
+
+
+def bollinger_panel(prices, period=20, num_std=2.0):
+    """종목별 볼린저 밴드 시계열 → (중심선, 상단, 하단)"""
+    if period < 2:
+        raise ValueError("period must be at least 2")
+    prices = _as_panel(prices)
+    return _bollinger_numpy(prices, period, num_std)
+
+
+def momentum_panel(prices, period=5):
+    """종목별 N일 수익률(%) 시계열 (calculate_momentum과 같은 정의)"""
+    _validate_period(period)
+    prices = _as_panel(prices)
+    return _momentum_numpy(prices, period)
+
+
+def cross_panel(prices, short_period=5, long_period=20):
+    """종목별 골든/데드 크로스 발생 여부 시계열 → (golden, death) bool 배열"""
+    _validate_period(short_period)
+    _validate_period(long_period)
+    prices = _as_panel(prices)
+    return _cross_numpy(prices, short_period, long_period)
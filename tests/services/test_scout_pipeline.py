@@ -0,0 +1,72 @@
+"""
+tests/services/test_scout_pipeline.py - Scout 정량 점수 일괄 계산 테스트
+=======================================================================
+
+services/scout-job/scout_pipeline.py의 process_quant_scoring_batch가
+종목 하나의 오류로 전체 배치를 잃지 않는지 테스트합니다.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# services/scout-job은 패키지가 아니므로 서비스 디렉토리를 경로에 추가 (scout.py와 같은 방식)
+SCOUT_JOB_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                             'services', 'scout-job')
+if SCOUT_JOB_DIR not in sys.path:
+    sys.path.insert(0, SCOUT_JOB_DIR)
+
+import scout_pipeline  # noqa: E402
+from shared.hybrid_scoring.quant_scorer import QuantScorer  # noqa: E402
+
+
+def _frames(codes, n=60):
+    rng = np.random.default_rng(3)
+    return {code: pd.DataFrame({
+        'CLOSE_PRICE': np.cumprod(1 + rng.normal(0, 0.02, n)) * 10000,
+        'VOLUME': rng.integers(1000, 100000, n).astype(float),
+    }) for code in codes}
+
+
+def _patch_prices(monkeypatch, frames):
+    monkeypatch.setattr(scout_pipeline.database, 'get_daily_prices_batch',
+                        lambda conn, codes, limit=150: {code: frames[code] for code in codes})
+    monkeypatch.setattr(scout_pipeline.database, 'get_daily_prices',
+                        lambda conn, code, limit=150: frames[code])
+
+
+class TestProcessQuantScoringBatch:
+
+    def test_bad_stock_does_not_fail_batch(self, monkeypatch):
+        """일괄 계산 중 한 종목 입력이 잘못되면 그 종목만 is_valid=False"""
+        frames = _frames(['A', 'B', 'C'])
+        _patch_prices(monkeypatch, frames)
+        candidates = {code: {'name': code, 'sentiment_score': 50} for code in frames}
+        snapshots = {'A': {'pbr': 1.2}, 'B': {'pbr': 'n/a'}, 'C': {'per': 9.0}}
+
+        results = scout_pipeline.process_quant_scoring_batch(
+            candidates, QuantScorer(db_conn=None), db_conn=None, snapshot_cache=snapshots,
+        )
+
+        assert set(results) == {'A', 'B', 'C'}
+        assert results['A'].is_valid and results['C'].is_valid
+        assert results['B'].is_valid is False
+        assert results['B'].invalid_reason.startswith('계산 오류')
+
+    def test_matches_per_stock_task(self, monkeypatch):
+        frames = _frames(['A', 'B'])
+        _patch_prices(monkeypatch, frames)
+        candidates = {'A': {'name': 'A', 'sentiment_score': 80, 'news_category': '배당'},
+                      'B': {'name': 'B', 'sentiment_score': 50}}
+        scorer = QuantScorer(db_conn=None)
+
+        batch = scout_pipeline.process_quant_scoring_batch(candidates, scorer, db_conn=None)
+        single = {code: scout_pipeline.process_quant_scoring_task({'code': code, 'info': info}, scorer, None)
+                  for code, info in candidates.items()}
+
+        for code in candidates:
+            assert batch[code].total_score == single[code].total_score
+            assert batch[code].details == single[code].details
+        assert batch['A'].details['reverse_signal_warning'] is True
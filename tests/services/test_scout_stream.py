@@ -0,0 +1,176 @@
+"""
+tests/services/test_scout_stream.py - Scout 스트리밍 파이프라인 테스트
+=====================================================================
+
+services/scout-job/scout_stream.py의 동적 Top-K 진입 정책, 지연 시간 히스토그램,
+Hunter → Debate/Judge 스트리밍 실행을 테스트합니다.
+"""
+
+import os
+import sys
+import threading
+
+# services/scout-job은 패키지가 아니므로 서비스 디렉토리를 경로에 추가 (scout.py와 같은 방식)
+SCOUT_JOB_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                             'services', 'scout-job')
+if SCOUT_JOB_DIR not in sys.path:
+    sys.path.insert(0, SCOUT_JOB_DIR)
+
+from scout_stream import StageLatency, TopKAdmission, run_streaming_pipeline  # noqa: E402
+
+
+def _hunter_results(scores):
+    return {code: {'code': code, 'passed': score >= 60, 'hunter_score': score}
+            for code, score in scores.items()}
+
+
+class TestTopKAdmission:
+
+    def test_never_admits_more_than_k(self):
+        admission = TopKAdmission(k=3, total=10)
+        admitted = []
+        for done, score in enumerate([90, 95, 70, 99, 80, 85, 97, 60, 92, 98], start=1):
+            admission.offer(score, score)
+            admitted += admission.ready(done)
+            assert admission.admitted <= 3
+        admitted += admission.drain()
+
+        assert len(admitted) == 3
+        assert admission.drain() == []
+
+    def test_budget_follows_hunter_progress(self):
+        """초반에 먼저 끝난 종목이 K개를 모두 차지하지 않음"""
+        admission = TopKAdmission(k=4, total=8)
+        for score in (70, 80, 90):
+            admission.offer(score, score)
+
+        # 8개 중 2개 완료 → ceil(4 × 2/8) = 1개만 진입 (점수 높은 순)
+        assert admission.ready(2) == [90]
+        assert admission.ready(4) == [80]
+        # 기준선(상위 K) 안의 점수만 바로 진입, 나머지는 drain에서 점수 순
+        assert admission.drain() == [70]
+
+    def test_below_threshold_waits_for_drain(self):
+        admission = TopKAdmission(k=2, total=4)
+        for score in (90, 95, 60):
+            admission.offer(score, score)
+        assert admission.threshold == 90
+
+        assert admission.ready(4) == [95, 90]
+        assert admission.drain() == []
+
+    def test_admits_all_when_k_or_fewer_pass(self):
+        admission = TopKAdmission(k=5, total=6)
+        for score in (61, 75, 62):
+            admission.offer(score, score)
+        admitted = admission.ready(3) + admission.drain()
+
+        assert sorted(admitted) == [61, 62, 75]
+
+    def test_zero_k_admits_nothing(self):
+        admission = TopKAdmission(k=0, total=2)
+        admission.offer('A', 99)
+        assert admission.ready(2) + admission.drain() == []
+
+
+def test_stage_latency_buckets():
+    latency = StageLatency(buckets=(1, 5))
+    for seconds in (0.2, 1.0, 3.0, 9.0):
+        latency.observe(seconds)
+    snapshot = latency.snapshot()
+
+    assert snapshot['buckets'] == {'1': 2, '5': 1, 'inf': 1}
+    assert snapshot['count'] == 4
+    assert snapshot['max_sec'] == 9.0
+    assert snapshot['avg_sec'] == 3.3
+
+
+class TestRunStreamingPipeline:
+
+    def test_judge_results_reach_callback(self):
+        scores = {'A': 90, 'B': 50, 'C': 70, 'D': 85, 'E': 30, 'F': 65}
+        hunters = _hunter_results(scores)
+        hunter_seen, judged = [], []
+
+        stats = run_streaming_pipeline(
+            sorted(scores), hunters.get,
+            lambda result: {'code': result['code'], 'approved': result['hunter_score'] >= 80},
+            max_entries=10, hunter_workers=3, judge_workers=2,
+            on_hunter_result=hunter_seen.append, on_judge_result=judged.append,
+        )
+
+        assert sorted(r['code'] for r in hunter_seen) == sorted(scores)
+        assert sorted(r['code'] for r in judged) == ['A', 'C', 'D', 'F']
+        assert (stats.hunter_done, stats.hunter_passed, stats.admitted, stats.judged) == (6, 4, 4, 4)
+        latency = stats.latency_snapshot()
+        assert latency['hunter']['count'] == 6
+        assert latency['judge']['count'] == 4
+
+    def test_admission_capped_at_k(self):
+        scores = {f'{i:06d}': 60 + i for i in range(20)}
+        hunters = _hunter_results(scores)
+        judged = []
+
+        stats = run_streaming_pipeline(
+            sorted(scores), hunters.get, lambda result: result,
+            max_entries=5, hunter_workers=4, judge_workers=2, on_judge_result=judged.append,
+        )
+
+        assert stats.hunter_passed == 20
+        assert stats.admitted == len(judged) == 5
+
+    def test_judge_overlaps_with_hunter(self):
+        """Hunter가 끝나기 전에 통과 종목의 Judge가 시작됨"""
+        release = threading.Event()
+        judge_started = threading.Event()
+
+        def hunter(code):
+            if code == 'SLOW':
+                # 다른 종목의 Judge가 시작될 때까지 대기 (2-Pass 방식이면 영원히 시작되지 않음)
+                assert judge_started.wait(timeout=5)
+                release.set()
+            return {'code': code, 'passed': True, 'hunter_score': 80}
+
+        def judge(result):
+            judge_started.set()
+            return result
+
+        stats = run_streaming_pipeline(['FAST', 'SLOW'], hunter, judge,
+                                       max_entries=2, hunter_workers=2, judge_workers=1)
+
+        assert release.is_set()
+        assert stats.judged == 2
+
+    def test_judge_error_keeps_other_results(self):
+        scores = {'A': 90, 'B': 80, 'C': 70, 'D': 40}
+        hunters = _hunter_results(scores)
+        hunter_seen, judged = [], []
+
+        def judge(result):
+            if result['code'] == 'A':
+                raise RuntimeError('judge boom')
+            return result
+
+        stats = run_streaming_pipeline(
+            sorted(scores), hunters.get, judge,
+            max_entries=10, hunter_workers=1, judge_workers=1,
+            on_hunter_result=hunter_seen.append, on_judge_result=judged.append,
+        )
+
+        assert sorted(r['code'] for r in hunter_seen) == ['A', 'B', 'C', 'D']
+        assert sorted(r['code'] for r in judged) == ['B', 'C']
+        assert stats.failed == {'hunter': 0, 'judge': 1}
+        assert stats.judged == 3
+
+    def test_progress_reported(self):
+        reports = []
+        run_streaming_pipeline(['A'], lambda code: {'code': code, 'passed': False, 'hunter_score': 10},
+                               lambda result: result, max_entries=3, hunter_workers=1, judge_workers=1,
+                               on_progress=lambda stats: reports.append(stats.progress))
+
+        assert reports and reports[-1] == 100.0
+
+    def test_empty_items(self):
+        stats = run_streaming_pipeline([], lambda code: None, lambda result: result,
+                                       max_entries=3, hunter_workers=2, judge_workers=2)
+        assert (stats.hunter_done, stats.admitted) == (0, 0)
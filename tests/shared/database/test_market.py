@@ -0,0 +1,285 @@
+"""
+tests/shared/database/test_market.py - 시세 조회 Unit Tests
+==========================================================
+
+shared/database/market.py의 일봉 조회 함수를 테스트합니다.
+In-memory SQLite를 사용하여 실제 DB 없이 테스트합니다.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def db_session(in_memory_db):
+    """In-memory SQLite 세션 fixture"""
+    return in_memory_db["session"]
+
+
+@pytest.fixture
+def session_with_prices(db_session):
+    """3종목 × 10일 일봉 데이터가 있는 세션 (000660은 3일치만)"""
+    from shared.db.models import StockDailyPrice
+
+    base = datetime(2025, 1, 1)
+    for code, days in (("005930", 10), ("000660", 3), ("035420", 10)):
+        for i in range(days):
+            db_session.add(StockDailyPrice(
+                stock_code=code,
+                price_date=base + timedelta(days=i),
+                open_price=1000 + i,
+                high_price=1100 + i,
+                low_price=900 + i,
+                close_price=1000 + i * 10,
+                volume=10000 + i,
+            ))
+    db_session.commit()
+    return db_session
+
+
+@pytest.fixture
+def session_with_tables(db_session):
+    """STOCK_DAILY_PRICES / STOCK_FUNDAMENTALS 테이블 (ORM 모델 없음)"""
+    from sqlalchemy import text
+
+    db_session.execute(text(
+        "CREATE TABLE STOCK_DAILY_PRICES (STOCK_CODE TEXT, PRICE_DATE TEXT, CLOSE_PRICE REAL, "
+        "HIGH_PRICE REAL, LOW_PRICE REAL, PRIMARY KEY (STOCK_CODE, PRICE_DATE))"
+    ))
+    db_session.execute(text(
+        "CREATE TABLE STOCK_FUNDAMENTALS (STOCK_CODE TEXT, TRADE_DATE TEXT, PER REAL, PBR REAL, "
+        "ROE REAL, MARKET_CAP REAL, PRIMARY KEY (STOCK_CODE, TRADE_DATE))"
+    ))
+    db_session.commit()
+    return db_session
+
+
+# ============================================================================
+# Tests: get_daily_prices_batch
+# ============================================================================
+
+class TestGetDailyPricesBatch:
+    """일봉 배치 조회 테스트"""
+
+    def test_limit_applied_per_code(self, session_with_prices):
+        """종목별 최근 limit건만 반환"""
+        from shared.database.market import get_daily_prices_batch
+
+        result = get_daily_prices_batch(session_with_prices, ["005930", "000660"], limit=5)
+
+        assert len(result["005930"]) == 5
+        assert len(result["000660"]) == 3  # 보유 데이터가 limit보다 적음
+
+    def test_returns_latest_rows_ascending(self, session_with_prices):
+        """최신 limit건을 날짜 오름차순으로 반환"""
+        from shared.database.market import get_daily_prices_batch
+
+        df = get_daily_prices_batch(session_with_prices, ["005930"], limit=3)["005930"]
+
+        assert df["CLOSE_PRICE"].tolist() == [1070.0, 1080.0, 1090.0]
+        assert df["PRICE_DATE"].is_monotonic_increasing
+        assert set(df["STOCK_CODE"]) == {"005930"}
+        assert list(df.columns) == [
+            "STOCK_CODE", "PRICE_DATE", "OPEN_PRICE", "HIGH_PRICE", "LOW_PRICE", "CLOSE_PRICE", "VOLUME"
+        ]
+
+    def test_matches_single_code_query(self, session_with_prices):
+        """단일 종목 조회(get_daily_prices)와 동일한 값"""
+        from shared.database.market import get_daily_prices, get_daily_prices_batch
+
+        batch = get_daily_prices_batch(session_with_prices, ["005930", "035420"], limit=7)
+        single = get_daily_prices(session_with_prices, "035420", limit=7)
+
+        assert batch["035420"]["CLOSE_PRICE"].tolist() == [float(v) for v in single["CLOSE_PRICE"]]
+        assert batch["035420"]["VOLUME"].tolist() == [float(v) for v in single["VOLUME"]]
+
+    def test_frames_share_cache_format(self, session_with_prices):
+        """SQL 경로도 0부터 시작하는 인덱스와 datetime64 PRICE_DATE (캐시 경로와 동일)"""
+        import pandas as pd
+        from shared.database.market import get_daily_prices, get_daily_prices_batch
+
+        batch = get_daily_prices_batch(session_with_prices, ["005930", "035420"], limit=4)
+        single = get_daily_prices(session_with_prices, "035420", limit=4)
+
+        for df in (batch["005930"], batch["035420"], single):
+            assert list(df.index) == [0, 1, 2, 3]
+            assert pd.api.types.is_datetime64_any_dtype(df["PRICE_DATE"])
+        assert single["PRICE_DATE"].iloc[-1] == pd.Timestamp(2025, 1, 10)
+
+    def test_unknown_code_stays_empty(self, session_with_prices):
+        """데이터 없는 종목은 빈 리스트 유지 (기존 동작)"""
+        from shared.database.market import get_daily_prices_batch
+
+        result = get_daily_prices_batch(session_with_prices, ["005930", "999999"], limit=5)
+
+        assert result["999999"] == []
+        assert len(result["005930"]) == 5
+
+    def test_empty_inputs(self, session_with_prices):
+        """빈 종목 리스트 / 데이터 없음"""
+        from shared.database.market import get_daily_prices_batch
+
+        assert get_daily_prices_batch(session_with_prices, [], limit=5) == {}
+        assert get_daily_prices_batch(session_with_prices, ["999999"], limit=5) == {}
+
+    def test_stops_fetching_at_capacity(self):
+        """limit × 종목 수만큼 채우면 남은 배치를 더 끌어오지 않음"""
+        from shared.database.market import _load_daily_price_columns
+
+        row = ("005930", datetime(2025, 1, 1), 1.0, 1.0, 1.0, 1.0, 1.0)
+        batches = [[row] * 3, [row] * 3, [row] * 3]
+        calls = []
+
+        def fetchmany(size):
+            calls.append(size)
+            return batches.pop(0) if batches else []
+
+        columns = _load_daily_price_columns(fetchmany, capacity=3)
+
+        assert len(columns["STOCK_CODE"]) == 3
+        assert len(calls) == 1
+
+
+# ============================================================================
+# Tests: get_close_price_panel
+# ============================================================================
+
+class TestGetClosePricePanel:
+    """종가 패널 조회 테스트"""
+
+    def test_panel_shape_and_alignment(self, session_with_prices):
+        """날짜 × 종목 패널, 요청 순서대로 컬럼 정렬"""
+        from shared.database.market import get_close_price_panel
+
+        panel = get_close_price_panel(session_with_prices, ["035420", "005930", "000660"], limit=5)
+
+        assert list(panel.columns) == ["035420", "005930", "000660"]
+        assert len(panel) == 8  # 000660의 1/1~1/3 + 나머지 종목의 1/6~1/10
+        assert panel.index.is_monotonic_increasing
+        assert panel["005930"].dropna().tolist() == [1050.0, 1060.0, 1070.0, 1080.0, 1090.0]
+
+    def test_missing_dates_are_nan(self, session_with_prices):
+        """보유 데이터가 짧은 종목은 NaN으로 채움"""
+        from shared.database.market import get_close_price_panel
+
+        panel = get_close_price_panel(session_with_prices, ["005930", "000660"], limit=10)
+
+        assert panel["000660"].notna().sum() == 3
+        assert panel["005930"].notna().sum() == 10
+
+    def test_unknown_code_column(self, session_with_prices):
+        """데이터 없는 종목도 NaN 컬럼으로 유지"""
+        from shared.database.market import get_close_price_panel
+
+        panel = get_close_price_panel(session_with_prices, ["005930", "999999"], limit=3)
+
+        assert panel["999999"].isna().all()
+        assert get_close_price_panel(session_with_prices, [], limit=3).empty
+
+
+class TestGetStockNames:
+    """STOCK_MASTER 종목명 조회 테스트"""
+
+    def test_names_for_requested_codes(self, db_session):
+        from shared.db.models import StockMaster
+        from shared.database import get_stock_names
+
+        db_session.add_all([StockMaster(stock_code="005930", stock_name="삼성전자"),
+                            StockMaster(stock_code="000660", stock_name="SK하이닉스"),
+                            StockMaster(stock_code="035420", stock_name=None)])
+        db_session.commit()
+
+        assert get_stock_names(db_session, ["005930", "035420", "999999"]) == {"005930": "삼성전자", "035420": "035420"}
+        assert len(get_stock_names(db_session)) == 3
+        assert get_stock_names(db_session, []) == {}
+
+    def test_requested_codes_are_queried_in_chunks(self, db_session, monkeypatch):
+        """요청 종목은 SQL IN 절로 청크 단위 조회"""
+        from shared.db.models import StockMaster
+        from shared.database import market
+
+        db_session.add_all([StockMaster(stock_code=f"{i:06d}", stock_name=f"종목{i}") for i in range(5)])
+        db_session.commit()
+        monkeypatch.setattr(market, "_STOCK_NAME_CHUNK", 2)
+        statements = []
+        execute = db_session.execute
+        monkeypatch.setattr(db_session, "execute",
+                            lambda stmt, *args, **kwargs: statements.append(str(stmt)) or execute(stmt, *args, **kwargs))
+
+        names = market.get_stock_names(db_session, ["000000", "000001", "000004"])
+
+        assert names == {"000000": "종목0", "000001": "종목1", "000004": "종목4"}
+        assert len(statements) == 2
+        assert all("WHERE STOCK_CODE IN" in stmt for stmt in statements)
+
+
+class TestBulkUpsert:
+    """bulk_upsert / save_all_daily_prices / save_daily_ohlcv (SQLite ON CONFLICT 경로)"""
+
+    def test_chunked_insert_then_update(self, session_with_tables):
+        from sqlalchemy import text
+        from shared.database import bulk_upsert
+
+        session = session_with_tables
+        columns = ("STOCK_CODE", "PRICE_DATE", "CLOSE_PRICE", "HIGH_PRICE", "LOW_PRICE")
+        rows = [{"STOCK_CODE": f"{i:06d}", "PRICE_DATE": "2025-01-02", "CLOSE_PRICE": i,
+                 "HIGH_PRICE": i, "LOW_PRICE": i} for i in range(25)]
+
+        assert bulk_upsert(session, "STOCK_DAILY_PRICES", columns, rows,
+                           ("STOCK_CODE", "PRICE_DATE"), chunk_size=10) == 25
+        rows[3]["CLOSE_PRICE"] = 999
+        assert bulk_upsert(session, "STOCK_DAILY_PRICES", columns, rows[:5],
+                           ("STOCK_CODE", "PRICE_DATE"), chunk_size=2) == 5
+
+        assert session.execute(text("SELECT COUNT(*) FROM STOCK_DAILY_PRICES")).scalar() == 25
+        assert session.execute(text(
+            "SELECT CLOSE_PRICE FROM STOCK_DAILY_PRICES WHERE STOCK_CODE = '000003'"
+        )).scalar() == 999
+
+    def test_save_all_daily_prices_and_fundamentals(self, session_with_tables):
+        from sqlalchemy import text
+        from shared.database import save_all_daily_prices, update_all_stock_fundamentals
+
+        session = session_with_tables
+        params = [{"p_code": "005930", "p_date": "2025-01-02", "p_price": 100, "p_high": 110, "p_low": 90},
+                  {"stock_code": "000660", "price_date": "2025-01-02", "close_price": 200,
+                   "high_price": 210, "low_price": 190}]
+        assert save_all_daily_prices(session, params, chunk_size=1) == 2
+        params[0]["p_price"] = 105
+        assert save_all_daily_prices(session, params[:1]) == 1
+        assert session.execute(text(
+            "SELECT CLOSE_PRICE FROM STOCK_DAILY_PRICES WHERE STOCK_CODE = '005930'"
+        )).scalar() == 105
+
+        fundamentals = [{"stock_code": "005930", "trade_date": "2025-01-02", "per": 10.0,
+                         "pbr": 1.2, "roe": 8.0, "market_cap": 1e12}]
+        assert update_all_stock_fundamentals(session, fundamentals) == 1
+        fundamentals[0]["per"] = None
+        assert update_all_stock_fundamentals(session, fundamentals, use_infile=True) == 1
+        assert session.execute(text("SELECT PER FROM STOCK_FUNDAMENTALS")).scalar() is None
+
+    def test_save_daily_prices_failure_returns_zero(self, db_session):
+        """테이블이 없으면 롤백 후 0 반환"""
+        from shared.database import save_all_daily_prices
+
+        assert save_all_daily_prices(db_session, [{"p_code": "005930", "p_date": "2025-01-02"}]) == 0
+
+    def test_save_daily_ohlcv(self, db_session):
+        from shared.database import save_daily_ohlcv
+        from shared.db.models import StockDailyPrice
+
+        rows = [{"code": "005930", "date": datetime(2025, 1, 2), "open": 1, "high": 2, "low": 0.5,
+                 "close": 1.5, "volume": 100}]
+        assert save_daily_ohlcv(db_session, rows) == 1
+        rows[0]["close"] = 1.8
+        assert save_daily_ohlcv(db_session, rows) == 1
+        db_session.commit()
+
+        saved = db_session.query(StockDailyPrice).all()
+        assert len(saved) == 1
+        assert saved[0].close_price == 1.8 and saved[0].volume == 100
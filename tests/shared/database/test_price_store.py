@@ -0,0 +1,278 @@
+"""
+tests/shared/database/test_price_store.py - 로컬 Arrow 일봉 캐시 Unit Tests
+==========================================================================
+
+shared/database/price_store.py의 병합/읽기/신선도 판단과
+market.get_daily_prices(_batch)의 캐시 우선 조회를 테스트합니다.
+"""
+
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+
+def _rows(code, start, days, close_base=1000.0):
+    dates = [start + timedelta(days=i) for i in range(days)]
+    return pd.DataFrame({
+        "STOCK_CODE": code,
+        "PRICE_DATE": dates,
+        "OPEN_PRICE": [close_base + i for i in range(days)],
+        "HIGH_PRICE": [close_base + 100 + i for i in range(days)],
+        "LOW_PRICE": [close_base - 100 + i for i in range(days)],
+        "CLOSE_PRICE": [close_base + i * 10 for i in range(days)],
+        "VOLUME": [10000 + i for i in range(days)],
+    })
+
+
+@pytest.fixture
+def store(tmp_path):
+    from shared.database.price_store import PriceStore
+    return PriceStore(str(tmp_path))
+
+
+@pytest.fixture
+def enabled_store(tmp_path, monkeypatch):
+    """PRICE_STORE_DIR가 설정된 공용 스토어 (005930 10일, 035420 10일)"""
+    from shared.database import price_store
+
+    monkeypatch.setenv("PRICE_STORE_DIR", str(tmp_path))
+    monkeypatch.setattr(price_store, "_store", None)
+    monkeypatch.setattr(price_store, "db_last_date_cache", price_store.DbLastDateCache())
+    store = price_store.get_price_store()
+    base = datetime(2025, 1, 1)
+    store.append(pd.concat([_rows("005930", base, 10), _rows("035420", base, 10, 5000.0)]))
+    return store
+
+
+class TestPriceStore:
+    """PriceStore 병합/읽기 테스트"""
+
+    def test_read_empty_store(self, store):
+        """파일이 없으면 빈 결과, 신선하지 않음"""
+        assert store.read_frames(["005930"]) == {}
+        assert store.fresh_codes(["005930"], {"005930": datetime(2025, 1, 1)}) == []
+
+    def test_append_and_read_with_limit(self, store):
+        """종목별 최근 limit건을 날짜 오름차순으로 반환"""
+        store.append(pd.concat([_rows("005930", datetime(2025, 1, 1), 10), _rows("000660", datetime(2025, 1, 1), 3)]))
+
+        frames = store.read_frames(["005930", "000660", "999999"], limit=5)
+
+        assert set(frames) == {"005930", "000660"}
+        assert len(frames["005930"]) == 5
+        assert len(frames["000660"]) == 3
+        assert frames["005930"]["PRICE_DATE"].is_monotonic_increasing
+        assert frames["005930"]["CLOSE_PRICE"].tolist() == [1050.0, 1060.0, 1070.0, 1080.0, 1090.0]
+        assert list(frames["005930"].index) == list(range(5))
+
+    def test_incremental_append_overwrites_overlap(self, store):
+        """겹치는 일자는 새 값으로 덮어쓰고 다른 종목은 유지"""
+        base = datetime(2025, 1, 1)
+        store.append(pd.concat([_rows("005930", base, 5), _rows("035420", base, 5)]))
+
+        update = _rows("005930", base + timedelta(days=4), 3, close_base=2000.0)
+        assert store.append(update) == 1
+
+        frames = store.read_frames(["005930", "035420"])
+        assert len(frames["005930"]) == 7
+        assert frames["005930"]["CLOSE_PRICE"].tolist()[-3:] == [2000.0, 2010.0, 2020.0]
+        assert len(frames["035420"]) == 5
+        assert store.last_date == base + timedelta(days=6)
+        assert store.last_date_of("005930") == base + timedelta(days=6)
+        assert store.last_date_of("035420") == base + timedelta(days=4)
+
+    def test_freshness_against_db_last_date(self, store):
+        """종목별 마지막 일자가 DB보다 뒤처지지 않아야 신선한 것으로 판단"""
+        store.append(_rows("005930", datetime(2025, 1, 1), 3))
+
+        for db_last_date in (datetime(2025, 1, 3), datetime(2025, 1, 2)):
+            assert store.fresh_codes(["005930"], {"005930": db_last_date}) == ["005930"]
+        for db_last_date in (datetime(2025, 1, 4), None):
+            assert store.fresh_codes(["005930"], {"005930": db_last_date}) == []
+        assert store.fresh_codes(["005930"], None) == []
+
+    def test_freshness_is_per_code(self, store):
+        """한 종목만 DB보다 뒤처지면 그 종목만 제외"""
+        base = datetime(2025, 1, 1)
+        store.append(pd.concat([_rows("005930", base, 3), _rows("035420", base, 3)]))
+        db_last_dates = {"005930": base + timedelta(days=3), "035420": base + timedelta(days=2)}
+
+        assert store.fresh_codes(["035420", "005930", "999999"], db_last_dates) == ["035420"]
+        store.append(_rows("005930", base + timedelta(days=3), 1))
+        assert store.fresh_codes(["035420", "005930"], db_last_dates) == ["035420", "005930"]
+
+
+class TestDbLastDateCache:
+    """DB 마지막 일자 캐시 (TTL + LRU)"""
+
+    def test_ttl_and_invalidate(self):
+        from shared.database.price_store import DbLastDateCache
+
+        cache = DbLastDateCache()
+        cache.put_many("T", {"005930": datetime(2025, 1, 3), "000660": None})
+
+        hits, missing = cache.get_many("T", ["005930", "000660", "035420"], ttl=60)
+        assert hits == {"005930": datetime(2025, 1, 3), "000660": None}
+        assert missing == ["035420"]
+        assert cache.get_many("T", ["005930"], ttl=0) == ({}, ["005930"])
+        cache.invalidate("T", ["005930"])
+        assert cache.get_many("T", ["005930", "000660"], ttl=60)[1] == ["005930"]
+
+    def test_evicts_least_recently_used(self):
+        from shared.database.price_store import DbLastDateCache
+
+        cache = DbLastDateCache(maxsize=2)
+        cache.put_many("T", {"A": None, "B": None})
+        cache.get_many("T", ["A"], ttl=60)
+        cache.put_many("T", {"C": None})
+
+        assert cache.get_many("T", ["A", "B", "C"], ttl=60)[1] == ["B"]
+
+
+def _add_db_rows(session, code, start, days, close_base):
+    from shared.db.models import StockDailyPrice
+
+    for i in range(days):
+        session.add(StockDailyPrice(
+            stock_code=code, price_date=start + timedelta(days=i),
+            open_price=1, high_price=1, low_price=1, close_price=close_base + i, volume=1,
+        ))
+    session.commit()
+
+
+def _mirror_to_db(session, frame):
+    """스토어에 넣은 행을 DB에도 그대로 저장 (collector가 양쪽에 쓰는 상황)"""
+    from shared.db.models import StockDailyPrice
+
+    for row in frame.itertuples(index=False):
+        session.add(StockDailyPrice(
+            stock_code=row.STOCK_CODE, price_date=row.PRICE_DATE,
+            open_price=row.OPEN_PRICE, high_price=row.HIGH_PRICE, low_price=row.LOW_PRICE,
+            close_price=row.CLOSE_PRICE, volume=row.VOLUME,
+        ))
+    session.commit()
+
+
+def _patch_db_last_dates(monkeypatch, store, codes):
+    """DB 마지막 일자가 스토어와 같다고 가정 (codes만)"""
+    from shared.database import price_store
+
+    calls = []
+
+    def _fake(connection, table_name, stock_codes):
+        calls.append(list(stock_codes))
+        return {code: store.last_date_of(code) for code in stock_codes if code in codes}
+
+    monkeypatch.setattr(price_store, "_query_db_last_dates", _fake)
+    return calls
+
+
+class TestMarketReadsFromStore:
+    """get_daily_prices(_batch)의 캐시 우선 조회"""
+
+    def test_get_daily_prices_served_from_store(self, enabled_store, in_memory_db, monkeypatch):
+        """DB보다 뒤처지지 않았으면 캐시 값을 반환"""
+        from shared.database.market import get_daily_prices
+
+        _patch_db_last_dates(monkeypatch, enabled_store, {"005930"})
+
+        df = get_daily_prices(in_memory_db["session"], "005930", limit=4)
+
+        assert list(df.columns) == ["PRICE_DATE", "OPEN_PRICE", "HIGH_PRICE", "LOW_PRICE", "CLOSE_PRICE", "VOLUME"]
+        assert df["CLOSE_PRICE"].tolist() == [1060.0, 1070.0, 1080.0, 1090.0]
+
+    def test_db_last_dates_from_sql(self, enabled_store, in_memory_db):
+        """실제 DB의 종목별 MAX(PRICE_DATE)로 신선도 판단 (DB에 없는 종목은 None)"""
+        from shared.database import price_store
+
+        session = in_memory_db["session"]
+        _mirror_to_db(session, _rows("005930", datetime(2025, 1, 1), 10))
+
+        last_dates = price_store.get_db_last_dates(session, ["005930", "035420"])
+
+        assert last_dates == {"005930": datetime(2025, 1, 10), "035420": None}
+        assert enabled_store.fresh_codes(["005930", "035420"], last_dates) == ["005930"]
+
+    def test_save_daily_ohlcv_rewrite_reaches_store(self, enabled_store, in_memory_db):
+        """save_daily_ohlcv로 같은 일자를 재기록하면 스토어에도 반영되어 캐시가 새 값을 반환"""
+        from shared.database.market import get_daily_prices, save_daily_ohlcv
+
+        session = in_memory_db["session"]
+        _mirror_to_db(session, _rows("005930", datetime(2025, 1, 1), 10))
+        assert get_daily_prices(session, "005930", limit=1)["CLOSE_PRICE"].tolist() == [1090.0]
+
+        save_daily_ohlcv(session, [{"code": "005930", "date": datetime(2025, 1, 10), "open": 1009.0,
+                                    "high": 1300.0, "low": 900.0, "close": 1200.0, "volume": 5}])
+        session.commit()
+
+        assert enabled_store.read_frames(["005930"], limit=1)["005930"]["CLOSE_PRICE"].tolist() == [1200.0]
+        assert get_daily_prices(session, "005930", limit=2)["CLOSE_PRICE"].tolist() == [1080.0, 1200.0]
+
+    def test_batch_falls_back_to_sql_for_missing_codes(self, enabled_store, in_memory_db, monkeypatch):
+        """캐시에 없는 종목만 SQL로 조회"""
+        from shared.database.market import get_daily_prices_batch
+
+        session = in_memory_db["session"]
+        _patch_db_last_dates(monkeypatch, enabled_store, {"005930"})
+        _add_db_rows(session, "000660", datetime(2025, 1, 1), 3, 700.0)
+
+        result = get_daily_prices_batch(session, ["005930", "000660", "999999"], limit=5)
+
+        assert len(result["005930"]) == 5
+        assert result["000660"]["CLOSE_PRICE"].tolist() == [700.0, 701.0, 702.0]
+        assert isinstance(result["999999"], list) and not result["999999"]
+
+    def test_store_behind_db_uses_sql(self, enabled_store, in_memory_db):
+        """스토어에 append하지 않는 쓰기로 DB가 더 최신이면 캐시를 쓰지 않음"""
+        from shared.database.market import get_daily_prices
+
+        session = in_memory_db["session"]
+        _add_db_rows(session, "005930", datetime(2025, 1, 9), 3, 500.0)
+
+        df = get_daily_prices(session, "005930", limit=3)
+
+        assert df["CLOSE_PRICE"].tolist() == [500.0, 501.0, 502.0]
+
+    def test_batch_reads_stale_codes_from_sql(self, enabled_store, in_memory_db):
+        """스토어와 DB가 같은 종목은 캐시에서, DB에만 바뀐 종목은 SQL로 조회"""
+        from shared.database.market import get_daily_prices_batch
+
+        session = in_memory_db["session"]
+        latest = _rows("005930", datetime(2025, 1, 11), 1, 3000.0)
+        enabled_store.append(latest)
+        _mirror_to_db(session, pd.concat([_rows("005930", datetime(2025, 1, 1), 10), latest]))
+        _add_db_rows(session, "035420", datetime(2025, 1, 9), 3, 600.0)
+
+        result = get_daily_prices_batch(session, ["005930", "035420"], limit=3)
+
+        assert result["005930"]["CLOSE_PRICE"].tolist() == [1080.0, 1090.0, 3000.0]
+        assert result["035420"]["CLOSE_PRICE"].tolist() == [600.0, 601.0, 602.0]
+
+    def test_close_panel_mixes_store_and_sql(self, enabled_store, in_memory_db, monkeypatch):
+        """종가 패널도 캐시 종목은 스토어에서, 캐시에 없는 종목은 SQL에서 읽어 날짜로 정렬"""
+        from shared.database.market import get_close_price_panel
+
+        session = in_memory_db["session"]
+        _patch_db_last_dates(monkeypatch, enabled_store, {"005930"})
+        _add_db_rows(session, "000660", datetime(2025, 1, 9), 2, 700.0)
+
+        panel = get_close_price_panel(session, ["005930", "000660"], limit=2)
+
+        assert list(panel.columns) == ["005930", "000660"]
+        assert panel["005930"].tolist() == [1080.0, 1090.0]
+        assert panel["000660"].tolist() == [700.0, 701.0]
+
+    def test_db_last_dates_are_reused_within_ttl(self, enabled_store, in_memory_db, monkeypatch):
+        """DB 마지막 일자는 종목별로 TTL 동안 한 번만 조회"""
+        from shared.database import price_store
+
+        calls = _patch_db_last_dates(monkeypatch, enabled_store, {"005930", "035420"})
+        session = in_memory_db["session"]
+
+        assert set(price_store.read_fresh_frames(session, ["005930"])) == {"005930"}
+        assert set(price_store.read_fresh_frames(session, ["005930", "035420"])) == {"005930", "035420"}
+        assert set(price_store.read_fresh_frames(session, ["035420"])) == {"035420"}
+        assert calls == [["005930"], ["035420"]]
@@ -15,6 +15,7 @@ In-memory SQLite를 사용하여 실제 DB 없이 테스트합니다.
 import json
 import pytest
 from datetime import datetime, timezone, timedelta
+from unittest.mock import MagicMock
 
 
 # ============================================================================
@@ -644,3 +645,43 @@ class TestEdgeCases:
         assert watchlist["TEST01"]["market_cap"] is None
         assert watchlist["TEST01"]["llm_score"] == 0  # None -> 0
 
+
+
+# ============================================================================
+# Tests: KIS Gateway 현재가 조회
+# ============================================================================
+
+class TestFetchCurrentPrices:
+    """fetch_current_prices_from_kis 함수 테스트 (KISGatewayClient.get_stock_snapshots 사용)"""
+    
+    @pytest.fixture
+    def gateway_client(self, monkeypatch):
+        from shared.db import repository
+        
+        client = MagicMock()
+        monkeypatch.setattr(repository, "_get_gateway_client", lambda: client)
+        return client
+    
+    def test_prices_from_snapshots(self, gateway_client):
+        """일괄 조회 결과에서 현재가만 추출 (가격 없는 종목 제외)"""
+        from shared.db.repository import fetch_current_prices_from_kis
+        
+        gateway_client.get_stock_snapshots.return_value = {
+            "005930": {"stck_prpr": "70000"},
+            "000660": {"price": "120000"},
+            "035420": {},
+        }
+        
+        prices = fetch_current_prices_from_kis(["005930", "000660", "035420"])
+        
+        assert prices == {"005930": 70000.0, "000660": 120000.0}
+        gateway_client.get_stock_snapshots.assert_called_once_with(["005930", "000660", "035420"])
+    
+    def test_gateway_error_returns_empty(self, gateway_client):
+        """Gateway 클라이언트 예외 시 빈 결과"""
+        from shared.db.repository import fetch_current_prices_from_kis
+        
+        gateway_client.get_stock_snapshots.side_effect = RuntimeError("down")
+        
+        assert fetch_current_prices_from_kis(["005930"]) == {}
+        assert fetch_current_prices_from_kis([]) == {}
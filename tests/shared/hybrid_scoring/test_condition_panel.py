@@ -0,0 +1,106 @@
+"""
+tests/shared/hybrid_scoring/test_condition_panel.py - 복합 조건 패널 테스트
+=========================================================================
+
+shared/hybrid_scoring/condition_panel.py의 가격/수급/뉴스 정렬, 종목 경계 처리, 조건 마스크 평가를 테스트합니다.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from shared.hybrid_scoring.condition_panel import (
+    COMPOUND_CONDITIONS,
+    build_condition_panel,
+    evaluate_conditions,
+)
+
+DATES = pd.bdate_range("2024-01-01", periods=40)
+
+
+def make_prices(closes=None, volumes=None):
+    closes = np.linspace(100, 139, len(DATES)) if closes is None else closes
+    volumes = np.full(len(DATES), 1000.0) if volumes is None else volumes
+    return pd.DataFrame({"PRICE_DATE": DATES, "CLOSE_PRICE": closes, "VOLUME": volumes})
+
+
+def conditions(*keys):
+    return [c for c in COMPOUND_CONDITIONS if c["key"] in keys]
+
+
+class TestBuildConditionPanel:
+
+    def test_aligns_supply_and_daily_max_news(self):
+        supply = {"A": pd.DataFrame({
+            "TRADE_DATE": DATES[:3],
+            "FOREIGN_NET_BUY": [10, -5, None],
+            "INSTITUTION_NET_BUY": [1, 2, 3],
+        })}
+        news = {"A": pd.DataFrame({
+            "NEWS_DATE": [DATES[0] + pd.Timedelta(hours=9), DATES[0] + pd.Timedelta(hours=15), DATES[2]],
+            "SENTIMENT_SCORE": [60, 85, 40],
+        })}
+
+        panel = build_condition_panel({"A": make_prices()}, supply, news)
+
+        assert len(panel) == len(DATES)
+        assert panel["FOREIGN_NET"].iloc[:2].tolist() == [10, -5]
+        assert np.isnan(panel["FOREIGN_NET"].iloc[2]) and np.isnan(panel["FOREIGN_NET"].iloc[3])
+        assert panel["NEWS_SCORE"].iloc[0] == 85
+        assert panel["NEWS_SCORE"].iloc[2] == 40
+        assert panel["NEWS_SCORE"].iloc[1:2].isna().all()
+
+    def test_rolling_and_forward_values_do_not_cross_stocks(self):
+        price_data = {"A": make_prices(), "B": make_prices(np.linspace(500, 461, len(DATES)))}
+
+        panel = build_condition_panel(price_data, {}, {}, forward_days=5)
+        a = panel[panel["STOCK_CODE"] == "A"]
+        b = panel[panel["STOCK_CODE"] == "B"]
+
+        expected = make_prices()["CLOSE_PRICE"].pct_change(5).shift(-5) * 100
+        np.testing.assert_allclose(a["FORWARD_RETURN"].to_numpy(), expected.to_numpy(), equal_nan=True)
+        assert b["FORWARD_RETURN"].iloc[-5:].isna().all()
+        # B는 하락만 있으므로 RSI 0, 첫 13일은 NaN (A의 값과 섞이지 않음)
+        assert b["RSI"].iloc[:13].isna().all()
+        assert (b["RSI"].iloc[13:] == 0).all()
+        assert b["VOLUME_MA20"].iloc[:19].isna().all()
+
+    def test_short_history_excluded(self):
+        panel = build_condition_panel({"A": make_prices().iloc[:10]}, {}, {})
+
+        assert panel.empty
+
+
+class TestEvaluateConditions:
+
+    def test_masks_and_recent_split(self):
+        volumes = np.full(len(DATES), 1000.0)
+        volumes[25] = 5000.0
+        supply = {"A": pd.DataFrame({
+            "TRADE_DATE": DATES,
+            "FOREIGN_NET": np.where(np.arange(len(DATES)) % 2 == 0, 1.0, -1.0),
+            "INST_NET": 1.0,
+        })}
+        news = {"A": pd.DataFrame({"NEWS_DATE": DATES[[2, 3, 4, 38]], "SENTIMENT_SCORE": [90, 90, 75, 90]})}
+        panel = build_condition_panel({"A": make_prices(volumes=volumes)}, supply, news)
+
+        samples = evaluate_conditions(
+            panel,
+            conditions("news_70_foreign_buy", "news_80_all_buy", "volume_surge_foreign_buy"),
+            recent_cutoff=DATES[4].to_pydatetime(),
+        )
+
+        # 외국인 순매수는 짝수일만, 38일차는 D+5 수익률이 없어 제외
+        news_70 = samples["news_70_foreign_buy"]
+        assert len(news_70.returns) == 2
+        assert len(news_70.recent_returns) == 1
+        assert len(samples["news_80_all_buy"].returns) == 1
+        assert len(samples["volume_surge_foreign_buy"].returns) == 0  # 25일차는 외국인 순매도
+
+    def test_missing_supply_never_matches(self):
+        panel = build_condition_panel({"A": make_prices()}, {}, {})
+
+        samples = evaluate_conditions(panel, COMPOUND_CONDITIONS, datetime(2024, 1, 1))
+
+        assert all(len(s.returns) == 0 for s in samples.values())
@@ -350,6 +350,199 @@ class TestCalculateIC:
         assert ir == 0.0
 
 
+# ============================================================================
+# Tests: analyze_factors_panel (패널 기반 횡단면 IC)
+# ============================================================================
+
+class TestAnalyzeFactorsPanel:
+    """패널 IC 엔진 연동 테스트"""
+    
+    @pytest.fixture
+    def panel_prices(self, in_memory_db):
+        """8종목 × 200영업일, 종목별 추세가 달라 모멘텀이 미래 수익률을 예측"""
+        rng = np.random.default_rng(7)
+        dates = pd.bdate_range('2024-01-02', periods=200)
+        codes = [f'{i:06d}' for i in range(8)]
+        for n, code in enumerate(codes):
+            closes = 10000 * np.cumprod(1 + (n - 3.5) * 0.001 + rng.normal(scale=0.001, size=len(dates)))
+            for d, close in zip(dates, closes):
+                in_memory_db.add(StockDailyPrice(
+                    stock_code=code, price_date=d.to_pydatetime(), close_price=float(close),
+                    high_price=float(close), low_price=float(close), volume=1000,
+                ))
+        in_memory_db.commit()
+        return codes
+    
+    def test_all_factors_in_one_pass(self, analyzer, panel_prices):
+        results = analyzer.analyze_factors_panel(panel_prices, forward_days=5)
+        
+        assert set(results) == set(analyzer.FACTOR_DEFINITIONS)
+        momentum = results['momentum_1m']
+        assert momentum.ic_mean > 0.5
+        assert momentum.hit_rate > 0.9
+        assert momentum.sample_count == 8 * (200 - 20 - 5)
+        # 종가로 계산할 수 없는 팩터는 표본 부족 기본값
+        assert results['supply_foreign_buy'].sample_count == 0
+        assert results['supply_foreign_buy'].recommended_weight == 0.05
+    
+    def test_analyze_factor_reuses_panel(self, analyzer, panel_prices):
+        """같은 종목(또는 부분집합) 재분석 시 가격 데이터를 다시 조회하지 않음"""
+        with patch.object(analyzer, '_get_historical_prices',
+                          wraps=analyzer._get_historical_prices) as fetch:
+            analyzer.analyze_factor(panel_prices, 'momentum_1m')
+            analyzer.analyze_factor(panel_prices[:6], 'technical_rsi_oversold', forward_days=20)
+        
+        assert fetch.call_count == 1
+    
+    def test_factor_jobs_parallel_matches_sequential(self, analyzer, panel_prices):
+        """(팩터, 섹터, 보유기간) 작업: 프로세스 병렬 결과 = 순차 결과 = 섹터별 analyze_factor"""
+        sectors = {'S1': panel_prices[:5], 'S2': panel_prices[5:]}
+        jobs = [('momentum_1m', 'ALL', 5), ('momentum_1m', 'S1', 5), ('technical_rsi_oversold', 'ALL', 20)]
+        
+        sequential = analyzer.analyze_factor_jobs(panel_prices, jobs, sectors, workers=1)
+        parallel = analyzer.analyze_factor_jobs(panel_prices, jobs, sectors, workers=2)
+        
+        assert list(parallel) == jobs
+        assert parallel == sequential
+        assert sequential[('momentum_1m', 'S1', 5)] == analyzer.analyze_factor(panel_prices[:5], 'momentum_1m')
+    
+    def test_supply_factor_panel_in_factor_jobs(self, analyzer, panel_prices):
+        """외국인 순매수도 날짜 × 종목 패널로 같은 Rank IC 작업에 포함 (수급 데이터는 한 번만 조회)"""
+        dates = pd.bdate_range('2024-01-02', periods=200)
+        supply = {code: pd.DataFrame({'TRADE_DATE': dates.date, 'FOREIGN_NET': float(n), 'INST_NET': 0.0})
+                  for n, code in enumerate(panel_prices)}
+        jobs = [('supply_foreign_buy', 'ALL', 5)]
+        
+        with patch.object(analyzer, '_load_supply_demand_data', return_value=supply) as load:
+            close = analyzer._get_price_panel(panel_prices)
+            factor_panels = {'supply_foreign_buy': analyzer._supply_factor_panel(close, 'supply_foreign_buy')}
+            analyzer._get_supply_demand_data(panel_prices[:3])
+        sequential = analyzer.analyze_factor_jobs(panel_prices, jobs, workers=1, factor_panels=factor_panels)
+        parallel = analyzer.analyze_factor_jobs(panel_prices, jobs, workers=2, factor_panels=factor_panels)
+        
+        assert load.call_count == 1
+        result = sequential[jobs[0]]
+        assert result.sample_count == 8 * (200 - 5)
+        assert result.ic_mean > 0.5
+        assert parallel == sequential
+    
+    def test_analyze_by_sector_skips_small_sectors(self, analyzer, panel_prices):
+        sectors = {'S1': panel_prices[:5], 'S2': panel_prices[5:]}
+        with patch.object(analyzer, 'group_stocks_by_sector', return_value=sectors):
+            results = analyzer.analyze_by_sector(panel_prices, 'momentum_1m', workers=2)
+        
+        assert list(results) == ['S1']
+        assert results['S1']['stock_count'] == 5
+        assert results['S1']['sample_count'] == 5 * (200 - 20 - 5)
+    
+    def test_basic_conditions_match_per_stock_analysis(self, analyzer, panel_prices):
+        """조건 패널 기반 종목별 기본 조건 = 종목마다 조회하던 analyze_condition_performance"""
+        def rsi_oversold_condition(df):
+            close = df['CLOSE_PRICE']
+            delta = close.diff()
+            gain = delta.where(delta > 0, 0).rolling(window=14).mean()
+            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+            return 100 - (100 / (1 + gain / loss)) < 30
+        
+        expected = [r for code in panel_prices
+                    for r in [analyzer.analyze_condition_performance(code, 'rsi_oversold_30', rsi_oversold_condition)]
+                    if r]
+        results = analyzer.analyze_basic_conditions(panel_prices, workers=2)
+        
+        assert expected
+        assert [r for r in results if r.condition_key == 'rsi_oversold_30'] == expected
+
+
+class TestAnalyzeFactorWithFinancials:
+    """분기 재무 데이터 시점 매칭 (PointInTimeIndex.panel) + 일별 횡단면 Rank IC"""
+    
+    @pytest.fixture
+    def financial_prices(self, in_memory_db):
+        """6종목 × 200영업일, 재무 지표는 100번째 거래일 기준 분기에 처음 나옴"""
+        dates = pd.bdate_range('2024-01-02', periods=200)
+        codes = [f'{i:06d}' for i in range(6)]
+        for n, code in enumerate(codes):
+            for i, d in enumerate(dates):
+                close = 10000.0 * (1 + 0.01 * ((i * (n + 1)) % 7))
+                in_memory_db.add(StockDailyPrice(
+                    stock_code=code, price_date=d.to_pydatetime(), close_price=close,
+                    high_price=close, low_price=close, volume=1000,
+                ))
+            in_memory_db.add(FinancialMetricsQuarterly(
+                stock_code=code, quarter_date=dates[100].date(), per=10.0 + n, pbr=1.0, roe=5.0 + n,
+            ))
+        in_memory_db.commit()
+        return codes
+    
+    def test_matches_quarter_by_price_date(self, analyzer, financial_prices):
+        result = analyzer.analyze_factor_with_financials(financial_prices, 'quality_roe')
+        
+        # 분기 기준일 이전 거래일(100일)은 값 없음 → 종목당 100개만 매칭 (미래 분기 참조 없음),
+        # 그중 마지막 5일은 D+5 수익률이 없어 제외
+        assert result.sample_count == 6 * (100 - 5)
+    
+    def test_uses_daily_cross_sectional_ic(self, analyzer, financial_prices):
+        """재무 팩터도 일별 Rank IC 요약 (적중률 = IC > 0인 날짜 비율)"""
+        from shared.hybrid_scoring.factor_panel import build_close_panel, cross_sectional_rank_ic, forward_return_panel
+        
+        close = build_close_panel(analyzer._get_historical_prices(financial_prices))
+        per = pd.DataFrame(np.nan, index=close.index, columns=close.columns)
+        per.iloc[100:] = [10.0 + n for n in range(6)]
+        ic = cross_sectional_rank_ic(-per, forward_return_panel(close, 5)).dropna()
+        
+        result = analyzer.analyze_factor_with_financials(financial_prices, 'value_per')
+        
+        assert result.ic_mean == round(ic.mean(), 4)
+        assert result.hit_rate == round((ic > 0).mean(), 4)
+    
+    def test_sector_jobs_use_fundamentals_panel(self, analyzer, financial_prices):
+        """섹터별 ROE 작업도 재무 패널을 받아 전체 종목 분석과 같은 방식으로 계산"""
+        sectors = {'S1': financial_prices}
+        with patch.object(analyzer, 'group_stocks_by_sector', return_value=sectors):
+            results = analyzer.analyze_by_sector(financial_prices, 'quality_roe', workers=2)
+        
+        expected = analyzer.analyze_factor_with_financials(financial_prices, 'quality_roe')
+        assert results['S1']['sample_count'] == expected.sample_count == 6 * (100 - 5)
+        assert results['S1']['ic_mean'] == expected.ic_mean
+    
+    def test_index_loaded_once(self, analyzer, financial_prices):
+        with patch.object(analyzer, '_get_financial_data', wraps=analyzer._get_financial_data) as fetch:
+            analyzer.analyze_factor_with_financials(financial_prices, 'value_per')
+            analyzer.analyze_factor_with_financials(financial_prices[:3], 'quality_roe', forward_days=20)
+        
+        assert fetch.call_count == 1
+        index = analyzer._get_fundamentals_index(financial_prices)
+        assert analyzer._get_financial_at_date(index, '000001', '2024-01-02')['per'] == 11.0
+
+
+class TestAnalyzeCompoundConditions:
+    """복합 조건 분석 (컬럼형 패널 + 마스크)"""
+    
+    def test_conditions_from_aligned_panel(self, analyzer):
+        dates = pd.bdate_range('2024-01-01', periods=60)
+        prices = {code: pd.DataFrame({
+            'PRICE_DATE': dates,
+            'CLOSE_PRICE': np.linspace(100, 159, 60) * (n + 1),
+            'VOLUME': 1000.0,
+        }) for n, code in enumerate(['A', 'B'])}
+        supply = {code: pd.DataFrame({'TRADE_DATE': dates, 'FOREIGN_NET': 1.0, 'INST_NET': 1.0})
+                  for code in prices}
+        news = {'A': pd.DataFrame({'NEWS_DATE': dates[:10], 'SENTIMENT_SCORE': 90}),
+                'B': pd.DataFrame({'NEWS_DATE': dates[:10], 'SENTIMENT_SCORE': 50})}
+        
+        with patch.object(analyzer, '_get_historical_prices', return_value=prices), \
+             patch.object(analyzer, '_get_supply_demand_data', return_value=supply), \
+             patch.object(analyzer, '_get_news_sentiment_history', return_value=news), \
+             patch.object(analyzer, 'save_factor_performance') as save:
+            results = analyzer.analyze_compound_conditions(['A', 'B'])
+        
+        by_key = {r.condition_key: r for r in results}
+        assert set(by_key) == {'news_70_foreign_buy', 'news_70_inst_buy', 'news_80_all_buy'}
+        assert by_key['news_70_foreign_buy'].sample_count == 10
+        assert by_key['news_70_foreign_buy'].win_rate == 1.0
+        assert save.call_count == 3
+
+
 # ============================================================================
 # Tests: group_stocks_by_sector
 # ============================================================================
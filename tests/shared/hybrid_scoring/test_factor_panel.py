@@ -0,0 +1,103 @@
+"""
+tests/shared/hybrid_scoring/test_factor_panel.py - 패널 IC 엔진 테스트
+=====================================================================
+
+shared/hybrid_scoring/factor_panel.py의 종가 패널 구성, 일별 횡단면 Rank IC, IC 요약을 테스트합니다.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from shared.hybrid_scoring.factor_panel import (
+    build_close_panel,
+    compute_panel_ic,
+    cross_sectional_rank_ic,
+    forward_return_panel,
+    summarize_ic,
+)
+
+
+def make_price_frame(closes, start="2024-01-01"):
+    dates = pd.bdate_range(start, periods=len(closes))
+    return pd.DataFrame({"PRICE_DATE": dates, "CLOSE_PRICE": closes})
+
+
+class TestBuildClosePanel:
+
+    def test_aligns_dates_and_drops_short_history(self):
+        price_data = {
+            "A": make_price_frame(np.arange(1, 201, dtype=float)),
+            "B": make_price_frame(np.arange(1, 181, dtype=float), start="2024-01-15"),
+            "SHORT": make_price_frame(np.ones(10)),
+        }
+        panel = build_close_panel(price_data, min_history=150)
+
+        assert list(panel.columns) == ["A", "B"]
+        assert panel.index.is_monotonic_increasing
+        assert panel["B"].isna().sum() == len(panel) - 180
+
+    def test_forward_returns_match_per_stock_definition(self):
+        close = pd.DataFrame({"A": [100.0, 110.0, 121.0, 133.1]})
+        returns = forward_return_panel(close, 1)
+        expected = close["A"].pct_change(1).shift(-1) * 100
+        pd.testing.assert_series_equal(returns["A"], expected, check_names=False)
+
+
+class TestCrossSectionalRankIC:
+
+    def test_matches_row_wise_spearman(self):
+        rng = np.random.default_rng(0)
+        factor = pd.DataFrame(rng.normal(size=(40, 12)))
+        returns = pd.DataFrame(rng.normal(size=(40, 12)))
+        factor.iloc[3, 2] = np.nan
+        returns.iloc[7, 5] = np.nan
+        factor.iloc[9, :4] = 1.0  # 동순위 포함
+
+        ic = cross_sectional_rank_ic(factor, returns, min_stocks=5)
+
+        for row in (0, 3, 7, 9, 39):
+            pair = pd.DataFrame({"f": factor.iloc[row], "r": returns.iloc[row]}).dropna()
+            assert ic.iloc[row] == pytest.approx(pair["f"].corr(pair["r"], method="spearman"))
+
+    def test_min_stocks_and_constant_rows_are_nan(self):
+        factor = pd.DataFrame([[1.0, 2.0, 3.0, np.nan], [5.0, 5.0, 5.0, 5.0]])
+        returns = pd.DataFrame([[1.0, 2.0, 3.0, 4.0], [1.0, 2.0, 3.0, 4.0]])
+
+        ic = cross_sectional_rank_ic(factor, returns, min_stocks=4)
+
+        assert ic.isna().all()
+
+    def test_summarize_ic(self):
+        summary = summarize_ic(pd.Series([0.1, 0.3, -0.1, np.nan]), sample_count=30)
+
+        assert summary.ic_mean == pytest.approx(0.1)
+        assert summary.ir == pytest.approx(0.1 / 0.2)
+        assert summary.hit_rate == pytest.approx(2 / 3)
+        assert (summary.sample_count, summary.date_count) == (30, 3)
+
+
+class TestComputePanelIC:
+
+    def test_predictive_momentum_and_unknown_factor(self):
+        """모멘텀이 미래 수익률을 예측하는 패널 → 1개월 모멘텀 IC 양수, 패널 없는 팩터는 None"""
+        rng = np.random.default_rng(1)
+        drift = np.linspace(-0.002, 0.002, 10)
+        log_returns = drift + rng.normal(scale=0.001, size=(300, 10))
+        close = pd.DataFrame(100 * np.exp(np.cumsum(log_returns, axis=0)),
+                             index=pd.bdate_range("2023-01-02", periods=300))
+
+        results = compute_panel_ic(close, ["momentum_1m", "value_per"], forward_days=5)
+
+        assert results["value_per"] is None
+        assert results["momentum_1m"].ic_mean > 0.5
+        assert results["momentum_1m"].date_count == 300 - 20 - 5
+
+    def test_external_factor_panel(self):
+        rng = np.random.default_rng(2)
+        close = pd.DataFrame(100 * np.cumprod(1 + rng.normal(scale=0.01, size=(60, 6)), axis=0))
+        returns = forward_return_panel(close, 1)
+        results = compute_panel_ic(close, ["supply_foreign_buy"], forward_days=1,
+                                   factor_panels={"supply_foreign_buy": returns})
+
+        assert results["supply_foreign_buy"].ic_mean == pytest.approx(1.0)
@@ -188,6 +188,52 @@ class TestHistoricalPrices:
         assert len(result['005930']) == 5
         assert len(result['000660']) == 5
 
+    def test_get_historical_prices_bulk_matches_per_code(self, repo, in_memory_db, monkeypatch):
+        """일괄 조회(청크 분할 포함) 결과 == 종목별 조회 결과"""
+        import shared.db.factor_repository as factor_repository
+        
+        base_date = datetime(2025, 1, 31)
+        for n, code in enumerate(['005930', '000660', '035420']):
+            for i in range(8 + n):
+                in_memory_db.add(StockDailyPrice(
+                    stock_code=code,
+                    price_date=base_date - timedelta(days=i),
+                    close_price=1000 * (n + 1) + i,
+                    volume=100 + i,
+                    high_price=1100 * (n + 1) + i,
+                    low_price=900 * (n + 1) + i,
+                ))
+        in_memory_db.commit()
+        monkeypatch.setattr(factor_repository, 'PRICE_BULK_CHUNK_SIZE', 2)
+        
+        codes = ['035420', '005930', '999999', '000660']
+        result = repo.get_historical_prices_bulk(codes, days=9)
+        
+        assert list(result.keys()) == codes
+        assert result['999999'].empty
+        for code in ['005930', '000660', '035420']:
+            pd.testing.assert_frame_equal(result[code], repo.get_historical_prices(code, days=9), check_dtype=False)
+    
+    def test_get_historical_price_frame_long_format(self, repo, in_memory_db):
+        """long-format 프레임: 범주형 종목 코드, (종목, 날짜) 오름차순, 종목별 최근 N건"""
+        base_date = datetime(2025, 1, 31)
+        for code in ['000660', '005930']:
+            for i in range(6):
+                in_memory_db.add(StockDailyPrice(
+                    stock_code=code, price_date=base_date - timedelta(days=i),
+                    close_price=100 + i, volume=1, high_price=101, low_price=99,
+                ))
+        in_memory_db.commit()
+        
+        frame = repo.get_historical_price_frame(['005930', '000660'], days=4)
+        
+        assert isinstance(frame['STOCK_CODE'].dtype, pd.CategoricalDtype)
+        assert len(frame) == 8
+        assert frame.groupby('STOCK_CODE', observed=True).size().to_dict() == {'005930': 4, '000660': 4}
+        first = frame[frame['STOCK_CODE'] == '000660']
+        assert first['PRICE_DATE'].is_monotonic_increasing
+        assert first['PRICE_DATE'].iloc[-1] == pd.Timestamp(base_date)
+
 
 # ============================================================================
 # Tests: 종목 마스터 조회
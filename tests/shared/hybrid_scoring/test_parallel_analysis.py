@@ -0,0 +1,114 @@
+"""
+tests/shared/hybrid_scoring/test_parallel_analysis.py - 병렬 분석 작업 테스트
+=========================================================================
+
+shared/hybrid_scoring/parallel_analysis.py의 공유 메모리 패널, IC/조건 작업 실행과
+워커 수와 무관한 결과 순서를 테스트합니다.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from shared.hybrid_scoring.condition_panel import build_condition_panel, panel_arrays
+from shared.hybrid_scoring.factor_panel import compute_panel_ic
+from shared.hybrid_scoring.parallel_analysis import (
+    AnalysisPanels,
+    ConditionJob,
+    ICJob,
+    SharedArrays,
+    resolve_workers,
+    run_jobs,
+)
+
+
+@pytest.fixture
+def close_panel():
+    rng = np.random.default_rng(3)
+    dates = pd.bdate_range("2024-01-02", periods=220)
+    codes = [f"{i:06d}" for i in range(12)]
+    values = 10000 * np.cumprod(1 + rng.normal(scale=0.02, size=(len(dates), len(codes))), axis=0)
+    return pd.DataFrame(values, index=dates, columns=codes)
+
+
+class TestSharedArrays:
+
+    def test_round_trip(self):
+        from multiprocessing import shared_memory
+        from shared.hybrid_scoring.parallel_analysis import _views
+
+        arrays = {"a": np.arange(10, dtype=np.float64), "b": np.array([True, False, True])}
+        shared = SharedArrays(arrays)
+        try:
+            name, layout = shared.spec
+            shm = shared_memory.SharedMemory(name=name)
+            views = _views(shm, layout)
+            np.testing.assert_array_equal(views["a"], arrays["a"])
+            np.testing.assert_array_equal(views["b"], arrays["b"])
+            del views
+            shm.close()
+        finally:
+            shared.close()
+
+
+class TestRunJobs:
+
+    def test_ic_jobs_match_direct_computation(self, close_panel):
+        sector = (0, 2, 4, 6, 8, 10)
+        jobs = [
+            ICJob("momentum_1m", "ALL", 5, None),
+            ICJob("technical_rsi_oversold", "ALL", 20, None),
+            ICJob("momentum_1m", "EVEN", 5, sector),
+            ICJob("quality_roe", "ALL", 5, None),
+        ]
+        results = run_jobs(AnalysisPanels(close=close_panel), jobs, workers=1)
+
+        assert results[0] == compute_panel_ic(close_panel, ["momentum_1m"], 5)["momentum_1m"]
+        assert results[1] == compute_panel_ic(close_panel, ["technical_rsi_oversold"], 20)["technical_rsi_oversold"]
+        assert results[2] == compute_panel_ic(close_panel.iloc[:, list(sector)], ["momentum_1m"], 5)["momentum_1m"]
+        # 종가로 계산할 수 없는 팩터는 None
+        assert results[3] is None
+
+    def test_process_pool_results_in_job_order(self, close_panel):
+        factor_panel = close_panel.pct_change(3)
+        jobs = [ICJob(key, "ALL", days, None)
+                for key in ("momentum_1m", "momentum_6m", "external") for days in (5, 20)]
+        jobs.append(ICJob("external", "FIRST", 5, tuple(range(6))))
+        panels = AnalysisPanels(close=close_panel, factor_panels={"external": factor_panel})
+
+        sequential = run_jobs(panels, jobs, workers=1)
+        parallel = run_jobs(panels, jobs, workers=2)
+
+        assert parallel == sequential
+        assert sequential[4] is not None
+
+    def test_condition_jobs_over_row_ranges(self):
+        dates = pd.bdate_range("2024-01-01", periods=60)
+        prices = {code: pd.DataFrame({
+            "PRICE_DATE": dates,
+            "CLOSE_PRICE": 100 + np.sin(np.arange(60) / (3 + n)) * 10,
+            "VOLUME": np.where(np.arange(60) % 7 == 0, 5000.0, 1000.0),
+        }) for n, code in enumerate(["A", "B"])}
+        panel = build_condition_panel(prices, {}, {}, min_history=1)
+        arrays = panel_arrays(panel, datetime(2024, 3, 1))
+        jobs = [ConditionJob("volume_surge_2x", "STOCK", "A", 0, 60),
+                ConditionJob("volume_surge_2x", "STOCK", "B", 60, 120),
+                ConditionJob("rsi_oversold_30", "STOCK", "B", 60, 120)]
+
+        sequential = run_jobs(AnalysisPanels(condition_arrays=arrays), jobs, workers=1)
+        parallel = run_jobs(AnalysisPanels(condition_arrays=arrays), jobs, workers=2)
+
+        for seq, par in zip(sequential, parallel):
+            np.testing.assert_array_equal(seq.returns, par.returns)
+            np.testing.assert_array_equal(seq.recent_returns, par.recent_returns)
+        # 20일 평균의 2배를 넘는 거래량 급증일 (미래 수익률이 있는 날만)
+        assert len(sequential[0].returns) > 0
+        assert len(sequential[0].recent_returns) < len(sequential[0].returns)
+
+
+def test_resolve_workers():
+    assert resolve_workers(None) == 1
+    assert resolve_workers(3) == 3
+    assert resolve_workers(0) >= 1
@@ -387,3 +387,125 @@ class TestEdgeCases:
         
         assert result.sector == '반도체'
 
+
+
+# ============================================================================
+# Tests: score_universe (일괄 점수 계산)
+# ============================================================================
+
+class TestScoreUniverse:
+    """score_universe가 종목별 calculate_total_quant_score와 같은 결과를 내는지 테스트"""
+    
+    @pytest.fixture
+    def universe(self):
+        import numpy as np
+        rng = np.random.default_rng(7)
+        lengths = {'A': 150, 'B': 120, 'C': 70, 'D': 45, 'E': 20, 'F': 0}
+        frames = {}
+        for code, n in lengths.items():
+            if n == 0:
+                frames[code] = pd.DataFrame()
+                continue
+            frames[code] = pd.DataFrame({
+                'CLOSE_PRICE': np.cumprod(1 + rng.normal(0, 0.02, n)) * 10000,
+                'VOLUME': rng.integers(1000, 100000, n).astype(float),
+            })
+        kospi = pd.DataFrame({'CLOSE_PRICE': np.cumprod(1 + rng.normal(0, 0.01, 150)) * 2500})
+        inputs = {
+            'roe': [12.0, None, -3.0, 25.0, 8.0, None],
+            'pbr': [1.1, 0.4, None, -1.0, 2.5, 1.0],
+            'per': [8.0, None, 35.0, -2.0, 12.0, 9.0],
+            'foreign_net_buy': [250_000, -80_000, None, 1_500_000, 10, None],
+            'foreign_holding_ratio': [30.0, None, 55.0, 5.0, None, None],
+            'sentiment_scores': [50, 80, 20, 75, 50, 50],
+            'news_categories': [None, '수주', '실적', '배당', None, None],
+        }
+        return list(lengths), frames, kospi, inputs
+    
+    @pytest.mark.parametrize("with_kospi", [True, False])
+    def test_matches_per_stock_scoring(self, universe, with_kospi):
+        """일괄 계산 결과 == 종목별 계산 결과 (점수/세부 내역 모두 일치)"""
+        from shared.hybrid_scoring.quant_scorer import QuantScorer
+        
+        codes, frames, kospi, inputs = universe
+        kospi_df = kospi if with_kospi else None
+        scorer = QuantScorer(db_conn=None)
+        
+        expected = [
+            scorer.calculate_total_quant_score(
+                code, code, frames[code], kospi_df,
+                roe=inputs['roe'][i], pbr=inputs['pbr'][i], per=inputs['per'][i],
+                current_sentiment_score=inputs['sentiment_scores'][i],
+                news_category=inputs['news_categories'][i],
+                foreign_net_buy=inputs['foreign_net_buy'][i],
+                foreign_holding_ratio=inputs['foreign_holding_ratio'][i],
+            )
+            for i, code in enumerate(codes)
+        ]
+        close_panel, volume_panel = QuantScorer.build_price_panels(frames, codes, length=150)
+        actual = scorer.score_universe(codes, codes, close_panel, volume_panel, kospi_df, **inputs)
+        
+        for exp, act in zip(expected, actual):
+            assert act.stock_code == exp.stock_code
+            assert act.is_valid == exp.is_valid
+            assert act.invalid_reason == exp.invalid_reason
+            for field_name in ('total_score', 'momentum_score', 'quality_score', 'value_score',
+                               'technical_score', 'news_stat_score', 'supply_demand_score',
+                               'short_term_score', 'long_term_score', 'compound_bonus'):
+                assert getattr(act, field_name) == getattr(exp, field_name), field_name
+            assert act.short_term_grade == exp.short_term_grade
+            assert act.news_timing_signal == exp.news_timing_signal
+            assert act.details == exp.details
+    
+    def test_invalid_rows(self, universe):
+        """데이터 없음/부족 종목은 is_valid=False"""
+        from shared.hybrid_scoring.quant_scorer import QuantScorer
+        
+        codes, frames, _, _ = universe
+        close_panel, volume_panel = QuantScorer.build_price_panels(frames, codes, length=150)
+        results = QuantScorer(db_conn=None).score_universe(codes, codes, close_panel, volume_panel)
+        by_code = {r.stock_code: r for r in results}
+        
+        assert by_code['F'].invalid_reason == '일봉 데이터 없음'
+        assert by_code['E'].invalid_reason == '데이터 부족 (20일)'
+        assert by_code['A'].is_valid is True
+    
+    def test_empty_universe(self):
+        """빈 유니버스"""
+        import numpy as np
+        from shared.hybrid_scoring.quant_scorer import QuantScorer
+        
+        assert QuantScorer(db_conn=None).score_universe([], [], np.empty((150, 0))) == []
+
+
+class TestPrefetchUniverseStats:
+    """FACTOR_PERFORMANCE / NEWS_FACTOR_STATS 일괄 프리페치 테스트"""
+    
+    def test_prefetch_fills_caches_with_one_query_per_table(self):
+        """테이블당 1회 조회 후 종목별 조회는 캐시 사용"""
+        from shared.hybrid_scoring.quant_scorer import QuantScorer
+        
+        db_conn = MagicMock()
+        cursor = db_conn.cursor.return_value
+        scorer = QuantScorer(db_conn=db_conn)
+        db_conn.reset_mock()
+        cursor.fetchall.side_effect = [
+            [('005930', 'RSI_OVERSOLD', 'RSI<30', 0.6, 1.2, 40, 'HIGH', 0.58)],
+            [('005930', '실적', 0.55, 1.0, 10, 'MID'), ('005930', '수주', 0.45, -0.5, 30, 'HIGH')],
+            [('005930', '반도체'), ('000660', None)],
+        ]
+        
+        scorer.prefetch_universe_stats(['005930', '000660'])
+        
+        assert cursor.execute.call_count == 3
+        perf = scorer._load_factor_performance('005930')
+        assert perf['best_win_rate'] == 0.6
+        assert scorer._load_factor_performance('000660')['conditions'] == []
+        assert scorer._load_news_stats('005930', '수주')['win_rate_d5'] == 0.45
+        all_stats = scorer._load_news_stats('005930')
+        assert all_stats['win_rate_d5'] == pytest.approx(0.5)
+        assert all_stats['sample_count'] == 40
+        assert all_stats['confidence'] == 'MID'
+        assert scorer._get_stock_sector('005930') == '반도체'
+        assert scorer._get_stock_sector('000660') == '미분류'
+        assert cursor.execute.call_count == 3  # 추가 조회 없음
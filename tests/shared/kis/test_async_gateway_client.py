@@ -0,0 +1,130 @@
+"""
+tests/shared/kis/test_async_gateway_client.py - 비동기 KIS Gateway 클라이언트 테스트
+===================================================================================
+
+shared/kis/async_gateway_client.py의 일괄/동시 조회, 동시성 제한, 404 폴백을 테스트합니다.
+(httpx.MockTransport로 Gateway 응답 대체)
+"""
+
+import asyncio
+import json
+import time
+
+import httpx
+
+from shared.kis.async_gateway_client import AsyncKISGatewayClient, AsyncRateLimiter
+
+
+def _make_client(handler, **kwargs):
+    client = AsyncKISGatewayClient(gateway_url="http://gateway", **kwargs)
+    client.use_auth = False
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestAsyncRateLimiter:
+
+    def test_limits_rate(self):
+        async def _main():
+            limiter = AsyncRateLimiter(rate=100, burst=1)
+            started = time.monotonic()
+            for _ in range(11):
+                await limiter.acquire()
+            return time.monotonic() - started
+
+        assert 0.08 <= _run(_main()) < 0.5
+
+
+class TestAsyncKISGatewayClient:
+
+    def test_snapshots_use_batch_endpoint(self):
+        """get_stock_snapshots는 일괄 조회 API를 사용"""
+        paths = []
+
+        def handler(request):
+            paths.append(request.url.path)
+            codes = json.loads(request.content)["stock_codes"]
+            return httpx.Response(200, json={
+                "success": True,
+                "data": {code: {"stck_prpr": "100"} for code in codes if code != "999999"},
+                "failed": ["999999"],
+            })
+
+        async def _main():
+            async with _make_client(handler) as client:
+                return await client.get_stock_snapshots(["005930", "000660", "999999", "005930"])
+
+        result = _run(_main())
+
+        assert set(result) == {"005930", "000660"}
+        assert paths == ["/api/market-data/snapshots"]
+
+    def test_snapshots_fall_back_to_single_when_batch_missing(self):
+        """Gateway가 일괄 조회를 지원하지 않으면(404) 종목별 조회"""
+        def handler(request):
+            if request.url.path.endswith("/snapshots"):
+                return httpx.Response(404)
+            code = json.loads(request.content)["stock_code"]
+            return httpx.Response(200, json={"success": True, "data": {"code": code}})
+
+        async def _main():
+            async with _make_client(handler) as client:
+                return await client.get_stock_snapshots(["005930", "000660"])
+
+        assert _run(_main()) == {"005930": {"code": "005930"}, "000660": {"code": "000660"}}
+
+    def test_investor_trends_fan_out_with_bounded_concurrency(self):
+        """종목별 요청을 동시에 보내되 max_concurrency를 넘지 않음"""
+        state = {"active": 0, "peak": 0}
+
+        async def handler(request):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.02)
+            state["active"] -= 1
+            code = json.loads(request.content)["stock_code"]
+            if code == "999999":
+                return httpx.Response(500, text="boom")
+            return httpx.Response(200, json={"success": True, "data": [{"date": "20250101", "code": code}]})
+
+        codes = [f"{i:06d}" for i in range(20)] + ["999999"]
+
+        async def _main():
+            async with _make_client(handler, max_concurrency=4, rate_per_sec=1000) as client:
+                return await client.get_investor_trends(codes)
+
+        started = time.monotonic()
+        result = _run(_main())
+        elapsed = time.monotonic() - started
+
+        assert len(result) == 20 and "999999" not in result
+        assert state["peak"] == 4
+        assert elapsed < 20 * 0.02  # 순차 실행보다 빠름
+
+    def test_investor_trend_sorted_ascending(self):
+        """KIS 응답(최신일 우선)을 일자 오름차순으로 정렬해 마지막 행이 최신일"""
+        def handler(request):
+            return httpx.Response(200, json={"success": True, "data": [
+                {"date": "20250103"}, {"date": "20250102"}, {"date": "20250101"},
+            ]})
+
+        async def _main():
+            async with _make_client(handler) as client:
+                return await client.get_investor_trend("005930")
+
+        assert [row["date"] for row in _run(_main())] == ["20250101", "20250102", "20250103"]
+
+    def test_daily_prices_many_returns_dataframes(self):
+        def handler(request):
+            return httpx.Response(200, json={"success": True, "data": [{"date": "2025-01-01", "close": 1.0}]})
+
+        async def _main():
+            async with _make_client(handler) as client:
+                return await client.get_daily_prices_many(["005930"], num_days_to_fetch=5)
+
+        result = _run(_main())
+        assert list(result["005930"]["close"]) == [1.0]
@@ -0,0 +1,85 @@
+"""
+tests/shared/kis/test_gateway_client.py - KIS Gateway 클라이언트 테스트
+======================================================================
+
+shared/kis/gateway_client.py의 일괄 조회 분할과 종목별 폴백을 테스트합니다.
+(requests.Session.post를 Mock으로 대체)
+"""
+
+import json
+
+import pytest
+import requests
+from unittest.mock import MagicMock
+
+from shared.kis.gateway_client import KISGatewayClient
+
+
+def _response(status_code, body=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = "http://gateway"
+    response._content = json.dumps(body or {}).encode()
+    return response
+
+
+@pytest.fixture
+def gateway():
+    """일괄 조회는 200개 초과 시 400, batch_status로 일괄 조회 응답 코드 지정"""
+    calls = []
+    state = {"batch_status": 200}
+
+    def post(url, headers=None, json=None, timeout=None):
+        if url.endswith("/snapshots"):
+            calls.append(("batch", len(json["stock_codes"])))
+            if state["batch_status"] != 200:
+                return _response(state["batch_status"])
+            if len(json["stock_codes"]) > 200:
+                return _response(400)
+            return _response(200, {
+                "success": True,
+                "data": {code: {"stck_prpr": "100"} for code in json["stock_codes"]},
+            })
+        calls.append(("single", json["stock_code"]))
+        return _response(200, {"success": True, "data": {"price": "50"}})
+
+    client = KISGatewayClient(gateway_url="http://gateway")
+    client.use_auth = False
+    client.API_CALL_DELAY = 0
+    client.session = MagicMock()
+    client.session.post.side_effect = post
+    return client, calls, state
+
+
+class TestGetStockSnapshots:
+
+    def test_batches_are_chunked(self, gateway):
+        """SNAPSHOT_BATCH_SIZE 단위로 나눠 일괄 조회 (중복 종목 제거)"""
+        client, calls, _ = gateway
+        codes = [f"{i:06d}" for i in range(450)]
+
+        snapshots = client.get_stock_snapshots(codes + codes[:10])
+
+        assert len(snapshots) == 450
+        assert calls == [("batch", 200), ("batch", 200), ("batch", 50)]
+
+    def test_falls_back_to_single_on_unavailable(self, gateway):
+        """일괄 조회가 503이면 그 묶음만 종목별 조회로 폴백"""
+        client, calls, state = gateway
+        state["batch_status"] = 503
+
+        snapshots = client.get_stock_snapshots(["005930", "000660"])
+
+        assert snapshots == {"005930": {"price": "50"}, "000660": {"price": "50"}}
+        assert calls == [("batch", 2), ("single", "005930"), ("single", "000660")]
+
+    def test_unsupported_gateway_skips_batch_afterwards(self, gateway):
+        """일괄 조회 404(미지원)면 이후 묶음과 다음 호출은 바로 종목별 조회"""
+        client, calls, state = gateway
+        state["batch_status"] = 404
+        codes = [f"{i:06d}" for i in range(201)]
+
+        assert len(client.get_stock_snapshots(codes)) == 201
+        assert client.get_stock_snapshots(["005930"]) == {"005930": {"price": "50"}}
+        assert calls[0] == ("batch", 200)
+        assert [kind for kind, _ in calls[1:]] == ["single"] * 202
@@ -0,0 +1,88 @@
+"""
+tests/shared/kis/test_quote_cache.py - 시세 캐시 테스트
+=======================================================
+
+shared/kis/quote_cache.py의 TTL 재사용, 동시 요청 합치기, 실패 비캐시를 테스트합니다.
+"""
+
+import threading
+import time
+
+import pytest
+
+from shared.kis.quote_cache import QuoteCache
+
+
+class TestQuoteCache:
+
+    def test_hit_within_ttl(self):
+        """TTL 안에서는 fetch를 다시 호출하지 않음"""
+        cache = QuoteCache(ttl=60)
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return {"stck_prpr": "70000"}
+
+        assert cache.get_or_fetch("005930", fetch) == {"stck_prpr": "70000"}
+        assert cache.get_or_fetch("005930", fetch) == {"stck_prpr": "70000"}
+
+        assert len(calls) == 1
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["hit_rate"] == "50.0%"
+
+    def test_expired_entry_refetched(self):
+        cache = QuoteCache(ttl=0.01)
+        values = iter([1, 2])
+        assert cache.get_or_fetch("k", lambda: next(values)) == 1
+        time.sleep(0.02)
+        assert cache.get_or_fetch("k", lambda: next(values)) == 2
+
+    def test_zero_ttl_disables_cache(self):
+        cache = QuoteCache(ttl=lambda: 0)
+        values = iter([1, 2])
+        assert cache.get_or_fetch("k", lambda: next(values)) == 1
+        assert cache.get_or_fetch("k", lambda: next(values)) == 2
+
+    def test_concurrent_requests_coalesced(self):
+        """동시에 들어온 같은 키 요청은 fetch 1회로 합쳐짐"""
+        cache = QuoteCache(ttl=60)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_fetch():
+            calls.append(1)
+            started.set()
+            release.wait(2)
+            return 42
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(cache.get_or_fetch("k", slow_fetch)))
+        leader.start()
+        started.wait(2)
+        followers = [threading.Thread(target=lambda: results.append(cache.get_or_fetch("k", slow_fetch)))
+                     for _ in range(5)]
+        for t in followers:
+            t.start()
+        time.sleep(0.05)
+        release.set()
+        for t in [leader] + followers:
+            t.join(2)
+
+        assert results == [42] * 6
+        assert len(calls) == 1
+        assert cache.get_stats()["coalesced"] == 5
+
+    def test_failures_not_cached(self):
+        """None/예외 결과는 캐시하지 않음"""
+        cache = QuoteCache(ttl=60)
+        assert cache.get_or_fetch("k", lambda: None) is None
+
+        def boom():
+            raise RuntimeError("KIS down")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_fetch("k", boom)
+        assert cache.get_or_fetch("k", lambda: 7) == 7
@@ -0,0 +1,134 @@
+"""
+tests/shared/kis/test_scheduler.py - KIS 호출 스케줄러 테스트
+=============================================================
+
+shared/kis/scheduler.py의 토큰 버킷, TR_ID 분류, 우선순위 대기열과
+safe_request의 스케줄러/세션 사용을 테스트합니다. (HTTP는 Mock)
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from shared.kis import scheduler as kis_scheduler
+from shared.kis.scheduler import (
+    FAMILY_ACCOUNT,
+    FAMILY_ORDER,
+    FAMILY_QUOTE,
+    PRIORITY_QUOTE,
+    PRIORITY_SELL,
+    KISRequestScheduler,
+    TokenBucket,
+    classify_tr_id,
+)
+
+
+class TestClassifyTrId:
+
+    @pytest.mark.parametrize("tr_id, expected", [
+        ("TTTC0011U", (FAMILY_ORDER, PRIORITY_SELL)),
+        ("VTTC0013U", (FAMILY_ORDER, PRIORITY_SELL)),
+        ("TTTC0012U", (FAMILY_ORDER, kis_scheduler.PRIORITY_ORDER)),
+        ("VTTC8434R", (FAMILY_ACCOUNT, kis_scheduler.PRIORITY_ACCOUNT)),
+        ("CTCA0903R", (FAMILY_ACCOUNT, kis_scheduler.PRIORITY_ACCOUNT)),
+        ("FHKST01010100", (FAMILY_QUOTE, PRIORITY_QUOTE)),
+        ("FHKST01010900", (FAMILY_QUOTE, PRIORITY_QUOTE)),
+        ("", (FAMILY_QUOTE, PRIORITY_QUOTE)),
+    ])
+    def test_families(self, tr_id, expected):
+        assert classify_tr_id(tr_id) == expected
+
+
+class TestTokenBucket:
+
+    def test_burst_then_wait(self):
+        """capacity만큼은 즉시, 이후에는 1/rate 간격"""
+        bucket = TokenBucket(rate=10, capacity=2)
+        now = time.monotonic()
+        for _ in range(2):
+            assert bucket.wait_time(now) == 0
+            bucket.consume(now)
+        assert bucket.wait_time(now) == pytest.approx(0.1, abs=1e-3)
+        assert bucket.wait_time(now + 0.1) == pytest.approx(0.0, abs=1e-9)
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestKISRequestScheduler:
+
+    def test_rate_limits_throughput(self):
+        """초당 50회 한도에서 버스트 이후 10회 추가 호출은 약 0.2초"""
+        scheduler = KISRequestScheduler(rate_per_sec=50, family_rates={FAMILY_QUOTE: 50}, burst=1)
+        started = time.monotonic()
+        for _ in range(11):
+            scheduler.acquire("FHKST01010100")
+        elapsed = time.monotonic() - started
+
+        assert 0.15 <= elapsed < 0.6
+        assert scheduler.get_stats()["families"][FAMILY_QUOTE]["requests"] == 11
+
+    def test_sell_order_preempts_queued_quotes(self):
+        """대기 중인 시세 조회보다 나중에 들어온 매도 주문이 먼저 토큰을 받음"""
+        scheduler = KISRequestScheduler(rate_per_sec=20, family_rates={FAMILY_QUOTE: 20}, burst=1)
+        scheduler.acquire("FHKST01010100")  # 버스트 소진
+        order = []
+        lock = threading.Lock()
+
+        def _call(tr_id, name):
+            scheduler.acquire(tr_id)
+            with lock:
+                order.append(name)
+
+        quotes = [threading.Thread(target=_call, args=("FHKST01010100", f"quote{i}")) for i in range(4)]
+        for t in quotes:
+            t.start()
+        time.sleep(0.01)
+        sell = threading.Thread(target=_call, args=("TTTC0011U", "sell"))
+        sell.start()
+        for t in quotes + [sell]:
+            t.join(timeout=5)
+
+        assert len(order) == 5
+        assert order.index("sell") <= 1
+
+    def test_quote_family_cap_leaves_room_for_orders(self):
+        """시세 계열 한도가 소진되어도 주문은 전체 예산으로 바로 처리"""
+        scheduler = KISRequestScheduler(rate_per_sec=100, family_rates={FAMILY_QUOTE: 1}, burst=10)
+        scheduler.acquire("FHKST01010100")
+
+        waited = scheduler.acquire("TTTC0012U")
+
+        assert waited < 0.05
+
+
+class TestSafeRequestUsesScheduler:
+
+    def test_session_reused_and_no_fixed_sleep(self, monkeypatch):
+        """keep-alive 세션을 재사용하고 API_CALL_DELAY만큼 고정 대기하지 않음"""
+        from shared.kis.request import safe_request
+
+        monkeypatch.setattr(kis_scheduler, "_schedulers", {})
+        client = MagicMock(spec=["headers", "TIMEOUT", "API_CALL_DELAY", "APP_KEY", "TRADING_MODE"])
+        client.headers = {"Authorization": "Bearer x"}
+        client.TIMEOUT = 5
+        client.API_CALL_DELAY = 1.0  # 초당 1회 → 버스트 1
+        client.APP_KEY = "test-key"
+        client.TRADING_MODE = "MOCK"
+
+        response = MagicMock(status_code=200, text='{"rt_cd": "0"}')
+        response.json.return_value = {"rt_cd": "0"}
+        session = MagicMock()
+        session.request.return_value = response
+        client._http_session = session
+
+        started = time.monotonic()
+        result = safe_request(client, "GET", "http://kis/quote", tr_id="TTTC0011U")
+        elapsed = time.monotonic() - started
+
+        assert result == {"rt_cd": "0"}
+        assert session.request.call_count == 1
+        assert elapsed < 0.5
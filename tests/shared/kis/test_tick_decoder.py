@@ -0,0 +1,104 @@
+"""
+tests/shared/kis/test_tick_decoder.py - 실시간 체결 프레임 디코더 테스트
+=====================================================================
+
+shared/kis/tick_decoder.py의 다건 프레임 해석, 비데이터 프레임 무시, 종목별 최신 틱 합치기를 테스트합니다.
+"""
+
+import threading
+import time
+
+from shared.kis.tick_decoder import H0STCNT0_FIELD_COUNT, Tick, TickCoalescer, decode_frame
+
+
+def make_record(code="005930", price=71900, high=72400, volume=3052507, hhmmss="093354"):
+    fields = [""] * H0STCNT0_FIELD_COUNT
+    fields[0], fields[1], fields[2] = code, hhmmss, str(price)
+    fields[5] = "-0.14"  # 전일 대비율 (고가 아님)
+    fields[8], fields[13] = str(high), str(volume)
+    return "^".join(fields)
+
+
+def make_frame(*records, count=None):
+    return f"0|H0STCNT0|{count if count is not None else len(records):03d}|" + "^".join(records)
+
+
+class TestDecodeFrame:
+
+    def test_single_record(self):
+        ticks = decode_frame(make_frame(make_record()))
+        assert ticks == [Tick("005930", 71900.0, 72400.0, 3052507, "093354")]
+
+    def test_multi_record_frame(self):
+        """건수 필드만큼 레코드를 모두 해석"""
+        frame = make_frame(
+            make_record("005930", 71900),
+            make_record("000660", 120000, volume=10),
+            make_record("005930", 72000),
+        )
+        ticks = decode_frame(frame)
+        assert [(t.code, t.price) for t in ticks] == [("005930", 71900.0), ("000660", 120000.0), ("005930", 72000.0)]
+        assert ticks[1].volume == 10
+
+    def test_non_data_frames_ignored(self):
+        assert decode_frame('{"header": {"tr_id": "PINGPONG"}}') == []
+        assert decode_frame("") == []
+        assert decode_frame("0|H0STASP0|001|" + make_record()) == []
+
+    def test_truncated_record_dropped(self):
+        """건수보다 레코드가 적으면 완전한 레코드만 사용"""
+        frame = make_frame(make_record("005930"), make_record("000660")[:20], count=2)
+        assert [t.code for t in decode_frame(frame)] == ["005930"]
+
+
+class TestTickCoalescer:
+
+    def test_latest_tick_per_code(self):
+        """처리 전에 같은 종목 틱이 여러 번 오면 마지막 것만 처리"""
+        handled = []
+        coalescer = TickCoalescer(handled.append)
+        coalescer.push(decode_frame(make_frame(make_record("005930", 1), make_record("000660", 2))))
+        coalescer.push(decode_frame(make_frame(make_record("005930", 3))))
+
+        assert coalescer.drain() == 2
+        assert [(t.code, t.price) for t in handled] == [("005930", 3.0), ("000660", 2.0)]
+        stats = coalescer.get_stats()
+        assert (stats["received"], stats["dispatched"], stats["coalesced"]) == (3, 2, 1)
+
+    def test_slow_handler_does_not_block_push(self):
+        """처리 스레드가 느려도 push는 바로 반환되고, 밀린 틱은 합쳐짐"""
+        release = threading.Event()
+        handled = []
+
+        def handler(tick):
+            release.wait(2)
+            handled.append(tick)
+
+        coalescer = TickCoalescer(handler).start()
+        try:
+            started = time.perf_counter()
+            for price in range(1, 101):
+                coalescer.push([Tick("005930", float(price), 0.0, 0, "")])
+            assert time.perf_counter() - started < 0.5
+            release.set()
+
+            deadline = time.time() + 5
+            while (not handled or handled[-1].price != 100.0) and time.time() < deadline:
+                time.sleep(0.01)
+            assert handled[-1].price == 100.0
+            assert len(handled) < 100
+        finally:
+            coalescer.stop()
+
+    def test_handler_error_does_not_stop_dispatch(self):
+        handled = []
+
+        def handler(tick):
+            if tick.code == "bad":
+                raise ValueError("boom")
+            handled.append(tick.code)
+
+        coalescer = TickCoalescer(handler)
+        coalescer.push([Tick("bad", 1.0, 1.0, 0, ""), Tick("005930", 1.0, 1.0, 0, "")])
+        coalescer.drain()
+        assert handled == ["005930"]
@@ -310,3 +310,139 @@ class TestGetAll:
         assert 'BUY_RSI_OVERSOLD_THRESHOLD' in result
         assert result['SCAN_INTERVAL_SEC'] == 600
 
+
+
+# ============================================================================
+# Tests: CONFIG 스냅샷 / 변경 알림
+# ============================================================================
+
+@pytest.fixture
+def db_backed_config(in_memory_db, monkeypatch):
+    """in-memory DB의 CONFIG 테이블을 읽는 ConfigManager (조회 횟수 기록)"""
+    from contextlib import contextmanager
+    from shared import config as config_module
+    from shared.db.models import Config
+
+    session = in_memory_db["session"]
+    session.add_all([
+        Config(config_key='SELL_STOP_LOSS_PCT', config_value='-4.5'),
+        Config(config_key='MAX_HOLDING_STOCKS', config_value='12'),
+    ])
+    session.commit()
+
+    loads = []
+
+    @contextmanager
+    def fake_session_scope(readonly=False):
+        loads.append(readonly)
+        yield session
+
+    monkeypatch.setattr(config_module, "session_scope", fake_session_scope)
+    monkeypatch.setenv("CONFIG_PUBSUB_ENABLED", "false")
+    manager = config_module.ConfigManager(db_conn=None, cache_ttl=300)
+    return manager, session, loads
+
+
+class TestConfigSnapshot:
+    """CONFIG 테이블 일괄 로드 + negative cache 테스트"""
+
+    def test_bulk_load_once_for_many_keys(self, db_backed_config):
+        """여러 키(없는 키 포함)를 반복 조회해도 DB는 한 번만 읽음"""
+        manager, _, loads = db_backed_config
+
+        for _ in range(50):
+            assert manager.get_float('SELL_STOP_LOSS_PCT', default=-5.0) == -4.5
+            assert manager.get('MAX_HOLDING_STOCKS') == 12  # 기본값 타입(int)으로 변환
+            assert manager.get_float('NOT_IN_CONFIG_TABLE', default=2.0) == 2.0
+
+        assert len(loads) == 1
+
+    def test_snapshot_is_read_only_view(self, db_backed_config):
+        """snapshot()은 수정할 수 없는 뷰"""
+        manager, _, _ = db_backed_config
+        manager.get('SELL_STOP_LOSS_PCT')
+
+        snapshot = manager.snapshot()
+
+        assert snapshot['SELL_STOP_LOSS_PCT'] == '-4.5'
+        with pytest.raises(TypeError):
+            snapshot['SELL_STOP_LOSS_PCT'] = '0'
+
+    def test_reload_swaps_snapshot(self, db_backed_config):
+        """reload()는 새 스냅샷으로 교체 (이전 스냅샷 객체는 그대로)"""
+        from shared.db.models import Config
+        manager, session, _ = db_backed_config
+        manager.get('SELL_STOP_LOSS_PCT')
+        before = manager.snapshot()
+
+        session.query(Config).filter(Config.config_key == 'SELL_STOP_LOSS_PCT').update({'config_value': '-3.0'})
+        session.commit()
+        assert manager.reload() is True
+
+        assert manager.get_float('SELL_STOP_LOSS_PCT') == -3.0
+        assert before['SELL_STOP_LOSS_PCT'] == '-4.5'
+
+    def test_reload_key_updates_only_that_key(self, db_backed_config):
+        """reload_key()는 한 키만 다시 읽어 새 스냅샷으로 교체 (삭제된 키는 스냅샷에서 제거)"""
+        from shared.db.models import Config
+        manager, session, _ = db_backed_config
+        manager.get('SELL_STOP_LOSS_PCT')
+        before = manager.snapshot()
+
+        session.query(Config).filter(Config.config_key == 'SELL_STOP_LOSS_PCT').update({'config_value': '-3.0'})
+        session.commit()
+        assert manager.reload_key('SELL_STOP_LOSS_PCT') is True
+        assert manager.get_float('SELL_STOP_LOSS_PCT') == -3.0
+        assert before['SELL_STOP_LOSS_PCT'] == '-4.5'
+
+        session.query(Config).filter(Config.config_key == 'SELL_STOP_LOSS_PCT').delete()
+        session.commit()
+        assert manager.reload_key('SELL_STOP_LOSS_PCT') is True
+        assert 'SELL_STOP_LOSS_PCT' not in manager.snapshot()
+
+    def test_load_failure_is_not_retried_every_call(self, config_manager, monkeypatch):
+        """DB 로드 실패 후에는 재시도 간격 동안 환경변수/기본값 사용"""
+        from shared import config as config_module
+
+        attempts = []
+
+        def failing_session_scope(readonly=False):
+            attempts.append(readonly)
+            raise RuntimeError("DB down")
+
+        monkeypatch.setattr(config_module, "session_scope", failing_session_scope)
+
+        for _ in range(10):
+            assert config_manager.get('SCAN_INTERVAL_SEC') == 600
+
+        assert len(attempts) == 1
+
+
+class TestConfigChangeNotification:
+    """Redis Pub/Sub 변경 알림 테스트"""
+
+    def test_published_change_reloads_snapshot(self, config_manager, fake_redis, monkeypatch):
+        """변경 알림을 받으면 해당 키의 메모리 캐시를 지우고 그 키만 다시 읽음"""
+        import threading
+        from shared import config as config_module
+
+        from shared.redis_cache import stop_channel_listeners
+
+        monkeypatch.setenv("CONFIG_PUBSUB_ENABLED", "true")
+        reloaded = threading.Event()
+        reloaded_keys = []
+        monkeypatch.setattr(config_manager, "reload_key", lambda key: reloaded_keys.append(key) or reloaded.set())
+        monkeypatch.setattr(config_manager, "reload", lambda: pytest.fail("전체 CONFIG를 다시 읽음"))
+        config_manager._memory_cache['SELL_STOP_LOSS_PCT'] = (-9.9, time.time())
+        config_manager._memory_cache['OTHER_KEY'] = (1, time.time())
+
+        try:
+            assert config_module._ensure_change_listener(config_manager, redis_client=fake_redis) is True
+            assert config_module.publish_config_changed('SELL_STOP_LOSS_PCT', redis_client=fake_redis) is True
+
+            assert reloaded.wait(5)
+            assert reloaded_keys == ['SELL_STOP_LOSS_PCT']
+            assert 'SELL_STOP_LOSS_PCT' not in config_manager._memory_cache
+            assert 'OTHER_KEY' in config_manager._memory_cache
+        finally:
+            stop_channel_listeners()
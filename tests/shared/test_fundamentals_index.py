@@ -0,0 +1,96 @@
+"""
+tests/shared/test_fundamentals_index.py - 시점 기준 재무 인덱스 테스트
+=================================================================
+
+shared/fundamentals_index.py의 as-of 조회(날짜 벡터/단일 날짜/레코드/패널)를 테스트합니다.
+"""
+
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from shared.fundamentals_index import PointInTimeIndex
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def index():
+    """분기 키가 정렬되지 않은 입력 (FactorRepository는 최신 분기부터 반환)"""
+    return PointInTimeIndex.from_quarterly({
+        '005930': {
+            '2024-09-30': {'per': 10.5, 'pbr': 1.2, 'roe': 15.0},
+            '2024-06-30': {'per': 11.0, 'pbr': None, 'roe': 14.5},
+        },
+        '000660': {
+            '2024-09-30': {'per': 8.0, 'pbr': 1.5, 'roe': 18.0},
+        },
+        'EMPTY': {},
+    })
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+class TestLookup:
+
+    def test_date_vector_as_of(self, index):
+        dates = pd.to_datetime(['2024-06-01', '2024-06-30', '2024-08-15', '2024-09-30', '2025-01-02'])
+        values = index.lookup('005930', dates)
+
+        np.testing.assert_array_equal(values['per'], [np.nan, 11.0, 11.0, 10.5, 10.5])
+        np.testing.assert_array_equal(values['pbr'], [np.nan, np.nan, np.nan, 1.2, 1.2])
+
+    def test_unknown_code_returns_nan(self, index):
+        values = index.lookup('999999', ['2024-10-01', '2024-11-01'], ['roe'])
+
+        assert list(values) == ['roe']
+        assert np.isnan(values['roe']).all()
+        assert 'EMPTY' not in index
+        assert len(index) == 2
+
+    def test_matches_linear_scan(self, index):
+        """분기 키 정렬 후 순회하던 기존 방식과 같은 분기 선택"""
+        quarters = {'2024-06-30': 11.0, '2024-09-30': 10.5}
+        dates = pd.bdate_range('2024-06-01', '2024-12-31')
+
+        expected = []
+        for d in dates:
+            applicable = [q for q in sorted(quarters) if q <= d.strftime('%Y-%m-%d')]
+            expected.append(quarters[applicable[-1]] if applicable else np.nan)
+
+        np.testing.assert_array_equal(index.lookup('005930', dates)['per'], expected)
+
+
+class TestScalarLookup:
+
+    def test_as_of(self, index):
+        assert index.as_of('005930', date(2024, 7, 1)) == {'per': 11.0, 'pbr': None, 'roe': 14.5}
+        assert index.as_of('005930', '2024-01-01') == {}
+        assert index.as_of('005930', '2024-01-01', fill_first=True)['per'] == 11.0
+        assert index.as_of('999999', '2024-10-01', fill_first=True) == {}
+
+    def test_record_as_of_keeps_last_duplicate(self):
+        records = {'A': [
+            {'report_date': datetime(2024, 3, 31), 'roe': 5.0, 'report_type': 'Q1'},
+            {'report_date': datetime(2023, 12, 31), 'roe': 4.0, 'report_type': 'Q4'},
+            {'report_date': datetime(2024, 3, 31), 'roe': 6.0, 'report_type': 'Q1-revised'},
+        ]}
+        index = PointInTimeIndex.from_records(records, 'report_date', fields=('roe',))
+
+        assert index.record_as_of('A', pd.Timestamp('2024-02-01'))['report_type'] == 'Q4'
+        assert index.record_as_of('A', datetime(2024, 4, 1))['report_type'] == 'Q1-revised'
+        assert index.record_as_of('A', datetime(2023, 1, 1)) == {}
+        assert index.record_as_of('B', datetime(2024, 4, 1)) == {}
+
+
+def test_panel(index):
+    panel = index.panel('roe', ['2024-07-01', '2024-10-01'], ['005930', '000660', '999999'])
+
+    assert list(panel.columns) == ['005930', '000660', '999999']
+    np.testing.assert_array_equal(panel.to_numpy(), [[14.5, np.nan, np.nan], [15.0, 18.0, np.nan]])
@@ -0,0 +1,181 @@
+"""
+tests/shared/test_pretrade_state.py - 매수 전 상태 스냅샷 Unit Tests
+==================================================================
+
+shared/pretrade_state.py의 동시 조회, 계좌 상태 재사용, 무효화를 테스트합니다.
+"""
+
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+
+
+@pytest.fixture
+def trade_db(monkeypatch):
+    """스레드 간 공유되는 SQLite DB (보유 2종목, 오늘 매수 1건, 5분 전 000660 거래)"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+    from shared import pretrade_state
+    from shared.db.models import Base, Portfolio, TradeLog
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine)
+
+    with SessionLocal() as session:
+        session.add_all([
+            Portfolio(stock_code="005930", stock_name="삼성전자", quantity=10, average_buy_price=70000, status="HOLDING"),
+            Portfolio(stock_code="035420", stock_name="NAVER", quantity=3, average_buy_price=200000, status="HOLDING"),
+            TradeLog(stock_code="000660", trade_type="BUY", quantity=5, price=100000,
+                     trade_timestamp=datetime.utcnow() - timedelta(minutes=5)),
+        ])
+        session.commit()
+
+    @contextmanager
+    def fake_session_scope(readonly=False):
+        session = SessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    monkeypatch.setattr(pretrade_state, "session_scope", fake_session_scope)
+    yield SessionLocal
+    engine.dispose()
+
+
+@pytest.fixture
+def provider(trade_db):
+    from shared.pretrade_state import PreTradeStateProvider
+
+    cash_calls = []
+
+    def get_cash_balance():
+        cash_calls.append(time.time())
+        return 5_000_000.0
+
+    p = PreTradeStateProvider(get_cash_balance, max_age_sec=30)
+    p.cash_calls = cash_calls
+    return p
+
+
+class TestPreTradeState:
+    """매수 전 상태 조회 테스트"""
+
+    def test_cold_load_fetches_everything(self, provider):
+        """처음 조회 시 포트폴리오/오늘 매수/현금/최근 거래를 모두 읽음"""
+        state = provider.get(["000660", "068270"])
+
+        assert state.warm is False
+        assert state.holding_codes == {"005930", "035420"}
+        assert state.today_buy_count == 1
+        assert state.today_buy_amount == 500000
+        assert state.cash == 5_000_000.0
+        assert state.recently_traded == {"000660"}
+        assert {"portfolio", "today_buys", "cash", "recent_trades", "total"} <= set(state.timings)
+
+    def test_account_state_reused_between_signals(self, provider):
+        """두 번째 신호는 계좌 상태를 재사용하고 최근 거래만 다시 확인"""
+        provider.get(["000660"])
+        state = provider.get(["068270"])
+
+        assert state.warm is True
+        assert len(provider.cash_calls) == 1
+        assert state.recently_traded == frozenset()
+        assert "cash" not in state.timings
+
+    def test_invalidate_forces_reload(self, provider):
+        """무효화 후에는 다시 조회"""
+        provider.get([])
+        provider.invalidate("test", rewarm=False)
+
+        state = provider.get([])
+
+        assert state.warm is False
+        assert len(provider.cash_calls) == 2
+
+    def test_stale_or_zero_cash_state_not_reused(self, provider):
+        """max_age가 지났거나 현금 조회가 0(실패)이면 재사용하지 않음"""
+        provider.get([])
+        provider.max_age_sec = -1
+        assert provider.get([]).warm is False
+
+        provider.max_age_sec = 30
+        provider._get_cash_balance = lambda: 0.0
+        provider.invalidate("test", rewarm=False)
+        provider.get([])
+        assert provider.get([]).warm is False
+
+    def test_rewarm_after_invalidate(self, provider):
+        """무효화 시 백그라운드에서 다시 읽어 다음 신호는 warm"""
+        provider.get([])
+        provider.invalidate("fill")
+
+        deadline = time.time() + 5
+        while provider._account is None and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert provider.get([]).warm is True
+        assert len(provider.cash_calls) == 2
+
+    def test_trade_event_invalidates(self, provider, fake_redis):
+        """Redis 체결 이벤트를 받으면 계좌 상태 무효화"""
+        from shared.redis_cache import publish_event, stop_channel_listeners, TRADE_EVENTS_CHANNEL
+
+        provider.get([])
+        try:
+            assert provider.subscribe_trade_events(redis_client=fake_redis) is True
+            assert publish_event(TRADE_EVENTS_CHANNEL, {"trade_type": "SELL", "stock_code": "005930"},
+                                 redis_client=fake_redis) is True
+
+            deadline = time.time() + 5
+            while provider._generation == 0 and time.time() < deadline:
+                time.sleep(0.01)
+            assert provider._generation == 1
+        finally:
+            stop_channel_listeners()
+
+    def test_resubscribes_after_listener_dies(self, provider, fake_redis):
+        """수신 스레드가 끊기면 캐시를 재사용하지 않고 다음 get()에서 재구독"""
+        from shared.redis_cache import is_channel_listening, stop_channel_listeners, TRADE_EVENTS_CHANNEL
+
+        try:
+            assert provider.subscribe_trade_events(redis_client=fake_redis) is True
+            provider.get([])
+            assert provider.get([]).warm is True
+
+            # 연결 끊김 → 수신 스레드 종료
+            stop_channel_listeners()
+            assert is_channel_listening(TRADE_EVENTS_CHANNEL) is False
+
+            # 재시도 간격 전: 재구독하지 않지만 캐시도 재사용하지 않음
+            assert provider.get([]).warm is False
+            assert provider.get([]).warm is False
+            assert is_channel_listening(TRADE_EVENTS_CHANNEL) is False
+
+            provider._resubscribe_at = 0.0
+            assert provider.get([]).warm is False
+            assert is_channel_listening(TRADE_EVENTS_CHANNEL) is True
+            assert provider.get([]).warm is True
+        finally:
+            stop_channel_listeners()
+
+
+class TestStageTimer:
+    """단계별 소요 시간 기록 테스트"""
+
+    def test_stage_accumulates(self):
+        from shared.pretrade_state import StageTimer
+
+        timer = StageTimer()
+        with timer.stage("order"):
+            time.sleep(0.01)
+        with timer.stage("order"):
+            time.sleep(0.01)
+
+        timings = timer.as_ms()
+        assert timings["order"] >= 20
+        assert timings["total"] >= timings["order"]
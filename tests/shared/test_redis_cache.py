@@ -242,6 +242,87 @@ class TestCompetitorBenefitScore:
         assert all_benefits["000660"]["score"] == 10
 
 
+class TestHashLayout:
+    """[v2.0] 해시 + 만료 zset 기반 감성/수혜/알림 저장소 테스트"""
+    
+    def test_sentiment_bulk_and_top_reads(self, fake_redis):
+        """여러 종목 일괄 조회와 점수 순위 조회"""
+        from shared.redis_cache import set_sentiment_score, get_sentiment_scores, get_top_sentiment_scores
+        
+        # Given: 세 종목 저장
+        for code, score in [("005930", 70), ("000660", 90), ("035420", 40)]:
+            set_sentiment_score(code, score, "이유", redis_client=fake_redis)
+        
+        # When / Then: 없는 종목은 제외
+        scores = get_sentiment_scores(["005930", "035420", "999999"], redis_client=fake_redis)
+        assert set(scores) == {"005930", "035420"}
+        assert scores["005930"]["score"] == 70
+        
+        # When / Then: 점수 내림차순 상위 2개
+        top = get_top_sentiment_scores(2, redis_client=fake_redis)
+        assert [code for code, _ in top] == ["000660", "005930"]
+        assert top[0][1]["score"] == 90
+    
+    def test_sentiment_stored_in_hash_not_per_key(self, fake_redis):
+        """종목별 문자열 키 대신 sentiment 해시에 저장"""
+        from shared.redis_cache import set_sentiment_score, SENTIMENT_HASH_KEY, SENTIMENT_RANK_KEY
+        
+        set_sentiment_score("005930", 80, "호재", redis_client=fake_redis)
+        
+        assert fake_redis.keys("sentiment:*") == []
+        assert json.loads(fake_redis.hget(SENTIMENT_HASH_KEY, "005930"))["score"] == 80
+        assert fake_redis.zscore(SENTIMENT_RANK_KEY, "005930") == 80
+    
+    def test_expired_entries_are_skipped_and_pruned(self, fake_redis):
+        """만료 시각이 지난 엔트리는 조회되지 않고 정리됨"""
+        from shared.redis_cache import (
+            set_competitor_benefit_score, get_all_competitor_benefits, get_competitor_benefit_score,
+            COMPETITOR_BENEFIT_HASH_KEY,
+        )
+        
+        set_competitor_benefit_score("000660", 10, "이유1", "005930", "보안사고", redis_client=fake_redis)
+        set_competitor_benefit_score("035420", 8, "이유2", "005930", "보안사고", redis_client=fake_redis)
+        # Given: 000660 만료 처리
+        fake_redis.zadd(f"{COMPETITOR_BENEFIT_HASH_KEY}_expiry", {"000660": 1})
+        
+        assert set(get_all_competitor_benefits(redis_client=fake_redis)) == {"035420"}
+        assert fake_redis.hexists(COMPETITOR_BENEFIT_HASH_KEY, "000660") is False
+        assert get_competitor_benefit_score("000660", redis_client=fake_redis)["score"] == 0
+    
+    def test_legacy_keys_are_migrated_on_bulk_read(self, fake_redis):
+        """레거시 '{prefix}:{code}' 키도 전체 조회에 포함되고 해시로 이전됨"""
+        from shared.redis_cache import get_price_alerts, delete_price_alert, PRICE_ALERT_HASH_KEY
+        
+        # Given: 이전 버전 형식의 가격 알림
+        fake_redis.setex("price_alert:005930", 3600, json.dumps({"stock_name": "삼성전자", "target_price": 80000}))
+        
+        # When
+        alerts = get_price_alerts(redis_client=fake_redis)
+        
+        # Then
+        assert alerts["005930"]["target_price"] == 80000
+        assert fake_redis.exists("price_alert:005930") == 0
+        assert fake_redis.hexists(PRICE_ALERT_HASH_KEY, "005930") is True
+        assert delete_price_alert("005930", redis_client=fake_redis) is True
+        assert get_price_alerts(redis_client=fake_redis) == {}
+
+    def test_legacy_keys_are_migrated_once_on_batch_read(self, fake_redis):
+        """일괄 조회도 첫 호출에 레거시 키를 한 번 이전하고, 이후 미스는 해시만 확인"""
+        from shared.redis_cache import get_sentiment_scores, SENTIMENT_HASH_KEY
+
+        # Given: 이전 버전 형식의 감성 점수
+        fake_redis.setex("sentiment:005930", 3600, json.dumps({"score": 70, "reason": "이전"}))
+
+        # When / Then: 첫 조회에 이전되어 반환
+        scores = get_sentiment_scores(["005930", "000660"], redis_client=fake_redis)
+        assert scores["005930"]["score"] == 70
+        assert fake_redis.hexists(SENTIMENT_HASH_KEY, "005930") is True
+
+        # When / Then: 이전 이후 새로 생긴 레거시 키는 더 이상 읽지 않음
+        fake_redis.setex("sentiment:000660", 3600, json.dumps({"score": 60, "reason": "이전"}))
+        assert set(get_sentiment_scores(["005930", "000660"], redis_client=fake_redis)) == {"005930"}
+
+
 class TestGenericRedisData:
     """일반 Redis 데이터 저장/조회 테스트"""
     
@@ -362,3 +443,43 @@ class TestEdgeCases:
         assert "반도체" in cached["sectors"]
         assert cached["market_context_dict"]["confidence"] == 0.85
 
+
+
+class TestDashboardStream:
+    """대시보드 이벤트 스트림 (XADD/XREAD) 테스트"""
+
+    def test_append_and_read_in_order(self, fake_redis):
+        """추가한 순서대로 type/data가 복원됨"""
+        from shared.redis_cache import append_stream_event, read_stream_events
+
+        first = append_stream_event("price", {"stock_code": "005930", "price": 71000}, redis_client=fake_redis)
+        append_stream_event("fill", {"trade_type": "BUY", "stock_code": "000660"}, redis_client=fake_redis)
+
+        events = read_stream_events("0-0", redis_client=fake_redis)
+
+        assert [e[1]["type"] for e in events] == ["price", "fill"]
+        assert events[0] == (first, {"type": "price", "data": {"stock_code": "005930", "price": 71000}})
+
+    def test_read_after_last_id(self, fake_redis):
+        """마지막 ID 이후 이벤트만 읽고, 새 이벤트가 없으면 빈 리스트"""
+        from shared.redis_cache import append_stream_event, read_stream_events, get_stream_last_id
+
+        assert get_stream_last_id(redis_client=fake_redis) == "0-0"
+        append_stream_event("price", {"stock_code": "005930", "price": 71000}, redis_client=fake_redis)
+        last_id = get_stream_last_id(redis_client=fake_redis)
+
+        assert read_stream_events(last_id, redis_client=fake_redis) == []
+
+        append_stream_event("pipeline", {"phase": 2}, redis_client=fake_redis)
+        events = read_stream_events(last_id, redis_client=fake_redis)
+        assert [e[1]["data"] for e in events] == [{"phase": 2}]
+
+    def test_read_failure_returns_none(self):
+        """Redis 오류 시 None (빈 리스트와 구분)"""
+        from shared.redis_cache import read_stream_events
+
+        class BrokenRedis:
+            def xread(self, *args, **kwargs):
+                raise ConnectionError("down")
+
+        assert read_stream_events("0-0", redis_client=BrokenRedis()) is None
@@ -0,0 +1,221 @@
+"""
+tests/shared/test_strategy.py - 전략 지표 테스트
+===============================================
+
+shared/strategy.py의 지표 계산 함수와 IncrementalIndicatorState를 테스트합니다.
+"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def _wilder_rsi(prices, period=14):
+    """Rust strategy_core.rsi와 동일한 참조 구현 (prices: 과거 → 최신)"""
+    avg_gain = sum(max(prices[i] - prices[i - 1], 0) for i in range(1, period + 1)) / period
+    avg_loss = sum(max(prices[i - 1] - prices[i], 0) for i in range(1, period + 1)) / period
+    for i in range(period + 1, len(prices)):
+        delta = prices[i] - prices[i - 1]
+        avg_gain = ((period - 1) * avg_gain + max(delta, 0)) / period
+        avg_loss = ((period - 1) * avg_loss + max(-delta, 0)) / period
+    if avg_loss == 0:
+        return 100.0 if avg_gain > 0 else 50.0
+    return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+def _wilder_atr(highs, lows, closes, period=14):
+    """Rust strategy_core.atr와 동일한 참조 구현"""
+    trs = [max(highs[i] - lows[i], abs(highs[i] - closes[i - 1]), abs(lows[i] - closes[i - 1]))
+           for i in range(1, len(closes))]
+    if len(trs) < period:
+        return None
+    atr = sum(trs[:period]) / period
+    for tr in trs[period:]:
+        atr = ((period - 1) * atr + tr) / period
+    return atr
+
+
+def _make_daily_df(closes):
+    return pd.DataFrame({
+        'PRICE_DATE': pd.date_range('2025-01-01', periods=len(closes)),
+        'CLOSE_PRICE': closes,
+        'OPEN_PRICE': closes,
+        'HIGH_PRICE': [c * 1.02 for c in closes],
+        'LOW_PRICE': [c * 0.98 for c in closes],
+    })
+
+
+@pytest.fixture
+def daily_df():
+    closes = [10000 + (i % 7) * 150 - (i % 3) * 90 + i * 20 for i in range(30)]
+    return _make_daily_df(closes)
+
+
+# ============================================================================
+# Tests: IncrementalIndicatorState
+# ============================================================================
+
+class TestIncrementalIndicatorState:
+    """증분 지표 상태 테스트"""
+
+    def test_rsi_matches_full_recompute(self, daily_df):
+        """틱 가격 반영 RSI가 전체 재계산(Wilder)과 동일"""
+        from shared.strategy import IncrementalIndicatorState
+
+        state = IncrementalIndicatorState('005930', daily_df, seed_date=date(2025, 1, 31))
+        closes = daily_df['CLOSE_PRICE'].tolist()
+
+        for price in (9500, 10500, 11200, closes[-1]):
+            expected = _wilder_rsi(closes + [price])
+            assert state.rsi(price) == pytest.approx(expected)
+
+    def test_atr_matches_wilder(self, daily_df):
+        """ATR이 Wilder 방식 전체 계산과 동일"""
+        from shared.strategy import IncrementalIndicatorState
+
+        state = IncrementalIndicatorState('005930', daily_df)
+        highs = daily_df['HIGH_PRICE'].tolist()
+        lows = daily_df['LOW_PRICE'].tolist()
+        closes = daily_df['CLOSE_PRICE'].tolist()
+        trs = [max(highs[i] - lows[i], abs(highs[i] - closes[i - 1]), abs(lows[i] - closes[i - 1]))
+               for i in range(1, len(closes))]
+        expected = sum(trs[:14]) / 14
+        for tr in trs[14:]:
+            expected = (13 * expected + tr) / 14
+
+        assert state.atr == pytest.approx(expected)
+
+    def test_death_cross_matches_dataframe_check(self):
+        """데드 크로스 판정이 check_death_cross(일봉 + 현재가)와 동일"""
+        from shared.strategy import IncrementalIndicatorState, check_death_cross
+
+        # 상승 후 단기 조정: 큰 하락 틱에서 5일선이 20일선을 하향 돌파
+        closes = [10000 + i * 10 for i in range(25)] + [10100, 10050, 10000, 9980, 9960]
+        df = _make_daily_df(closes)
+        state = IncrementalIndicatorState('000660', df)
+
+        for price in (12000, 10000, 9000, 8000):
+            with_tick = pd.concat([df, _make_daily_df([price])], ignore_index=True)
+            assert state.is_death_cross(price) == check_death_cross(with_tick)
+
+    def test_insufficient_data(self):
+        """데이터 부족 시 지표 없음"""
+        from shared.strategy import IncrementalIndicatorState
+
+        state = IncrementalIndicatorState('005930', _make_daily_df([100, 101, 102]))
+
+        assert state.bar_count == 3
+        assert state.atr is None
+        assert state.rsi(105) is None
+        assert state.is_death_cross(90) is False
+
+    def test_empty_dataframe(self):
+        """빈 DataFrame 처리"""
+        from shared.strategy import IncrementalIndicatorState
+
+        state = IncrementalIndicatorState('005930', pd.DataFrame())
+
+        assert state.bar_count == 0
+        assert state.rsi(100) is None
+
+    def test_is_stale_on_day_rollover(self, daily_df):
+        """시드 일자와 다른 날이면 재시드 필요"""
+        from shared.strategy import IncrementalIndicatorState
+
+        state = IncrementalIndicatorState('005930', daily_df, seed_date=date(2025, 1, 31))
+
+        assert state.is_stale(date(2025, 1, 31)) is False
+        assert state.is_stale(date(2025, 2, 1)) is True
+
+
+class TestCalculateRsiPanel:
+    """calculate_rsi_panel 벡터화 결과가 종목별 calculate_rsi와 같은지 테스트"""
+    
+    @pytest.mark.parametrize("rust_enabled", [True, False])
+    def test_matches_scalar_rsi(self, monkeypatch, rust_enabled):
+        import numpy as np
+        import shared.strategy as strategy
+        
+        monkeypatch.setattr(strategy, '_RUST_BACKEND_ENABLED', rust_enabled)
+        if rust_enabled:
+            # Rust 미설치 환경: 참조 Wilder 구현으로 대체
+            monkeypatch.setattr(strategy, '_rust_rsi', lambda prices, period: _wilder_rsi(prices, period), raising=False)
+        
+        rng = np.random.default_rng(3)
+        panel = np.cumprod(1 + rng.normal(0, 0.02, (60, 3)), axis=0) * 1000
+        panel[:40, 1] = np.nan  # 20봉만 있는 종목
+        panel[:50, 2] = np.nan  # 10봉만 있는 종목 (부족)
+        
+        result = strategy.calculate_rsi_panel(panel, period=14)
+        
+        assert result[0] == pytest.approx(_wilder_rsi(list(panel[:, 0])) if rust_enabled
+                                          else strategy.calculate_rsi(pd.DataFrame({'CLOSE_PRICE': panel[:, 0]})))
+        assert result[1] == pytest.approx(_wilder_rsi(list(panel[40:, 1])) if rust_enabled
+                                          else strategy.calculate_rsi(pd.DataFrame({'CLOSE_PRICE': panel[40:, 1]})))
+        assert np.isnan(result[2])
+
+
+class TestIndicatorSeries:
+    """*_series 함수의 t번째 값 == 같은 지표를 iloc[:t+1]로 계산한 값"""
+    
+    @pytest.fixture
+    def ohlc_df(self):
+        import numpy as np
+        rng = np.random.default_rng(5)
+        closes = np.cumprod(1 + rng.normal(0, 0.02, 60)) * 10000
+        return pd.DataFrame({
+            'CLOSE_PRICE': closes,
+            'HIGH_PRICE': closes * 1.01,
+            'LOW_PRICE': closes * 0.985,
+        }, index=pd.date_range('2024-01-01', periods=60))
+    
+    @pytest.mark.parametrize("rust_enabled", [True, False])
+    def test_series_match_last_value_functions(self, monkeypatch, ohlc_df, rust_enabled):
+        import numpy as np
+        import shared.strategy as strategy
+        
+        monkeypatch.setattr(strategy, '_RUST_BACKEND_ENABLED', rust_enabled)
+        if rust_enabled:
+            # Rust 미설치 환경: 참조 Wilder 구현으로 대체
+            monkeypatch.setattr(strategy, '_rust_rsi', lambda prices, period: _wilder_rsi(prices, period), raising=False)
+            monkeypatch.setattr(strategy, '_rust_atr', _wilder_atr, raising=False)
+        
+        rsi = strategy.calculate_rsi_series(ohlc_df)
+        atr = strategy.calculate_atr_series(ohlc_df)
+        bb = strategy.calculate_bollinger_series(ohlc_df)
+        cross = strategy.calculate_cross_series(ohlc_df)
+        
+        for t in range(1, len(ohlc_df)):
+            window = ohlc_df.iloc[:t + 1]
+            for series_value, scalar in (
+                (rsi.iloc[t], strategy.calculate_rsi(window)),
+                (atr.iloc[t], strategy.calculate_atr(window)),
+                (bb['BB_LOWER'].iloc[t], strategy.calculate_bollinger_bands(window)),
+            ):
+                if scalar is None or np.isnan(scalar):
+                    assert np.isnan(series_value)
+                else:
+                    assert series_value == pytest.approx(scalar, rel=1e-12)
+            assert bool(cross['GOLDEN_CROSS'].iloc[t]) == strategy.check_golden_cross(window)
+            assert bool(cross['DEATH_CROSS'].iloc[t]) == strategy.check_death_cross(window)
+    
+    def test_cache_reuses_until_data_changes(self, ohlc_df):
+        from shared.strategy import IndicatorSeriesCache
+        
+        cache = IndicatorSeriesCache(maxsize=2)
+        first = cache.get('005930', ohlc_df, 'atr', period=14)
+        assert cache.get('005930', ohlc_df, 'atr', period=14) is first
+        assert cache.hits == 1
+        
+        # 파라미터가 다르면 별도 항목, 데이터가 늘어나면 재계산
+        assert cache.get('005930', ohlc_df, 'atr', period=10) is not first
+        assert cache.get('005930', ohlc_df.iloc[:-1], 'atr', period=14) is not first
+        assert len(cache._entries) == 2  # maxsize
+        
+        with pytest.raises(ValueError):
+            cache.get('005930', ohlc_df, 'unknown')
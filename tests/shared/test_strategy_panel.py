@@ -0,0 +1,141 @@
+"""
+tests/shared/test_strategy_panel.py - 패널 지표 테스트
+=====================================================
+
+shared/strategy_panel.py의 (일자 × 종목) 패널 지표가 종목별 스칼라 계산과
+같은 값을 내는지 테스트합니다.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def panel():
+    """80일 × 3종목 종가 패널 (종목 1은 50일, 종목 2는 10일만 존재)"""
+    rng = np.random.default_rng(11)
+    closes = np.cumprod(1 + rng.normal(0, 0.02, (80, 3)), axis=0) * 10000
+    closes[:30, 1] = np.nan
+    closes[:70, 2] = np.nan
+    return closes
+
+
+def _wilder(values, period):
+    avg = sum(values[:period]) / period
+    for v in values[period:]:
+        avg = ((period - 1) * avg + v) / period
+    return avg
+
+
+def _wilder_rsi(prices, period=14):
+    deltas = np.diff(prices)
+    gain = _wilder(np.maximum(deltas, 0), period)
+    loss = _wilder(np.maximum(-deltas, 0), period)
+    if loss == 0:
+        return 100.0 if gain > 0 else 50.0
+    return 100 - 100 / (1 + gain / loss)
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+class TestStrategyPanel:
+    """패널 지표 == 종목별 계산"""
+    
+    def test_moving_average(self, panel):
+        from shared.strategy_panel import moving_average_panel
+        
+        result = moving_average_panel(panel, period=20)
+        
+        assert result.shape == panel.shape
+        assert result[-1, 0] == pytest.approx(panel[-20:, 0].mean())
+        assert np.isnan(result[18, 0]) and not np.isnan(result[19, 0])
+        assert np.isnan(result[:, 2]).all()  # 10일 < 20일
+    
+    def test_rsi_full_series_matches_scalar_wilder(self, panel):
+        from shared.strategy_panel import rsi_panel
+        
+        result = rsi_panel(panel, period=14)
+        
+        for t in (14, 40, 79):
+            assert result[t, 0] == pytest.approx(_wilder_rsi(panel[:t + 1, 0]))
+        assert np.isnan(result[13, 0])
+        assert result[-1, 1] == pytest.approx(_wilder_rsi(panel[30:, 1]))
+        assert np.isnan(result[:, 2]).all()  # 변화량 9개 < 14
+    
+    def test_rsi_flat_prices(self):
+        from shared.strategy_panel import rsi_panel
+        
+        assert rsi_panel(np.full(20, 100.0))[-1, 0] == 50.0
+        assert rsi_panel(np.arange(20, dtype=float))[-1, 0] == 100.0
+    
+    def test_atr(self, panel):
+        from shared.strategy_panel import atr_panel
+        
+        high, low = panel * 1.01, panel * 0.98
+        result = atr_panel(high, low, panel, period=14)
+        
+        c = panel[30:, 1]
+        h, l = high[30:, 1], low[30:, 1]
+        tr = np.maximum.reduce([h[1:] - l[1:], np.abs(h[1:] - c[:-1]), np.abs(l[1:] - c[:-1])])
+        assert result[-1, 1] == pytest.approx(_wilder(tr, 14))
+        assert np.isnan(result[30 + 13, 1])
+    
+    def test_bollinger_matches_pandas(self, panel):
+        from shared.strategy import calculate_bollinger_bands
+        from shared.strategy_panel import bollinger_panel
+        
+        mid, upper, lower = bollinger_panel(panel, period=20, num_std=2)
+        
+        df = pd.DataFrame({'CLOSE_PRICE': panel[30:, 1]})
+        assert lower[-1, 1] == pytest.approx(calculate_bollinger_bands(df, period=20, std_dev=2))
+        assert upper[-1, 1] - mid[-1, 1] == pytest.approx(mid[-1, 1] - lower[-1, 1])
+    
+    def test_momentum_matches_scalar(self, panel):
+        from shared.strategy import calculate_momentum
+        from shared.strategy_panel import momentum_panel
+        
+        result = momentum_panel(panel, period=5)
+        
+        for code, start in ((0, 0), (1, 30), (2, 70)):
+            df = pd.DataFrame({'CLOSE_PRICE': panel[start:, code]})
+            assert result[-1, code] == pytest.approx(calculate_momentum(df, period=5))
+    
+    def test_cross_flags_match_scalar(self, panel):
+        from shared.strategy import check_death_cross, check_golden_cross
+        from shared.strategy_panel import cross_panel
+        
+        golden, death = cross_panel(panel, short_period=5, long_period=20)
+        
+        assert golden.dtype == bool and golden.shape == panel.shape
+        for t in range(20, 80):
+            df = pd.DataFrame({'CLOSE_PRICE': panel[:t + 1, 0]})
+            assert golden[t, 0] == check_golden_cross(df)
+            assert death[t, 0] == check_death_cross(df)
+        assert golden[:, 0].any() or death[:, 0].any()
+    
+    def test_accepts_dataframe_and_validates(self, panel):
+        from shared.strategy_panel import atr_panel, rsi_panel
+        
+        df = pd.DataFrame(panel)
+        np.testing.assert_array_equal(rsi_panel(df), rsi_panel(panel))
+        with pytest.raises(ValueError):
+            rsi_panel(panel, period=0)
+        with pytest.raises(ValueError):
+            atr_panel(panel, panel[:, :2], panel)
+    
+    def test_right_aligned_panel(self):
+        from shared.strategy_panel import right_aligned_panel
+        
+        result = right_aligned_panel([[1.0, 2.0, 3.0], [4.0], []])
+        
+        np.testing.assert_array_equal(result[:, 0], [1.0, 2.0, 3.0])
+        np.testing.assert_array_equal(result[:, 1], [np.nan, np.nan, 4.0])
+        assert np.isnan(result[:, 2]).all()
+        np.testing.assert_array_equal(right_aligned_panel([[1.0, 2.0, 3.0]], length=2)[:, 0], [2.0, 3.0])
@@ -23,6 +23,7 @@ from datetime import datetime, timedelta, time
 from typing import Dict, List, Tuple
 import argparse
 from dotenv import load_dotenv
+import numpy as np
 import pandas as pd
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 
@@ -32,7 +33,9 @@ sys.path.append(PROJECT_ROOT)
 
 import shared.auth as auth
 import shared.database as database
+from shared.database.price_store import read_fresh_frames
 import shared.strategy as strategy
+from shared.strategy_panel import bollinger_panel, moving_average_panel, right_aligned_panel
 from shared.market_regime import MarketRegimeDetector, StrategySelector
 # [개선 v2] Live Agent와 동일한 로직을 사용하기 위해 모듈 임포트
 from shared.config import ConfigManager
@@ -43,6 +46,7 @@ from shared.kis.client import KISClient as KIS_API
 from shared.kis.gateway_client import KISGatewayClient
 
 from shared.factor_scoring import FactorScorer
+from shared.fundamentals_index import PointInTimeIndex
 import json # JSON 로깅을 위해 추가
 
 import logging.handlers
@@ -190,7 +194,12 @@ def load_price_series(connection, stock_code: str) -> pd.DataFrame:
     특정 코드의 3년치 일봉 시계열을 날짜 오름차순으로 로드합니다.
     
     ⚠️ 중요: STOCK_DAILY_PRICES_3Y 테이블을 사용합니다 (30일치 STOCK_DAILY_PRICES 아님)
+    로컬 Arrow 캐시(PRICE_STORE_DIR)에서 이 종목이 DB보다 뒤처지지 않았으면 DB 대신 캐시에서 읽습니다.
     """
+    cached = read_fresh_frames(connection, [stock_code], include_code=False)
+    if stock_code in cached:
+        return cached[stock_code]
+
     cur = None
     try:
         cur = connection.cursor()
@@ -555,6 +564,7 @@ class Backtester:
         # Data caches
         self.all_prices_cache: Dict[str, pd.DataFrame] = {}
         self.all_fundamentals_cache: Dict[str, Dict] = {}
+        self.fundamentals_index = PointInTimeIndex()  # 재무 데이터 as-of 조회 인덱스
         self.stock_names: Dict[str, str] = {} # [v16.6] code -> name mapping
 
         # 시뮬레이션 범위
@@ -668,55 +678,74 @@ class Backtester:
         """시뮬레이션에 필요한 모든 데이터를 미리 로드하여 캐시에 저장 및 지표 선계산"""
         logger.info(f"Preloading data and calculating indicators for {len(stock_codes)} stocks...")
         
-        # 1. 가격 데이터 프리로드 및 지표 계산
+        # 1. 가격 데이터 프리로드
+        frames = {}
         for code in stock_codes:
             df = load_price_series(self.connection, code)
             if not df.empty:
                 df['PRICE_DATE'] = pd.to_datetime(df['PRICE_DATE'])
                 df.set_index('PRICE_DATE', inplace=True)
-                
-                # --- 지표 선계산 ---
-                # RSI (14)
-                delta = df['CLOSE_PRICE'].diff()
-                gain = delta.where(delta > 0, 0)
-                loss = -delta.where(delta < 0, 0)
-                avg_gain = gain.ewm(com=13, min_periods=14).mean()
-                avg_loss = loss.ewm(com=13, min_periods=14).mean()
-                rs = avg_gain / avg_loss
-                df['RSI'] = 100 - (100 / (1 + rs))
-                
-                # ATR (14)
-                prev_close = df['CLOSE_PRICE'].shift(1)
-                tr1 = df['HIGH_PRICE'] - df['LOW_PRICE']
-                tr2 = (df['HIGH_PRICE'] - prev_close).abs()
-                tr3 = (df['LOW_PRICE'] - prev_close).abs()
-                tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-                df['ATR'] = tr.ewm(com=13, min_periods=14).mean()
-                
-                # Bollinger Bands (20, 2)
-                ma20 = df['CLOSE_PRICE'].rolling(window=20).mean()
-                std20 = df['CLOSE_PRICE'].rolling(window=20).std()
-                df['BB_UPPER'] = ma20 + (std20 * 2)
-                df['BB_LOWER'] = ma20 - (std20 * 2)
-                
-                # Moving Averages
-                df['MA_5'] = df['CLOSE_PRICE'].rolling(window=5).mean()
-                df['MA_20'] = ma20
-                df['MA_60'] = df['CLOSE_PRICE'].rolling(window=60).mean()
-                df['MA_120'] = df['CLOSE_PRICE'].rolling(window=120).mean()
-                
-                # Volume MA
-                df['VOL_MA_20'] = df['VOLUME'].rolling(window=20).mean()
-                
-                # Resistance Level (20-day High, shifted by 1 to represent yesterday's high)
-                # 당일 고가 돌파 여부를 확인하기 위해, 전날까지의 20일 고점을 저항선으로 사용
-                df['RES_20'] = df['HIGH_PRICE'].rolling(window=20).max().shift(1)
-                
-                self.all_prices_cache[code] = df
+                frames[code] = df
+        
+        # --- 지표 선계산 (전 종목을 한 번에) ---
+        self._precompute_indicators(frames)
+        self.all_prices_cache.update(frames)
         
         # 2. 펀더멘털 데이터 프리로드 (전체 로드)
         self._preload_financial_data(stock_codes)
 
+    @staticmethod
+    def _precompute_indicators(frames: Dict[str, pd.DataFrame]):
+        """
+        종목별 일봉을 우측 정렬 (일자 × 종목) 패널로 쌓아 지표를 전 종목 한 번에 계산하고 컬럼으로 붙입니다.
+        (종목별 pandas 계산과 같은 정의: RSI/ATR은 ewm(com=13), 나머지는 단순 이동 창)
+        """
+        if not frames:
+            return
+        codes = list(frames)
+        close = right_aligned_panel([frames[c]['CLOSE_PRICE'].to_numpy(dtype=float) for c in codes])
+        high = right_aligned_panel([frames[c]['HIGH_PRICE'].to_numpy(dtype=float) for c in codes])
+        low = right_aligned_panel([frames[c]['LOW_PRICE'].to_numpy(dtype=float) for c in codes])
+        volume = right_aligned_panel([frames[c]['VOLUME'].to_numpy(dtype=float) for c in codes])
+        
+        # RSI (14): 종목별 첫 행(변화량 없음)은 0으로 시작, 상장 전 구간은 NaN으로 남김
+        close_df = pd.DataFrame(close)
+        delta = close_df.diff()
+        listed = close_df.notna()
+        gain = delta.where(delta > 0, 0).where(listed)
+        loss = (-delta).where(delta < 0, 0).where(listed)
+        avg_gain = gain.ewm(com=13, min_periods=14).mean()
+        avg_loss = loss.ewm(com=13, min_periods=14).mean()
+        rsi = (100 - (100 / (1 + avg_gain / avg_loss))).to_numpy()
+        
+        # ATR (14)
+        prev_close = np.vstack([np.full((1, close.shape[1]), np.nan), close[:-1]])
+        tr = np.fmax.reduce([high - low, np.abs(high - prev_close), np.abs(low - prev_close)])
+        atr = pd.DataFrame(tr).ewm(com=13, min_periods=14).mean().to_numpy()
+        
+        # Bollinger Bands (20, 2) / Moving Averages / Volume MA
+        ma20, bb_upper, bb_lower = bollinger_panel(close, period=20, num_std=2)
+        columns = {
+            'RSI': rsi,
+            'ATR': atr,
+            'BB_UPPER': bb_upper,
+            'BB_LOWER': bb_lower,
+            'MA_5': moving_average_panel(close, 5),
+            'MA_20': ma20,
+            'MA_60': moving_average_panel(close, 60),
+            'MA_120': moving_average_panel(close, 120),
+            'VOL_MA_20': moving_average_panel(volume, 20),
+            # Resistance Level (20-day High, shifted by 1 to represent yesterday's high)
+            # 당일 고가 돌파 여부를 확인하기 위해, 전날까지의 20일 고점을 저항선으로 사용
+            'RES_20': pd.DataFrame(high).rolling(window=20).max().shift(1).to_numpy(),
+        }
+        
+        for j, code in enumerate(codes):
+            df = frames[code]
+            start = close.shape[0] - len(df)
+            for name, values in columns.items():
+                df[name] = values[start:, j]
+
     def _preload_financial_data(self, stock_codes: List[str]):
         """모든 종목의 재무 데이터를 미리 로드"""
         logger.info("Preloading financial data...")
@@ -758,19 +787,16 @@ class Backtester:
         finally:
             if cur:
                 cur.close()
+        
+        # 종목별 공시일 정렬 배열을 한 번 만들어 두고 조회는 이진 탐색
+        self.fundamentals_index = PointInTimeIndex.from_records(
+            self.all_fundamentals_cache, 'report_date',
+            fields=('sales_growth', 'eps_growth', 'sales', 'net_income', 'roe'),
+        )
 
     def _get_financial_data(self, code, current_date):
-        """캐시된 재무 데이터에서 해당 날짜 기준 최신 데이터 조회"""
-        if code not in self.all_fundamentals_cache:
-            return {}
-        
-        # 날짜순으로 정렬되어 있다고 가정
-        reports = self.all_fundamentals_cache[code]
-        # 뒤에서부터 검색 (최신 데이터 우선)
-        for report in reversed(reports):
-            if report['report_date'] <= current_date:
-                return report
-        return {}
+        """캐시된 재무 데이터에서 해당 날짜 기준 최신 데이터 조회 (PointInTimeIndex as-of)"""
+        return self.fundamentals_index.record_as_of(code, current_date)
             
         logger.info(f"Preloading complete. Loaded prices for {len(self.all_prices_cache)} stocks.")
 
@@ -1378,7 +1404,23 @@ class Backtester:
         return abs(max_drawdown)
 
     def _slice_until_date(self, df: pd.DataFrame, current_date) -> pd.DataFrame:
-        return df[df.index <= current_date]
+        # 인덱스는 날짜 오름차순 → 이진 탐색 후 슬라이스 (전체 불리언 마스크 생성 없음)
+        return df.iloc[:df.index.searchsorted(current_date, side='right')]
+
+    def _indicator_at(self, code: str, indicator: str, as_of_date, **params):
+        """
+        [v16.7] 전체 시계열을 종목별로 한 번 계산(캐시)해 두고 해당 날짜 값만 조회합니다.
+        (df_window로 매번 재계산하는 O(N²) 방지, 값이 없으면 None)
+        """
+        df = self.all_prices_cache.get(code)
+        if df is None or df.empty:
+            return None
+        series = strategy.get_indicator_series(code, df, indicator, **params)
+        pos = series.index.searchsorted(as_of_date, side='right')
+        if pos == 0:
+            return None
+        value = series.iloc[pos - 1]
+        return None if pd.isna(value) else float(value)
     
     def _generate_virtual_intraday_price(self, df_window: pd.DataFrame, interval_idx: int, total_intervals: int) -> float:
         """
@@ -1602,7 +1644,7 @@ class Backtester:
                 logger.debug(f"유동성 필터 계산 오류: {e}")
             return False
     
-    def _calculate_position_size(self, df_window: pd.DataFrame, current_price: float, available_cash: float) -> Tuple[int, float]:
+    def _calculate_position_size(self, df_window: pd.DataFrame, current_price: float, available_cash: float, code: str = None) -> Tuple[int, float]:
         """v14.2: 자산 증식 목표 - 동적 포지션 사이징 (가용 현금 최대한 활용)"""
         try:
             # v14.2: 전체 자산 기준으로 계산 (현재 날짜는 run()에서 사용 가능하므로 임시로 현재 시점 사용)
@@ -1610,7 +1652,11 @@ class Backtester:
             current_equity = self._compute_equity(datetime.now()) if hasattr(self, 'price_cache') and self.price_cache else INITIAL_CAPITAL
             current_equity = max(current_equity, INITIAL_CAPITAL)  # 최소 초기 자본
             
-            atr_val = strategy.calculate_atr(df_window, period=self.config.get_int('ATR_PERIOD', 14))
+            atr_period = self.config.get_int('ATR_PERIOD', 14)
+            if code:
+                atr_val = self._indicator_at(code, 'atr', df_window.index[-1], period=atr_period)
+            else:
+                atr_val = strategy.calculate_atr(df_window, period=atr_period)
             if not atr_val or atr_val == 0:
                 # ATR 없으면 전체 자산의 2% 할당 (1.5억원 기준 300만원)
                 base_amount = current_equity * 0.02
@@ -1946,7 +1992,7 @@ class Backtester:
             buy_signal_type = cand["signal"]
             key_metrics = cand["key_metrics"]
 
-            qty, cost = self._calculate_position_size(df_window, last_close, self.cash)
+            qty, cost = self._calculate_position_size(df_window, last_close, self.cash, code=code)
             if cost > self.cash:
                 logger.warning(f"   (Buy Execute) ⚠️ {code} 매수 건너뜀 (현금 부족: 필요 {cost:,.0f} > 보유 {self.cash:,.0f})")
                 continue
@@ -1958,7 +2004,7 @@ class Backtester:
                 logger.warning(f"   (Buy Execute) ⚠️ {code} 매수 건너뜀 (슬리피지 적용 후 현금 부족: 필요 {actual_cost:,.0f} > 보유 {self.cash:,.0f})")
                 continue
 
-            atr_val = strategy.calculate_atr(df_window, period=self.config.get_int('ATR_PERIOD', 14))
+            atr_val = self._indicator_at(code, 'atr', df_window.index[-1], period=self.config.get_int('ATR_PERIOD', 14))
             if regime == MarketRegimeDetector.REGIME_STRONG_BULL:
                 atr_mult = self.config.get_float('STRONG_BULL_ATR_MULTIPLIER_INITIAL', 2.5)
             else:
@@ -10,7 +10,8 @@
 # - 소스:
 #   youngs75_jennie.kis.KISClient.market_data.get_stock_daily_prices
 # - 저장:
-#   OCI DB 테이블 STOCK_DAILY_PRICES_3Y (DDL 포함)
+#   DB 테이블 STOCK_DAILY_PRICES_3Y (없으면 ORM 모델로 생성)
+#   chunk 단위 Bulk UPSERT (BULK_UPSERT_CHUNK_SIZE, 기본 1000)
 #
 
 import os
@@ -29,6 +30,9 @@ import pandas as pd
 
 import shared.auth as auth
 import shared.database as database
+from shared.database.price_store import append_ohlcv_rows
+from shared.db.connection import dispose_engine, ensure_engine_initialized, session_scope
+from shared.db.models import StockDailyPrice
 from shared.kis.client import KISClient as KIS_API
 
 # scout의 BLUE_CHIP_STOCKS 재활용 (bs4 의존성 제거를 위해 직접 정의)
@@ -96,119 +100,36 @@ logger = logging.getLogger(__name__)
 NUM_DAYS_TO_FETCH = 1100  # 약 3년
 KOSPI_CODE = "0001"
 
-DDL_STOCK_DAILY_PRICES_3Y = """
-CREATE TABLE STOCK_DAILY_PRICES_3Y (
-  STOCK_CODE        VARCHAR2(16) NOT NULL,
-  PRICE_DATE        DATE NOT NULL,
-  OPEN_PRICE        NUMBER,
-  HIGH_PRICE        NUMBER,
-  LOW_PRICE         NUMBER,
-  CLOSE_PRICE       NUMBER,
-  VOLUME            NUMBER,
-  CREATED_AT        TIMESTAMP DEFAULT SYSTIMESTAMP,
-  CONSTRAINT PK_STOCK_DAILY_PRICES_3Y PRIMARY KEY (STOCK_CODE, PRICE_DATE)
-)
-"""
+CHUNK_SIZE = int(os.getenv("BULK_UPSERT_CHUNK_SIZE", "1000"))
+
 
-def ensure_table_exists(connection):
+def ensure_table_exists(engine):
     """
-    STOCK_DAILY_PRICES_3Y 테이블이 없으면 생성합니다.
+    STOCK_DAILY_PRICES_3Y 테이블이 없으면 생성합니다. (ORM 모델 StockDailyPrice 기준)
     """
-    try:
-        cur = connection.cursor()
-        # 세션 병렬 DML 비활성화 (ORA-12838 회피)
-        try:
-            cur.execute("ALTER SESSION DISABLE PARALLEL DML")
-        except Exception:
-            pass
-        # 존재 여부 확인
-        cur.execute("""
-            SELECT COUNT(*) 
-            FROM user_tables 
-            WHERE table_name = 'STOCK_DAILY_PRICES_3Y'
-        """)
-        exists = cur.fetchone()[0] > 0
-        if not exists:
-            logger.info("테이블 'STOCK_DAILY_PRICES_3Y' 미존재. 생성 시도...")
-            cur.execute(DDL_STOCK_DAILY_PRICES_3Y)
-            # 테이블 병렬 옵션 해제
-            try:
-                cur.execute("ALTER TABLE STOCK_DAILY_PRICES_3Y NOPARALLEL")
-            except Exception:
-                pass
-            connection.commit()
-            logger.info("✅ 'STOCK_DAILY_PRICES_3Y' 생성 완료.")
-        else:
-            logger.info("✅ 'STOCK_DAILY_PRICES_3Y' 이미 존재.")
-    except Exception as e:
-        logger.error(f"❌ 테이블 생성 확인 중 오류: {e}", exc_info=True)
-        raise
-    finally:
-        try:
-            cur.close()
-        except Exception:
-            pass
+    StockDailyPrice.__table__.create(bind=engine, checkfirst=True)
+    logger.info("✅ 'STOCK_DAILY_PRICES_3Y' 확인 완료.")
 
-def upsert_daily_prices(connection, rows):
+def upsert_daily_prices(rows, chunk_size=CHUNK_SIZE):
     """
-    수집된 일봉 데이터를 STOCK_DAILY_PRICES_3Y에 MERGE 저장합니다.
+    수집된 일봉 데이터를 STOCK_DAILY_PRICES_3Y에 Bulk UPSERT 저장합니다.
     rows: List[dict] with keys: date, code, open, high, low, close, volume
+    chunk_size개씩 executemany(다중 행 VALUES)로 전송합니다. (database.save_daily_ohlcv)
+    commit 후 같은 행을 로컬 가격 스토어(PRICE_STORE_DIR 설정 시)에도 반영합니다.
     """
     if not rows:
-        return
-    sql_merge = """
-    MERGE /*+ NOPARALLEL(t) */ INTO STOCK_DAILY_PRICES_3Y t
-    USING (
-      SELECT TO_DATE(:p_date, 'YYYY-MM-DD') AS price_date,
-             :p_code AS stock_code,
-             :p_open AS open_price,
-             :p_high AS high_price,
-             :p_low  AS low_price,
-             :p_close AS close_price,
-             :p_volume AS volume
-      FROM DUAL
-    ) s
-    ON (t.STOCK_CODE = s.stock_code AND t.PRICE_DATE = s.price_date)
-    WHEN MATCHED THEN
-      UPDATE /*+ NOPARALLEL(t) */ SET t.OPEN_PRICE = s.open_price,
-                 t.HIGH_PRICE = s.high_price,
-                 t.LOW_PRICE = s.low_price,
-                 t.CLOSE_PRICE = s.close_price,
-                 t.VOLUME = s.volume
-    WHEN NOT MATCHED THEN
-      INSERT /*+ NOPARALLEL(t) */ (STOCK_CODE, PRICE_DATE, OPEN_PRICE, HIGH_PRICE, LOW_PRICE, CLOSE_PRICE, VOLUME)
-      VALUES (s.stock_code, s.price_date, s.open_price, s.high_price, s.low_price, s.close_price, s.volume)
-    """
-    params = []
-    for r in rows:
-        params.append({
-            "p_date": r["date"],
-            "p_code": r["code"],
-            "p_open": r.get("open"),
-            "p_high": r.get("high"),
-            "p_low": r.get("low"),
-            "p_close": r.get("close"),
-            "p_volume": r.get("volume", 0)
-        })
-    cur = None
+        return 0
+    started = time.perf_counter()
     try:
-        cur = connection.cursor()
-        # 세션 병렬 DML 비활성화
-        try:
-            cur.execute("ALTER SESSION DISABLE PARALLEL DML")
-        except Exception:
-            pass
-        cur.executemany(sql_merge, params)
-        connection.commit()
-        logger.info(f"✅ 저장 완료: {len(params)}건")
+        with session_scope() as session:
+            written = database.save_daily_ohlcv(session, rows, chunk_size=chunk_size, sync_store=False)
     except Exception as e:
         logger.error(f"❌ 저장 실패: {e}", exc_info=True)
-        if connection:
-            connection.rollback()
         raise
-    finally:
-        if cur:
-            cur.close()
+    append_ohlcv_rows(rows)
+    elapsed = time.perf_counter() - started
+    logger.info(f"✅ 저장 완료: {written}건 ({elapsed:.2f}초, {written / max(elapsed, 1e-9):,.0f}행/초)")
+    return written
 
 def _fetch_ohlcv_range(kis_api: KIS_API, stock_code: str, start_date_yyyymmdd: str, end_date_yyyymmdd: str):
     """
@@ -368,22 +289,13 @@ def main():
         logger.error("❌ .env 파일 로드 실패: GCP_PROJECT_ID가 설정되지 않았습니다.")
         return
     logger.info("--- 🤖 3년치 데이터 수집기 시작 ---")
-    db_conn = None
     kis_api = None
     try:
         # DB 연결
-        db_user = auth.get_secret(os.getenv("SECRET_ID_ORACLE_DB_USER"), os.getenv("GCP_PROJECT_ID"))
-        db_password = auth.get_secret(os.getenv("SECRET_ID_ORACLE_DB_PASSWORD"), os.getenv("GCP_PROJECT_ID"))
-        wallet_path = os.path.join(PROJECT_ROOT, os.getenv("OCI_WALLET_DIR_NAME", "wallet"))
-        db_conn = database.get_db_connection(
-            db_user=db_user,
-            db_password=db_password,
-            db_service_name=os.getenv("OCI_DB_SERVICE_NAME"),
-            wallet_path=wallet_path
-        )
-        if not db_conn:
-            raise RuntimeError("OCI DB 연결 실패")
-        ensure_table_exists(db_conn)
+        engine = ensure_engine_initialized()
+        if engine is None:
+            raise RuntimeError("DB 연결 실패")
+        ensure_table_exists(engine)
 
         # KIS API
         # 로컬 개발 시에는 .env 파일의 TRADING_MODE (MOCK)를 따르도록 수정
@@ -402,7 +314,7 @@ def main():
         # 1) KOSPI 포함하여 수집
         logger.info(f"--- (1/2) KOSPI({KOSPI_CODE}) 3년치 수집 ---")
         kospi_rows = fetch_ohlcv_for_code(kis_api, KOSPI_CODE)
-        upsert_daily_prices(db_conn, kospi_rows)
+        upsert_daily_prices(kospi_rows)
 
         # 2) BLUE_CHIP_STOCKS 병렬 수집
         logger.info("--- (2/2) BLUE_CHIP_STOCKS 3년치 수집 ---")
@@ -428,7 +340,7 @@ def main():
 
         if all_rows_to_save:
             logger.info(f"--- 모든 수집 데이터({len(all_rows_to_save)}건) Bulk 저장 시작 ---")
-            upsert_daily_prices(db_conn, all_rows_to_save)
+            upsert_daily_prices(all_rows_to_save)
             logger.info(f"--- ✅ 모든 데이터 Bulk 저장 완료 ---")
         else:
             logger.warning("⚠️ 저장할 데이터가 없습니다.")
@@ -439,9 +351,8 @@ def main():
         logger.critical(f"❌ 수집기 실행 중 치명적 오류: {e}", exc_info=True)
         sys.exit(1)
     finally:
-        if db_conn:
-            db_conn.close()
-            logger.info("--- DB 연결 종료 ---")
+        dispose_engine()
+        logger.info("--- DB 연결 종료 ---")
 
 if __name__ == "__main__":
     main()